@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Chat message codec benchmark for BGBG AI Server
+Bytes per message and decode time for legacy JSON vs msgpack v1 (no Redis required)
+
+Usage:
+    python benchmarks/chat_codec_benchmark.py --messages 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.chat_history_models import ChatMessage, MessageType
+from src.services.chat_message_codec import (
+    JsonChatMessageCodec,
+    MsgpackChatMessageCodec,
+    decode_message
+)
+
+
+def sample_messages(count: int):
+    """실제 토론 채팅과 비슷한 길이의 메시지"""
+    contents = [
+        "저는 주인공이 마지막에 떠나기로 한 선택이 이해가 됐어요.",
+        "3장에서 작가가 반복해서 쓰는 '창문' 이미지가 어떤 의미일까요?",
+        "동의해요! 특히 어머니와의 대화 장면이 인상 깊었습니다.",
+        "I think the narrator is unreliable here, especially in chapter 5.",
+    ]
+    return [
+        ChatMessage(
+            message_id="",
+            session_id="meeting-1024_discussion",
+            user_id="ai_moderator" if i % 4 == 3 else f"user-{i % 5}",
+            nickname="AI 토론 진행자" if i % 4 == 3 else f"참여자{i % 5}",
+            content=contents[i % len(contents)],
+            timestamp=datetime.utcnow(),
+            message_type=MessageType.AI if i % 4 == 3 else MessageType.USER
+        )
+        for i in range(count)
+    ]
+
+
+def measure(codec, messages, repeat: int):
+    encoded = [codec.encode(message) for message in messages]
+    size = sum(len(data) for data in encoded) / len(encoded)
+
+    def decode_all():
+        for data in encoded:
+            decode_message(data)
+
+    best = min(timeit.repeat(decode_all, number=1, repeat=repeat))
+    return size, best / len(encoded) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chat message codec benchmark")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    messages = sample_messages(args.messages)
+
+    # 왕복 검증
+    for codec in (JsonChatMessageCodec(), MsgpackChatMessageCodec()):
+        restored = decode_message(codec.encode(messages[0]))
+        assert restored.content == messages[0].content
+        assert restored.message_type == messages[0].message_type
+        assert abs((restored.timestamp - messages[0].timestamp).total_seconds()) < 0.001
+
+    print(f"\n📊 Chat message codec benchmark ({args.messages} messages, best of {args.repeat})")
+    print(f"{'codec':<10} {'bytes/msg':>10} {'decode µs/msg':>15}")
+
+    results = {}
+    for codec in (JsonChatMessageCodec(), MsgpackChatMessageCodec()):
+        size, decode_us = measure(codec, messages, args.repeat)
+        results[codec.name] = (size, decode_us)
+        print(f"{codec.name:<10} {size:>10.1f} {decode_us:>15.2f}")
+
+    json_size, json_us = results["json"]
+    mp_size, mp_us = results["msgpack"]
+    print(f"\n⚡ size: {mp_size / json_size:.0%} of JSON, decode: {json_us / mp_us:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Chat turn benchmark for BGBG AI Server
+Compares the legacy multi round-trip chat turn with the single-script append-and-read
+
+Usage:
+    python benchmarks/chat_turn_benchmark.py --host localhost --port 6379 --turns 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from redis.asyncio import Redis
+
+from src.models.chat_history_models import ChatMessage, MessageType
+from src.services.redis_chat_storage import RedisChatStorage, session_ttl_hours
+
+
+def make_message(session_id: str, index: int) -> ChatMessage:
+    """벤치마크용 메시지 (4턴마다 AI 응답)"""
+    is_ai = index % 4 == 3
+    return ChatMessage(
+        message_id="",
+        session_id=session_id,
+        user_id="ai_moderator" if is_ai else f"user-{index % 3}",
+        nickname="AI 토론 진행자" if is_ai else f"참여자{index % 3}",
+        content=f"벤치마크 메시지 {index} - 이 책의 주인공이 내린 선택에 대해 어떻게 생각하시나요?",
+        timestamp=datetime.utcnow(),
+        message_type=MessageType.AI if is_ai else MessageType.USER
+    )
+
+
+async def legacy_turn(storage: RedisChatStorage, session_id: str, message: ChatMessage, limit: int):
+    """기존 경로: store_message → get_session_stats → set_session_ttl → get_recent_messages"""
+    await storage.store_message(session_id, message)
+    stats = await storage.get_session_stats(session_id)
+    await storage.set_session_ttl(session_id, session_ttl_hours(stats.get("message_count", 0)))
+    messages = await storage.get_recent_messages(session_id, limit, timedelta(hours=2))
+    user_since_ai = 0
+    for msg in reversed(messages):
+        if msg.message_type == MessageType.AI:
+            break
+        user_since_ai += 1
+    return messages, user_since_ai
+
+
+async def scripted_turn(storage: RedisChatStorage, session_id: str, message: ChatMessage, limit: int):
+    """스크립트 경로: append_and_read 1회"""
+    turn = await storage.append_and_read(session_id, message, limit, timedelta(hours=2))
+    return turn["messages"], turn["user_messages_since_ai"]
+
+
+async def run(name: str, turn_fn, storage: RedisChatStorage, redis_client: Redis, turns: int, limit: int):
+    session_id = f"bench-{name}-{uuid.uuid4().hex[:8]}"
+    latencies = []
+    commands_before = (await redis_client.info("stats"))["total_commands_processed"]
+
+    for i in range(turns):
+        message = make_message(session_id, i)
+        start = time.perf_counter()
+        await turn_fn(storage, session_id, message, limit)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    commands_after = (await redis_client.info("stats"))["total_commands_processed"]
+    # info 호출 자체(1회) 제외
+    commands_per_turn = (commands_after - commands_before - 1) / turns
+
+    await redis_client.delete(
+        storage.MESSAGES_KEY.format(session_id=session_id),
+        storage.META_KEY.format(session_id=session_id),
+        storage.PARTICIPANTS_KEY.format(session_id=session_id),
+        storage.CONTEXT_KEY.format(session_id=session_id)
+    )
+    await redis_client.srem(storage.ACTIVE_SESSIONS_KEY, session_id)
+
+    latencies.sort()
+    return {
+        "name": name,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "mean_ms": statistics.mean(latencies),
+        "commands_per_turn": commands_per_turn
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Chat turn Redis benchmark")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    redis_client = Redis(host=args.host, port=args.port, password=args.password, decode_responses=True)
+    await redis_client.ping()
+    storage = RedisChatStorage(redis_client=redis_client)
+
+    # 스크립트 로드 및 커넥션 워밍업
+    await run("warmup", scripted_turn, storage, redis_client, 10, args.limit)
+
+    results = [
+        await run("legacy", legacy_turn, storage, redis_client, args.turns, args.limit),
+        await run("scripted", scripted_turn, storage, redis_client, args.turns, args.limit)
+    ]
+
+    print(f"\n📊 Chat turn benchmark ({args.turns} turns, window={args.limit}, redis={args.host}:{args.port})")
+    print(f"{'path':<10} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8} {'cmds/turn':>10}")
+    for r in results:
+        print(f"{r['name']:<10} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['mean_ms']:>8.2f} {r['commands_per_turn']:>10.1f}")
+
+    legacy, scripted = results
+    print(f"\n⚡ p50 speedup: {legacy['p50_ms'] / scripted['p50_ms']:.1f}x")
+
+    await redis_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Import-time audit for BGBG AI Server
+Runs `python -X importtime` in a fresh interpreter and reports the slowest imports,
+per-package totals, peak RSS and which heavy optional modules got loaded
+
+Usage:
+    python benchmarks/import_time_report.py
+    python benchmarks/import_time_report.py --module src.grpc_server.server --top 40
+    python benchmarks/import_time_report.py --env LOCAL_OCR__ENABLED=false --output benchmarks/importtime_server.txt
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# 시작 경로에서 로드되지 않아야 하는 무거운 선택 모듈
+HEAVY_MODULES = [
+    "torch", "sentence_transformers", "chromadb", "numpy",
+    "fitz", "cv2", "PIL.Image", "paddleocr", "paddle"
+]
+
+# 자식 인터프리터: 모듈 import 후 소요 시간/최대 RSS/로드된 무거운 모듈을 JSON으로 출력
+CHILD_SCRIPT = """
+import importlib, json, resource, sys, time
+heavy = json.loads(sys.argv[1])
+started = time.perf_counter()
+errors = {}
+for name in sys.argv[2:]:
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        errors[name] = f"{type(e).__name__}: {e}"
+elapsed_ms = (time.perf_counter() - started) * 1000
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(json.dumps({
+    "elapsed_ms": elapsed_ms,
+    "max_rss_mb": rss_kb / 1024,
+    "heavy_loaded": [name for name in heavy if name in sys.modules],
+    "module_count": len(sys.modules),
+    "errors": errors
+}))
+"""
+
+
+def run_importtime(modules: List[str], env_overrides: Dict[str, str]) -> Tuple[dict, List[Tuple[int, int, str]]]:
+    """
+    새 인터프리터에서 -X importtime 실행
+
+    Returns:
+        Tuple[dict, List[Tuple[int, int, str]]]: 자식 요약, (self µs, cumulative µs, 모듈) 목록
+    """
+    env = {**os.environ, **env_overrides}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT, json.dumps(HEAVY_MODULES), *modules],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append((int(self_us), int(cumulative_us), name.rstrip()))
+
+    summary_line = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else "{}"
+    summary = json.loads(summary_line)
+    if result.returncode != 0:
+        summary.setdefault("errors", {})["<interpreter>"] = result.stderr.strip().splitlines()[-1]
+    return summary, entries
+
+
+def package_totals(entries: List[Tuple[int, int, str]]) -> List[Tuple[str, int]]:
+    """최상위 패키지별 self 시간 합계 (µs)"""
+    totals = defaultdict(int)
+    for self_us, _, name in entries:
+        totals[name.strip().split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def build_report(modules: List[str], env_overrides: Dict[str, str], summary: dict,
+                 entries: List[Tuple[int, int, str]], top: int) -> str:
+    lines = [
+        f"📦 Import-time report: {', '.join(modules)}",
+        f"   python {sys.version.split()[0]}, env overrides: {env_overrides or 'none'}",
+        f"   wall {summary.get('elapsed_ms', 0):.0f}ms, peak RSS {summary.get('max_rss_mb', 0):.1f}MB, "
+        f"{summary.get('module_count', 0)} modules in sys.modules",
+        f"   heavy modules loaded: {', '.join(summary.get('heavy_loaded', [])) or 'none'}",
+    ]
+    for name, error in summary.get("errors", {}).items():
+        lines.append(f"   ⚠️ {name}: {error}")
+
+    lines.append("")
+    lines.append(f"Slowest imports (cumulative, top {top})")
+    lines.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+    lines.append("")
+    lines.append(f"Top-level packages (self time, top {top})")
+    for package, self_us in package_totals(entries)[:top]:
+        lines.append(f"{self_us / 1000:>14.1f}  {package}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time audit (-X importtime)")
+    parser.add_argument("--module", action="append", dest="modules",
+                        help="Module to import (repeatable, default: main)")
+    parser.add_argument("--env", action="append", default=[],
+                        help="Settings override for the child interpreter, e.g. LOCAL_OCR__ENABLED=false")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--output", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    modules = args.modules or ["main"]
+    env_overrides = dict(item.split("=", 1) for item in args.env)
+
+    summary, entries = run_importtime(modules, env_overrides)
+    report = build_report(modules, env_overrides, summary, entries, args.top)
+    print(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+        print(f"\n📝 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
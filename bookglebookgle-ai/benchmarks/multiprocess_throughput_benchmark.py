@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Multi-process gRPC throughput benchmark for BGBG AI Server
+Req/s of a CPU-bound RPC (ProcessPdfResponse assembly with many TextBlocks) served by
+GRPCSupervisor with 1, 2 and 4 SO_REUSEPORT workers (no Redis/Chroma/GMS required)
+
+Usage:
+    python benchmarks/multiprocess_throughput_benchmark.py --workers 1 2 4 --duration 10
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import grpc
+from loguru import logger
+
+from src.grpc_server.generated import ai_service_pb2
+from src.grpc_server.supervisor import GRPCSupervisor, WorkerContext, WORKER_DRAINING, WORKER_SERVING
+
+METHOD = "/bgbg.bench.Bench/AssemblePdf"
+
+
+def build_response(blocks: int) -> bytes:
+    """OCR 결과 응답 조립 (실제 ProcessPdf 응답과 같은 메시지)"""
+    response = ai_service_pb2.ProcessPdfResponse(
+        success=True, message="ok", document_id="bench-doc", total_pages=blocks // 40 + 1
+    )
+    for i in range(blocks):
+        response.text_blocks.add(
+            text=f"벤치마크 텍스트 블록 {i} - 독서 모임 토론용 문서 내용",
+            page_number=i // 40 + 1,
+            x0=10.0 + i % 7, y0=20.0 + i % 11, x1=300.0, y1=40.0,
+            block_type="text",
+            confidence=0.98
+        )
+    return response.SerializeToString()
+
+
+def run_bench_worker(port: int, blocks: int, worker: WorkerContext):
+    async def serve():
+        def assemble(request: bytes, context) -> bytes:
+            return build_response(blocks)
+
+        handler = grpc.method_handlers_generic_handler("bgbg.bench.Bench", {
+            "AssemblePdf": grpc.unary_unary_rpc_method_handler(assemble)
+        })
+        server = grpc.aio.server(options=[("grpc.so_reuseport", 1)])
+        server.add_generic_rpc_handlers((handler,))
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        await server.start()
+        worker.set_state(WORKER_SERVING)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, stop.set)
+        await stop.wait()
+        worker.set_state(WORKER_DRAINING)
+        await server.stop(grace=5)
+
+    asyncio.run(serve())
+
+
+def run_client(port: int, concurrency: int, duration: float, results):
+    async def load():
+        latencies = []
+        async with grpc.aio.insecure_channel(
+            f"127.0.0.1:{port}",
+            # 클라이언트 프로세스마다 별도 연결 -> 커널이 워커 간 분산
+            options=[("grpc.use_local_subchannel_pool", 1)]
+        ) as channel:
+            call = channel.unary_unary(METHOD)
+            deadline = time.perf_counter() + duration
+
+            async def loop_calls():
+                while time.perf_counter() < deadline:
+                    started_at = time.perf_counter()
+                    await call(b"")
+                    latencies.append((time.perf_counter() - started_at) * 1000)
+
+            await asyncio.gather(*(loop_calls() for _ in range(concurrency)))
+        return latencies
+
+    results.put(asyncio.run(load()))
+
+
+def measure(workers: int, args) -> dict:
+    supervisor = GRPCSupervisor(
+        workers,
+        lambda worker: run_bench_worker(args.port, args.blocks, worker),
+        drain_timeout=10
+    )
+    supervisor.start()
+    try:
+        if not supervisor.wait_until_serving(timeout=30):
+            raise RuntimeError(f"workers failed to start: {supervisor.get_worker_states()}")
+
+        mp = multiprocessing.get_context("fork")
+        results = mp.Queue()
+        clients = [
+            mp.Process(target=run_client, args=(args.port, args.concurrency, args.duration, results))
+            for _ in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        latencies = []
+        for _ in clients:
+            latencies.extend(results.get())
+        for client in clients:
+            client.join()
+    finally:
+        supervisor.drain()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / args.duration,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] if latencies else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process gRPC throughput benchmark")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=4, help="Client processes")
+    parser.add_argument("--concurrency", type=int, default=8, help="In-flight calls per client process")
+    parser.add_argument("--blocks", type=int, default=2000, help="TextBlocks per response")
+    parser.add_argument("--port", type=int, default=50611)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(f"\n📊 Multi-process gRPC throughput ({args.blocks} TextBlocks/response, "
+          f"{args.clients} clients x {args.concurrency} in flight, {args.duration:.0f}s, {os.cpu_count()} CPUs)")
+    print(f"{'workers':>8} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'speedup':>8}")
+
+    baseline = None
+    for workers in args.workers:
+        result = measure(workers, args)
+        baseline = baseline or result["rps"]
+        print(f"{workers:>8} {result['rps']:>10.1f} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+              f"{result['rps'] / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
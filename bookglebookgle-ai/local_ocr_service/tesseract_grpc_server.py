@@ -85,6 +85,16 @@ def kill_port_process(port):
         return False
 
 
+def get_trace_id(context) -> str:
+    """AI 서버가 전파한 W3C traceparent(00-<trace_id>-<span_id>-<flags>)에서 trace id 추출 (로그 상관관계용)"""
+    for key, value in context.invocation_metadata() or ():
+        if key == "traceparent" and isinstance(value, str):
+            parts = value.split("-")
+            if len(parts) == 4 and len(parts[1]) == 32:
+                return parts[1]
+    return "-"
+
+
 class TesseractOCRServicer(AIServiceServicer):
     """Tesseract OCR gRPC 서비스"""
     
@@ -101,8 +111,10 @@ class TesseractOCRServicer(AIServiceServicer):
         start_time = time.time()
         self.total_requests += 1
         
+        trace_id = get_trace_id(context)
+        
         try:
-            logger.info("🔧 Tesseract ProcessPdf request received")
+            logger.info(f"🔧 Tesseract ProcessPdf request received (trace {trace_id})")
             
             if not self.initialized:
                 logger.error("❌ Tesseract OCR engine not initialized")
@@ -184,7 +196,7 @@ class TesseractOCRServicer(AIServiceServicer):
             processing_time = time.time() - start_time
             self.successful_requests += 1
             
-            logger.info(f"✅ Tesseract OCR completed: {len(text_blocks)} blocks from {total_pages} pages in {processing_time:.2f}s")
+            logger.info(f"✅ Tesseract OCR completed: {len(text_blocks)} blocks from {total_pages} pages in {processing_time:.2f}s (trace {trace_id})")
             
             response = ProcessPdfResponse(
                 success=True,
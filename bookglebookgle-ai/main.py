@@ -13,31 +13,45 @@ Core features:
 """
 
 import asyncio
+import os
 import signal
 import sys
 from pathlib import Path
+from typing import Optional
 
 from loguru import logger
 
 from src.config.settings import get_settings
 from src.grpc_server.server import GRPCServer
+from src.grpc_server.supervisor import GRPCSupervisor, WorkerContext, WORKER_DRAINING, WORKER_SERVING
 from src.services.service_initializer import ServiceInitializer
 from src.utils.logging_config import setup_logging
+from src.utils.metrics import start_metrics_server
 from src.utils.port_utils import ensure_port_free, print_ports_report
+from src.utils.tracing import setup_tracing, shutdown_tracing
 
 
-async def initialize_services():
+async def initialize_services(worker: Optional[WorkerContext] = None):
     """Initialize all required services using ServiceInitializer"""
     settings = get_settings()
     
     # Setup logging
     setup_logging(settings.LOG_LEVEL)
-    logger.info("🚀 Starting BGBG AI Server...")
+    if worker:
+        logger.info(f"🚀 Starting BGBG AI Server worker {worker.index + 1}/{worker.count} (pid {os.getpid()})...")
+    else:
+        logger.info("🚀 Starting BGBG AI Server...")
+        
+        # Check and prepare ports (워커 모드에서는 다른 워커가 같은 포트를 사용 중)
+        logger.info("🔍 Checking required ports...")
+        required_ports = [settings.SERVER_PORT]
+        print_ports_report(required_ports)
+    
+    # Prometheus /metrics endpoint (LLM telemetry 등) - 워커별 포트 PROMETHEUS_PORT + index
+    start_metrics_server(settings.PROMETHEUS_PORT + worker.index if worker else None)
     
-    # Check and prepare ports
-    logger.info("🔍 Checking required ports...")
-    required_ports = [settings.SERVER_PORT]
-    print_ports_report(required_ports)
+    # OpenTelemetry span export (TRACING_ENABLED) - 서버 인터셉터 등록 전에 설정
+    setup_tracing(worker.index if worker else None)
     
     # Initialize all services using ServiceInitializer
     logger.info("⚙️ Initializing services with ServiceInitializer...")
@@ -61,7 +75,7 @@ async def initialize_services():
         return partial_services
 
 
-async def start_grpc_server(services):
+async def start_grpc_server(services, worker: Optional[WorkerContext] = None):
     """Start gRPC server with initialized services"""
     settings = get_settings()
     logger.info("🚀 Starting gRPC server...")
@@ -71,7 +85,8 @@ async def start_grpc_server(services):
         redis_manager=services['redis_manager'],
         llm_client=services['llm_client'],
         quiz_service=services.get('quiz_service'),
-        proofreading_service=services.get('proofreading_service')
+        proofreading_service=services.get('proofreading_service'),
+        reuse_port=worker is not None
     )
     
     try:
@@ -80,6 +95,9 @@ async def start_grpc_server(services):
         return grpc_server
     except Exception as e:
         logger.error(f"❌ Failed to start gRPC server: {e}")
+        if worker:
+            # 포트 정리는 다른 워커를 종료시키므로 워커 모드에서는 실패 처리 (감독 프로세스가 재시작)
+            raise
         logger.info("🔄 Attempting to clean up and retry...")
         ensure_port_free(settings.SERVER_PORT, kill_if_needed=True)
         await asyncio.sleep(2)
@@ -122,28 +140,40 @@ async def cleanup_services(services, grpc_server):
         except Exception as e:
             logger.error(f"⚠️ Error cleaning up Redis: {e}")
     
+    # 배치에 남은 span flush
+    shutdown_tracing()
     logger.info("✅ Server shutdown complete")
 
 
-async def main_async():
-    """Main async function"""
+async def main_async(worker: Optional[WorkerContext] = None):
+    """Main async function (worker가 있으면 감독 프로세스가 fork한 워커로 실행)"""
     services = None
     grpc_server = None
     
     try:
         # Initialize services
-        services = await initialize_services()
+        services = await initialize_services(worker)
+        
+        if worker and services.get('redis_manager') is None:
+            logger.warning("⚠️ Redis unavailable in multi-process mode - discussion state and caches are per-worker")
         
         # Start gRPC server
-        grpc_server = await start_grpc_server(services)
+        grpc_server = await start_grpc_server(services, worker)
         
         # Setup signal handlers for graceful shutdown
         def signal_handler(signum, frame):
             logger.info(f"Received signal {signum}, shutting down...")
+            if worker:
+                worker.set_state(WORKER_DRAINING)
             raise KeyboardInterrupt()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        if worker:
+            # SIGINT는 감독 프로세스만 처리 (워커는 SIGTERM으로 drain)
+            signal.signal(signal.SIGTERM, signal_handler)
+            worker.set_state(WORKER_SERVING)
+        else:
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
         
         logger.info("🎯 BGBG AI Server is running. Press Ctrl+C to stop.")
         
@@ -162,8 +192,46 @@ async def main_async():
             await cleanup_services(services or {}, grpc_server)
 
 
+def run_worker(worker: WorkerContext):
+    """Worker process entry point (multi-process mode)"""
+    try:
+        asyncio.run(main_async(worker))
+    except KeyboardInterrupt:
+        logger.info(f"✅ Worker {worker.index} stopped")
+
+
+def preload_shared_models():
+    """fork 전에 임베딩 모델을 로드해 워커들이 가중치를 copy-on-write로 공유"""
+    settings = get_settings()
+    if not settings.SERVER_PRELOAD_BEFORE_FORK or not settings.vector_db.EMBEDDING_PRELOAD:
+        return
+    from src.services.embedding_backend import get_shared_embedding_backend
+    get_shared_embedding_backend().load()
+
+
+def run_supervisor(settings) -> int:
+    """Fork SERVER_PROCESSES workers sharing SERVER_PORT via SO_REUSEPORT"""
+    setup_logging(settings.LOG_LEVEL)
+    logger.info(f"🧑‍✈️ Starting BGBG AI Server supervisor with {settings.SERVER_PROCESSES} workers "
+                f"on port {settings.SERVER_PORT}")
+    print_ports_report([settings.SERVER_PORT])
+    
+    supervisor = GRPCSupervisor(
+        settings.SERVER_PROCESSES,
+        run_worker,
+        preload=preload_shared_models,
+        drain_timeout=settings.SERVER_DRAIN_TIMEOUT_SECONDS,
+        max_restarts=settings.SERVER_WORKER_MAX_RESTARTS
+    )
+    return supervisor.run()
+
+
 def main():
     """Main function to run the gRPC server"""
+    settings = get_settings()
+    if settings.SERVER_PROCESSES > 1:
+        sys.exit(run_supervisor(settings))
+    
     try:
         asyncio.run(main_async())
     except KeyboardInterrupt:
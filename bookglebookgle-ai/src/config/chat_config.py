@@ -136,6 +136,10 @@ def get_performance_config() -> dict:
     return {
         'redis_memory_limit_mb': settings.chat_history.CHAT_REDIS_MEMORY_LIMIT_MB,
         'session_cleanup_interval_minutes': settings.chat_history.CHAT_SESSION_CLEANUP_INTERVAL_MINUTES,
+        'redis_scan_batch_size': settings.chat_history.CHAT_REDIS_SCAN_BATCH_SIZE,
+        'cache_sketch_width': settings.chat_history.CHAT_CACHE_SKETCH_WIDTH,
+        'cache_l1_capacity': settings.chat_history.CHAT_CACHE_L1_CAPACITY,
+        'cache_l2_capacity': settings.chat_history.CHAT_CACHE_L2_CAPACITY,
         'context_window_size': settings.chat_history.CHAT_CONTEXT_WINDOW_SIZE,
         'max_tokens': settings.chat_history.CHAT_MAX_TOKENS
     }
@@ -4,7 +4,7 @@ Configuration settings for BGBG AI Server
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
@@ -35,12 +35,39 @@ class AISettings(BaseModel):
     GMS_BASE_URL: str = Field(default="https://gms.ssafy.io/gmsapi/api.anthropic.com/v1", description="GMS API base URL")
     GMS_DEV_MODEL: str = Field(default="claude-3-5-haiku-latest", description="GMS development model")
     GMS_PROD_MODEL: str = Field(default="claude-3-5-sonnet-latest", description="GMS production model")
+    GMS_PROMPT_CACHING: bool = Field(default=True, description="Send cache_control markers on fixed system prompt blocks")
+
+    # GMS circuit breaker (rolling window)
+    GMS_BREAKER_ENABLED: bool = Field(default=True, description="Enable GMS circuit breaker")
+    GMS_BREAKER_WINDOW_SECONDS: int = Field(default=60, description="Rolling window for error/latency stats")
+    GMS_BREAKER_MIN_CALLS: int = Field(default=5, description="Minimum calls in window before the breaker can trip")
+    GMS_BREAKER_ERROR_RATE: float = Field(default=0.5, description="Error rate that trips the breaker")
+    GMS_BREAKER_SLOW_CALL_MS: int = Field(default=8000, description="Latency above which a call counts as slow")
+    GMS_BREAKER_SLOW_CALL_RATE: float = Field(default=0.6, description="Slow call rate that trips the breaker")
+    GMS_BREAKER_OPEN_SECONDS: int = Field(default=30, description="Time the breaker stays open before half-open probes")
+    GMS_BREAKER_HALF_OPEN_PROBES: int = Field(default=1, description="Concurrent probe requests allowed while half-open")
+
+    # Hedged requests for latency-critical chat calls
+    GMS_HEDGE_ENABLED: bool = Field(default=False, description="Send a hedged GMS request when the first one is slow")
+    GMS_HEDGE_PERCENTILE: float = Field(default=0.95, description="Latency percentile used as the hedge delay")
+    GMS_HEDGE_MIN_DELAY_MS: int = Field(default=1500, description="Minimum hedge delay in ms")
+    GMS_HEDGE_MAX_DELAY_MS: int = Field(default=8000, description="Maximum hedge delay in ms")
 
     # Feature flags
     ENABLE_QUIZ_GENERATION: bool = Field(default=True, description="Enable quiz generation")
     ENABLE_PROOFREADING: bool = Field(default=True, description="Enable proofreading")
     ENABLE_DISCUSSION_AI: bool = Field(default=True, description="Enable discussion AI")
-    
+
+    # Discussion session state (shared across replicas via Redis)
+    DISCUSSION_STATE_BACKEND: str = Field(default="redis", description="Discussion session state store: redis (shared by all replicas) or memory (single process)")
+    DISCUSSION_STATE_CACHE_TTL_SECONDS: float = Field(default=2.0, description="Local read-through cache TTL for discussion session state (invalidated via pub/sub)")
+    DISCUSSION_BROADCAST_QUEUE_SIZE: int = Field(default=256, description="Per-stream queue bound for broadcast AI replies; a stream whose queue fills is dropped")
+    DISCUSSION_BROADCAST_RELAY: bool = Field(default=True, description="Relay AI reply chunks to session streams on other replicas via Redis pub/sub")
+
+    # Quiz bank (PDF 업로드 시 진도율별 퀴즈 사전 생성)
+    QUIZ_BANK_ENABLED: bool = Field(default=True, description="Pre-generate quizzes after document ingest")
+    QUIZ_BANK_TTL_HOURS: int = Field(default=24, description="Pre-generated quiz TTL in hours")
+
     # Model configurations
     KOREAN_MODEL_PATH: str = Field(default="./models/korean", description="Korean model path")
     SPACY_MODEL: str = Field(default="ko_core_news_sm", description="SpaCy model for Korean")
@@ -54,6 +81,7 @@ class VectorDBSettings(BaseModel):
     CHROMA_PERSIST_DIRECTORY: str = Field(default="./data/chroma", description="Chroma persistence directory")
     PINECONE_API_KEY: Optional[str] = Field(default=None, description="Pinecone API key")
     PINECONE_ENVIRONMENT: Optional[str] = Field(default=None, description="Pinecone environment")
+    EMBEDDING_PRELOAD: bool = Field(default=True, description="Load the embedding model at startup; when false it loads on first embedding")
     
     # 벡터 데이터베이스 정리 관련 설정
     ENABLE_CLEANUP_ON_MEETING_END: bool = Field(
@@ -88,6 +116,9 @@ class ChatHistorySettings(BaseModel):
     CHAT_CONTEXT_TTL_HOURS: int = Field(default=1, description="Chat context TTL in hours")
     CHAT_PARTICIPANT_TTL_HOURS: int = Field(default=2, description="Chat participant TTL in hours")
     CHAT_META_TTL_HOURS: int = Field(default=168, description="Chat metadata TTL in hours (7 days)")
+    CHAT_MESSAGE_CODEC: str = Field(default="msgpack", description="Chat message storage codec (msgpack or json); legacy JSON is always readable")
+    CHAT_STORAGE_BACKEND: str = Field(default="list", description="Chat message log structure: list (LPUSH/LRANGE) or stream (XADD with cursor pagination and per-user index)")
+    CHAT_STREAM_MAXLEN: int = Field(default=5000, description="Approximate cap (MAXLEN ~) per session stream and per-user index stream")
     
     # Context window settings
     CHAT_CONTEXT_WINDOW_SIZE: int = Field(default=10, description="Maximum messages in context window")
@@ -95,6 +126,14 @@ class ChatHistorySettings(BaseModel):
     CHAT_TIME_WINDOW_HOURS: int = Field(default=2, description="Time window for recent messages in hours")
     CHAT_MAX_BOOK_CHUNKS: int = Field(default=3, description="Maximum book context chunks")
     
+    # In-process recent message ring buffer (replicas kept coherent via pub/sub)
+    CHAT_RECENT_BUFFER_ENABLED: bool = Field(default=True, description="Cache recent messages per session in process memory")
+    CHAT_RECENT_BUFFER_SIZE: int = Field(default=50, description="Maximum buffered messages per session")
+    CHAT_RECENT_BUFFER_MAX_SESSIONS: int = Field(default=1000, description="Maximum sessions with a buffer (LRU)")
+    CHAT_RECENT_BUFFER_IDLE_MINUTES: int = Field(default=30, description="Evict a session buffer after this idle time")
+    CHAT_HISTORY_TOKEN_RATIO: float = Field(default=0.35, description="Share of the prompt token budget reserved for chat history")
+    CHAT_CACHED_CONTEXT_MAX_TOKENS: int = Field(default=1500, description="Token cap for session book context sent as a cacheable system prefix")
+    
     # Summarization settings
     CHAT_ENABLE_SUMMARIZATION: bool = Field(default=True, description="Enable context summarization")
     CHAT_SUMMARIZATION_THRESHOLD: int = Field(default=1500, description="Token threshold for summarization")
@@ -102,6 +141,12 @@ class ChatHistorySettings(BaseModel):
     # Performance settings
     CHAT_REDIS_MEMORY_LIMIT_MB: int = Field(default=512, description="Redis memory limit in MB")
     CHAT_SESSION_CLEANUP_INTERVAL_MINUTES: int = Field(default=30, description="Session cleanup interval in minutes")
+    CHAT_REDIS_SCAN_BATCH_SIZE: int = Field(default=200, description="Keys per SCAN/SSCAN cursor step and per pipelined batch in Redis maintenance")
+    CHAT_RECONCILE_TIME_BUDGET_MS: int = Field(default=250, description="Time budget per active-session reconciliation run (resumes next cycle)")
+    CHAT_CACHE_SKETCH_WIDTH: int = Field(default=16384, description="Counters per row of the cache access frequency sketch (fixed memory: width x 4 bytes)")
+    CHAT_CACHE_L1_CAPACITY: int = Field(default=1000, description="Maximum cache keys assigned to L1_HOT per optimization pass")
+    CHAT_CACHE_L2_CAPACITY: int = Field(default=10000, description="Maximum cache keys assigned to L2_WARM per optimization pass")
+    CHAT_CACHE_L0_ENABLED: bool = Field(default=True, description="In-process L0 cache for context/participant/analysis cache reads (invalidated via Redis pub/sub)")
     CHAT_INACTIVE_THRESHOLD_MINUTES: int = Field(default=30, description="Inactive participant threshold in minutes")
     
     # Analysis settings
@@ -126,6 +171,51 @@ class LocalOCRSettings(BaseModel):
     FALLBACK_ENABLED: bool = Field(default=False, description="Enable fallback to local OCR (DISABLED for EC2)")
 
 
+class IngestQueueSettings(BaseModel):
+    """Asynchronous PDF ingest job queue configuration (ProcessPdfStream)"""
+    WORKERS: int = Field(default=2, description="Concurrent ingest jobs per process")
+    SPOOL_DIR: str = Field(default="./data/ingest_spool", description="Directory for uploaded PDFs awaiting processing")
+    MAX_PENDING_JOBS: int = Field(default=100, description="Queued jobs before new uploads are rejected")
+    MAX_ATTEMPTS: int = Field(default=2, description="Attempts per job before it is marked failed")
+    JOB_TIMEOUT_SECONDS: int = Field(default=1800, description="Per-job processing deadline in seconds")
+    JOB_TTL_HOURS: int = Field(default=24, description="Retention of finished job status in hours")
+    POLL_INTERVAL_SECONDS: float = Field(default=1.0, description="Idle worker queue poll interval in seconds")
+    HEARTBEAT_SECONDS: float = Field(default=5.0, description="Running job progress/heartbeat write interval in seconds")
+    STALE_SECONDS: int = Field(default=60, description="Running job without heartbeat is requeued after this many seconds")
+    WATCH_INTERVAL_SECONDS: float = Field(default=0.5, description="WatchIngestJob status poll interval in seconds")
+
+
+class AdmissionControlSettings(BaseModel):
+    """gRPC admission control / load shedding configuration (adaptive per-method concurrency)"""
+    ENABLED: bool = Field(default=True, description="Enable the admission control interceptor")
+    METHOD_LIMITS: Dict[str, int] = Field(
+        default={"ProcessChatMessage": 500, "ProcessPdf": 4, "ProcessPdfStream": 8, "GenerateQuiz": 16, "ProofreadText": 16},
+        description="Maximum concurrent RPCs per method (adaptive limit never exceeds this)"
+    )
+    DEFAULT_LIMIT: int = Field(default=64, description="Maximum concurrent RPCs for methods not in METHOD_LIMITS")
+    MIN_LIMIT: int = Field(default=1, description="Lowest adaptive concurrency limit per method")
+    INTERACTIVE_METHODS: List[str] = Field(
+        default=["ProcessChatMessage", "InitializeDiscussion", "EndDiscussion", "GetChatHistory",
+                 "GetChatSessionStats"],
+        description="Latency-sensitive methods, shed only after batch methods"
+    )
+    BATCH_METHODS: List[str] = Field(
+        # ProcessPdfStream은 스풀 후 즉시 반환하고 대기열(ingest.MAX_PENDING_JOBS)이 부하를 제한하므로 제외
+        default=["ProcessPdf"],
+        description="Batch ingest methods, shed first when interactive traffic is under pressure"
+    )
+    QUEUE_TIMEOUT_SECONDS: float = Field(default=5.0, description="Time a call waits for a free slot before it is shed")
+    INTERACTIVE_QUEUE_TIMEOUT_SECONDS: float = Field(default=2.0, description="Queue timeout for interactive methods")
+    MAX_QUEUE: int = Field(default=32, description="Calls waiting per method before new calls are shed immediately")
+    LATENCY_TOLERANCE: float = Field(default=2.0, description="Latency above this multiple of the method's baseline reduces its limit")
+    LATENCY_FLOOR_MS: float = Field(default=250.0, description="Latency below this never counts as overload, whatever the baseline")
+    MIN_LATENCY_SAMPLES: int = Field(default=20, description="Samples a method needs before its latency can signal overload")
+    DECREASE_FACTOR: float = Field(default=0.7, description="Multiplicative limit decrease on overload")
+    LOOP_LAG_THRESHOLD_MS: float = Field(default=200.0, description="Event loop lag that counts as interactive pressure while interactive calls are in flight")
+    PRESSURE_HOLD_SECONDS: float = Field(default=5.0, description="Batch methods stay shed this long after interactive pressure")
+    MAX_RETRY_AFTER_SECONDS: float = Field(default=30.0, description="Upper bound for the retry-after hint")
+
+
 class GRPCSettings(BaseModel):
     """gRPC server configuration"""
     GRPC_MAX_MESSAGE_LENGTH: int = Field(default=4194304, description="Max gRPC message length (4MB)")
@@ -142,14 +232,27 @@ class Settings(BaseSettings):
     SERVER_WORKERS: int = 10
     SERVER_START_RETRIES: int = 3
     SERVER_RETRY_DELAY: int = 2  # seconds
+    SERVER_PROCESSES: int = Field(default=1, description="gRPC worker processes; >1 runs a supervisor that forks workers sharing SERVER_PORT via SO_REUSEPORT")
+    SERVER_PRELOAD_BEFORE_FORK: bool = Field(default=True, description="Load the embedding model in the supervisor before forking so workers share weights copy-on-write")
+    SERVER_DRAIN_GRACE_SECONDS: int = Field(default=10, description="Grace period for in-flight RPCs when a server stops")
+    SERVER_DRAIN_TIMEOUT_SECONDS: int = Field(default=30, description="Time the supervisor waits for workers to drain and clean up before killing them")
+    SERVER_WORKER_MAX_RESTARTS: int = Field(default=5, description="Restarts allowed per crashed worker before the supervisor shuts down")
+    RPC_DEADLINE_MARGIN_SECONDS: float = Field(default=0.5, description="Time reserved for building the response when the caller's remaining deadline is passed to OCR/LLM calls")
+    STARTUP_BACKGROUND_WARMUP: bool = Field(default=True, description="Declare readiness before optional components (LLM probe, OCR) finish warming")
     LOG_LEVEL: str = Field(default="INFO", description="Log level")
     
     # Cache configuration
     CACHE_TTL: int = Field(default=3600, description="Cache TTL in seconds")
     
     # Monitoring
-    PROMETHEUS_PORT: int = Field(default=9090, description="Prometheus metrics port")
+    PROMETHEUS_PORT: int = Field(default=9090, description="Prometheus metrics port (worker N in multi-process mode uses PROMETHEUS_PORT + N)")
     ENABLE_METRICS: bool = Field(default=True, description="Enable Prometheus metrics")
+    TRACING_ENABLED: bool = Field(default=False, description="Enable OpenTelemetry tracing spans (RPCs, PDF ingest pipeline)")
+    TRACING_EXPORTER: str = Field(default="file", description="Span exporter: file (OTLP JSON lines, offline), console (stdout) or otlp (gRPC collector)")
+    TRACING_FILE_PATH: str = Field(default="./logs/traces.jsonl", description="OTLP JSON lines output for the file exporter (worker N writes traces.workerN.jsonl)")
+    TRACING_OTLP_ENDPOINT: str = Field(default="localhost:4317", description="Collector endpoint for the otlp exporter")
+    TRACING_SERVICE_NAME: str = Field(default="bgbg-ai", description="service.name resource attribute")
+    TRACING_SAMPLE_RATIO: float = Field(default=1.0, description="Root span sampling ratio (child spans follow the caller's decision)")
     
     # Sub-configurations
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
@@ -157,6 +260,8 @@ class Settings(BaseSettings):
     vector_db: VectorDBSettings = Field(default_factory=VectorDBSettings)
     chat_history: ChatHistorySettings = Field(default_factory=ChatHistorySettings)
     local_ocr: LocalOCRSettings = Field(default_factory=LocalOCRSettings)
+    ingest: IngestQueueSettings = Field(default_factory=IngestQueueSettings)
+    admission: AdmissionControlSettings = Field(default_factory=AdmissionControlSettings)
     grpc: GRPCSettings = Field(default_factory=GRPCSettings)
     
     class Config:
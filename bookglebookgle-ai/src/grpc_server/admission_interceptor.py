@@ -0,0 +1,410 @@
+"""
+gRPC Admission Control Interceptor for BGBG AI Server
+Per-method adaptive concurrency limits (AIMD on observed latency) with bounded queueing,
+priority-aware load shedding and retry-after hints
+"""
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+import grpc
+from loguru import logger
+
+from src.config.settings import get_settings
+
+try:
+    from prometheus_client import Counter, Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # prometheus_client 미설치 시 통계 dict만 제공
+    PROMETHEUS_AVAILABLE = False
+
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_STANDARD = "standard"
+PRIORITY_BATCH = "batch"
+
+if PROMETHEUS_AVAILABLE:
+    GRPC_SHED_TOTAL = Counter(
+        "bgbg_grpc_server_shed_total",
+        "RPCs rejected with RESOURCE_EXHAUSTED by admission control",
+        ["method", "priority", "reason"]
+    )
+    GRPC_CONCURRENCY_LIMIT = Gauge(
+        "bgbg_grpc_server_concurrency_limit",
+        "Current adaptive concurrency limit per method",
+        ["method"]
+    )
+    GRPC_ADMISSION_QUEUE = Gauge(
+        "bgbg_grpc_server_admission_queue",
+        "RPCs waiting for a concurrency slot",
+        ["method"]
+    )
+
+
+class AdaptiveLimiter:
+    """
+    메서드 하나의 적응형 동시 실행 제한 (AIMD)
+    
+    - 지연 시간이 기준선(EWMA)의 LATENCY_TOLERANCE배 이하이면 limit을 창(window)당 +1 증가
+    - 초과하면 DECREASE_FACTOR배로 감소 (기준선 지연 동안 한 번만)
+    - 샘플이 MIN_LATENCY_SAMPLES 미만이거나 LATENCY_FLOOR_MS 이하인 지연은 과부하로 보지 않음
+      (1ms -> 2.5ms 같은 빠른 RPC의 흔들림 무시)
+    - 슬롯이 없으면 MAX_QUEUE까지 FIFO로 대기, 대기 시간 초과 시 거부
+    - 응답 스트리밍 RPC(채팅 세션 등)는 지속 시간이 부하와 무관하므로 지연 샘플에서 제외
+    """
+    
+    BASELINE_ALPHA = 0.05
+    
+    def __init__(self, method: str, priority: str, max_limit: int):
+        self.config = get_settings().admission
+        self.method = method
+        self.priority = priority
+        self.max_limit = max(max_limit, self.config.MIN_LIMIT)
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self.samples = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        
+        self.stats = {
+            "admitted": 0,
+            "queued": 0,
+            "shed": 0,
+            "decreases": 0
+        }
+    
+    @property
+    def queue_length(self) -> int:
+        return len(self._waiters)
+    
+    def has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit) and not self._waiters
+    
+    async def acquire(self, queue_timeout: float) -> Optional[str]:
+        """
+        실행 슬롯 획득
+        
+        Args:
+            queue_timeout: 슬롯 대기 최대 시간 (0이면 대기 없이 거부)
+        
+        Returns:
+            Optional[str]: 거부 사유 (limit, queue_full, queue_timeout), 획득 시 None
+        """
+        if self.has_capacity():
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            return None
+        if queue_timeout <= 0:
+            return "limit"
+        if len(self._waiters) >= self.config.MAX_QUEUE:
+            return "queue_full"
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats["queued"] += 1
+        self._publish()
+        try:
+            await asyncio.wait_for(waiter, timeout=queue_timeout)
+        except asyncio.TimeoutError:
+            return "queue_timeout"
+        except asyncio.CancelledError:
+            # 호출 측 취소 - 이미 슬롯을 넘겨받았다면 반납
+            if waiter.done() and not waiter.cancelled():
+                self.release(None)
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self._publish()
+        self.stats["admitted"] += 1
+        return None
+    
+    def release(self, latency: Optional[float]):
+        """슬롯 반납 (latency가 있으면 AIMD 갱신)"""
+        self.in_flight -= 1
+        if latency is not None:
+            self._observe(latency)
+        self._wake_waiters()
+        self._publish()
+    
+    def _publish(self):
+        if PROMETHEUS_AVAILABLE:
+            GRPC_CONCURRENCY_LIMIT.labels(self.method).set(int(self.limit))
+            GRPC_ADMISSION_QUEUE.labels(self.method).set(len(self._waiters))
+    
+    def _wake_waiters(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+    
+    def is_latency_spike(self, latency: float) -> bool:
+        """기준선 대비 지연 급증 여부 (충분한 샘플과 절대 하한을 모두 넘어야 함)"""
+        if self.baseline is None or self.samples < self.config.MIN_LATENCY_SAMPLES:
+            return False
+        threshold = max(self.baseline * self.config.LATENCY_TOLERANCE, self.config.LATENCY_FLOOR_MS / 1000)
+        return latency > threshold
+    
+    def _observe(self, latency: float):
+        overloaded = self.is_latency_spike(latency)
+        self.samples += 1
+        if self.baseline is None:
+            self.baseline = latency
+            return
+        self.baseline += self.BASELINE_ALPHA * (latency - self.baseline)
+        if overloaded:
+            self.decrease()
+        elif self.limit < self.max_limit:
+            # 가산 증가: limit개 완료(한 창)마다 +1
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+    
+    def decrease(self) -> bool:
+        """곱셈 감소 (같은 과부하 구간에서 연속 감소 방지)"""
+        now = time.monotonic()
+        if now - self._last_decrease < max(self.baseline or 0.0, 0.1):
+            return False
+        self._last_decrease = now
+        new_limit = max(float(self.config.MIN_LIMIT), self.limit * self.config.DECREASE_FACTOR)
+        if new_limit < self.limit:
+            self.limit = new_limit
+            self.stats["decreases"] += 1
+            self._publish()
+        return True
+    
+    def retry_after(self) -> float:
+        """대기열이 비기까지 예상 시간 (초)"""
+        per_call = self.baseline if self.baseline is not None else 1.0
+        backlog = (len(self._waiters) + 1) / max(int(self.limit), 1)
+        return min(max(per_call * backlog, 0.5), self.config.MAX_RETRY_AFTER_SECONDS)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued_now": len(self._waiters),
+            "samples": self.samples,
+            "baseline_ms": round(self.baseline * 1000, 1) if self.baseline is not None else 0.0
+        }
+
+
+class AdmissionControlInterceptor(grpc.aio.ServerInterceptor):
+    """
+    메서드별 적응형 동시 실행 제한과 우선순위 기반 부하 차단
+    
+    - interactive(채팅/토론) > standard(퀴즈/교정) > batch(PDF 수집) 순으로 보호
+    - interactive 요청이 실제로 진행 중이거나 대기 중일 때만 부하 신호 인정:
+      interactive 대기 발생, 이벤트 루프 지연, interactive 지연 급증 시 PRESSURE_HOLD_SECONDS 동안
+      batch 요청은 대기 없이 즉시 거부되고 batch limit은 곱셈 감소 -> 채팅보다 먼저 차단
+    - interactive 요청이 없을 때의 루프 지연(수집 작업 자체가 만든 지연 등)은 무시
+    - 거부 시 RESOURCE_EXHAUSTED + trailing metadata retry-after(초), grpc-retry-pushback-ms
+    """
+    
+    LAG_PROBE_INTERVAL = 0.1
+    
+    def __init__(self):
+        self.config = get_settings().admission
+        self.interactive_methods = set(self.config.INTERACTIVE_METHODS)
+        self.batch_methods = set(self.config.BATCH_METHODS)
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._pressure_until = 0.0
+        self._loop_lag_ms = 0.0
+        self._lag_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "shed": {PRIORITY_INTERACTIVE: 0, PRIORITY_STANDARD: 0, PRIORITY_BATCH: 0},
+            "pressure_events": 0
+        }
+    
+    def _priority(self, rpc_name: str) -> str:
+        if rpc_name in self.interactive_methods:
+            return PRIORITY_INTERACTIVE
+        if rpc_name in self.batch_methods:
+            return PRIORITY_BATCH
+        return PRIORITY_STANDARD
+    
+    def _limiter(self, method: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(method)
+        if limiter is None:
+            rpc_name = method.rpartition("/")[2]
+            max_limit = self.config.METHOD_LIMITS.get(rpc_name, self.config.DEFAULT_LIMIT)
+            limiter = AdaptiveLimiter(method, self._priority(rpc_name), max_limit)
+            self._limiters[method] = limiter
+        return limiter
+    
+    def _interactive_active(self) -> bool:
+        """진행 중이거나 슬롯을 기다리는 interactive 요청 존재 여부"""
+        return any(
+            limiter.in_flight > 0 or limiter.queue_length > 0
+            for limiter in list(self._limiters.values())
+            if limiter.priority == PRIORITY_INTERACTIVE
+        )
+    
+    @property
+    def under_pressure(self) -> bool:
+        return time.monotonic() < self._pressure_until
+    
+    def _signal_pressure(self, reason: str):
+        """interactive 부하 감지 - batch limit 감소 후 일정 시간 신규 batch 요청 차단"""
+        if not self.under_pressure:
+            self.stats["pressure_events"] += 1
+            logger.warning(f"🚦 Interactive pressure ({reason}) - shedding batch ingest for {self.config.PRESSURE_HOLD_SECONDS:.0f}s")
+        self._pressure_until = time.monotonic() + self.config.PRESSURE_HOLD_SECONDS
+        for limiter in self._limiters.values():
+            if limiter.priority == PRIORITY_BATCH:
+                limiter.decrease()
+    
+    async def _probe_loop_lag(self):
+        """이벤트 루프 지연 측정 (블로킹 작업이 채팅 응답을 늦추는지 확인)"""
+        while True:
+            started_at = time.monotonic()
+            await asyncio.sleep(self.LAG_PROBE_INTERVAL)
+            self._loop_lag_ms = max(0.0, (time.monotonic() - started_at - self.LAG_PROBE_INTERVAL) * 1000)
+            if self._loop_lag_ms > self.config.LOOP_LAG_THRESHOLD_MS and self._interactive_active():
+                self._signal_pressure(f"event loop lag {self._loop_lag_ms:.0f}ms")
+    
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        
+        if self._lag_task is None:
+            self._lag_task = asyncio.create_task(self._probe_loop_lag(), name="admission-loop-lag")
+        
+        method = handler_call_details.method
+        limiter = self._limiter(method)
+        if handler.unary_unary:
+            behavior, factory = handler.unary_unary, grpc.unary_unary_rpc_method_handler
+        elif handler.unary_stream:
+            behavior, factory = handler.unary_stream, grpc.unary_stream_rpc_method_handler
+        elif handler.stream_unary:
+            behavior, factory = handler.stream_unary, grpc.stream_unary_rpc_method_handler
+        else:
+            behavior, factory = handler.stream_stream, grpc.stream_stream_rpc_method_handler
+        
+        if handler.response_streaming:
+            wrapped = self._wrap_streaming(limiter, behavior)
+        else:
+            wrapped = self._wrap_unary(limiter, behavior)
+        
+        return factory(
+            wrapped,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+    
+    async def _admit(self, limiter: AdaptiveLimiter, context) -> None:
+        """
+        슬롯 획득 또는 RESOURCE_EXHAUSTED로 종료
+        
+        Raises:
+            grpc.aio.AbortError: 요청이 차단된 경우 (context.abort)
+        """
+        if limiter.priority == PRIORITY_BATCH and self.under_pressure:
+            reason = "interactive_pressure"
+        else:
+            if limiter.priority == PRIORITY_INTERACTIVE:
+                if not limiter.has_capacity():
+                    self._signal_pressure(f"{limiter.method} queueing")
+                queue_timeout = self.config.INTERACTIVE_QUEUE_TIMEOUT_SECONDS
+            else:
+                queue_timeout = self.config.QUEUE_TIMEOUT_SECONDS
+            reason = await limiter.acquire(queue_timeout)
+            if reason is None:
+                return
+        
+        retry_after = limiter.retry_after()
+        if reason == "interactive_pressure":
+            retry_after = max(retry_after, self._pressure_until - time.monotonic())
+        limiter.stats["shed"] += 1
+        self.stats["shed"][limiter.priority] += 1
+        if PROMETHEUS_AVAILABLE:
+            GRPC_SHED_TOTAL.labels(limiter.method, limiter.priority, reason).inc()
+        logger.warning(f"🚫 Shed {limiter.method} ({limiter.priority}, {reason}) - "
+                       f"limit {int(limiter.limit)}, in flight {limiter.in_flight}, retry after {retry_after:.1f}s")
+        await context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            f"Server overloaded ({reason}), retry after {retry_after:.1f}s",
+            trailing_metadata=(
+                ("retry-after", f"{retry_after:.1f}"),
+                ("grpc-retry-pushback-ms", str(int(retry_after * 1000)))
+            )
+        )
+    
+    def _record_latency(self, limiter: AdaptiveLimiter, latency: float):
+        spike = limiter.priority == PRIORITY_INTERACTIVE and limiter.is_latency_spike(latency)
+        limiter.release(latency)
+        # 완료된 요청 외에 영향을 받는 interactive 요청이 남아 있을 때만 batch 차단
+        if spike and self._interactive_active():
+            self._signal_pressure(f"{limiter.method} latency {latency * 1000:.0f}ms")
+    
+    def _wrap_unary(self, limiter: AdaptiveLimiter, behavior: Callable) -> Callable:
+        async def wrapper(request_or_iterator, context):
+            await self._admit(limiter, context)
+            started_at = time.perf_counter()
+            latency = None
+            try:
+                result = behavior(request_or_iterator, context)
+                if inspect.isawaitable(result):
+                    result = await result
+                latency = time.perf_counter() - started_at
+                return result
+            finally:
+                if latency is None:
+                    # 예외/취소는 지연 샘플에서 제외
+                    limiter.release(None)
+                else:
+                    self._record_latency(limiter, latency)
+        return wrapper
+    
+    def _wrap_streaming(self, limiter: AdaptiveLimiter, behavior: Callable) -> Callable:
+        async def wrapper(request_or_iterator, context):
+            await self._admit(limiter, context)
+            try:
+                result = behavior(request_or_iterator, context)
+                if hasattr(result, "__aiter__"):
+                    async for response in result:
+                        yield response
+                elif inspect.isawaitable(result):
+                    await result
+                else:
+                    for response in result:
+                        yield response
+            finally:
+                limiter.release(None)
+        return wrapper
+    
+    def close(self):
+        """이벤트 루프 지연 측정 중단 (서버 종료 시)"""
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """우선순위별 차단 수와 메서드별 limit/진행 중/대기 현황"""
+        return {
+            "shed": dict(self.stats["shed"]),
+            "pressure_events": self.stats["pressure_events"],
+            "under_pressure": self.under_pressure,
+            "loop_lag_ms": round(self._loop_lag_ms, 1),
+            "methods": {
+                method.rpartition("/")[2]: limiter.get_stats()
+                for method, limiter in list(self._limiters.items())
+            }
+        }
+
+
+def create_admission_interceptors() -> list:
+    """
+    서버에 등록할 admission control 인터셉터 목록
+    
+    Returns:
+        list: admission.ENABLED이면 [AdmissionControlInterceptor], 아니면 빈 목록
+    """
+    if not get_settings().admission.ENABLED:
+        return []
+    return [AdmissionControlInterceptor()]
@@ -2,7 +2,8 @@
 AI Service gRPC Servicer Implementation
 """
 
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, Optional
 import uuid
 import time
 import asyncio
@@ -14,10 +15,14 @@ from loguru import logger
 from .generated import ai_service_pb2, ai_service_pb2_grpc
 
 from src.services.discussion_service import DiscussionService
+from src.services.ingest_job_queue import IngestJob, IngestJobQueue, TERMINAL_STATES
 from src.services.tailscale_ocr_client import TailscaleOCRClient
 from src.services.vector_db import VectorDBManager
 from src.services.meeting_service import MeetingService
+from src.services.startup_graph import StartupGraph
 from src.config.settings import get_settings
+from src.utils.cancellation import cancellable_rpc
+from src.utils.tracing import set_span_attributes, trace_span
 
 
 class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
@@ -38,37 +43,76 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
         self.llm_client = llm_client
         self.quiz_service = quiz_service
         self.proofreading_service = proofreading_service
+        self.startup_graph: Optional[StartupGraph] = None
+        
+        # ProcessPdfStream 비동기 수집 작업 큐 (업로드 즉시 job_id 반환, 워커가 OCR/벡터DB 처리)
+        self.ingest_queue = IngestJobQueue(redis_manager, processor=self._process_ingest_job)
         
         logger.info("AI Servicer initialized with all injected dependencies.")
     
     async def initialize_services(self):
-        """Initialize all services asynchronously"""
+        """
+        Initialize all services asynchronously
+        
+        토론/모임 서비스와 OCR 연결을 동시에 초기화하고, STARTUP_BACKGROUND_WARMUP이면
+        OCR 연결 완료를 기다리지 않고 준비 완료 (연결 전 PDF 요청은 OCR 클라이언트가 거부)
+        """
+        warm_in_background = self.settings.STARTUP_BACKGROUND_WARMUP
+        self.startup_graph = StartupGraph("servicer startup")
+        self.startup_graph.add("discussion_service", self._start_discussion_service)
+        self.startup_graph.add("meeting_service", self._start_meeting_service, depends_on=["discussion_service"])
+        self.startup_graph.add("ingest_queue", self._start_ingest_queue, critical=False)
+        # Tailscale OCR service (EC2에서는 로컬 OCR이 없으므로 PDF 처리에 필요)
+        if self.settings.local_ocr.ENABLED:
+            self.startup_graph.add("ocr_service", self._start_ocr_service, critical=False, background=warm_in_background)
+        else:
+            logger.info("📴 Tailscale OCR disabled (LOCAL_OCR__ENABLED=false) - skipping OCR connection")
+        
         try:
-            # Initialize discussion service with vector DB
-            await self.discussion_service.initialize_manager(self.vector_db_manager)
-            
-            # Initialize meeting service with vector DB, discussion service, and other services
-            await self.meeting_service.initialize(
-                self.vector_db_manager, 
-                self.discussion_service,
-                quiz_service=self.quiz_service,
-                proofreading_service=self.proofreading_service
-            )
-            
-            # Initialize Tailscale OCR service (critical for EC2)
-            ocr_success = await self.initialize_ocr_service()
-            if not ocr_success:
-                logger.error("❌ Tailscale OCR service initialization failed - EC2 cannot start without local OCR")
-                raise Exception("EC2 requires Tailscale OCR service - server cannot start without it")
-            
-            # Log service availability status
-            self._log_service_status()
-            
-            logger.info("✅ All AI services initialized successfully")
-            return ocr_success
+            await self.startup_graph.run()
         except Exception as e:
             logger.error(f"❌ Service initialization error: {e}")
             return False
+        
+        if self.startup_graph.warming_components():
+            logger.info("🔥 OCR connection warming in background - accepting requests")
+            return True
+        
+        # Log service availability status
+        self._log_service_status()
+        
+        ocr_success = self.startup_graph.results.get("ocr_service") is True
+        if self.settings.local_ocr.ENABLED and not ocr_success:
+            logger.error("❌ Tailscale OCR service initialization failed - PDF processing unavailable")
+            return False
+        
+        logger.info("✅ All AI services initialized successfully")
+        return True
+    
+    async def _start_discussion_service(self, deps):
+        # Initialize discussion service with vector DB
+        await self.discussion_service.initialize_manager(self.vector_db_manager, redis_manager=self.redis_manager)
+        return self.discussion_service
+    
+    async def _start_meeting_service(self, deps):
+        # Initialize meeting service with vector DB, discussion service, and other services
+        await self.meeting_service.initialize(
+            self.vector_db_manager, 
+            deps["discussion_service"],
+            quiz_service=self.quiz_service,
+            proofreading_service=self.proofreading_service
+        )
+        return self.meeting_service
+    
+    async def _start_ingest_queue(self, deps):
+        return await self.ingest_queue.start()
+    
+    async def _start_ocr_service(self, deps):
+        ocr_success = await self.initialize_ocr_service()
+        if self.startup_graph.ready_ms is not None:
+            # 준비 완료 후 웜업이 끝난 경우 최종 상태 로깅
+            self._log_service_status()
+        return ocr_success
     
     def _log_service_status(self):
         """Log the status of all injected services"""
@@ -108,7 +152,22 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             logger.error(f"❌ Tailscale OCR client initialization error: {e}")
             logger.error("🚨 EC2 server requires Tailscale OCR service to be running")
             return False
-    
+
+    async def _on_document_stored(self, meeting_id: str, document_id: str):
+        """문서 저장 완료 후 후속 처리 - 토론 주제 캐시 무효화 및 퀴즈 사전 생성 예약"""
+        try:
+            await self.discussion_service.invalidate_document_topics(meeting_id, document_id)
+        except Exception as e:
+            logger.warning(f"Topic cache invalidation failed for document {document_id}: {e}")
+
+        if not self.quiz_service:
+            return
+        try:
+            await self.quiz_service.schedule_quiz_bank_build(meeting_id, document_id)
+        except Exception as e:
+            # 퀴즈 사전 생성 실패는 PDF 처리 결과에 영향을 주지 않음
+            logger.warning(f"Quiz bank scheduling failed for document {document_id}: {e}")
+
     # 퀴즈 생성과 교정 기능은 나중에 구현 예정으로 제거
     
     async def InitializeDiscussion(self, request, context):
@@ -130,7 +189,8 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             )
 
             if result["success"]:
-                logger.info(f"✅ Mobile discussion started for session: {request.session_id}")
+                logger.info(f"✅ Mobile discussion started for session: {request.session_id} "
+                           f"(topics {'warm' if result.get('topics_cached') else 'cold'}, {result.get('latency_ms', 0):.1f}ms)")
                 response = ai_service_pb2.DiscussionInitResponse(
                     success=True, 
                     message=result.get("message", "Discussion started successfully")
@@ -155,20 +215,54 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             return None
     
     async def ProcessChatMessage(self, request_iterator, context):
-        """모바일 앱 채팅 메시지 처리 - 채팅 기록 컨텍스트 지원"""
+        """모바일 앱 채팅 메시지 처리 - 세션의 모든 스트림에 AI 응답 브로드캐스트"""
         session_id = None
+        subscriber = None
+        reader_task = None
         try:
             first_request = await anext(request_iterator)
             session_id = first_request.discussion_session_id
             
             logger.info(f"🗨️ Starting chat stream for session: {session_id}")
             await self.discussion_service.register_stream(session_id, context)
+            subscriber = self.discussion_service.broadcast_hub.subscribe(session_id)
+            
+            # 요청 수신은 별도 태스크 - 이 스트림은 자신/다른 참여자 메시지에 대한 AI 응답을 모두 수신
+            reader_task = asyncio.create_task(
+                self._read_chat_requests(first_request, request_iterator, subscriber)
+            )
+            
+            async for payload in subscriber:
+                yield self._chat_stream_response(payload)
+            
+            if subscriber.dropped:
+                logger.warning(f"Chat stream for session {session_id} dropped as a slow consumer")
 
-            async def message_generator():
-                yield first_request
-                async for req in request_iterator:
-                    yield req
+        except (grpc.aio.AioRpcError, asyncio.CancelledError) as e:
+            logger.info(f"Client disconnected from session {session_id}: {e})")
+        except StopAsyncIteration:
+            logger.info(f"Client stream finished for session {session_id}")
+        except Exception as e:
+            logger.error(f"Chat stream failed for session {session_id}: {e}")
+            if not context.done():
+                await context.abort(grpc.StatusCode.INTERNAL, f"Chat error: {str(e)}")
+        finally:
+            if reader_task and not reader_task.done():
+                reader_task.cancel()
+            if subscriber:
+                self.discussion_service.broadcast_hub.unsubscribe(subscriber)
+            if session_id:
+                await self.discussion_service.unregister_stream(session_id, context)
+                logger.info(f"Cleaned up stream for session {session_id}")
+    
+    async def _read_chat_requests(self, first_request, request_iterator, subscriber):
+        """채팅 스트림 요청 처리 - 응답은 브로드캐스트 허브를 통해 전달"""
+        async def message_generator():
+            yield first_request
+            async for req in request_iterator:
+                yield req
 
+        try:
             async for request in message_generator():
                 try:
                     # ChatMessageRequest 필드 사용
@@ -191,52 +285,44 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
                     
                     logger.debug(f"Processing message from {sender.nickname}: {message_text[:50]}...")
                     
-                    # Discussion Service를 통한 스트리밍 응답
-                    async for response_chunk in self.discussion_service.process_bookclub_chat_message_stream(
+                    # Discussion Service를 통한 스트리밍 응답 (AI 응답은 세션 전체, 안내는 보낸 사람에게)
+                    await self.discussion_service.broadcast_chat_message(
                         meeting_id=meeting_id,
                         session_id=current_session_id,
-                        message_data=message_data
-                    ):
-                        if response_chunk:  # 빈 청크 필터링
-                            yield ai_service_pb2.ChatMessageResponse(
-                                success=True,
-                                ai_response=response_chunk,
-                                message="AI response chunk",
-                                suggested_topics=[],
-                                requires_moderation=False,
-                                context_messages_used=3,  # 기본값
-                                chat_history_enabled=True,
-                                recent_context=""
-                            )
+                        message_data=message_data,
+                        subscriber=subscriber
+                    )
                     
                     logger.debug(f"✅ Message processed for session {current_session_id}")
                     
                 except Exception as msg_error:
-                    logger.error(f"Failed to process individual message in session {session_id}: {msg_error}")
+                    logger.error(f"Failed to process individual message in session {subscriber.session_id}: {msg_error}")
                     # 개별 메시지 처리 실패 시에도 스트림 유지
-                    yield ai_service_pb2.ChatMessageResponse(
-                        success=False,
-                        message=f"메시지 처리 중 오류가 발생했습니다: {str(msg_error)}",
-                        ai_response="죄송합니다. 메시지 처리 중 오류가 발생했습니다.",
-                        suggested_topics=[],
-                        requires_moderation=False,
-                        context_messages_used=0,
-                        chat_history_enabled=True,
-                        recent_context=""
-                    )
-
-        except (grpc.aio.AioRpcError, asyncio.CancelledError) as e:
-            logger.info(f"Client disconnected from session {session_id}: {e})")
-        except StopAsyncIteration:
-            logger.info(f"Client stream finished for session {session_id}")
-        except Exception as e:
-            logger.error(f"Chat stream failed for session {session_id}: {e}")
-            if not context.done():
-                await context.abort(grpc.StatusCode.INTERNAL, f"Chat error: {str(e)}")
+                    self.discussion_service.broadcast_hub.send(subscriber, {
+                        "success": False,
+                        "message": f"메시지 처리 중 오류가 발생했습니다: {str(msg_error)}",
+                        "ai_response": "죄송합니다. 메시지 처리 중 오류가 발생했습니다.",
+                        "context_messages_used": 0
+                    })
+        except grpc.aio.AioRpcError as e:
+            logger.info(f"Client request stream closed for session {subscriber.session_id}: {e}")
         finally:
-            if session_id:
-                await self.discussion_service.unregister_stream(session_id, context)
-                logger.info(f"Cleaned up stream for session {session_id}")
+            # 클라이언트 입력 종료 - 대기 중인 응답을 보낸 뒤 스트림 종료
+            subscriber.close(drain=True)
+    
+    def _chat_stream_response(self, payload: Dict[str, Any]):
+        """브로드캐스트 payload -> ChatMessageResponse"""
+        fields = {
+            "success": True,
+            "message": "AI response chunk",
+            "suggested_topics": [],
+            "requires_moderation": False,
+            "context_messages_used": 3,  # 기본값
+            "chat_history_enabled": True,
+            "recent_context": ""
+        }
+        fields.update(payload)
+        return ai_service_pb2.ChatMessageResponse(**fields)
     
     async def EndDiscussion(self, request, context):
         """모바일 앱 토론 종료 - 간소화된 버전"""
@@ -319,9 +405,9 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             logger.debug(f"📜 Chat history requested for session: {request.session_id}")
 
             session_id = request.session_id
-            limit = getattr(request, 'limit', 10)
-            since_timestamp = getattr(request, 'since_timestamp', None)
-            user_id = getattr(request, 'user_id', None)
+            limit = request.limit if request.HasField('limit') and request.limit > 0 else 10
+            since = datetime.utcfromtimestamp(request.since_timestamp) if request.HasField('since_timestamp') else None
+            user_id = request.user_id if request.HasField('user_id') else None
 
             if not session_id:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
@@ -329,24 +415,16 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
                 return None
 
             try:
-                # 채팅 기록 매니저에서 메시지 조회
-                if user_id:
-                    # 특정 사용자의 메시지만 조회
-                    messages = await self.discussion_service.chat_history_manager.get_user_messages(
-                        session_id, user_id, limit
-                    )
-                else:
-                    # 최근 메시지 조회
-                    messages = await self.discussion_service.chat_history_manager.get_recent_messages(
-                        session_id, limit
-                    )
-
-                # since_timestamp 필터링
-                if since_timestamp:
-                    messages = [
-                        msg for msg in messages 
-                        if msg.timestamp.timestamp() > since_timestamp
-                    ]
+                # 커서 페이지 조회 (since/user_id 필터는 저장소에서 적용)
+                page = await self.discussion_service.chat_history_manager.get_message_page(
+                    session_id,
+                    limit,
+                    before=request.before_cursor if request.HasField('before_cursor') else None,
+                    after=request.after_cursor if request.HasField('after_cursor') else None,
+                    since=since,
+                    user_id=user_id
+                )
+                messages = page["messages"]
 
                 # 응답 메시지 생성
                 response_messages = []
@@ -375,7 +453,9 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
                     message="Chat history retrieved successfully",
                     messages=response_messages,
                     total_count=len(response_messages),
-                    has_more=len(response_messages) >= limit
+                    has_more=page["has_more"],
+                    next_cursor=page["next_cursor"],
+                    latest_cursor=page["latest_cursor"]
                 )
 
             except Exception as e:
@@ -459,6 +539,7 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             
     # 사용자 분석 기능은 모바일 앱에서 불필요하므로 제거
 
+    @cancellable_rpc("GenerateQuiz")
     async def GenerateQuiz(self, request, context):
         """Generate quiz based on progress percentage (50% or 100%)"""
         try:
@@ -558,6 +639,7 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             context.set_details(f"Internal error: {str(e)}")
             return None
 
+    @cancellable_rpc("ProofreadText")
     async def ProofreadText(self, request, context):
         """Proofread and correct text for grammar and context"""
         try:
@@ -625,6 +707,7 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             context.set_details(f"Internal error: {str(e)}")
             return None
     
+    @cancellable_rpc("ProcessPdf")
     async def ProcessPdf(self, request_iterator, context):
         """Process PDF stream, perform OCR, and store results in VectorDB automatically"""
         document_id = None
@@ -634,19 +717,25 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
         pdf_data_chunks = []
 
         try:
-            async for request in request_iterator:
-                if request.HasField("info"):
-                    # First message should contain PdfInfo
-                    document_id = request.info.document_id or str(uuid.uuid4())
-                    file_name = request.info.file_name
-                    meeting_id = request.info.meeting_id  # 직접 필드에서 가져오기
-                    metadata = dict(request.info.metadata)
-                    logger.info(f"Received PDF info for document: {document_id}, file: {file_name}, meeting: {meeting_id}")
-                elif request.HasField("chunk"):
-                    # Subsequent messages contain PDF data chunks
-                    pdf_data_chunks.append(request.chunk)
-                else:
-                    logger.warning("Received unknown message type in ProcessPdf stream.")
+            # 업로드 스트림 수신 (클라이언트 전송 속도/청크 수 확인용)
+            with trace_span("pdf.upload") as upload_span:
+                async for request in request_iterator:
+                    if request.HasField("info"):
+                        # First message should contain PdfInfo
+                        document_id = request.info.document_id or str(uuid.uuid4())
+                        file_name = request.info.file_name
+                        meeting_id = request.info.meeting_id  # 직접 필드에서 가져오기
+                        metadata = dict(request.info.metadata)
+                        logger.info(f"Received PDF info for document: {document_id}, file: {file_name}, meeting: {meeting_id}")
+                    elif request.HasField("chunk"):
+                        # Subsequent messages contain PDF data chunks
+                        pdf_data_chunks.append(request.chunk)
+                    else:
+                        logger.warning("Received unknown message type in ProcessPdf stream.")
+                upload_span.set_attributes({
+                    "pdf.upload_chunks": len(pdf_data_chunks),
+                    "pdf.bytes": sum(len(chunk) for chunk in pdf_data_chunks)
+                })
 
             if not document_id:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
@@ -666,6 +755,7 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             full_pdf_data = b"".join(pdf_data_chunks)
 
             logger.info(f"📄 Processing PDF with response for meeting {meeting_id}, document: {document_id}")
+            set_span_attributes({"document.id": document_id, "meeting.id": meeting_id, "pdf.bytes": len(full_pdf_data)})
 
             # OCR 처리
             ocr_result = await self.ocr_service.process_pdf_stream(full_pdf_data, document_id)
@@ -679,6 +769,7 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             full_text = ocr_result.get("full_text", "")
             page_texts = ocr_result.get("page_texts", [])
             total_pages = ocr_result.get("total_pages", 0)
+            set_span_attributes({"pdf.page_count": total_pages, "ocr.block_count": len(ocr_result.get("ocr_blocks", []))})
             
             # 벡터DB에 자동 저장 (meeting_id별로 격리)
             try:
@@ -693,7 +784,9 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
                         **metadata
                     }
                 )
+                set_span_attributes({"vector_db.chunk_count": len(chunk_ids)})
                 logger.info(f"✅ PDF processed and stored in VectorDB: {len(chunk_ids)} chunks created for meeting {meeting_id}")
+                await self._on_document_stored(meeting_id, document_id)
             except Exception as e:
                 logger.error(f"Failed to store PDF in vector DB: {e}")
                 context.set_code(grpc.StatusCode.INTERNAL)
@@ -729,6 +822,7 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
                 except (ValueError, TypeError, AttributeError) as e:
                     logger.warning(f"Failed to convert OCRBlock data: {e}, block: {ocr_block}")
                     continue
+            set_span_attributes({"response.text_block_count": len(response_text_blocks)})
 
             return ai_service_pb2.ProcessPdfResponse(
                 success=True,
@@ -744,8 +838,9 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
             context.set_details(f"Internal server error: {str(e)}")
             return ai_service_pb2.ProcessPdfResponse(success=False, message=f"Internal error: {str(e)}")
 
+    @cancellable_rpc("ProcessPdfStream")
     async def ProcessPdfStream(self, request_iterator, context):
-        """Process PDF stream with fire-and-forget approach (no response data)"""
+        """Receive PDF stream and queue an async ingest job (OCR + VectorDB), returning the job id immediately"""
         document_id = None
         file_name = None
         metadata = {}
@@ -753,85 +848,155 @@ class AIServicer(ai_service_pb2_grpc.AIServiceServicer):
         pdf_data_chunks = []
 
         try:
-            async for request in request_iterator:
-                if request.HasField("info"):
-                    # First message should contain PdfInfo
-                    document_id = request.info.document_id
-                    file_name = request.info.file_name
-                    meeting_id = request.info.meeting_id
-                    metadata = dict(request.info.metadata)
-                    logger.info(f"Received PDF info for fire-and-forget processing: {document_id}, file: {file_name}, meeting: {meeting_id}")
-                elif request.HasField("chunk"):
-                    # Subsequent messages contain PDF data chunks
-                    pdf_data_chunks.append(request.chunk)
-                else:
-                    logger.warning("Received unknown message type in ProcessPdfStream stream.")
+            # 업로드 스트림 수신 (클라이언트 전송 속도/청크 수 확인용)
+            with trace_span("pdf.upload") as upload_span:
+                async for request in request_iterator:
+                    if request.HasField("info"):
+                        # First message should contain PdfInfo
+                        document_id = request.info.document_id
+                        file_name = request.info.file_name
+                        meeting_id = request.info.meeting_id
+                        metadata = dict(request.info.metadata)
+                        logger.info(f"Received PDF info for async ingest: {document_id}, file: {file_name}, meeting: {meeting_id}")
+                    elif request.HasField("chunk"):
+                        # Subsequent messages contain PDF data chunks
+                        pdf_data_chunks.append(request.chunk)
+                    else:
+                        logger.warning("Received unknown message type in ProcessPdfStream stream.")
+                upload_span.set_attributes({
+                    "pdf.upload_chunks": len(pdf_data_chunks),
+                    "pdf.bytes": sum(len(chunk) for chunk in pdf_data_chunks)
+                })
 
             if not document_id:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                 context.set_details("Document ID not provided in PdfInfo.")
-                return
+                return ai_service_pb2.IngestJobAccepted(success=False, message="Document ID missing.")
 
             if not pdf_data_chunks:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                 context.set_details("No PDF data chunks received.")
-                return
+                return ai_service_pb2.IngestJobAccepted(success=False, message="No PDF data.", document_id=document_id)
 
             if not meeting_id:
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                 context.set_details("meeting_id is required.")
-                return
+                return ai_service_pb2.IngestJobAccepted(success=False, message="meeting_id missing.", document_id=document_id)
 
             full_pdf_data = b"".join(pdf_data_chunks)
+            set_span_attributes({"document.id": document_id, "meeting.id": meeting_id, "pdf.bytes": len(full_pdf_data)})
 
-            logger.info(f"📄 Processing PDF fire-and-forget for meeting {meeting_id}, document: {document_id}")
-
-            # OCR 처리
-            ocr_result = await self.ocr_service.process_pdf_stream(full_pdf_data, document_id)
-
-            if not ocr_result["success"]:
-                logger.error(f"OCR processing failed for {document_id}: {ocr_result.get('error', 'Unknown error')}")
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(f"OCR processing failed: {ocr_result.get('error', 'Unknown error')}")
-                return
-
-            # OCR 결과 추출 (응답용 데이터는 생성하지 않음)
-            full_text = ocr_result.get("full_text", "")
-            total_pages = ocr_result.get("total_pages", 0)
-            
-            # 벡터DB에 자동 저장 (meeting_id별로 격리)
-            try:
-                chunk_ids = await self.vector_db_manager.process_bookclub_document(
-                    meeting_id=meeting_id,
-                    document_id=document_id,
-                    text=full_text,
-                    metadata={
-                        "file_name": file_name,
-                        "total_pages": total_pages,
-                        "processing_type": "ocr_stream",
-                        **metadata
-                    }
-                )
-                logger.info(f"✅ PDF processed and stored in VectorDB (fire-and-forget): {len(chunk_ids)} chunks created for meeting {meeting_id}")
-            except Exception as e:
-                logger.error(f"Failed to store PDF in vector DB (fire-and-forget): {e}")
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(f"Failed to store in vector DB: {str(e)}")
-                return
-
-            # Fire-and-forget: 응답 데이터 생성하지 않고 Empty 반환
-            from google.protobuf.empty_pb2 import Empty
-            return Empty()
+            result = await self.ingest_queue.submit(
+                document_id=document_id,
+                meeting_id=meeting_id,
+                pdf_data=full_pdf_data,
+                file_name=file_name,
+                metadata=metadata
+            )
+            if not result["success"]:
+                # 대기열이 가득 찬 경우 호출 측이 나중에 재시도하도록 RESOURCE_EXHAUSTED
+                code = grpc.StatusCode.RESOURCE_EXHAUSTED if result.get("queue_full") else grpc.StatusCode.UNAVAILABLE
+                context.set_code(code)
+                context.set_details(result["error"])
+                return ai_service_pb2.IngestJobAccepted(success=False, message=result["error"], document_id=document_id)
+
+            job = result["job"]
+            set_span_attributes({"ingest.job_id": job.job_id, "ingest.queue_position": result["queue_position"]})
+            return ai_service_pb2.IngestJobAccepted(
+                success=True,
+                message="PDF accepted for processing",
+                job_id=job.job_id,
+                document_id=document_id,
+                queue_position=result["queue_position"]
+            )
 
         except Exception as e:
             logger.error(f"Error in ProcessPdfStream RPC for document {document_id}: {e}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Internal server error: {str(e)}")
-            return
+            return ai_service_pb2.IngestJobAccepted(success=False, message=f"Internal error: {str(e)}")
+
+    async def _process_ingest_job(self, job: IngestJob, pdf_data: bytes) -> Dict[str, Any]:
+        """수집 작업 처리 - OCR 후 벡터DB 저장 (IngestJobQueue 워커에서 호출)"""
+        job.update(stage="ocr")
+        ocr_result = await self.ocr_service.process_pdf_stream(pdf_data, job.document_id)
+        if not ocr_result["success"]:
+            return {"success": False, "error": f"OCR processing failed: {ocr_result.get('error', 'Unknown error')}"}
+
+        total_pages = ocr_result.get("total_pages", 0)
+        job.update(stage="indexing", total_pages=total_pages or job.total_pages)
+        chunk_ids = await self.vector_db_manager.process_bookclub_document(
+            meeting_id=job.meeting_id,
+            document_id=job.document_id,
+            text=ocr_result.get("full_text", ""),
+            metadata={
+                "file_name": job.file_name,
+                "total_pages": total_pages,
+                "processing_type": "ocr_stream",
+                **job.metadata
+            }
+        )
+        logger.info(f"✅ PDF processed and stored in VectorDB (ingest job {job.job_id}): {len(chunk_ids)} chunks created for meeting {job.meeting_id}")
+        await self._on_document_stored(job.meeting_id, job.document_id)
+        return {"success": True, "chunk_count": len(chunk_ids), "total_pages": total_pages}
+
+    async def _ingest_job_status(self, job: IngestJob) -> Any:
+        return ai_service_pb2.IngestJobStatus(
+            success=True,
+            message="ok",
+            job_id=job.job_id,
+            document_id=job.document_id,
+            meeting_id=job.meeting_id,
+            state=job.state,
+            stage=job.stage,
+            pages_done=job.pages_done,
+            total_pages=job.total_pages,
+            chunk_count=job.chunk_count,
+            error=job.error,
+            created_at=int(job.created_at),
+            updated_at=int(job.updated_at),
+            queue_position=await self.ingest_queue.get_queue_position(job)
+        )
+
+    async def GetIngestJobStatus(self, request, context):
+        """Return the current state and per-page progress of an ingest job"""
+        try:
+            job = await self.ingest_queue.get_job(request.job_id)
+            if job is None:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Ingest job not found: {request.job_id}")
+                return ai_service_pb2.IngestJobStatus(success=False, message="Job not found", job_id=request.job_id)
+            return await self._ingest_job_status(job)
+        except Exception as e:
+            logger.error(f"Error in GetIngestJobStatus RPC for job {request.job_id}: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Internal server error: {str(e)}")
+            return ai_service_pb2.IngestJobStatus(success=False, message=f"Internal error: {str(e)}", job_id=request.job_id)
+
+    async def WatchIngestJob(self, request, context):
+        """Stream ingest job status whenever progress changes, until the job completes or fails"""
+        job = await self.ingest_queue.get_job(request.job_id)
+        if job is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"Ingest job not found: {request.job_id}")
+
+        last_status = None
+        while True:
+            status = await self._ingest_job_status(job)
+            if status != last_status:
+                last_status = status
+                yield status
+            if job.state in TERMINAL_STATES:
+                return
+            await asyncio.sleep(self.settings.ingest.WATCH_INTERVAL_SECONDS)
+            job = await self.ingest_queue.get_job(request.job_id)
+            if job is None:
+                # TTL 만료/메모리 저장소 재시작 등으로 사라진 작업 - 마지막 상태로 계속 폴링하지 않음
+                await context.abort(grpc.StatusCode.NOT_FOUND, f"Ingest job no longer available: {request.job_id}")
 
     async def cleanup(self):
         """Clean up resources when shutting down"""
         try:
+            await self.ingest_queue.stop()
             if hasattr(self, 'discussion_service'):
                 await self.discussion_service.cleanup()
                 logger.info("DiscussionService cleaned up")
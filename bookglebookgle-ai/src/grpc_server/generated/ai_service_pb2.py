@@ -12,10 +12,9 @@ from google.protobuf.internal import builder as _builder
 _sym_db = _symbol_database.Default()
 
 
-from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61i_service.proto\x12\x07\x62gbg.ai\x1a\x1bgoogle/protobuf/empty.proto\"O\n\x0bTextContent\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x10\n\x08language\x18\x02 \x01(\t\x12\x14\n\x07\x63ontext\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_context\")\n\x04User\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08nickname\x18\x02 \x01(\t\"S\n\x0bQuizRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x12\n\nmeeting_id\x18\x02 \x01(\t\x12\x1b\n\x13progress_percentage\x18\x03 \x01(\x05\"P\n\x08Question\x12\x15\n\rquestion_text\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x03(\t\x12\x1c\n\x14\x63orrect_answer_index\x18\x03 \x01(\x05\"g\n\x0cQuizResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\tquestions\x18\x03 \x03(\x0b\x32\x11.bgbg.ai.Question\x12\x0f\n\x07quiz_id\x18\x04 \x01(\t\"\x88\x01\n\x10ProofreadRequest\x12+\n\roriginal_text\x18\x01 \x01(\x0b\x32\x14.bgbg.ai.TextContent\x12*\n\x0c\x63ontext_text\x18\x02 \x01(\x0b\x32\x14.bgbg.ai.TextContent\x12\x1b\n\x04user\x18\x03 \x01(\x0b\x32\r.bgbg.ai.User\"\x91\x01\n\x0eTextCorrection\x12\x10\n\x08original\x18\x01 \x01(\t\x12\x11\n\tcorrected\x18\x02 \x01(\t\x12\x17\n\x0f\x63orrection_type\x18\x03 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\x12\x16\n\x0estart_position\x18\x05 \x01(\x05\x12\x14\n\x0c\x65nd_position\x18\x06 \x01(\x05\"\x95\x01\n\x11ProofreadResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x16\n\x0e\x63orrected_text\x18\x03 \x01(\t\x12,\n\x0b\x63orrections\x18\x04 \x03(\x0b\x32\x17.bgbg.ai.TextCorrection\x12\x18\n\x10\x63onfidence_score\x18\x05 \x01(\x01\"\x8d\x01\n\x15\x44iscussionInitRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x12\n\nmeeting_id\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12#\n\x0cparticipants\x18\x04 \x03(\x0b\x32\r.bgbg.ai.User\x12\x12\n\nstarted_at\x18\x05 \x01(\x03\"p\n\x16\x44iscussionInitResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x19\n\x11\x64iscussion_topics\x18\x03 \x03(\t\x12\x19\n\x11recommended_topic\x18\x04 \x01(\t\"P\n\x14\x44iscussionEndRequest\x12\x12\n\nmeeting_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x10\n\x08\x65nded_at\x18\x03 \x01(\x03\"9\n\x15\x44iscussionEndResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"w\n\x11MeetingEndRequest\x12\x12\n\nmeeting_id\x18\x01 \x01(\t\x12\x14\n\x0cmeeting_type\x18\x02 \x01(\t\x12\x10\n\x08\x65nded_at\x18\x03 \x01(\x03\x12\x17\n\nsession_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\r\n\x0b_session_id\"L\n\x12MeetingEndResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x14\n\x0cmeeting_type\x18\x03 \x01(\t\"\x83\x02\n\x12\x43hatHistoryMessage\x12\x12\n\nmessage_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x1d\n\x06sender\x18\x03 \x01(\x0b\x32\r.bgbg.ai.User\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\x03\x12\x14\n\x0cmessage_type\x18\x06 \x01(\t\x12;\n\x08metadata\x18\x07 \x03(\x0b\x32).bgbg.ai.ChatHistoryMessage.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x9d\x01\n\x15GetChatHistoryRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\x05limit\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x1c\n\x0fsince_timestamp\x18\x03 \x01(\x03H\x01\x88\x01\x01\x12\x14\n\x07user_id\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x08\n\x06_limitB\x12\n\x10_since_timestampB\n\n\x08_user_id\"\x90\x01\n\x16GetChatHistoryResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12-\n\x08messages\x18\x03 \x03(\x0b\x32\x1b.bgbg.ai.ChatHistoryMessage\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\x12\x10\n\x08has_more\x18\x05 \x01(\x08\"-\n\x17\x43hatSessionStatsRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"~\n\x10ParticipantStats\x12\"\n\x0bparticipant\x18\x01 \x01(\x0b\x32\r.bgbg.ai.User\x12\x15\n\rmessage_count\x18\x02 \x01(\x05\x12\x15\n\rlast_activity\x18\x03 \x01(\x03\x12\x18\n\x10\x65ngagement_level\x18\x04 \x01(\x01\"\x90\x02\n\x18\x43hatSessionStatsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12\x16\n\x0etotal_messages\x18\x04 \x01(\x05\x12\x1a\n\x12total_participants\x18\x05 \x01(\x05\x12\x34\n\x11participant_stats\x18\x06 \x03(\x0b\x32\x19.bgbg.ai.ParticipantStats\x12\x1a\n\x12session_start_time\x18\x07 \x01(\x03\x12\x1a\n\x12last_activity_time\x18\x08 \x01(\x03\x12\x1c\n\x14\x63hat_history_enabled\x18\t \x01(\x08\"\x98\x02\n\x12\x43hatMessageRequest\x12\x1d\n\x15\x64iscussion_session_id\x18\x01 \x01(\t\x12\x1d\n\x06sender\x18\x02 \x01(\x0b\x32\r.bgbg.ai.User\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12\x1d\n\x10use_chat_context\x18\x05 \x01(\x08H\x00\x88\x01\x01\x12 \n\x13\x63ontext_window_size\x18\x06 \x01(\x05H\x01\x88\x01\x01\x12\x1d\n\x10store_in_history\x18\x07 \x01(\x08H\x02\x88\x01\x01\x42\x13\n\x11_use_chat_contextB\x16\n\x14_context_window_sizeB\x13\n\x11_store_in_history\"\xc7\x02\n\x13\x43hatMessageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x0b\x61i_response\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x10suggested_topics\x18\x04 \x03(\t\x12\x1b\n\x13requires_moderation\x18\x05 \x01(\x08\x12\"\n\x15\x63ontext_messages_used\x18\x06 \x01(\x05H\x01\x88\x01\x01\x12!\n\x14\x63hat_history_enabled\x18\x07 \x01(\x08H\x02\x88\x01\x01\x12\x33\n\x0erecent_context\x18\x08 \x03(\x0b\x32\x1b.bgbg.ai.ChatHistoryMessageB\x0e\n\x0c_ai_responseB\x18\n\x16_context_messages_usedB\x17\n\x15_chat_history_enabled\"N\n\x11ProcessPdfRequest\x12 \n\x04info\x18\x01 \x01(\x0b\x32\x10.bgbg.ai.PdfInfoH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"\xa8\x01\n\x07PdfInfo\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x12\n\nmeeting_id\x18\x03 \x01(\t\x12\x30\n\x08metadata\x18\x04 \x03(\x0b\x32\x1e.bgbg.ai.PdfInfo.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x86\x01\n\tTextBlock\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x13\n\x0bpage_number\x18\x02 \x01(\x05\x12\n\n\x02x0\x18\x03 \x01(\x01\x12\n\n\x02y0\x18\x04 \x01(\x01\x12\n\n\x02x1\x18\x05 \x01(\x01\x12\n\n\x02y1\x18\x06 \x01(\x01\x12\x12\n\nblock_type\x18\x07 \x01(\t\x12\x12\n\nconfidence\x18\x08 \x01(\x01\"\x89\x01\n\x12ProcessPdfResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x03 \x01(\t\x12\x13\n\x0btotal_pages\x18\x04 \x01(\x05\x12\'\n\x0btext_blocks\x18\x05 \x03(\x0b\x32\x12.bgbg.ai.TextBlock\"Q\n\x0c\x45rrorDetails\x12\x12\n\nerror_code\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x16\n\x0e\x65rror_category\x18\x03 \x01(\t2\x97\x06\n\tAIService\x12;\n\x0cGenerateQuiz\x12\x14.bgbg.ai.QuizRequest\x1a\x15.bgbg.ai.QuizResponse\x12\x46\n\rProofreadText\x12\x19.bgbg.ai.ProofreadRequest\x1a\x1a.bgbg.ai.ProofreadResponse\x12W\n\x14InitializeDiscussion\x12\x1e.bgbg.ai.DiscussionInitRequest\x1a\x1f.bgbg.ai.DiscussionInitResponse\x12S\n\x12ProcessChatMessage\x12\x1b.bgbg.ai.ChatMessageRequest\x1a\x1c.bgbg.ai.ChatMessageResponse(\x01\x30\x01\x12N\n\rEndDiscussion\x12\x1d.bgbg.ai.DiscussionEndRequest\x1a\x1e.bgbg.ai.DiscussionEndResponse\x12\x45\n\nEndMeeting\x12\x1a.bgbg.ai.MeetingEndRequest\x1a\x1b.bgbg.ai.MeetingEndResponse\x12Q\n\x0eGetChatHistory\x12\x1e.bgbg.ai.GetChatHistoryRequest\x1a\x1f.bgbg.ai.GetChatHistoryResponse\x12Z\n\x13GetChatSessionStats\x12 .bgbg.ai.ChatSessionStatsRequest\x1a!.bgbg.ai.ChatSessionStatsResponse\x12G\n\nProcessPdf\x12\x1a.bgbg.ai.ProcessPdfRequest\x1a\x1b.bgbg.ai.ProcessPdfResponse(\x01\x12H\n\x10ProcessPdfStream\x12\x1a.bgbg.ai.ProcessPdfRequest\x1a\x16.google.protobuf.Empty(\x01\x42\"\n\x10\x63om.bgbg.ai.grpcB\x0e\x41IServiceProtob\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x61i_service.proto\x12\x07\x62gbg.ai\"O\n\x0bTextContent\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x10\n\x08language\x18\x02 \x01(\t\x12\x14\n\x07\x63ontext\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_context\")\n\x04User\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08nickname\x18\x02 \x01(\t\"S\n\x0bQuizRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x12\n\nmeeting_id\x18\x02 \x01(\t\x12\x1b\n\x13progress_percentage\x18\x03 \x01(\x05\"P\n\x08Question\x12\x15\n\rquestion_text\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x03(\t\x12\x1c\n\x14\x63orrect_answer_index\x18\x03 \x01(\x05\"g\n\x0cQuizResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12$\n\tquestions\x18\x03 \x03(\x0b\x32\x11.bgbg.ai.Question\x12\x0f\n\x07quiz_id\x18\x04 \x01(\t\"\x88\x01\n\x10ProofreadRequest\x12+\n\roriginal_text\x18\x01 \x01(\x0b\x32\x14.bgbg.ai.TextContent\x12*\n\x0c\x63ontext_text\x18\x02 \x01(\x0b\x32\x14.bgbg.ai.TextContent\x12\x1b\n\x04user\x18\x03 \x01(\x0b\x32\r.bgbg.ai.User\"\x91\x01\n\x0eTextCorrection\x12\x10\n\x08original\x18\x01 \x01(\t\x12\x11\n\tcorrected\x18\x02 \x01(\t\x12\x17\n\x0f\x63orrection_type\x18\x03 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\x12\x16\n\x0estart_position\x18\x05 \x01(\x05\x12\x14\n\x0c\x65nd_position\x18\x06 \x01(\x05\"\x95\x01\n\x11ProofreadResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x16\n\x0e\x63orrected_text\x18\x03 \x01(\t\x12,\n\x0b\x63orrections\x18\x04 \x03(\x0b\x32\x17.bgbg.ai.TextCorrection\x12\x18\n\x10\x63onfidence_score\x18\x05 \x01(\x01\"\x8d\x01\n\x15\x44iscussionInitRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x12\n\nmeeting_id\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12#\n\x0cparticipants\x18\x04 \x03(\x0b\x32\r.bgbg.ai.User\x12\x12\n\nstarted_at\x18\x05 \x01(\x03\"p\n\x16\x44iscussionInitResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x19\n\x11\x64iscussion_topics\x18\x03 \x03(\t\x12\x19\n\x11recommended_topic\x18\x04 \x01(\t\"P\n\x14\x44iscussionEndRequest\x12\x12\n\nmeeting_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x10\n\x08\x65nded_at\x18\x03 \x01(\x03\"9\n\x15\x44iscussionEndResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"w\n\x11MeetingEndRequest\x12\x12\n\nmeeting_id\x18\x01 \x01(\t\x12\x14\n\x0cmeeting_type\x18\x02 \x01(\t\x12\x10\n\x08\x65nded_at\x18\x03 \x01(\x03\x12\x17\n\nsession_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\r\n\x0b_session_id\"L\n\x12MeetingEndResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x14\n\x0cmeeting_type\x18\x03 \x01(\t\"\x83\x02\n\x12\x43hatHistoryMessage\x12\x12\n\nmessage_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x1d\n\x06sender\x18\x03 \x01(\x0b\x32\r.bgbg.ai.User\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\x03\x12\x14\n\x0cmessage_type\x18\x06 \x01(\t\x12;\n\x08metadata\x18\x07 \x03(\x0b\x32).bgbg.ai.ChatHistoryMessage.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xf7\x01\n\x15GetChatHistoryRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\x05limit\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x1c\n\x0fsince_timestamp\x18\x03 \x01(\x03H\x01\x88\x01\x01\x12\x14\n\x07user_id\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\rbefore_cursor\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x19\n\x0c\x61\x66ter_cursor\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x08\n\x06_limitB\x12\n\x10_since_timestampB\n\n\x08_user_idB\x10\n\x0e_before_cursorB\x0f\n\r_after_cursor\"\xe8\x01\n\x16GetChatHistoryResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12-\n\x08messages\x18\x03 \x03(\x0b\x32\x1b.bgbg.ai.ChatHistoryMessage\x12\x13\n\x0btotal_count\x18\x04 \x01(\x05\x12\x10\n\x08has_more\x18\x05 \x01(\x08\x12\x18\n\x0bnext_cursor\x18\x06 \x01(\tH\x00\x88\x01\x01\x12\x1a\n\rlatest_cursor\x18\x07 \x01(\tH\x01\x88\x01\x01\x42\x0e\n\x0c_next_cursorB\x10\n\x0e_latest_cursor\"-\n\x17\x43hatSessionStatsRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\"~\n\x10ParticipantStats\x12\"\n\x0bparticipant\x18\x01 \x01(\x0b\x32\r.bgbg.ai.User\x12\x15\n\rmessage_count\x18\x02 \x01(\x05\x12\x15\n\rlast_activity\x18\x03 \x01(\x03\x12\x18\n\x10\x65ngagement_level\x18\x04 \x01(\x01\"\x90\x02\n\x18\x43hatSessionStatsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12\x16\n\x0etotal_messages\x18\x04 \x01(\x05\x12\x1a\n\x12total_participants\x18\x05 \x01(\x05\x12\x34\n\x11participant_stats\x18\x06 \x03(\x0b\x32\x19.bgbg.ai.ParticipantStats\x12\x1a\n\x12session_start_time\x18\x07 \x01(\x03\x12\x1a\n\x12last_activity_time\x18\x08 \x01(\x03\x12\x1c\n\x14\x63hat_history_enabled\x18\t \x01(\x08\"\x98\x02\n\x12\x43hatMessageRequest\x12\x1d\n\x15\x64iscussion_session_id\x18\x01 \x01(\t\x12\x1d\n\x06sender\x18\x02 \x01(\x0b\x32\r.bgbg.ai.User\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12\x1d\n\x10use_chat_context\x18\x05 \x01(\x08H\x00\x88\x01\x01\x12 \n\x13\x63ontext_window_size\x18\x06 \x01(\x05H\x01\x88\x01\x01\x12\x1d\n\x10store_in_history\x18\x07 \x01(\x08H\x02\x88\x01\x01\x42\x13\n\x11_use_chat_contextB\x16\n\x14_context_window_sizeB\x13\n\x11_store_in_history\"\xc7\x02\n\x13\x43hatMessageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x0b\x61i_response\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x10suggested_topics\x18\x04 \x03(\t\x12\x1b\n\x13requires_moderation\x18\x05 \x01(\x08\x12\"\n\x15\x63ontext_messages_used\x18\x06 \x01(\x05H\x01\x88\x01\x01\x12!\n\x14\x63hat_history_enabled\x18\x07 \x01(\x08H\x02\x88\x01\x01\x12\x33\n\x0erecent_context\x18\x08 \x03(\x0b\x32\x1b.bgbg.ai.ChatHistoryMessageB\x0e\n\x0c_ai_responseB\x18\n\x16_context_messages_usedB\x17\n\x15_chat_history_enabled\"N\n\x11ProcessPdfRequest\x12 \n\x04info\x18\x01 \x01(\x0b\x32\x10.bgbg.ai.PdfInfoH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"\xa8\x01\n\x07PdfInfo\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x12\n\nmeeting_id\x18\x03 \x01(\t\x12\x30\n\x08metadata\x18\x04 \x03(\x0b\x32\x1e.bgbg.ai.PdfInfo.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x86\x01\n\tTextBlock\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x13\n\x0bpage_number\x18\x02 \x01(\x05\x12\n\n\x02x0\x18\x03 \x01(\x01\x12\n\n\x02y0\x18\x04 \x01(\x01\x12\n\n\x02x1\x18\x05 \x01(\x01\x12\n\n\x02y1\x18\x06 \x01(\x01\x12\x12\n\nblock_type\x18\x07 \x01(\t\x12\x12\n\nconfidence\x18\x08 \x01(\x01\"\x89\x01\n\x12ProcessPdfResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x03 \x01(\t\x12\x13\n\x0btotal_pages\x18\x04 \x01(\x05\x12\'\n\x0btext_blocks\x18\x05 \x03(\x0b\x32\x12.bgbg.ai.TextBlock\"r\n\x11IngestJobAccepted\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x04 \x01(\t\x12\x16\n\x0equeue_position\x18\x05 \x01(\x05\"(\n\x16IngestJobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x97\x02\n\x0fIngestJobStatus\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x04 \x01(\t\x12\x12\n\nmeeting_id\x18\x05 \x01(\t\x12\r\n\x05state\x18\x06 \x01(\t\x12\r\n\x05stage\x18\x07 \x01(\t\x12\x12\n\npages_done\x18\x08 \x01(\x05\x12\x13\n\x0btotal_pages\x18\t \x01(\x05\x12\x13\n\x0b\x63hunk_count\x18\n \x01(\x05\x12\r\n\x05\x65rror\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\x03\x12\x12\n\nupdated_at\x18\r \x01(\x03\x12\x16\n\x0equeue_position\x18\x0e \x01(\x05\"Q\n\x0c\x45rrorDetails\x12\x12\n\nerror_code\x18\x01 \x01(\t\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12\x16\n\x0e\x65rror_category\x18\x03 \x01(\t2\xbb\x07\n\tAIService\x12;\n\x0cGenerateQuiz\x12\x14.bgbg.ai.QuizRequest\x1a\x15.bgbg.ai.QuizResponse\x12\x46\n\rProofreadText\x12\x19.bgbg.ai.ProofreadRequest\x1a\x1a.bgbg.ai.ProofreadResponse\x12W\n\x14InitializeDiscussion\x12\x1e.bgbg.ai.DiscussionInitRequest\x1a\x1f.bgbg.ai.DiscussionInitResponse\x12S\n\x12ProcessChatMessage\x12\x1b.bgbg.ai.ChatMessageRequest\x1a\x1c.bgbg.ai.ChatMessageResponse(\x01\x30\x01\x12N\n\rEndDiscussion\x12\x1d.bgbg.ai.DiscussionEndRequest\x1a\x1e.bgbg.ai.DiscussionEndResponse\x12\x45\n\nEndMeeting\x12\x1a.bgbg.ai.MeetingEndRequest\x1a\x1b.bgbg.ai.MeetingEndResponse\x12Q\n\x0eGetChatHistory\x12\x1e.bgbg.ai.GetChatHistoryRequest\x1a\x1f.bgbg.ai.GetChatHistoryResponse\x12Z\n\x13GetChatSessionStats\x12 .bgbg.ai.ChatSessionStatsRequest\x1a!.bgbg.ai.ChatSessionStatsResponse\x12G\n\nProcessPdf\x12\x1a.bgbg.ai.ProcessPdfRequest\x1a\x1b.bgbg.ai.ProcessPdfResponse(\x01\x12L\n\x10ProcessPdfStream\x12\x1a.bgbg.ai.ProcessPdfRequest\x1a\x1a.bgbg.ai.IngestJobAccepted(\x01\x12O\n\x12GetIngestJobStatus\x12\x1f.bgbg.ai.IngestJobStatusRequest\x1a\x18.bgbg.ai.IngestJobStatus\x12M\n\x0eWatchIngestJob\x12\x1f.bgbg.ai.IngestJobStatusRequest\x1a\x18.bgbg.ai.IngestJobStatus0\x01\x42\"\n\x10\x63om.bgbg.ai.grpcB\x0e\x41IServiceProtob\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -27,64 +26,70 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_CHATHISTORYMESSAGE_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_PDFINFO_METADATAENTRY']._options = None
   _globals['_PDFINFO_METADATAENTRY']._serialized_options = b'8\001'
-  _globals['_TEXTCONTENT']._serialized_start=58
-  _globals['_TEXTCONTENT']._serialized_end=137
-  _globals['_USER']._serialized_start=139
-  _globals['_USER']._serialized_end=180
-  _globals['_QUIZREQUEST']._serialized_start=182
-  _globals['_QUIZREQUEST']._serialized_end=265
-  _globals['_QUESTION']._serialized_start=267
-  _globals['_QUESTION']._serialized_end=347
-  _globals['_QUIZRESPONSE']._serialized_start=349
-  _globals['_QUIZRESPONSE']._serialized_end=452
-  _globals['_PROOFREADREQUEST']._serialized_start=455
-  _globals['_PROOFREADREQUEST']._serialized_end=591
-  _globals['_TEXTCORRECTION']._serialized_start=594
-  _globals['_TEXTCORRECTION']._serialized_end=739
-  _globals['_PROOFREADRESPONSE']._serialized_start=742
-  _globals['_PROOFREADRESPONSE']._serialized_end=891
-  _globals['_DISCUSSIONINITREQUEST']._serialized_start=894
-  _globals['_DISCUSSIONINITREQUEST']._serialized_end=1035
-  _globals['_DISCUSSIONINITRESPONSE']._serialized_start=1037
-  _globals['_DISCUSSIONINITRESPONSE']._serialized_end=1149
-  _globals['_DISCUSSIONENDREQUEST']._serialized_start=1151
-  _globals['_DISCUSSIONENDREQUEST']._serialized_end=1231
-  _globals['_DISCUSSIONENDRESPONSE']._serialized_start=1233
-  _globals['_DISCUSSIONENDRESPONSE']._serialized_end=1290
-  _globals['_MEETINGENDREQUEST']._serialized_start=1292
-  _globals['_MEETINGENDREQUEST']._serialized_end=1411
-  _globals['_MEETINGENDRESPONSE']._serialized_start=1413
-  _globals['_MEETINGENDRESPONSE']._serialized_end=1489
-  _globals['_CHATHISTORYMESSAGE']._serialized_start=1492
-  _globals['_CHATHISTORYMESSAGE']._serialized_end=1751
-  _globals['_CHATHISTORYMESSAGE_METADATAENTRY']._serialized_start=1704
-  _globals['_CHATHISTORYMESSAGE_METADATAENTRY']._serialized_end=1751
-  _globals['_GETCHATHISTORYREQUEST']._serialized_start=1754
-  _globals['_GETCHATHISTORYREQUEST']._serialized_end=1911
-  _globals['_GETCHATHISTORYRESPONSE']._serialized_start=1914
-  _globals['_GETCHATHISTORYRESPONSE']._serialized_end=2058
-  _globals['_CHATSESSIONSTATSREQUEST']._serialized_start=2060
-  _globals['_CHATSESSIONSTATSREQUEST']._serialized_end=2105
-  _globals['_PARTICIPANTSTATS']._serialized_start=2107
-  _globals['_PARTICIPANTSTATS']._serialized_end=2233
-  _globals['_CHATSESSIONSTATSRESPONSE']._serialized_start=2236
-  _globals['_CHATSESSIONSTATSRESPONSE']._serialized_end=2508
-  _globals['_CHATMESSAGEREQUEST']._serialized_start=2511
-  _globals['_CHATMESSAGEREQUEST']._serialized_end=2791
-  _globals['_CHATMESSAGERESPONSE']._serialized_start=2794
-  _globals['_CHATMESSAGERESPONSE']._serialized_end=3121
-  _globals['_PROCESSPDFREQUEST']._serialized_start=3123
-  _globals['_PROCESSPDFREQUEST']._serialized_end=3201
-  _globals['_PDFINFO']._serialized_start=3204
-  _globals['_PDFINFO']._serialized_end=3372
-  _globals['_PDFINFO_METADATAENTRY']._serialized_start=1704
-  _globals['_PDFINFO_METADATAENTRY']._serialized_end=1751
-  _globals['_TEXTBLOCK']._serialized_start=3375
-  _globals['_TEXTBLOCK']._serialized_end=3509
-  _globals['_PROCESSPDFRESPONSE']._serialized_start=3512
-  _globals['_PROCESSPDFRESPONSE']._serialized_end=3649
-  _globals['_ERRORDETAILS']._serialized_start=3651
-  _globals['_ERRORDETAILS']._serialized_end=3732
-  _globals['_AISERVICE']._serialized_start=3735
-  _globals['_AISERVICE']._serialized_end=4526
+  _globals['_TEXTCONTENT']._serialized_start=29
+  _globals['_TEXTCONTENT']._serialized_end=108
+  _globals['_USER']._serialized_start=110
+  _globals['_USER']._serialized_end=151
+  _globals['_QUIZREQUEST']._serialized_start=153
+  _globals['_QUIZREQUEST']._serialized_end=236
+  _globals['_QUESTION']._serialized_start=238
+  _globals['_QUESTION']._serialized_end=318
+  _globals['_QUIZRESPONSE']._serialized_start=320
+  _globals['_QUIZRESPONSE']._serialized_end=423
+  _globals['_PROOFREADREQUEST']._serialized_start=426
+  _globals['_PROOFREADREQUEST']._serialized_end=562
+  _globals['_TEXTCORRECTION']._serialized_start=565
+  _globals['_TEXTCORRECTION']._serialized_end=710
+  _globals['_PROOFREADRESPONSE']._serialized_start=713
+  _globals['_PROOFREADRESPONSE']._serialized_end=862
+  _globals['_DISCUSSIONINITREQUEST']._serialized_start=865
+  _globals['_DISCUSSIONINITREQUEST']._serialized_end=1006
+  _globals['_DISCUSSIONINITRESPONSE']._serialized_start=1008
+  _globals['_DISCUSSIONINITRESPONSE']._serialized_end=1120
+  _globals['_DISCUSSIONENDREQUEST']._serialized_start=1122
+  _globals['_DISCUSSIONENDREQUEST']._serialized_end=1202
+  _globals['_DISCUSSIONENDRESPONSE']._serialized_start=1204
+  _globals['_DISCUSSIONENDRESPONSE']._serialized_end=1261
+  _globals['_MEETINGENDREQUEST']._serialized_start=1263
+  _globals['_MEETINGENDREQUEST']._serialized_end=1382
+  _globals['_MEETINGENDRESPONSE']._serialized_start=1384
+  _globals['_MEETINGENDRESPONSE']._serialized_end=1460
+  _globals['_CHATHISTORYMESSAGE']._serialized_start=1463
+  _globals['_CHATHISTORYMESSAGE']._serialized_end=1722
+  _globals['_CHATHISTORYMESSAGE_METADATAENTRY']._serialized_start=1675
+  _globals['_CHATHISTORYMESSAGE_METADATAENTRY']._serialized_end=1722
+  _globals['_GETCHATHISTORYREQUEST']._serialized_start=1725
+  _globals['_GETCHATHISTORYREQUEST']._serialized_end=1972
+  _globals['_GETCHATHISTORYRESPONSE']._serialized_start=1975
+  _globals['_GETCHATHISTORYRESPONSE']._serialized_end=2207
+  _globals['_CHATSESSIONSTATSREQUEST']._serialized_start=2209
+  _globals['_CHATSESSIONSTATSREQUEST']._serialized_end=2254
+  _globals['_PARTICIPANTSTATS']._serialized_start=2256
+  _globals['_PARTICIPANTSTATS']._serialized_end=2382
+  _globals['_CHATSESSIONSTATSRESPONSE']._serialized_start=2385
+  _globals['_CHATSESSIONSTATSRESPONSE']._serialized_end=2657
+  _globals['_CHATMESSAGEREQUEST']._serialized_start=2660
+  _globals['_CHATMESSAGEREQUEST']._serialized_end=2940
+  _globals['_CHATMESSAGERESPONSE']._serialized_start=2943
+  _globals['_CHATMESSAGERESPONSE']._serialized_end=3270
+  _globals['_PROCESSPDFREQUEST']._serialized_start=3272
+  _globals['_PROCESSPDFREQUEST']._serialized_end=3350
+  _globals['_PDFINFO']._serialized_start=3353
+  _globals['_PDFINFO']._serialized_end=3521
+  _globals['_PDFINFO_METADATAENTRY']._serialized_start=1675
+  _globals['_PDFINFO_METADATAENTRY']._serialized_end=1722
+  _globals['_TEXTBLOCK']._serialized_start=3524
+  _globals['_TEXTBLOCK']._serialized_end=3658
+  _globals['_PROCESSPDFRESPONSE']._serialized_start=3661
+  _globals['_PROCESSPDFRESPONSE']._serialized_end=3798
+  _globals['_INGESTJOBACCEPTED']._serialized_start=3800
+  _globals['_INGESTJOBACCEPTED']._serialized_end=3914
+  _globals['_INGESTJOBSTATUSREQUEST']._serialized_start=3916
+  _globals['_INGESTJOBSTATUSREQUEST']._serialized_end=3956
+  _globals['_INGESTJOBSTATUS']._serialized_start=3959
+  _globals['_INGESTJOBSTATUS']._serialized_end=4238
+  _globals['_ERRORDETAILS']._serialized_start=4240
+  _globals['_ERRORDETAILS']._serialized_end=4321
+  _globals['_AISERVICE']._serialized_start=4324
+  _globals['_AISERVICE']._serialized_end=5279
 # @@protoc_insertion_point(module_scope)
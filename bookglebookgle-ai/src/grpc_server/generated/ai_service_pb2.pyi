@@ -1,4 +1,3 @@
-from google.protobuf import empty_pb2 as _empty_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
@@ -188,30 +187,38 @@ class ChatHistoryMessage(_message.Message):
     def __init__(self, message_id: _Optional[str] = ..., session_id: _Optional[str] = ..., sender: _Optional[_Union[User, _Mapping]] = ..., content: _Optional[str] = ..., timestamp: _Optional[int] = ..., message_type: _Optional[str] = ..., metadata: _Optional[_Mapping[str, str]] = ...) -> None: ...
 
 class GetChatHistoryRequest(_message.Message):
-    __slots__ = ("session_id", "limit", "since_timestamp", "user_id")
+    __slots__ = ("session_id", "limit", "since_timestamp", "user_id", "before_cursor", "after_cursor")
     SESSION_ID_FIELD_NUMBER: _ClassVar[int]
     LIMIT_FIELD_NUMBER: _ClassVar[int]
     SINCE_TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
     USER_ID_FIELD_NUMBER: _ClassVar[int]
+    BEFORE_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    AFTER_CURSOR_FIELD_NUMBER: _ClassVar[int]
     session_id: str
     limit: int
     since_timestamp: int
     user_id: str
-    def __init__(self, session_id: _Optional[str] = ..., limit: _Optional[int] = ..., since_timestamp: _Optional[int] = ..., user_id: _Optional[str] = ...) -> None: ...
+    before_cursor: str
+    after_cursor: str
+    def __init__(self, session_id: _Optional[str] = ..., limit: _Optional[int] = ..., since_timestamp: _Optional[int] = ..., user_id: _Optional[str] = ..., before_cursor: _Optional[str] = ..., after_cursor: _Optional[str] = ...) -> None: ...
 
 class GetChatHistoryResponse(_message.Message):
-    __slots__ = ("success", "message", "messages", "total_count", "has_more")
+    __slots__ = ("success", "message", "messages", "total_count", "has_more", "next_cursor", "latest_cursor")
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
     MESSAGES_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
     HAS_MORE_FIELD_NUMBER: _ClassVar[int]
+    NEXT_CURSOR_FIELD_NUMBER: _ClassVar[int]
+    LATEST_CURSOR_FIELD_NUMBER: _ClassVar[int]
     success: bool
     message: str
     messages: _containers.RepeatedCompositeFieldContainer[ChatHistoryMessage]
     total_count: int
     has_more: bool
-    def __init__(self, success: bool = ..., message: _Optional[str] = ..., messages: _Optional[_Iterable[_Union[ChatHistoryMessage, _Mapping]]] = ..., total_count: _Optional[int] = ..., has_more: bool = ...) -> None: ...
+    next_cursor: str
+    latest_cursor: str
+    def __init__(self, success: bool = ..., message: _Optional[str] = ..., messages: _Optional[_Iterable[_Union[ChatHistoryMessage, _Mapping]]] = ..., total_count: _Optional[int] = ..., has_more: bool = ..., next_cursor: _Optional[str] = ..., latest_cursor: _Optional[str] = ...) -> None: ...
 
 class ChatSessionStatsRequest(_message.Message):
     __slots__ = ("session_id",)
@@ -352,6 +359,58 @@ class ProcessPdfResponse(_message.Message):
     text_blocks: _containers.RepeatedCompositeFieldContainer[TextBlock]
     def __init__(self, success: bool = ..., message: _Optional[str] = ..., document_id: _Optional[str] = ..., total_pages: _Optional[int] = ..., text_blocks: _Optional[_Iterable[_Union[TextBlock, _Mapping]]] = ...) -> None: ...
 
+class IngestJobAccepted(_message.Message):
+    __slots__ = ("success", "message", "job_id", "document_id", "queue_position")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    DOCUMENT_ID_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    message: str
+    job_id: str
+    document_id: str
+    queue_position: int
+    def __init__(self, success: bool = ..., message: _Optional[str] = ..., job_id: _Optional[str] = ..., document_id: _Optional[str] = ..., queue_position: _Optional[int] = ...) -> None: ...
+
+class IngestJobStatusRequest(_message.Message):
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class IngestJobStatus(_message.Message):
+    __slots__ = ("success", "message", "job_id", "document_id", "meeting_id", "state", "stage", "pages_done", "total_pages", "chunk_count", "error", "created_at", "updated_at", "queue_position")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    DOCUMENT_ID_FIELD_NUMBER: _ClassVar[int]
+    MEETING_ID_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    STAGE_FIELD_NUMBER: _ClassVar[int]
+    PAGES_DONE_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_PAGES_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_COUNT_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AT_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_POSITION_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    message: str
+    job_id: str
+    document_id: str
+    meeting_id: str
+    state: str
+    stage: str
+    pages_done: int
+    total_pages: int
+    chunk_count: int
+    error: str
+    created_at: int
+    updated_at: int
+    queue_position: int
+    def __init__(self, success: bool = ..., message: _Optional[str] = ..., job_id: _Optional[str] = ..., document_id: _Optional[str] = ..., meeting_id: _Optional[str] = ..., state: _Optional[str] = ..., stage: _Optional[str] = ..., pages_done: _Optional[int] = ..., total_pages: _Optional[int] = ..., chunk_count: _Optional[int] = ..., error: _Optional[str] = ..., created_at: _Optional[int] = ..., updated_at: _Optional[int] = ..., queue_position: _Optional[int] = ...) -> None: ...
+
 class ErrorDetails(_message.Message):
     __slots__ = ("error_code", "error_message", "error_category")
     ERROR_CODE_FIELD_NUMBER: _ClassVar[int]
@@ -3,7 +3,6 @@
 import grpc
 
 from . import ai_service_pb2 as ai__service__pb2
-from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
 class AIServiceStub(object):
@@ -64,7 +63,17 @@ class AIServiceStub(object):
         self.ProcessPdfStream = channel.stream_unary(
                 '/bgbg.ai.AIService/ProcessPdfStream',
                 request_serializer=ai__service__pb2.ProcessPdfRequest.SerializeToString,
-                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                response_deserializer=ai__service__pb2.IngestJobAccepted.FromString,
+                )
+        self.GetIngestJobStatus = channel.unary_unary(
+                '/bgbg.ai.AIService/GetIngestJobStatus',
+                request_serializer=ai__service__pb2.IngestJobStatusRequest.SerializeToString,
+                response_deserializer=ai__service__pb2.IngestJobStatus.FromString,
+                )
+        self.WatchIngestJob = channel.unary_stream(
+                '/bgbg.ai.AIService/WatchIngestJob',
+                request_serializer=ai__service__pb2.IngestJobStatusRequest.SerializeToString,
+                response_deserializer=ai__service__pb2.IngestJobStatus.FromString,
                 )
 
 
@@ -133,12 +142,26 @@ class AIServiceServicer(object):
         raise NotImplementedError('Method not implemented!')
 
     def ProcessPdfStream(self, request_iterator, context):
-        """PDF OCR Processing (fire-and-forget, no response)
+        """PDF OCR Processing (async ingest job, returns job id immediately)
+        IngestJobAccepted is wire-compatible with the former google.protobuf.Empty response
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetIngestJobStatus(self, request, context):
+        """Ingest Job Status (poll or stream per-page progress)
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchIngestJob(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AIServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -190,7 +213,17 @@ def add_AIServiceServicer_to_server(servicer, server):
             'ProcessPdfStream': grpc.stream_unary_rpc_method_handler(
                     servicer.ProcessPdfStream,
                     request_deserializer=ai__service__pb2.ProcessPdfRequest.FromString,
-                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                    response_serializer=ai__service__pb2.IngestJobAccepted.SerializeToString,
+            ),
+            'GetIngestJobStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetIngestJobStatus,
+                    request_deserializer=ai__service__pb2.IngestJobStatusRequest.FromString,
+                    response_serializer=ai__service__pb2.IngestJobStatus.SerializeToString,
+            ),
+            'WatchIngestJob': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchIngestJob,
+                    request_deserializer=ai__service__pb2.IngestJobStatusRequest.FromString,
+                    response_serializer=ai__service__pb2.IngestJobStatus.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
@@ -369,6 +402,40 @@ class AIService(object):
             metadata=None):
         return grpc.experimental.stream_unary(request_iterator, target, '/bgbg.ai.AIService/ProcessPdfStream',
             ai__service__pb2.ProcessPdfRequest.SerializeToString,
-            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            ai__service__pb2.IngestJobAccepted.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetIngestJobStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/bgbg.ai.AIService/GetIngestJobStatus',
+            ai__service__pb2.IngestJobStatusRequest.SerializeToString,
+            ai__service__pb2.IngestJobStatus.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchIngestJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/bgbg.ai.AIService/WatchIngestJob',
+            ai__service__pb2.IngestJobStatusRequest.SerializeToString,
+            ai__service__pb2.IngestJobStatus.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,180 @@
+"""
+gRPC Metrics Interceptor for BGBG AI Server
+Per-method latency, in-flight, message size and status code metrics for the grpc.aio server
+"""
+
+import inspect
+import time
+from typing import Any, Callable, Optional
+
+import grpc
+from loguru import logger
+
+from src.config.settings import get_settings
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # prometheus_client 미설치 시 인터셉터 비활성화
+    PROMETHEUS_AVAILABLE = False
+
+
+# OCR 스트리밍(PDF 전체)까지 포함하도록 상한을 길게 설정
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+BYTES_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 52428800)
+
+if PROMETHEUS_AVAILABLE:
+    GRPC_HANDLING_SECONDS = Histogram(
+        "bgbg_grpc_server_handling_seconds",
+        "RPC latency from handler entry until the last response message (streams: whole stream)",
+        ["method", "rpc_type"], buckets=LATENCY_BUCKETS
+    )
+    GRPC_IN_FLIGHT = Gauge(
+        "bgbg_grpc_server_in_flight",
+        "RPCs currently being handled",
+        ["method"]
+    )
+    GRPC_HANDLED_TOTAL = Counter(
+        "bgbg_grpc_server_handled_total",
+        "Completed RPCs by status code",
+        ["method", "code"]
+    )
+    GRPC_REQUEST_BYTES = Histogram(
+        "bgbg_grpc_server_request_message_bytes",
+        "Serialized size of each received request message",
+        ["method"], buckets=BYTES_BUCKETS
+    )
+    GRPC_RESPONSE_BYTES = Histogram(
+        "bgbg_grpc_server_response_message_bytes",
+        "Serialized size of each sent response message",
+        ["method"], buckets=BYTES_BUCKETS
+    )
+
+
+def _status_name(context, error: Optional[BaseException]) -> str:
+    """핸들러 종료 시 상태 코드 (set_code/abort 반영, 예외는 UNKNOWN, 취소는 CANCELLED)"""
+    if isinstance(error, Exception) and not isinstance(error, grpc.aio.AbortError):
+        return grpc.StatusCode.UNKNOWN.name
+    if error is not None and not isinstance(error, grpc.aio.AbortError):
+        return grpc.StatusCode.CANCELLED.name
+    code = context.code()
+    if code is None:
+        return grpc.StatusCode.OK.name
+    if isinstance(code, grpc.StatusCode):
+        return code.name
+    # 일부 버전은 정수 코드를 반환
+    for status in grpc.StatusCode:
+        if status.value[0] == code:
+            return status.name
+    return str(code)
+
+
+class MetricsInterceptor(grpc.aio.ServerInterceptor):
+    """
+    메서드별 gRPC 서버 메트릭 기록
+    
+    - 지연 시간: 핸들러 진입 -> 응답 완료 (스트리밍은 스트림 종료까지)
+    - 진행 중 RPC 수, 상태 코드별 완료 수
+    - 요청/응답 메시지 크기: 역직렬화/직렬화 함수를 감싸서 메시지마다 기록
+    """
+    
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        
+        method = handler_call_details.method
+        if handler.unary_unary:
+            rpc_type, behavior, factory = "unary_unary", handler.unary_unary, grpc.unary_unary_rpc_method_handler
+        elif handler.unary_stream:
+            rpc_type, behavior, factory = "unary_stream", handler.unary_stream, grpc.unary_stream_rpc_method_handler
+        elif handler.stream_unary:
+            rpc_type, behavior, factory = "stream_unary", handler.stream_unary, grpc.stream_unary_rpc_method_handler
+        else:
+            rpc_type, behavior, factory = "stream_stream", handler.stream_stream, grpc.stream_stream_rpc_method_handler
+        
+        if handler.response_streaming:
+            wrapped = self._wrap_streaming(method, rpc_type, behavior)
+        else:
+            wrapped = self._wrap_unary(method, rpc_type, behavior)
+        
+        return factory(
+            wrapped,
+            request_deserializer=self._measure(handler.request_deserializer, GRPC_REQUEST_BYTES.labels(method), True),
+            response_serializer=self._measure(handler.response_serializer, GRPC_RESPONSE_BYTES.labels(method), False)
+        )
+    
+    @staticmethod
+    def _measure(codec: Optional[Callable], histogram, incoming: bool) -> Callable:
+        if incoming:
+            def deserialize(data: bytes) -> Any:
+                histogram.observe(len(data))
+                return codec(data) if codec else data
+            return deserialize
+        
+        def serialize(message: Any) -> bytes:
+            data = codec(message) if codec else message
+            histogram.observe(len(data))
+            return data
+        return serialize
+    
+    @staticmethod
+    def _finish(method: str, rpc_type: str, started_at: float, context, error: Optional[BaseException]):
+        GRPC_IN_FLIGHT.labels(method).dec()
+        GRPC_HANDLING_SECONDS.labels(method, rpc_type).observe(time.perf_counter() - started_at)
+        GRPC_HANDLED_TOTAL.labels(method, _status_name(context, error)).inc()
+    
+    def _wrap_unary(self, method: str, rpc_type: str, behavior: Callable) -> Callable:
+        async def wrapper(request_or_iterator, context):
+            GRPC_IN_FLIGHT.labels(method).inc()
+            started_at = time.perf_counter()
+            error = None
+            try:
+                result = behavior(request_or_iterator, context)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._finish(method, rpc_type, started_at, context, error)
+        return wrapper
+    
+    def _wrap_streaming(self, method: str, rpc_type: str, behavior: Callable) -> Callable:
+        async def wrapper(request_or_iterator, context):
+            GRPC_IN_FLIGHT.labels(method).inc()
+            started_at = time.perf_counter()
+            error = None
+            try:
+                result = behavior(request_or_iterator, context)
+                if hasattr(result, "__aiter__"):
+                    async for response in result:
+                        yield response
+                elif inspect.isawaitable(result):
+                    # context.write()로 응답하는 핸들러
+                    await result
+                else:
+                    for response in result:
+                        yield response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._finish(method, rpc_type, started_at, context, error)
+        return wrapper
+
+
+def create_metrics_interceptors() -> list:
+    """
+    서버에 등록할 메트릭 인터셉터 목록
+    
+    Returns:
+        list: ENABLE_METRICS이고 prometheus_client가 있으면 [MetricsInterceptor], 아니면 빈 목록
+    """
+    if not get_settings().ENABLE_METRICS:
+        return []
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("⚠️ prometheus_client not installed - gRPC metrics interceptor disabled")
+        return []
+    return [MetricsInterceptor()]
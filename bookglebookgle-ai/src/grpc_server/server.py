@@ -13,16 +13,22 @@ from grpc import aio
 from loguru import logger
 
 from src.config.settings import get_settings
+from src.grpc_server.admission_interceptor import create_admission_interceptors
 from src.grpc_server.ai_servicer import AIServicer
 from src.grpc_server.generated import ai_service_pb2_grpc
+from src.grpc_server.metrics_interceptor import create_metrics_interceptors
+from src.grpc_server.tracing_interceptor import create_tracing_interceptors
 from src.services.vector_db import VectorDBManager  # Import VectorDBManager
+from src.utils.cancellation import get_cancellation_stats
+from src.utils.lazy_import import get_lazy_import_stats
+from src.utils.metrics import register_stats_collector
 
 
 class GRPCServer:
     """Manages the gRPC server lifecycle"""
     
     def __init__(self, vector_db_manager: VectorDBManager, redis_manager=None, llm_client=None,
-                 quiz_service=None, proofreading_service=None):
+                 quiz_service=None, proofreading_service=None, reuse_port: bool = False):
         self.settings = get_settings()
         self.server = None
         self.vector_db_manager = vector_db_manager  # Store the initialized manager
@@ -30,6 +36,10 @@ class GRPCServer:
         self.llm_client = llm_client
         self.quiz_service = quiz_service
         self.proofreading_service = proofreading_service
+        # 멀티 프로세스 모드: 워커들이 같은 포트에 바인딩 (SO_REUSEPORT)
+        self.reuse_port = reuse_port
+        self.ai_servicer: Optional[AIServicer] = None
+        self.admission_interceptors: list = []
         logger.info("gRPC Server object created.")
         
     def _is_port_available(self, host: str, port: int) -> bool:
@@ -52,6 +62,34 @@ class GRPCServer:
         
         raise RuntimeError(f"No available port found in range {start_port}-{start_port + max_attempts - 1}")
     
+    def _register_service_stats(self, ai_servicer: AIServicer):
+        """기존 서비스 통계 dict를 /metrics 게이지(bgbg_service_stat)로 등록"""
+        discussion_service = ai_servicer.discussion_service
+        sources = {
+            "ocr_client": ai_servicer.ocr_service.get_stats,
+            "discussion_broadcast": discussion_service.get_broadcast_stats,
+            "discussion_topics": discussion_service.get_topic_cache_stats,
+            "discussion_prompts": discussion_service.get_prompt_stats,
+            "chat_recent_cache": discussion_service.chat_history_manager.get_recent_cache_stats,
+            "lazy_imports": get_lazy_import_stats,
+            "cancellation": get_cancellation_stats,
+            "ingest_queue": ai_servicer.ingest_queue.get_stats
+        }
+        for interceptor in self.admission_interceptors:
+            sources["admission_control"] = interceptor.get_stats
+        if self.llm_client:
+            sources["llm_usage"] = self.llm_client.get_usage_stats
+        if discussion_service.session_store:
+            sources["discussion_state_cache"] = discussion_service.session_store.get_cache_stats
+        if discussion_service.topic_cache:
+            sources["cache_frequency"] = discussion_service.topic_cache.get_frequency_stats
+        if self.quiz_service and getattr(self.quiz_service, "quiz_bank", None):
+            sources["quiz_bank"] = self.quiz_service.quiz_bank.get_stats
+        
+        registered = [name for name, getter in sources.items() if register_stats_collector(name, getter)]
+        if registered:
+            logger.info(f"📈 Service stats exported to /metrics: {', '.join(registered)}")
+    
     async def start(self):
         """Start the gRPC server with retry logic"""
         for attempt in range(1, self.settings.SERVER_START_RETRIES + 1):
@@ -69,10 +107,16 @@ class GRPCServer:
                     ('grpc.max_receive_message_length', 50 * 1024 * 1024),  # 50MB
                     ('grpc.max_send_message_length', 50 * 1024 * 1024),  # 50MB
                 ]
+                if self.reuse_port:
+                    server_options.append(('grpc.so_reuseport', 1))
                 
+                # 차단된 요청도 span/메트릭에 남도록 admission control을 가장 안쪽에 등록
+                self.admission_interceptors = create_admission_interceptors()
                 self.server = grpc.aio.server(
                     ThreadPoolExecutor(max_workers=self.settings.SERVER_WORKERS),
-                    options=server_options
+                    options=server_options,
+                    # RPC별 trace span + 메서드별 지연/진행 중/바이트/상태 코드 + 메서드별 동시 실행 제한
+                    interceptors=create_tracing_interceptors() + create_metrics_interceptors() + self.admission_interceptors
                 )
                 
                 # Pass the initialized services to the servicer
@@ -89,6 +133,9 @@ class GRPCServer:
                 if not services_init_success:
                     logger.warning("⚠️ Some services initialization failed, continuing with limited functionality")
                 
+                self._register_service_stats(ai_servicer)
+                self.ai_servicer = ai_servicer
+                
                 ai_service_pb2_grpc.add_AIServiceServicer_to_server(ai_servicer, self.server)
                 
                 # SERVER_HOST 설정에 따라 바인딩 주소 결정
@@ -113,11 +160,11 @@ class GRPCServer:
         raise RuntimeError("Failed to start gRPC server after multiple retries.")
             
     async def stop(self) -> None:
-        """Stop the gRPC server gracefully"""
+        """Stop the gRPC server gracefully (새 요청 수신 중단 후 진행 중 요청은 grace 동안 완료)"""
         if self.server:
             logger.info("🛑 Stopping gRPC server...")
             try:
-                await self.server.stop(grace=10)  # Reduced grace period
+                await self.server.stop(grace=self.settings.SERVER_DRAIN_GRACE_SECONDS)
                 logger.info("✅ gRPC server stopped gracefully")
             except Exception as e:
                 logger.error(f"Error during server shutdown: {e}")
@@ -129,6 +176,12 @@ class GRPCServer:
                     logger.error(f"Failed to force stop server: {force_error}")
             finally:
                 self.server = None
+        
+        # 진행 중 RPC 종료 후 수집 워커 중단 (실행 중 작업은 대기열로 복귀)
+        if self.ai_servicer:
+            await self.ai_servicer.ingest_queue.stop()
+        for interceptor in self.admission_interceptors:
+            interceptor.close()
             
     async def wait_for_termination(self) -> None:
         """Wait for server termination"""
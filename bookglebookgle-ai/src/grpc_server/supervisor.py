@@ -0,0 +1,219 @@
+"""
+gRPC Worker Supervisor for BGBG AI Server
+Forks N worker processes serving the same port (SO_REUSEPORT) with coordinated readiness and graceful drain
+"""
+
+import gc
+import multiprocessing
+import os
+import signal
+import time
+from typing import Callable, Dict, Optional
+
+from loguru import logger
+
+
+# 워커 상태 (공유 배열 값)
+WORKER_STARTING = 0
+WORKER_SERVING = 1
+WORKER_DRAINING = 2
+WORKER_STOPPED = 3
+
+_STATE_NAMES = {
+    WORKER_STARTING: "starting",
+    WORKER_SERVING: "serving",
+    WORKER_DRAINING: "draining",
+    WORKER_STOPPED: "stopped"
+}
+
+
+class WorkerContext:
+    """워커 프로세스의 자기 정보 (상태 배열은 fork로 상속되어 감독 프로세스와 공유)"""
+    
+    def __init__(self, index: int, count: int, states):
+        self.index = index
+        self.count = count
+        self._states = states
+    
+    def set_state(self, state: int):
+        self._states[self.index] = state
+    
+    @property
+    def state(self) -> str:
+        return _STATE_NAMES.get(self._states[self.index], "unknown")
+
+
+def _worker_entry(worker_main: Callable[[WorkerContext], None], worker: WorkerContext):
+    # Ctrl+C는 프로세스 그룹 전체에 전달되므로 워커는 무시하고 감독 프로세스의 SIGTERM으로만 종료
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    try:
+        worker_main(worker)
+    finally:
+        worker.set_state(WORKER_STOPPED)
+
+
+class GRPCSupervisor:
+    """
+    멀티 프로세스 gRPC 서버 감독
+    
+    - preload()를 fork 전에 실행하고 gc.freeze()로 고정해 읽기 전용 모델 가중치를 copy-on-write로 공유
+    - 워커는 grpc.so_reuseport로 같은 포트에 바인딩 (커널이 연결을 분산)
+    - 워커 상태(starting/serving/draining/stopped)를 공유 배열로 추적, 비정상 종료 시 재시작
+    - 종료 시 모든 워커에 SIGTERM -> 각 워커가 새 요청 수신 중단 후 진행 중 요청 완료(drain) -> 제한 시간 초과 시 SIGKILL
+    - 프로세스 간 상태(토론 세션, 브로드캐스트, 캐시 무효화)는 Redis로 공유
+    """
+    
+    def __init__(
+        self,
+        worker_count: int,
+        worker_main: Callable[[WorkerContext], None],
+        preload: Optional[Callable[[], None]] = None,
+        drain_timeout: float = 30.0,
+        max_restarts: int = 5
+    ):
+        """
+        Args:
+            worker_count: 워커 프로세스 수
+            worker_main: 워커 본체 (WorkerContext를 받아 서버 종료까지 블로킹)
+            preload: fork 전에 감독 프로세스에서 실행할 초기화 (공유 모델 로드 등)
+            drain_timeout: SIGTERM 후 워커 종료 대기 시간 (초)
+            max_restarts: 워커별 최대 재시작 횟수 (초과 시 전체 종료)
+        """
+        self.worker_count = worker_count
+        self.worker_main = worker_main
+        self.preload = preload
+        self.drain_timeout = drain_timeout
+        self.max_restarts = max_restarts
+        
+        self._mp = multiprocessing.get_context("fork")
+        self.states = self._mp.Array("i", worker_count, lock=False)
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.restarts: Dict[int, int] = {index: 0 for index in range(worker_count)}
+        self._stopping = False
+        self._all_serving_logged = False
+    
+    def _spawn(self, index: int):
+        self.states[index] = WORKER_STARTING
+        worker = WorkerContext(index, self.worker_count, self.states)
+        process = self._mp.Process(
+            target=_worker_entry,
+            args=(self.worker_main, worker),
+            name=f"bgbg-grpc-worker-{index}"
+        )
+        process.start()
+        self.processes[index] = process
+        logger.info(f"👷 Worker {index} started (pid {process.pid})")
+    
+    def start(self):
+        """공유 자원 preload 후 워커 fork"""
+        if self.preload:
+            started_at = time.perf_counter()
+            self.preload()
+            logger.info(f"📦 Pre-fork preload done in {(time.perf_counter() - started_at) * 1000:.0f}ms")
+        
+        # 이후 생성되는 객체만 GC 대상으로 두어 부모 객체 페이지가 워커에서 복사되지 않도록 함
+        gc.collect()
+        gc.freeze()
+        
+        for index in range(self.worker_count):
+            self._spawn(index)
+    
+    def request_stop(self, *_):
+        """종료 요청 (시그널 핸들러)"""
+        if not self._stopping:
+            logger.info("🛑 Supervisor received shutdown signal - draining workers...")
+        self._stopping = True
+    
+    def check_workers(self) -> bool:
+        """
+        워커 상태 점검 및 비정상 종료 워커 재시작
+        
+        Returns:
+            bool: 계속 실행 가능 여부 (재시작 한도 초과 시 False)
+        """
+        for index, process in list(self.processes.items()):
+            if process.is_alive() or self._stopping:
+                continue
+            
+            self.restarts[index] += 1
+            if self.restarts[index] > self.max_restarts:
+                logger.error(f"❌ Worker {index} exceeded {self.max_restarts} restarts - shutting down")
+                return False
+            
+            logger.warning(f"⚠️ Worker {index} exited (code {process.exitcode}) - restarting "
+                           f"({self.restarts[index]}/{self.max_restarts})")
+            self._all_serving_logged = False
+            self._spawn(index)
+        
+        if not self._all_serving_logged and self.serving_count() == self.worker_count:
+            self._all_serving_logged = True
+            logger.info(f"🟢 All {self.worker_count} workers serving")
+        return True
+    
+    def serving_count(self) -> int:
+        """서빙 중인 워커 수"""
+        return sum(1 for state in self.states if state == WORKER_SERVING)
+    
+    def wait_until_serving(self, timeout: float) -> bool:
+        """모든 워커가 서빙 상태가 될 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.serving_count() == self.worker_count:
+                return True
+            if any(not process.is_alive() for process in self.processes.values()):
+                return False
+            time.sleep(0.05)
+        return False
+    
+    def get_worker_states(self) -> Dict[int, Dict[str, object]]:
+        """워커별 상태"""
+        return {
+            index: {
+                "pid": process.pid,
+                "alive": process.is_alive(),
+                "state": _STATE_NAMES.get(self.states[index], "unknown"),
+                "restarts": self.restarts[index]
+            }
+            for index, process in self.processes.items()
+        }
+    
+    def drain(self):
+        """모든 워커 graceful drain 후 종료"""
+        self._stopping = True
+        for process in self.processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+        
+        deadline = time.monotonic() + self.drain_timeout
+        for process in self.processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+        
+        for index, process in self.processes.items():
+            if process.is_alive():
+                logger.warning(f"🚨 Worker {index} did not drain within {self.drain_timeout}s - killing")
+                process.kill()
+                process.join()
+            self.states[index] = WORKER_STOPPED
+        logger.info(f"✅ All {self.worker_count} workers stopped")
+    
+    def run(self) -> int:
+        """
+        워커 시작 후 종료 시그널까지 감독
+        
+        Returns:
+            int: 프로세스 종료 코드
+        """
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        
+        self.start()
+        exit_code = 0
+        while not self._stopping:
+            if not self.check_workers():
+                exit_code = 1
+                break
+            time.sleep(0.5)
+        
+        self.drain()
+        return exit_code
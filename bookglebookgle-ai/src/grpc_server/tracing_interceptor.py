@@ -0,0 +1,98 @@
+"""
+gRPC Tracing Interceptor for BGBG AI Server
+Opens a server span per RPC, continuing the caller's trace from W3C traceparent metadata
+"""
+
+import inspect
+from typing import Callable
+
+import grpc
+
+from src.utils.tracing import extract_context, is_tracing_enabled, trace_span
+
+
+class TracingInterceptor(grpc.aio.ServerInterceptor):
+    """
+    RPC마다 서버 span 생성 (span 이름은 "/bgbg.ai.AIService/ProcessPdf" 같은 전체 메서드명)
+    
+    - 호출 측(Spring 백엔드 등)이 traceparent를 보내면 같은 trace에 이어 붙임
+    - 핸들러 안에서 생성하는 span(OCR, VectorDB 단계)은 이 span의 자식이 됨
+    - 핸들러가 set_code()로 실패를 알린 경우 rpc.grpc.status_code 속성에 기록
+    """
+    
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        
+        method = handler_call_details.method
+        metadata = handler_call_details.invocation_metadata
+        if handler.unary_unary:
+            behavior, factory = handler.unary_unary, grpc.unary_unary_rpc_method_handler
+        elif handler.unary_stream:
+            behavior, factory = handler.unary_stream, grpc.unary_stream_rpc_method_handler
+        elif handler.stream_unary:
+            behavior, factory = handler.stream_unary, grpc.stream_unary_rpc_method_handler
+        else:
+            behavior, factory = handler.stream_stream, grpc.stream_stream_rpc_method_handler
+        
+        if handler.response_streaming:
+            wrapped = self._wrap_streaming(method, metadata, behavior)
+        else:
+            wrapped = self._wrap_unary(method, metadata, behavior)
+        
+        return factory(
+            wrapped,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+    
+    @staticmethod
+    def _span_attributes(method: str) -> dict:
+        service, _, rpc = method.lstrip("/").rpartition("/")
+        return {"rpc.system": "grpc", "rpc.service": service, "rpc.method": rpc}
+    
+    @staticmethod
+    def _record_status(span, context):
+        code = context.code()
+        if code is not None:
+            span.set_attribute("rpc.grpc.status_code", code.value[0] if isinstance(code, grpc.StatusCode) else int(code))
+    
+    def _wrap_unary(self, method: str, metadata, behavior: Callable) -> Callable:
+        async def wrapper(request_or_iterator, context):
+            with trace_span(method, self._span_attributes(method), kind="server",
+                            parent=extract_context(metadata)) as span:
+                result = behavior(request_or_iterator, context)
+                if inspect.isawaitable(result):
+                    result = await result
+                self._record_status(span, context)
+                return result
+        return wrapper
+    
+    def _wrap_streaming(self, method: str, metadata, behavior: Callable) -> Callable:
+        async def wrapper(request_or_iterator, context):
+            with trace_span(method, self._span_attributes(method), kind="server",
+                            parent=extract_context(metadata)) as span:
+                result = behavior(request_or_iterator, context)
+                if hasattr(result, "__aiter__"):
+                    async for response in result:
+                        yield response
+                elif inspect.isawaitable(result):
+                    await result
+                else:
+                    for response in result:
+                        yield response
+                self._record_status(span, context)
+        return wrapper
+
+
+def create_tracing_interceptors() -> list:
+    """
+    서버에 등록할 트레이싱 인터셉터 목록
+    
+    Returns:
+        list: setup_tracing()으로 트레이싱이 활성화되어 있으면 [TracingInterceptor], 아니면 빈 목록
+    """
+    if not is_tracing_enabled():
+        return []
+    return [TracingInterceptor()]
@@ -39,11 +39,12 @@ class InterventionType(str, Enum):
     SUMMARIZE_DISCUSSION = "summarize_discussion"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """
     Enhanced chat message model for chat history context feature
     Stores comprehensive message information including metadata for analysis
+    (__slots__ - 대량 역직렬화 시 인스턴스 메모리/생성 비용 절감)
     """
     message_id: str
     session_id: str
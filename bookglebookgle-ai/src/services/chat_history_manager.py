@@ -17,6 +17,7 @@ from src.config.chat_config import (
 )
 from src.models.chat_history_models import (
     ChatMessage, 
+    MessageType,
     ConversationContext, 
     ParticipantState,
     SessionMetadata,
@@ -24,11 +25,23 @@ from src.models.chat_history_models import (
     ChatHistoryError
 )
 from src.models.chat_interfaces import ChatHistoryManagerInterface
-from .redis_chat_storage import RedisChatStorage
+from .redis_chat_storage import RedisChatStorage, session_ttl_hours
+from .recent_message_cache import RecentMessageCache, filter_time_window
 
 logger = logging.getLogger(__name__)
 
 
+def count_user_messages_since_ai(messages: List[ChatMessage]) -> int:
+    """마지막 AI 응답 이후 사용자 메시지 수 (messages는 오래된 순)"""
+    count = 0
+    for msg in reversed(messages):
+        if msg.message_type == MessageType.AI:
+            break
+        if msg.message_type == MessageType.USER:
+            count += 1
+    return count
+
+
 class ChatHistoryManager:
     """
     Main chat history management service
@@ -52,6 +65,18 @@ class ChatHistoryManager:
         self.ttl_config = get_ttl_config()
         self.performance_config = get_performance_config()
         
+        # 세션별 최근 메시지 링 버퍼 (pub/sub 이벤트로 레플리카 간 동기화)
+        chat_settings = self.settings.chat_history
+        self.recent_cache: Optional[RecentMessageCache] = None
+        if chat_settings.CHAT_RECENT_BUFFER_ENABLED and hasattr(self._storage, 'listen_message_events'):
+            self.recent_cache = RecentMessageCache(
+                max_messages=max(chat_settings.CHAT_RECENT_BUFFER_SIZE, self.config.max_messages),
+                max_sessions=chat_settings.CHAT_RECENT_BUFFER_MAX_SESSIONS,
+                idle_seconds=chat_settings.CHAT_RECENT_BUFFER_IDLE_MINUTES * 60
+            )
+        self._events_task = None
+        self._events_connected = False
+        
         logger.info("ChatHistoryManager initialized")
     
     async def start(self) -> None:
@@ -66,6 +91,10 @@ class ChatHistoryManager:
             self._periodic_cleanup(cleanup_interval)
         )
         
+        # Start message event subscription for the recent message cache
+        if self.recent_cache is not None:
+            self._events_task = asyncio.create_task(self._consume_message_events())
+        
         logger.info("ChatHistoryManager started with periodic cleanup")
     
     async def stop(self) -> None:
@@ -77,6 +106,13 @@ class ChatHistoryManager:
             except asyncio.CancelledError:
                 pass
         
+        if self._events_task:
+            self._events_task.cancel()
+            try:
+                await self._events_task
+            except asyncio.CancelledError:
+                pass
+        
         if hasattr(self._storage, 'close'):
             await self._storage.close()
         
@@ -106,17 +142,26 @@ class ChatHistoryManager:
             raise ChatHistoryError("Chat history feature is disabled")
         
         try:
-            # Store message in underlying storage
-            message_id = await self._storage.store_message(session_id, message)
+            if auto_ttl and hasattr(self._storage, 'append_and_read'):
+                # 저장 + 활동량 기반 TTL 적용을 스크립트 1회로 처리
+                turn = await self._storage.append_and_read(session_id, message, 0)
+                message_id = message.message_id
+                if self.recent_cache is not None:
+                    self.recent_cache.append(session_id, message, turn["message_count"])
+            else:
+                # Store message in underlying storage
+                message_id = await self._storage.store_message(session_id, message)
+                if self.recent_cache is not None:
+                    self.recent_cache.invalidate(session_id)
+                
+                # Auto-adjust TTL based on activity
+                if auto_ttl:
+                    await self._adjust_session_ttl(session_id)
             
             # Update in-memory context if exists
             if session_id in self._session_contexts:
                 self._session_contexts[session_id].add_message(message)
             
-            # Auto-adjust TTL based on activity
-            if auto_ttl:
-                await self._adjust_session_ttl(session_id)
-            
             logger.debug(f"Stored message {message_id} for session {session_id}")
             return message_id
             
@@ -124,6 +169,130 @@ class ChatHistoryManager:
             logger.error(f"Failed to store message: {e}")
             raise ChatHistoryError(f"Failed to store message: {e}")
     
+    async def store_message_and_get_recent(
+        self,
+        session_id: str,
+        message: ChatMessage,
+        limit: Optional[int] = None,
+        time_window: Optional[timedelta] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a chat message and return the recent window in one storage call
+        
+        Args:
+            session_id: Discussion session identifier
+            message: ChatMessage object to store
+            limit: Maximum number of recent messages (defaults to config, 0 = store only)
+            time_window: Time window for messages (defaults to config)
+            
+        Returns:
+            Dict[str, Any]: messages (oldest first), user_messages_since_ai (session counter,
+                not limited to the returned window), speakers_since_ai, message_count
+            
+        Raises:
+            ChatHistoryError: If chat history is disabled or storage fails
+        """
+        if not is_chat_history_enabled():
+            raise ChatHistoryError("Chat history feature is disabled")
+        
+        if limit is None:
+            limit = self.config.max_messages
+        
+        if time_window is None:
+            time_window = self.config.time_window
+        
+        try:
+            if hasattr(self._storage, 'append_and_read'):
+                turn = await self._append_and_read_cached(session_id, message, limit, time_window)
+            else:
+                # 스크립트 미지원 저장소는 기존 방식(저장 + TTL 조정 + 조회)으로 처리
+                await self._storage.store_message(session_id, message)
+                await self._adjust_session_ttl(session_id)
+                messages = await self._storage.get_recent_messages(session_id, limit, time_window) if limit > 0 else []
+                turn = {
+                    "messages": messages,
+                    "user_messages_since_ai": count_user_messages_since_ai(messages),
+                    "speakers_since_ai": None,
+                    "message_count": None
+                }
+            
+            # Update in-memory context if exists
+            if session_id in self._session_contexts:
+                self._session_contexts[session_id].add_message(message)
+            
+            return turn
+            
+        except Exception as e:
+            logger.error(f"Failed to store message and get recent messages: {e}")
+            raise ChatHistoryError(f"Failed to store message and get recent messages: {e}")
+    
+    async def _append_and_read_cached(
+        self,
+        session_id: str,
+        message: ChatMessage,
+        limit: int,
+        time_window: Optional[timedelta]
+    ) -> Dict[str, Any]:
+        """
+        append-and-read with the recent message cache
+        
+        버퍼가 최신이면 저장만 요청(limit=0)하고 최근 창은 버퍼에서 응답,
+        아니면 스크립트가 돌려준 최근 창으로 버퍼를 다시 채움
+        """
+        cache = self.recent_cache if self._events_connected else None
+        warm = limit > 0 and cache is not None and cache.is_warm(session_id, limit)
+        
+        turn = await self._storage.append_and_read(session_id, message, 0 if warm else limit)
+        
+        if limit <= 0:
+            if cache is not None:
+                cache.append(session_id, message, turn["message_count"])
+            return turn
+        
+        if warm and cache.append(session_id, message, turn["message_count"]):
+            window = cache.get(session_id, limit)
+        elif warm:
+            # 다른 레플리카의 쓰기가 아직 반영되지 않음 - 이번 턴은 Redis에서 조회 (버퍼는 다음 턴에 재구성)
+            cache.record_miss(session_id)
+            window = await self._storage.get_recent_messages(session_id, limit)
+        else:
+            window = turn["messages"]
+            if cache is not None:
+                cache.record_miss(session_id)
+                cache.load(session_id, window, turn["message_count"])
+        
+        turn["messages"] = filter_time_window(window, time_window)
+        return turn
+    
+    async def get_turn_activity(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get user activity since the last AI reply (single key read)
+        
+        Args:
+            session_id: Discussion session identifier
+            
+        Returns:
+            Dict[str, Any]: user_messages_since_ai, speakers_since_ai, participant_messages
+        """
+        if not is_chat_history_enabled():
+            return {"session_id": session_id, "user_messages_since_ai": 0, "speakers_since_ai": 0}
+        
+        try:
+            if hasattr(self._storage, 'get_turn_activity'):
+                return await self._storage.get_turn_activity(session_id)
+            
+            # 활동 카운터 미지원 저장소는 최근 메시지로 계산
+            messages = await self._storage.get_recent_messages(session_id, self.config.max_messages)
+            return {
+                "session_id": session_id,
+                "user_messages_since_ai": count_user_messages_since_ai(messages),
+                "speakers_since_ai": None
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get turn activity: {e}")
+            raise ChatHistoryError(f"Failed to get turn activity: {e}")
+    
     async def get_recent_messages(
         self, 
         session_id: str, 
@@ -155,6 +324,12 @@ class ChatHistoryManager:
             if time_window is None:
                 time_window = self.config.time_window
             
+            # 최근 메시지 버퍼로 응답 가능하면 Redis 조회 생략
+            if self.recent_cache is not None and self._events_connected:
+                cached = self.recent_cache.get(session_id, limit, time_window)
+                if cached is not None:
+                    return cached
+            
             messages = await self._storage.get_recent_messages(
                 session_id, limit, time_window
             )
@@ -195,6 +370,44 @@ class ChatHistoryManager:
             logger.error(f"Failed to get user messages: {e}")
             return []  # Non-critical failure
     
+    async def get_message_page(
+        self,
+        session_id: str,
+        limit: int = 50,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        since: Optional[datetime] = None,
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of chat history (cursor pagination on the Streams backend)
+        
+        Args:
+            session_id: Discussion session identifier
+            limit: Page size
+            before: Cursor for the previous (older) page
+            after: Cursor for incremental sync (newer messages)
+            since: Only messages after this time
+            user_id: Only messages from this user
+            
+        Returns:
+            Dict[str, Any]: messages (oldest first), has_more, next_cursor, latest_cursor
+            
+        Raises:
+            ChatHistoryError: If retrieval fails
+        """
+        if not is_chat_history_enabled():
+            return {"messages": [], "has_more": False, "next_cursor": None, "latest_cursor": None}
+        
+        try:
+            return await self._storage.get_message_page(
+                session_id, limit, before=before, after=after, since=since, user_id=user_id
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to get message page: {e}")
+            raise ChatHistoryError(f"Failed to get message page: {e}")
+    
     async def get_conversation_context(
         self, 
         session_id: str,
@@ -326,6 +539,9 @@ class ChatHistoryManager:
                     }
                 })
             
+            if self.recent_cache is not None:
+                stats["recent_buffer"] = self.recent_cache.get_stats(session_id)
+            
             stats["chat_history_enabled"] = True
             return stats
             
@@ -348,6 +564,9 @@ class ChatHistoryManager:
             if session_id in self._session_contexts:
                 del self._session_contexts[session_id]
             
+            if self.recent_cache is not None:
+                self.recent_cache.remove_session(session_id)
+            
             # Note: Redis TTL will handle storage cleanup automatically
             logger.info(f"Cleaned up session {session_id}")
             return True
@@ -389,16 +608,8 @@ class ChatHistoryManager:
             stats = await self._storage.get_session_stats(session_id)
             message_count = stats.get('message_count', 0)
             
-            # Adjust TTL based on activity
-            if message_count > 50:
-                # High activity - extend TTL
-                ttl_hours = 6
-            elif message_count > 20:
-                # Medium activity - standard TTL
-                ttl_hours = 4
-            else:
-                # Low activity - shorter TTL
-                ttl_hours = 2
+            # Adjust TTL based on activity (high 6h / medium 4h / low 2h)
+            ttl_hours = session_ttl_hours(message_count)
             
             await self._storage.set_session_ttl(session_id, ttl_hours)
             
@@ -429,6 +640,12 @@ class ChatHistoryManager:
                 for session_id in expired_sessions:
                     await self.cleanup_session(session_id)
                 
+                # Evict idle recent message buffers
+                if self.recent_cache is not None:
+                    evicted = self.recent_cache.evict_idle()
+                    if evicted > 0:
+                        logger.debug(f"Evicted {evicted} idle recent message buffers")
+                
                 # Clean up expired sessions in storage
                 if hasattr(self._storage, 'cleanup_expired_sessions'):
                     cleaned_count = await self._storage.cleanup_expired_sessions()
@@ -443,6 +660,54 @@ class ChatHistoryManager:
             except Exception as e:
                 logger.error(f"Error in periodic cleanup: {e}")
     
+    async def _consume_message_events(self) -> None:
+        """
+        Apply message events from other replicas to the recent message cache
+        
+        구독이 끊기면 버퍼를 모두 비우고(이벤트 유실 가능) 재연결될 때까지 캐시를 사용하지 않음
+        """
+        retry_delay = 1
+        
+        def on_subscribed():
+            self._events_connected = True
+            logger.info("Subscribed to chat message events for recent message cache")
+        
+        while True:
+            try:
+                async for session_id, origin, message_count, message in self._storage.listen_message_events(
+                    on_subscribed=on_subscribed
+                ):
+                    retry_delay = 1
+                    if origin == self._storage.instance_id:
+                        continue  # 자신의 쓰기는 저장 시점에 이미 반영
+                    self.recent_cache.append(session_id, message, message_count, remote=True)
+            except asyncio.CancelledError:
+                self._events_connected = False
+                raise
+            except Exception as e:
+                logger.warning(f"Chat message event subscription lost: {e}")
+            
+            self._events_connected = False
+            self.recent_cache.clear()
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+    
+    def get_recent_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get recent message cache statistics (aggregate counters; per-session via get_session_stats)
+        
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        if self.recent_cache is None:
+            return {"enabled": False}
+        
+        return {
+            "enabled": True,
+            "events_connected": self._events_connected,
+            **self.recent_cache.get_stats()
+        }
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on chat history system
@@ -455,6 +720,7 @@ class ChatHistoryManager:
             "storage_healthy": False,
             "active_sessions": 0,
             "cached_contexts": len(self._session_contexts),
+            "recent_buffer_events_connected": self._events_connected,
             "cleanup_task_running": self._cleanup_task is not None and not self._cleanup_task.done()
         }
         
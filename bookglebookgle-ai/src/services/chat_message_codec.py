@@ -0,0 +1,172 @@
+"""
+Chat Message Codec for BGBG AI Server
+Versioned compact encoding for chat messages stored in Redis
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Union
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:  # msgpack 미설치 시 JSON 코덱으로 저장
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+from src.models.chat_history_models import ChatMessage, MessageType
+
+logger = logging.getLogger(__name__)
+
+
+# 저장 포맷 버전 (첫 바이트)
+# - '{' (0x7B): 레거시 JSON (ChatMessage.to_json)
+# - 0x01: msgpack v1 - [0x01][message_type 코드 1바이트][msgpack 배열]
+#   message_type을 고정 위치에 두어 Redis 스크립트가 디코딩 없이 타입 판별 가능
+JSON_PREFIX = b"{"
+MSGPACK_V1 = 0x01
+
+MESSAGE_TYPE_CODES: Dict[MessageType, int] = {
+    MessageType.USER: 0,
+    MessageType.AI: 1,
+    MessageType.SYSTEM: 2
+}
+MESSAGE_TYPES_BY_CODE: Dict[int, MessageType] = {code: message_type for message_type, code in MESSAGE_TYPE_CODES.items()}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch_ms(timestamp: datetime) -> int:
+    """naive UTC(또는 aware) datetime -> epoch milliseconds"""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // timedelta(milliseconds=1)
+
+
+def _from_epoch_ms(epoch_ms: int) -> datetime:
+    """epoch milliseconds -> naive UTC datetime (datetime.utcnow()와 동일 기준)"""
+    return _EPOCH + timedelta(milliseconds=epoch_ms)
+
+
+class ChatMessageCodec(ABC):
+    """
+    ChatMessage 직렬화 인터페이스
+
+    encode는 코덱별 포맷으로 쓰고, decode는 첫 바이트로 버전을 판별하여
+    레거시 JSON과 신규 포맷을 모두 읽음
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def encode(self, message: ChatMessage) -> bytes:
+        """Encode message for storage"""
+        pass
+
+    def decode(self, data: Union[bytes, str]) -> ChatMessage:
+        """Decode stored message (any supported version)"""
+        return decode_message(data)
+
+
+class JsonChatMessageCodec(ChatMessageCodec):
+    """레거시 JSON 포맷 (ISO 타임스탬프, 문자열 enum)"""
+
+    name = "json"
+
+    def encode(self, message: ChatMessage) -> bytes:
+        return message.to_json().encode("utf-8")
+
+
+class MsgpackChatMessageCodec(ChatMessageCodec):
+    """msgpack v1 포맷 (epoch ms 타임스탬프, 정수 enum, 위치 기반 필드)"""
+
+    name = "msgpack"
+
+    def encode(self, message: ChatMessage) -> bytes:
+        fields = [
+            message.message_id,
+            message.session_id,
+            message.user_id,
+            message.nickname,
+            message.content,
+            _to_epoch_ms(message.timestamp),
+            message.metadata or None,
+            message.sentiment,
+            message.topics,
+            message.intent
+        ]
+        # 비어 있는 선택 필드는 뒤에서부터 생략
+        while fields and fields[-1] is None:
+            fields.pop()
+
+        header = bytes((MSGPACK_V1, MESSAGE_TYPE_CODES[MessageType(message.message_type)]))
+        return header + msgpack.packb(fields, use_bin_type=True)
+
+
+def _decode_msgpack_v1(data: bytes) -> ChatMessage:
+    fields = msgpack.unpackb(data[2:], raw=False)
+    fields.extend([None] * (10 - len(fields)))
+    (message_id, session_id, user_id, nickname, content,
+     epoch_ms, metadata, sentiment, topics, intent) = fields
+
+    return ChatMessage(
+        message_id,
+        session_id,
+        user_id,
+        nickname,
+        content,
+        _from_epoch_ms(epoch_ms),
+        MESSAGE_TYPES_BY_CODE[data[1]],
+        metadata or {},
+        sentiment,
+        topics,
+        intent
+    )
+
+
+def decode_message(data: Union[bytes, str]) -> ChatMessage:
+    """
+    저장된 메시지 디코딩 (버전 자동 판별)
+
+    Args:
+        data: Redis에서 읽은 값 (bytes 또는 레거시 JSON 문자열)
+
+    Returns:
+        ChatMessage: 디코딩된 메시지
+
+    Raises:
+        ValueError: 지원하지 않는 포맷
+    """
+    if isinstance(data, str):
+        return ChatMessage.from_json(data)
+
+    if data[:1] == JSON_PREFIX:
+        return ChatMessage.from_dict(json.loads(data))
+
+    if data[:1] == bytes((MSGPACK_V1,)):
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack is required to decode chat message format v1")
+        return _decode_msgpack_v1(data)
+
+    raise ValueError(f"Unknown chat message format: 0x{data[:1].hex()}")
+
+
+def get_chat_message_codec(name: str = "msgpack") -> ChatMessageCodec:
+    """
+    설정 이름으로 쓰기 코덱 선택 (msgpack 미설치 시 JSON)
+
+    Args:
+        name: "msgpack" | "json"
+
+    Returns:
+        ChatMessageCodec: 쓰기용 코덱
+    """
+    if name == "msgpack":
+        if MSGPACK_AVAILABLE:
+            return MsgpackChatMessageCodec()
+        logger.warning("msgpack not installed - falling back to JSON chat message codec")
+    elif name != "json":
+        logger.warning(f"Unknown chat message codec '{name}' - using JSON")
+    return JsonChatMessageCodec()
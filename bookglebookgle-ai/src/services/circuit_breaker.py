@@ -0,0 +1,265 @@
+"""
+Circuit Breaker for BGBG AI Server
+Rolling-window circuit breaker for upstream LLM (GMS) calls
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Dict, Any, Optional
+
+from loguru import logger
+
+from src.config.settings import get_settings
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"          # 정상 - 모든 요청 허용
+    OPEN = "open"              # 차단 - 즉시 fallback
+    HALF_OPEN = "half_open"    # 복구 확인 - 제한된 probe 요청만 허용
+
+
+# /metrics는 숫자 값만 내보내므로 상태를 게이지 값으로도 제공 (0=closed, 1=half_open, 2=open)
+STATE_CODES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2
+}
+
+
+@dataclass
+class CallRecord:
+    """Rolling window call record"""
+    timestamp: float
+    success: bool
+    latency_ms: float
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    에러율/지연 기반 서킷 브레이커
+
+    - 최근 WINDOW_SECONDS 동안의 호출을 집계하여 에러율 또는 느린 호출 비율이
+      임계값을 넘으면 OPEN으로 전환 (최소 호출 수 충족 시)
+    - OPEN 상태에서는 OPEN_SECONDS 동안 즉시 거부한 뒤 HALF_OPEN으로 전환
+    - HALF_OPEN에서는 동시에 HALF_OPEN_MAX_PROBES개의 probe 요청만 허용하고,
+      probe 성공 시 CLOSED, 실패 시 다시 OPEN
+    """
+
+    def __init__(self, name: str):
+        settings = get_settings().ai
+        self.name = name
+        self.window_seconds = settings.GMS_BREAKER_WINDOW_SECONDS
+        self.min_calls = settings.GMS_BREAKER_MIN_CALLS
+        self.error_rate_threshold = settings.GMS_BREAKER_ERROR_RATE
+        self.slow_call_ms = settings.GMS_BREAKER_SLOW_CALL_MS
+        self.slow_call_rate_threshold = settings.GMS_BREAKER_SLOW_CALL_RATE
+        self.open_seconds = settings.GMS_BREAKER_OPEN_SECONDS
+        self.half_open_max_probes = settings.GMS_BREAKER_HALF_OPEN_PROBES
+
+        self.state = CircuitState.CLOSED
+        self._calls: Deque[CallRecord] = deque()
+        self._opened_at: float = 0.0
+        self._half_open_in_flight = 0
+
+        self.stats = {
+            "allowed": 0,
+            "rejected": 0,
+            "successes": 0,
+            "failures": 0,
+            "cancelled_slow": 0,
+            "trips": 0,
+            "last_trip_reason": None,
+            "last_state_change": time.time()
+        }
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부 확인 (허용 시 반드시 record_success/record_failure 호출)
+
+        Returns:
+            bool: True면 upstream 호출 진행, False면 즉시 fallback
+        """
+        now = time.time()
+
+        if self.state == CircuitState.OPEN:
+            if now - self._opened_at < self.open_seconds:
+                self.stats["rejected"] += 1
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._half_open_in_flight >= self.half_open_max_probes:
+                self.stats["rejected"] += 1
+                return False
+            self._half_open_in_flight += 1
+
+        self.stats["allowed"] += 1
+        return True
+
+    def record_success(self, latency_ms: float):
+        """성공 호출 기록"""
+        self.stats["successes"] += 1
+
+        if self.state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+            if latency_ms < self.slow_call_ms:
+                self._calls.clear()
+                self._transition(CircuitState.CLOSED)
+                return
+            # 응답은 왔지만 여전히 느리면 다시 차단
+            self._trip(f"half-open probe slow ({latency_ms:.0f}ms)")
+            return
+
+        self._append(CallRecord(time.time(), True, latency_ms))
+        self._evaluate()
+
+    def record_failure(self, latency_ms: float):
+        """실패 호출 기록 (타임아웃/HTTP 오류 등)"""
+        self.stats["failures"] += 1
+
+        if self.state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+            self._trip("half-open probe failed")
+            return
+
+        self._append(CallRecord(time.time(), False, latency_ms))
+        self._evaluate()
+
+    def release(self):
+        """결과 없이 취소된 호출 정리 (hedge로 취소된 요청 등)"""
+        if self.state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+
+    def record_cancelled(self, latency_ms: float):
+        """
+        hedge에서 져서 취소된 호출 기록
+
+        취소 시점까지의 지연 시간은 하한값이므로 느린 호출 기준을 이미 넘긴 경우만 윈도우에 기록
+        (기록하지 않으면 hedge가 느린 upstream을 가려 slow_call_rate가 낮게 집계됨)
+        """
+        if self.state != CircuitState.CLOSED or latency_ms < self.slow_call_ms:
+            return
+        self.stats["cancelled_slow"] += 1
+        self._append(CallRecord(time.time(), True, latency_ms))
+        self._evaluate()
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        최근 성공 호출 지연 시간 백분위수 (ms)
+
+        Args:
+            percentile: 0.0 ~ 1.0
+
+        Returns:
+            Optional[float]: 표본이 부족하면 None
+        """
+        self._prune(time.time())
+        return self._percentile(self._calls, percentile)
+
+    def _percentile(self, calls, percentile: float) -> Optional[float]:
+        latencies = sorted(call.latency_ms for call in calls if call.success)
+        if len(latencies) < self.min_calls:
+            return None
+        index = min(int(len(latencies) * percentile), len(latencies) - 1)
+        return latencies[index]
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        모니터링용 브레이커 상태
+
+        메트릭 HTTP 서버 스레드에서도 호출되므로 윈도우를 정리(popleft)하지 않고
+        호출 기록 스냅샷만 읽음 (이벤트 루프의 _evaluate()와 동시 순회 방지)
+        """
+        now = time.time()
+        cutoff = now - self.window_seconds
+        calls = [call for call in list(self._calls) if call.timestamp >= cutoff]
+        state = self.state
+        total = len(calls)
+        failures = sum(1 for call in calls if not call.success)
+        slow = sum(1 for call in calls if call.latency_ms >= self.slow_call_ms)
+
+        return {
+            "name": self.name,
+            "state": state.value,
+            "state_code": STATE_CODES[state],
+            "window_calls": total,
+            "error_rate": failures / total if total else 0.0,
+            "slow_call_rate": slow / total if total else 0.0,
+            "p95_latency_ms": self._percentile(calls, 0.95),
+            "open_remaining_seconds": max(self.open_seconds - (now - self._opened_at), 0.0)
+            if state == CircuitState.OPEN else 0.0,
+            **dict(self.stats)
+        }
+
+    def _append(self, record: CallRecord):
+        self._calls.append(record)
+        self._prune(record.timestamp)
+
+    def _prune(self, now: float):
+        """윈도우 밖 기록 제거"""
+        cutoff = now - self.window_seconds
+        while self._calls and self._calls[0].timestamp < cutoff:
+            self._calls.popleft()
+
+    def _evaluate(self):
+        """윈도우 집계 후 임계값 초과 시 차단"""
+        if self.state != CircuitState.CLOSED:
+            return
+
+        total = len(self._calls)
+        if total < self.min_calls:
+            return
+
+        failures = sum(1 for call in self._calls if not call.success)
+        slow = sum(1 for call in self._calls if call.latency_ms >= self.slow_call_ms)
+
+        error_rate = failures / total
+        slow_rate = slow / total
+
+        if error_rate >= self.error_rate_threshold:
+            self._trip(f"error rate {error_rate:.0%} over {total} calls")
+        elif slow_rate >= self.slow_call_rate_threshold:
+            self._trip(f"slow call rate {slow_rate:.0%} (>= {self.slow_call_ms}ms) over {total} calls")
+
+    def _trip(self, reason: str):
+        self._opened_at = time.time()
+        self.stats["trips"] += 1
+        self.stats["last_trip_reason"] = reason
+        self._transition(CircuitState.OPEN)
+        logger.warning(f"🔌 Circuit '{self.name}' OPEN for {self.open_seconds}s: {reason}")
+
+    def _transition(self, new_state: CircuitState):
+        if self.state == new_state:
+            return
+        logger.info(f"🔌 Circuit '{self.name}': {self.state.value} -> {new_state.value}")
+        self.state = new_state
+        self.stats["last_state_change"] = time.time()
+        if new_state != CircuitState.HALF_OPEN:
+            self._half_open_in_flight = 0
+
+
+# Global breaker registry (upstream별 1개 - 여러 LLMClient 인스턴스가 공유)
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get shared circuit breaker for an upstream
+
+    Args:
+        name: Upstream name (e.g. "gms")
+
+    Returns:
+        CircuitBreaker: Shared breaker instance
+    """
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
@@ -3,6 +3,9 @@ Discussion Service for BGBG AI Server
 Handles chat moderation and discussion topic generation
 """
 
+import asyncio
+import hashlib
+import time
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
@@ -11,6 +14,10 @@ from src.services.llm_client import LLMClient
 from src.services.vector_db import VectorDBManager
 from src.services.bookclub_discussion_manager import BookClubDiscussionManager
 from src.services.chat_history_manager import ChatHistoryManager
+from src.services.redis_cache_manager import RedisCacheManager
+from src.services.redis_discussion_manager import RedisDiscussionManager, EVENT_ENDED, EVENT_REPLY
+from src.services.session_broadcast_hub import SessionBroadcastHub, BroadcastSubscriber
+from src.services.prompt_builder import DiscussionPromptBuilder, BuiltPrompt
 from src.models.chat_history_models import ChatMessage, MessageType
 from src.config.settings import get_settings
 from datetime import datetime
@@ -26,12 +33,58 @@ class DiscussionService:
         self.vector_db = None  # Will be initialized later
         self.discussion_manager = None
         self.chat_history_manager = ChatHistoryManager()
-        self.active_streams = {}  # 세션별 활성 스트림 관리
+        self.active_streams = {}  # 세션별 활성 스트림 관리 (프로세스 로컬 gRPC 컨텍스트)
+        
+        # 토론 세션 상태 - Redis 공유 저장소 (레플리카 간 공유), 미사용 시 프로세스 로컬 dict
+        self.session_store: Optional[RedisDiscussionManager] = None
+        self.active_discussions = {}
+        self._session_events_task = None
+        
+        # 세션 스트림 브로드캐스트 허브 (AI 응답을 세션의 모든 스트림에 전달)
+        self.broadcast_hub = SessionBroadcastHub(queue_size=self.settings.ai.DISCUSSION_BROADCAST_QUEUE_SIZE)
+        
+        # 토론 주제 캐시 (동일 문서 반복 세션에서 LLM 호출 생략)
+        self.topic_cache: Optional[RedisCacheManager] = None
+        self.topic_cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "warm_latency_ms_total": 0.0,
+            "cold_latency_ms_total": 0.0
+        }
+        
+        # 토큰 예산 기반 프롬프트 빌더 및 입력 토큰 집계
+        self.prompt_builder = DiscussionPromptBuilder()
+        self.prompt_stats = {
+            "requests": 0,
+            "input_tokens_total": 0,
+            "cached_prefix_tokens_total": 0,
+            "dropped_chunks_total": 0,
+            "dropped_messages_total": 0
+        }
 
-    async def initialize_manager(self, vector_db: VectorDBManager):
+    async def initialize_manager(self, vector_db: VectorDBManager, redis_manager=None):
         self.vector_db = vector_db
         self.discussion_manager = BookClubDiscussionManager(vector_db)
         await self.chat_history_manager.start()
+        
+        if self.settings.ai.DISCUSSION_STATE_BACKEND == "redis":
+            if redis_manager is not None and await redis_manager.get_client() is not None:
+                session_store = RedisDiscussionManager(redis_manager)
+                await session_store.initialize(vector_db)
+                self.session_store = session_store
+                self._session_events_task = asyncio.create_task(self._consume_session_events())
+                logger.info("Discussion session state shared via Redis")
+            else:
+                logger.warning("Redis unavailable - discussion session state kept in process memory (single replica only)")
+        
+        try:
+            topic_cache = RedisCacheManager()
+            await topic_cache.start()
+            self.topic_cache = topic_cache
+        except Exception as e:
+            logger.warning(f"Topic cache unavailable, topics will be generated per session: {e}")
+            self.topic_cache = None
+        
         logger.info("DiscussionService initialized with BookClubDiscussionManager and ChatHistoryManager")
 
     async def register_stream(self, session_id: str, context: Any):
@@ -40,6 +93,62 @@ class DiscussionService:
         self.active_streams[session_id].append(context)
         logger.info(f"Stream registered for session {session_id}. Total streams: {len(self.active_streams[session_id])}")
 
+    def _cancel_local_streams(self, session_id: str) -> int:
+        """이 프로세스에 연결된 세션 스트림 종료"""
+        self.broadcast_hub.close_session(session_id)
+        streams = self.active_streams.pop(session_id, [])
+        for context in streams:
+            if not context.done():
+                context.cancel()
+                logger.info(f"Cancelled stream for session {session_id}")
+        return len(streams)
+
+    async def _get_discussion(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """활성 토론 세션 정보 (없으면 None)"""
+        if self.session_store:
+            return await self.session_store.get_discussion_session_raw(session_id)
+        return self.active_discussions.get(session_id)
+
+    async def _consume_session_events(self) -> None:
+        """
+        다른 레플리카의 토론 이벤트 처리
+        - 종료: 이 프로세스의 스트림 종료 및 채팅 상태 정리
+        - 응답 중계: 이 프로세스에 연결된 세션 스트림으로 전달
+        
+        세션 캐시 무효화는 RedisDiscussionManager가 이벤트 수신 시 처리
+        """
+        retry_delay = 1
+        
+        def on_subscribed():
+            logger.info("Subscribed to discussion session events")
+        
+        while True:
+            try:
+                async for event, session_id, origin, payload in self.session_store.listen_session_events(
+                    on_subscribed=on_subscribed
+                ):
+                    retry_delay = 1
+                    if origin == self.session_store.instance_id:
+                        continue
+                    
+                    if event == EVENT_REPLY:
+                        self.broadcast_hub.publish(session_id, payload)
+                        continue
+                    if event != EVENT_ENDED:
+                        continue
+                    
+                    cancelled = self._cancel_local_streams(session_id)
+                    await self.chat_history_manager.cleanup_session(session_id)
+                    if cancelled:
+                        logger.info(f"🔚 Discussion {session_id} ended on another replica: {cancelled} local streams closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Discussion session event subscription lost: {e}")
+            
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
     async def unregister_stream(self, session_id: str, context: Any):
         if session_id in self.active_streams and context in self.active_streams[session_id]:
             self.active_streams[session_id].remove(context)
@@ -56,6 +165,7 @@ class DiscussionService:
     ) -> Dict[str, Any]:
         try:
             logger.info(f"🎯 Starting discussion for document: {document_id}")
+            start_time = time.perf_counter()
             if self.vector_db is None:
                 logger.error("VectorDB not initialized.")
                 return {"success": False, "message": "Vector database not initialized."}
@@ -68,47 +178,113 @@ class DiscussionService:
             if not document_content:
                 return {"success": False, "message": "Document not found in vector database."}
 
-            topics_result = await self.generate_discussion_topics(" ".join(document_content) if document_content else "")
-            if not topics_result["success"]:
-                return {"success": False, "message": "Failed to generate discussion topics."}
+            # 청크 내용 지문 기반 주제 캐시 조회
+            fingerprint = self._content_fingerprint(document_content)
+            cached_topics = None
+            if self.topic_cache:
+                cached_topics = await self.topic_cache.get_cached_discussion_topics(
+                    meeting_id, document_id, fingerprint
+                )
 
-            if not hasattr(self, 'active_discussions'):
-                self.active_discussions = {}
-            self.active_discussions[session_id] = {
-                "meeting_id": meeting_id,
-                "document_id": document_id,
-                "started_at": datetime.utcnow(),
-                "participants": participants or [],
-                "chatbot_active": True
-            }
+            if cached_topics:
+                topics_result = {"success": True, "topics": list(cached_topics)}
+            else:
+                topics_result = await self.generate_discussion_topics(" ".join(document_content) if document_content else "")
+                if not topics_result["success"]:
+                    return {"success": False, "message": "Failed to generate discussion topics."}
+
+                # 기본 주제(LLM 응답 파싱 실패)는 캐시하지 않음
+                if self.topic_cache and not topics_result.get("fallback"):
+                    await self.topic_cache.cache_discussion_topics(
+                        meeting_id, document_id, fingerprint, list(topics_result["topics"])
+                    )
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            cache_state = "warm" if cached_topics else "cold"
+            if cached_topics:
+                self.topic_cache_stats["hits"] += 1
+                self.topic_cache_stats["warm_latency_ms_total"] += elapsed_ms
+            else:
+                self.topic_cache_stats["misses"] += 1
+                self.topic_cache_stats["cold_latency_ms_total"] += elapsed_ms
+            logger.info(f"⏱️ Discussion topics ready ({cache_state}) for document {document_id}: {elapsed_ms:.1f}ms")
+
+            if self.session_store:
+                # 세션 고정 독서 자료 - 토론 응답 시 캐시 가능한 시스템 prefix로 사용
+                stored = await self.session_store.start_discussion(
+                    meeting_id, session_id, document_id, participants, book_context=list(document_content)
+                )
+                if not stored["success"]:
+                    return {"success": False, "message": stored["message"]}
+            else:
+                self.active_discussions[session_id] = {
+                    "meeting_id": meeting_id,
+                    "document_id": document_id,
+                    "started_at": datetime.utcnow(),
+                    "participants": participants or [],
+                    "chatbot_active": True,
+                    # 세션 고정 독서 자료 - 토론 응답 시 캐시 가능한 시스템 prefix로 사용
+                    "book_context": list(document_content)
+                }
             self.active_streams[session_id] = []  # 스트림 리스트 초기화
             logger.info(f"✅ Discussion started for session: {session_id}")
             return {
                 "success": True,
                 "message": "Discussion started and topics generated.",
                 "discussion_topics": topics_result["topics"],
-                "recommended_topic": topics_result["topics"].pop(0) if topics_result["topics"] else ""
+                "recommended_topic": topics_result["topics"].pop(0) if topics_result["topics"] else "",
+                "topics_cached": bool(cached_topics),
+                "latency_ms": elapsed_ms
             }
         except Exception as e:
             logger.error(f"Failed to start discussion: {e}")
             return {"success": False, "message": f"Discussion start failed: {str(e)}"}
 
+    def _content_fingerprint(self, chunks: List[str]) -> str:
+        """주제 생성에 사용된 청크 내용의 지문 (재업로드 시 자동으로 달라짐)"""
+        digest = hashlib.sha256("\n".join(chunks).encode("utf-8")).hexdigest()
+        return digest[:16]
+
+    async def invalidate_document_topics(self, meeting_id: str, document_id: str) -> int:
+        """문서 재업로드 시 캐시된 토론 주제 무효화"""
+        if not self.topic_cache:
+            return 0
+        return await self.topic_cache.invalidate_document_topics(meeting_id, document_id)
+
+    def get_topic_cache_stats(self) -> Dict[str, Any]:
+        """토론 주제 캐시 적중률 및 cold/warm 평균 지연 시간"""
+        hits = self.topic_cache_stats["hits"]
+        misses = self.topic_cache_stats["misses"]
+        total = hits + misses
+        return {
+            "enabled": self.topic_cache is not None,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total > 0 else 0.0,
+            "avg_warm_latency_ms": self.topic_cache_stats["warm_latency_ms_total"] / hits if hits else 0.0,
+            "avg_cold_latency_ms": self.topic_cache_stats["cold_latency_ms_total"] / misses if misses else 0.0
+        }
+
     async def end_discussion(
         self,
         meeting_id: str,
         session_id: str
     ) -> Dict[str, Any]:
         try:
-            # 활성 스트림 종료
-            if session_id in self.active_streams:
-                for context in self.active_streams[session_id]:
-                    if not context.done():
-                        context.cancel()
-                        logger.info(f"Cancelled stream for session {session_id}")
-                del self.active_streams[session_id]
+            # 활성 스트림 종료 (다른 레플리카의 스트림은 종료 이벤트로 정리)
+            self._cancel_local_streams(session_id)
+
+            # 세션 최근 메시지 버퍼 등 인메모리 채팅 상태 정리
+            if self.chat_history_manager:
+                await self.chat_history_manager.cleanup_session(session_id)
 
             # 활성 토론에서 제거
-            if hasattr(self, 'active_discussions') and session_id in self.active_discussions:
+            if self.session_store:
+                result = await self.session_store.end_discussion(session_id)
+                if result["success"]:
+                    logger.info(f"✅ Discussion ended for session: {session_id}")
+                return {"success": result["success"], "message": result["message"]}
+            elif session_id in self.active_discussions:
                 del self.active_discussions[session_id]
                 logger.info(f"✅ Discussion ended for session: {session_id}")
                 return {"success": True, "message": "Discussion ended successfully"}
@@ -152,39 +328,39 @@ class DiscussionService:
                 message_type=MessageType.USER
             )
             
-            # 채팅 기록에 저장
+            discussion_info = await self._get_discussion(session_id)
+            is_active = discussion_info is not None
+            
+            # 채팅 기록 저장 + 최근 대화 조회 (Redis 1회 왕복)
+            chat_turn = None
             try:
-                await self.chat_history_manager.store_message(session_id, chat_message)
+                chat_turn = await self.chat_history_manager.store_message_and_get_recent(
+                    session_id, chat_message, limit=10 if is_active else 0
+                )
                 logger.debug(f"Stored user message in chat history for session {session_id}")
             except Exception as e:
                 logger.warning(f"Failed to store message in chat history: {e}")
             
             # 토론이 활성화되어 있는지 확인
-            if not hasattr(self, 'active_discussions') or session_id not in self.active_discussions:
+            if not is_active:
                 return {
                     "success": True,
                     "ai_response": None,  # 토론 비활성화 상태에서는 챗봇 응답 없음
                     "requires_moderation": False
                 }
             
-            discussion_info = self.active_discussions[session_id]
-            
             # 채팅 기록에서 최근 대화 컨텍스트 가져오기 및 AI 응답 필요성 판단
             try:
-                recent_messages = await self.chat_history_manager.get_recent_messages(
-                    session_id, limit=10
-                )
+                if chat_turn is None:
+                    raise RuntimeError("chat history unavailable")
+                recent_messages = chat_turn["messages"]
                 
-                # 최근 메시지에서 사용자 메시지만 카운트 (AI 메시지 제외)
-                user_messages_since_ai = []
-                for msg in reversed(recent_messages):
-                    if msg.message_type == MessageType.AI:
-                        break  # 마지막 AI 응답 이후부터 카운트
-                    if msg.message_type == MessageType.USER:
-                        user_messages_since_ai.append(msg)
+                # 마지막 AI 응답 이후 사용자 메시지 수 (Redis 세션 카운터 - 조회 창 크기와 무관)
+                user_messages_since_ai = chat_turn["user_messages_since_ai"]
                 
                 # 참여자 수에 따른 AI 응답 대기 채팅 수 계산
-                participants_count = len(discussion_info.get("participants", []))
+                # 참여자 목록이 없으면 마지막 AI 응답 이후 발언자 수로 대체
+                participants_count = len(discussion_info.get("participants", [])) or chat_turn.get("speakers_since_ai") or 0
                 if participants_count <= 1:
                     required_messages = 1  # 1명 이하: 1개 메시지 후 응답
                 elif participants_count <= 3:
@@ -193,9 +369,9 @@ class DiscussionService:
                     required_messages = 3  # 4명 이상: 3개 메시지 후 응답 (최대)
                 
                 # AI 응답이 필요한지 판단
-                should_respond = len(user_messages_since_ai) >= required_messages
+                should_respond = user_messages_since_ai >= required_messages
                 
-                logger.debug(f"Participants: {participants_count}, Required messages: {required_messages}, Current user messages: {len(user_messages_since_ai)}")
+                logger.debug(f"Participants: {participants_count}, Required messages: {required_messages}, Current user messages: {user_messages_since_ai}")
                 
                 chat_context = "\n".join([
                     f"{msg.nickname}: {msg.content}" 
@@ -206,7 +382,7 @@ class DiscussionService:
                 chat_context = f"{sender_nickname}: {message}"
                 # Redis 접근 실패 시 기본적으로 응답하지 않음
                 should_respond = False
-                user_messages_since_ai = []
+                user_messages_since_ai = 0
                 required_messages = 0  # Redis 실패시 기본값
             
             # 벡터DB에서 독서 모임별 문서 내용 가져와서 맥락 제공
@@ -234,9 +410,9 @@ class DiscussionService:
                     document_content=document_content,
                     chat_context=chat_context
                 )
-                logger.debug(f"AI response generated after {len(user_messages_since_ai)} user messages (required: {required_messages})")
+                logger.debug(f"AI response generated after {user_messages_since_ai} user messages (required: {required_messages})")
             else:
-                logger.debug(f"AI response skipped - only {len(user_messages_since_ai)} user messages since last AI response (required: {required_messages})")
+                logger.debug(f"AI response skipped - only {user_messages_since_ai} user messages since last AI response (required: {required_messages})")
             
             # AI 응답도 채팅 기록에 저장
             if ai_response:
@@ -250,7 +426,7 @@ class DiscussionService:
                         timestamp=datetime.utcnow(),
                         message_type=MessageType.AI
                     )
-                    await self.chat_history_manager.store_message(session_id, ai_message)
+                    await self.chat_history_manager.store_message_and_get_recent(session_id, ai_message, limit=0)
                     logger.debug(f"Stored AI response in chat history for session {session_id}")
                 except Exception as e:
                     logger.warning(f"Failed to store AI response in chat history: {e}")
@@ -289,6 +465,71 @@ class DiscussionService:
         Yields:
             str: Streaming AI response chunks
         """
+        async for chunk, _ in self._chat_reply_stream(meeting_id, session_id, message_data):
+            yield chunk
+
+    async def broadcast_chat_message(
+        self,
+        meeting_id: str,
+        session_id: str,
+        message_data: Dict[str, Any],
+        subscriber: BroadcastSubscriber
+    ) -> None:
+        """
+        토론 메시지 처리 후 AI 응답 청크를 세션의 모든 스트림에 전달
+        
+        토론 비활성 안내와 오류 메시지는 보낸 사람의 스트림에만 전달
+        
+        Args:
+            meeting_id: 독서 모임 ID
+            session_id: 토론 세션 ID
+            message_data: 메시지 데이터
+            subscriber: 보낸 사람 스트림의 구독
+        """
+        async for chunk, is_reply in self._chat_reply_stream(meeting_id, session_id, message_data):
+            if not chunk:
+                continue
+            
+            if is_reply:
+                await self.broadcast_reply(session_id, {"ai_response": chunk})
+            else:
+                self.broadcast_hub.send(subscriber, {"ai_response": chunk})
+
+    async def broadcast_reply(self, session_id: str, payload: Dict[str, Any]) -> int:
+        """
+        AI 응답 청크를 이 프로세스의 세션 스트림에 전달하고 다른 레플리카로 중계
+        
+        Returns:
+            int: 이 프로세스에서 큐에 추가된 스트림 수
+        """
+        enqueued = self.broadcast_hub.publish(session_id, payload)
+        if self.session_store and self.settings.ai.DISCUSSION_BROADCAST_RELAY:
+            try:
+                await self.session_store.publish_reply(session_id, payload)
+            except Exception as e:
+                logger.warning(f"Failed to relay discussion reply for session {session_id}: {e}")
+        return enqueued
+
+    def get_broadcast_stats(self) -> Dict[str, Any]:
+        """세션 스트림 브로드캐스트 통계 (전달 지연 시간, 느린 구독자 제거 수)"""
+        stats = self.broadcast_hub.get_stats()
+        if self.session_store:
+            stats["relayed"] = self.session_store.cache_stats["replies_relayed"]
+            stats["relay_received"] = self.session_store.cache_stats["replies_received"]
+        return stats
+
+    async def _chat_reply_stream(
+        self,
+        meeting_id: str,
+        session_id: str,
+        message_data: Dict[str, Any]
+    ):
+        """
+        토론 메시지 처리 스트림
+        
+        Yields:
+            tuple: (chunk, is_reply) - is_reply가 True면 세션 전체에 보낼 AI 응답, False면 보낸 사람에게만 보낼 안내
+        """
         try:
             # 사용자 메시지를 채팅 기록에 저장
             message = message_data.get("message", "")
@@ -307,39 +548,41 @@ class DiscussionService:
                 message_type=MessageType.USER
             )
             
+            discussion_info = await self._get_discussion(session_id)
+            is_active = discussion_info is not None
+            
+            # 채팅 기록 저장 + 최근 대화 조회 (Redis 1회 왕복)
+            chat_turn = None
             try:
-                await self.chat_history_manager.store_message(session_id, chat_message)
+                chat_turn = await self.chat_history_manager.store_message_and_get_recent(
+                    session_id, chat_message, limit=10 if is_active else 0
+                )
                 logger.debug(f"Stored user message in chat history for streaming session {session_id}")
             except Exception as e:
                 logger.warning(f"Failed to store message in chat history: {e}")
             
             # Check if discussion is active
-            if not hasattr(self, 'active_discussions') or session_id not in self.active_discussions:
-                yield "토론이 활성화되지 않았습니다. 토론을 먼저 시작해주세요."
+            if not is_active:
+                yield "토론이 활성화되지 않았습니다. 토론을 먼저 시작해주세요.", False
                 return
             
             # 토론 세션 정보 확인
-            discussion_info = self.active_discussions[session_id]
             if not discussion_info.get("chatbot_active", True):
-                yield "AI 토론 진행자가 비활성화되었습니다."
+                yield "AI 토론 진행자가 비활성화되었습니다.", False
                 return
             
             # 채팅 기록에서 최근 대화 컨텍스트 가져오기 및 AI 응답 필요성 판단
             try:
-                recent_messages = await self.chat_history_manager.get_recent_messages(
-                    session_id, limit=10
-                )
+                if chat_turn is None:
+                    raise RuntimeError("chat history unavailable")
+                recent_messages = chat_turn["messages"]
                 
-                # 최근 메시지에서 사용자 메시지만 카운트 (AI 메시지 제외)
-                user_messages_since_ai = []
-                for msg in reversed(recent_messages):
-                    if msg.message_type == MessageType.AI:
-                        break  # 마지막 AI 응답 이후부터 카운트
-                    if msg.message_type == MessageType.USER:
-                        user_messages_since_ai.append(msg)
+                # 마지막 AI 응답 이후 사용자 메시지 수 (Redis 세션 카운터 - 조회 창 크기와 무관)
+                user_messages_since_ai = chat_turn["user_messages_since_ai"]
                 
                 # 참여자 수에 따른 AI 응답 대기 채팅 수 계산
-                participants_count = len(discussion_info.get("participants", []))
+                # 참여자 목록이 없으면 마지막 AI 응답 이후 발언자 수로 대체
+                participants_count = len(discussion_info.get("participants", [])) or chat_turn.get("speakers_since_ai") or 0
                 if participants_count <= 1:
                     required_messages = 1  # 1명 이하: 1개 메시지 후 응답
                 elif participants_count <= 3:
@@ -348,9 +591,9 @@ class DiscussionService:
                     required_messages = 3  # 4명 이상: 3개 메시지 후 응답 (최대)
                 
                 # AI 응답이 필요한지 판단
-                should_respond = len(user_messages_since_ai) >= required_messages
+                should_respond = user_messages_since_ai >= required_messages
                 
-                logger.debug(f"Streaming - Participants: {participants_count}, Required messages: {required_messages}, Current user messages: {len(user_messages_since_ai)}")
+                logger.debug(f"Streaming - Participants: {participants_count}, Required messages: {required_messages}, Current user messages: {user_messages_since_ai}")
                 
                 chat_context_chunks = [
                     f"{msg.nickname}: {msg.content}" 
@@ -361,7 +604,7 @@ class DiscussionService:
                 chat_context_chunks = [f"{sender_nickname}: {message}"]
                 # Redis 접근 실패 시 기본적으로 응답하지 않음
                 should_respond = False
-                user_messages_since_ai = []
+                user_messages_since_ai = 0
                 required_messages = 0  # Redis 실패시 기본값
             
             # Get book material context from VectorDB
@@ -379,23 +622,24 @@ class DiscussionService:
             
             # AI 응답이 필요한 경우에만 스트리밍 응답 생성
             if not should_respond:
-                logger.debug(f"AI streaming response skipped - only {len(user_messages_since_ai)} user messages since last AI response (required: {required_messages})")
+                logger.debug(f"AI streaming response skipped - only {user_messages_since_ai} user messages since last AI response (required: {required_messages})")
                 return
             
-            logger.debug(f"AI streaming response generated after {len(user_messages_since_ai)} user messages (required: {required_messages})")
+            logger.debug(f"AI streaming response generated after {user_messages_since_ai} user messages (required: {required_messages})")
             
             # Generate streaming response with book context and chat history
             if self.settings.ai.MOCK_AI_RESPONSES:
                 mock_response = await self.mock_service.process_chat_message(message_data)
-                yield mock_response.get("ai_response", "Mock 토론 진행자 응답입니다.")
+                yield mock_response.get("ai_response", "Mock 토론 진행자 응답입니다."), True
             else:
                 # AI 응답을 수집하여 채팅 기록에 저장
                 ai_response_chunks = []
                 async for chunk in self._process_with_bookclub_llm_stream_with_context(
-                    message_data, context_chunks, chat_context_chunks
+                    message_data, context_chunks, chat_context_chunks,
+                    session_context=discussion_info.get("book_context")
                 ):
                     ai_response_chunks.append(chunk)
-                    yield chunk
+                    yield chunk, True
                 
                 # 완성된 AI 응답을 채팅 기록에 저장
                 if ai_response_chunks:
@@ -410,14 +654,14 @@ class DiscussionService:
                             timestamp=datetime.utcnow(),
                             message_type=MessageType.AI
                         )
-                        await self.chat_history_manager.store_message(session_id, ai_message)
+                        await self.chat_history_manager.store_message_and_get_recent(session_id, ai_message, limit=0)
                         logger.debug(f"Stored AI streaming response in chat history for session {session_id}")
                     except Exception as e:
                         logger.warning(f"Failed to store AI streaming response in chat history: {e}")
                     
         except Exception as e:
             logger.error(f"Book club chat streaming failed: {e}")
-            yield "AI 토론 진행자 응답 생성 중 오류가 발생했습니다."
+            yield "AI 토론 진행자 응답 생성 중 오류가 발생했습니다.", False
 
 
     
@@ -448,7 +692,8 @@ class DiscussionService:
                 system_message=system_message,
                 max_tokens=800,
                 temperature=0.7,
-                provider=LLMProvider.GMS
+                provider=LLMProvider.GMS,
+                caller="discussion_topics"
             )
 
             # 응답에서 주제 추출
@@ -460,8 +705,10 @@ class DiscussionService:
                         topic = topic.split('. ', 1)[1]
                     topics.append(topic)
             
+            fallback = False
             if not topics:
                 # 기본 주제 제공
+                fallback = True
                 topics = [
                     "이 문서에서 가장 인상 깊었던 부분은 무엇인가요?",
                     "작가의 주장에 대해 어떻게 생각하시나요?",
@@ -470,7 +717,8 @@ class DiscussionService:
 
             return {
                 "success": True,
-                "topics": topics[:3]  # 최대 3개
+                "topics": topics[:3],  # 최대 3개
+                "fallback": fallback
             }
 
         except Exception as e:
@@ -513,7 +761,8 @@ class DiscussionService:
                 system_message=system_message,
                 max_tokens=800,
                 temperature=0.8,
-                provider=LLMProvider.GMS
+                provider=LLMProvider.GMS,
+                caller="discussion"
             )
 
             return response.strip()
@@ -569,7 +818,8 @@ class DiscussionService:
                 system_message=system_message,
                 max_tokens=800,
                 temperature=0.8,
-                provider=LLMProvider.GMS
+                provider=LLMProvider.GMS,
+                caller="discussion"
             )
 
             return response.strip()
@@ -586,7 +836,8 @@ class DiscussionService:
         self, 
         message_data: Dict[str, Any], 
         context_chunks: List[str],
-        chat_context_chunks: List[str]
+        chat_context_chunks: List[str],
+        session_context: Optional[List[str]] = None
     ):
         """
         Process message with book club context and chat history using streaming LLM
@@ -596,6 +847,7 @@ class DiscussionService:
             message_data: 사용자 메시지 데이터
             context_chunks: 독서 자료 컨텍스트 청크들
             chat_context_chunks: 채팅 기록 컨텍스트 청크들
+            session_context: 세션 고정 독서 자료 (캐시 prefix)
             
         Yields:
             str: Streaming AI response chunks
@@ -609,46 +861,26 @@ class DiscussionService:
             message = message_data.get("message", "")
             sender_nickname = message_data.get("sender_nickname", "참여자")
             
-            # 채팅 기록과 독서 자료를 모두 고려한 시스템 프롬프트
-            system_message = """당신은 독서 모임의 전문 AI 토론 진행자입니다.
-최근 대화 흐름과 독서 자료를 모두 고려하여 맞춤형 응답을 해주세요.
-
-역할 및 지침:
-1. 최근 대화 맥락을 고려하여 자연스럽게 응답
-2. 참여자의 의견에 구체적으로 공감하고 인정
-3. 독서 내용과 연결된 새로운 관점이나 질문 제시
-4. 다른 참여자들의 참여를 자연스럽게 유도
-5. 150자 내외로 간결하면서도 의미있게 작성
-6. 친근하고 격려하는 톤 유지
-7. 대화가 반복되지 않도록 새로운 각도에서 접근
-8. **중요**: 매 메시지마다 응답하지 말고, 참여자들의 메시지가 2-3개 쌓인 후에만 의미있는 피드백 제공. 너무 적극적으로 개입하지 말 것
-9. 최근 대화가 2~3개 이하로 짧다면, 대화 시작을 돕는 배경/오픈 질문을 포함하고, 아직 참여하지 않은 분들을 부드럽게 초대
-10. 최근 10개 내 참여 빈도가 낮은 사람(메시지 1회 이하)이 있다면, 이름을 직접 거론하지 않고 모두에게 참여를 권유하는 일반 메시지를 덧붙이세요
-11. 위의 10개의 규칙을 절대로 위배하지 않기"""
-            
-            # 프롬프트 구성
-            book_context_text = "\n\n".join(context_chunks) if context_chunks else "독서 자료 내용 없음"
-            chat_context_text = "\n".join(chat_context_chunks) if chat_context_chunks else f"{sender_nickname}: {message}"
-            
-            prompt = f"""독서 자료 내용:
-{book_context_text}
-
-최근 대화 흐름:
-{chat_context_text}
-
-현재 상황:
-{sender_nickname}님이 방금 말했습니다: "{message}"
-
-위 맥락을 모두 고려하여 토론 진행자로서 자연스럽고 의미있는 응답을 해주세요."""
+            # 토큰 예산 내로 독서 자료/채팅 기록을 선별하여 프롬프트 구성
+            built = self.prompt_builder.build(
+                message=message,
+                sender_nickname=sender_nickname,
+                book_chunks=context_chunks,
+                chat_lines=chat_context_chunks,
+                session_context=session_context
+            )
+            self._record_prompt_stats(built)
             
             # GMS API 스트리밍 호출
             from src.services.llm_client import LLMProvider
             async for chunk in self.llm_client.generate_completion_stream(
-                prompt=prompt,
-                system_message=system_message,
+                prompt=built.prompt,
+                system_message=built.system_message,
                 max_tokens=800,
                 temperature=0.8,
-                provider=LLMProvider.GMS
+                provider=LLMProvider.GMS,
+                hedge=True,  # 실시간 채팅 응답 - 지연 시 헤지 요청 허용
+                caller="discussion"
             ):
                 yield chunk
                 
@@ -662,12 +894,42 @@ class DiscussionService:
                 yield f"{sender_nickname}님의 생각에 공감합니다. 다른 분들은 어떻게 생각하시나요?"
 
     
+    def _record_prompt_stats(self, built: BuiltPrompt):
+        """요청별 추정 입력 토큰 기록"""
+        self.prompt_stats["requests"] += 1
+        self.prompt_stats["input_tokens_total"] += built.input_tokens
+        self.prompt_stats["cached_prefix_tokens_total"] += built.cached_prefix_tokens
+        self.prompt_stats["dropped_chunks_total"] += built.dropped_chunks
+        self.prompt_stats["dropped_messages_total"] += built.dropped_messages
+        logger.info(f"🧮 Discussion prompt: ~{built.input_tokens} input tokens "
+                    f"(cacheable prefix {built.cached_prefix_tokens}, book {built.book_tokens}, history {built.history_tokens}, "
+                    f"dropped {built.dropped_chunks} chunks/{built.dropped_messages} messages)")
+
+    def get_prompt_stats(self) -> Dict[str, Any]:
+        """토론 프롬프트 입력 토큰 통계 (추정치 + LLM 응답 usage 실측치, 캐시 read/write 포함)"""
+        requests = self.prompt_stats["requests"]
+        return {
+            **self.prompt_stats,
+            "avg_input_tokens": self.prompt_stats["input_tokens_total"] / requests if requests else 0.0,
+            "token_budget": self.prompt_builder.max_tokens,
+            "llm_usage": self.llm_client.get_usage_stats()
+        }
+
     async def cleanup(self):
         """Clean up resources when shutting down"""
         try:
+            if self._session_events_task:
+                self._session_events_task.cancel()
+                try:
+                    await self._session_events_task
+                except asyncio.CancelledError:
+                    pass
             if hasattr(self, 'chat_history_manager'):
                 await self.chat_history_manager.stop()
                 logger.info("ChatHistoryManager stopped")
+            if self.topic_cache:
+                await self.topic_cache.stop()
+                logger.info("Topic cache stopped")
         except Exception as e:
             logger.error(f"Error during DiscussionService cleanup: {e}")
     
@@ -706,39 +968,27 @@ class DiscussionService:
                 "chat_history_sessions_cleaned": 0
             }
             
-            # 1. active_discussions에서 해당 미팅 삭제
-            if hasattr(self, 'active_discussions'):
-                sessions_to_remove = []
-                for session_id, discussion in self.active_discussions.items():
-                    if discussion.get("meeting_id") == meeting_id:
-                        sessions_to_remove.append(session_id)
-                
-                for session_id in sessions_to_remove:
+            # 1. 해당 미팅의 토론 세션 삭제 (Redis 모드에서는 모든 레플리카에 종료 이벤트 발행)
+            if self.session_store:
+                meeting_sessions = await self.session_store.get_active_sessions(meeting_id)
+                for session_id in meeting_sessions:
+                    result = await self.session_store.end_discussion(session_id)
+                    if result["success"]:
+                        cleanup_results["active_discussions_cleaned"] += 1
+                        logger.debug(f"Removed active discussion for session: {session_id}")
+            else:
+                meeting_sessions = [
+                    session_id for session_id, discussion in self.active_discussions.items()
+                    if discussion.get("meeting_id") == meeting_id
+                ]
+                for session_id in meeting_sessions:
                     del self.active_discussions[session_id]
                     cleanup_results["active_discussions_cleaned"] += 1
                     logger.debug(f"Removed active discussion for session: {session_id}")
             
-            # 2. active_streams에서 해당 미팅의 스트림들 정리
-            sessions_to_remove = []
-            for session_id, streams in self.active_streams.items():
-                # 세션 ID를 통해 미팅과 연관된 스트림인지 확인
-                # (세션별로 미팅 정보를 직접 확인할 수 없으므로, active_discussions 정보 활용)
-                if hasattr(self, 'active_discussions'):
-                    # 이미 삭제된 토론 세션의 스트림들 정리
-                    if session_id not in self.active_discussions:
-                        sessions_to_remove.append(session_id)
-                
-                # 활성 스트림들 취소
-                for context in streams:
-                    if not context.done():
-                        context.cancel()
-                        logger.debug(f"Cancelled stream for session {session_id}")
-            
-            for session_id in sessions_to_remove:
-                if session_id in self.active_streams:
-                    cleanup_results["active_streams_cleaned"] += len(self.active_streams[session_id])
-                    del self.active_streams[session_id]
-                    logger.debug(f"Removed active streams for session: {session_id}")
+            # 2. 해당 세션들의 이 프로세스 스트림 종료 (다른 레플리카는 종료 이벤트로 정리)
+            for session_id in meeting_sessions:
+                cleanup_results["active_streams_cleaned"] += self._cancel_local_streams(session_id)
             
             # 3. 채팅 히스토리 정리 (미팅 ID로 연관된 세션들)
             if self.chat_history_manager:
@@ -746,9 +996,11 @@ class DiscussionService:
                     # 모든 세션에서 해당 미팅과 관련된 세션들 찾아서 정리
                     # (실제 구현에서는 chat_history_manager에 미팅별 정리 메소드가 필요할 수 있음)
                     
-                    # 현재는 active_discussions에서 찾은 세션들만 정리
-                    for session_id in sessions_to_remove:
+                    # 현재는 활성 토론 목록에서 찾은 세션들만 정리
+                    for session_id in meeting_sessions:
                         try:
+                            await self.chat_history_manager.cleanup_session(session_id)
+                            
                             # 세션 데이터 정리 - ChatHistoryManager에 메소드가 있는지 확인
                             if hasattr(self.chat_history_manager, 'clear_session_history'):
                                 result = await self.chat_history_manager.clear_session_history(session_id)
@@ -0,0 +1,78 @@
+"""
+Embedding Backend for BGBG AI Server
+Lazy facade over the sentence-transformers embedding model
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Optional
+
+from loguru import logger
+
+from src.utils.lazy_import import lazy_import
+
+# sentence_transformers는 torch를 함께 로드하므로 모델을 실제로 로드할 때 import
+sentence_transformers = lazy_import("sentence_transformers")
+
+
+# 한국어 지원 다국어 모델
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+
+class EmbeddingBackend:
+    """
+    임베딩 모델 지연 로드 퍼사드
+    
+    - sentence_transformers import와 모델 로드를 ensure_loaded() 또는 첫 encode() 시점까지 미룸
+    - 비동기 경로는 ensure_loaded()로 스레드에서 로드 (이벤트 루프 블로킹 방지)
+    - 미로드 상태에서 encode()를 호출하면 호출 스레드에서 로드
+    """
+    
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL):
+        self.model_name = model_name
+        self._model: Optional[Any] = None
+        self._lock = threading.Lock()
+        self.load_ms: Optional[float] = None
+    
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+    
+    def load(self) -> Any:
+        """모델 로드 (이미 로드되어 있으면 그대로 반환)"""
+        if self._model is not None:
+            return self._model
+        
+        with self._lock:
+            if self._model is None:
+                logger.info("Loading embedding model...")
+                started_at = time.perf_counter()
+                self._model = sentence_transformers.SentenceTransformer(self.model_name)
+                self.load_ms = (time.perf_counter() - started_at) * 1000
+                logger.info(f"Embedding model loaded: {self.model_name} ({self.load_ms:.0f}ms)")
+        return self._model
+    
+    async def ensure_loaded(self):
+        """스레드에서 모델 로드"""
+        if self._model is None:
+            await asyncio.to_thread(self.load)
+    
+    def encode(self, *args, **kwargs) -> Any:
+        """SentenceTransformer.encode 위임"""
+        return self.load().encode(*args, **kwargs)
+
+
+_shared_backend: Optional[EmbeddingBackend] = None
+
+
+def get_shared_embedding_backend() -> EmbeddingBackend:
+    """
+    프로세스 공용 임베딩 백엔드
+    
+    멀티 프로세스 모드에서 감독 프로세스가 fork 전에 load()하면 워커는 같은 가중치 페이지를 copy-on-write로 공유
+    """
+    global _shared_backend
+    if _shared_backend is None:
+        _shared_backend = EmbeddingBackend()
+    return _shared_backend
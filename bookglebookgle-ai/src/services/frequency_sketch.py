@@ -0,0 +1,154 @@
+"""
+Frequency Sketch for BGBG AI Server
+Fixed-memory approximate access frequency (count-min sketch) and TinyLFU-style tier admission
+"""
+
+import heapq
+import itertools
+import logging
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 카운터 절반 감쇠용 변환 테이블 (bytearray.translate로 한 번에 처리)
+_HALVE_TABLE = bytes(value >> 1 for value in range(256))
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+class FrequencySketch:
+    """
+    Count-min sketch 기반 접근 빈도 추정기
+    
+    - depth개 행 x width개 카운터(1바이트, 15에서 포화) - 키 수와 무관한 고정 메모리
+    - 보수적 증가: 최소값인 카운터만 증가시켜 과대 추정 완화
+    - 증가 횟수가 sample_size에 도달하면 모든 카운터를 절반으로 감쇠 (오래된 인기도 퇴색)
+    """
+    
+    MAX_COUNT = 15
+    
+    def __init__(self, width: int = 16384, depth: int = 4, sample_factor: int = 10):
+        """
+        Args:
+            width: 행당 카운터 수 (2의 거듭제곱으로 올림)
+            depth: 해시 행 수
+            sample_factor: 감쇠 주기 (width의 배수만큼 증가 후 감쇠)
+        """
+        self.width = 1 << max(int(width) - 1, 1).bit_length()
+        self.depth = depth
+        self._mask = self.width - 1
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+        
+        self.sample_size = sample_factor * self.width
+        self.additions = 0
+        self.resets = 0
+    
+    def _indexes(self, key: Hashable) -> List[int]:
+        # 이중 해싱: h1 + i * h2 (프로세스 내에서만 쓰므로 내장 hash 사용)
+        h1 = hash(key) & _MASK_64
+        h2 = (((h1 * 0x9E3779B97F4A7C15) & _MASK_64) >> 32) | 1
+        return [(h1 + i * h2) & self._mask for i in range(self.depth)]
+    
+    def increment(self, key: Hashable) -> None:
+        """접근 1회 기록"""
+        indexes = self._indexes(key)
+        current = min(row[index] for row, index in zip(self._rows, indexes))
+        if current >= self.MAX_COUNT:
+            return
+        
+        for row, index in zip(self._rows, indexes):
+            if row[index] == current:
+                row[index] = current + 1
+        
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+    
+    def estimate(self, key: Hashable) -> int:
+        """추정 접근 빈도 (0 ~ MAX_COUNT)"""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+    
+    def _age(self) -> None:
+        for depth, row in enumerate(self._rows):
+            self._rows[depth] = row.translate(_HALVE_TABLE)
+        self.additions //= 2
+        self.resets += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """스케치 크기 및 감쇠 현황"""
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "memory_bytes": self.width * self.depth,
+            "additions": self.additions,
+            "sample_size": self.sample_size,
+            "resets": self.resets
+        }
+
+
+class TieredAdmission:
+    """
+    계층 배정 1회분 (TinyLFU 방식 승격 심사)
+    
+    상위 계층부터 심사하며, 계층이 가득 차 있으면 후보의 추정 빈도가
+    계층 내 최저 빈도 키(희생자)보다 높을 때만 받아들이고 희생자는 다음 계층 심사로 밀려남.
+    메모리는 계층 용량 합에 비례 (전체 키 수와 무관)
+    """
+    
+    def __init__(self, levels: Sequence[Tuple[Any, int, int]], fallback: Any):
+        """
+        Args:
+            levels: 상위 계층부터 (계층, 용량, 최소 빈도)
+            fallback: 어느 계층에도 들어가지 못한 키의 계층
+        """
+        self.levels = levels
+        self.fallback = fallback
+        self._heaps: Dict[Any, List[Tuple[int, int, Hashable]]] = {level: [] for level, _, _ in levels}
+        self._sequence = itertools.count()
+        self.stats = {"admitted": 0, "rejected": 0, "displaced": 0}
+    
+    def admit(self, key: Hashable, frequency: int) -> List[Tuple[Hashable, Any, bool]]:
+        """
+        후보 키 배정
+        
+        Args:
+            key: 후보 키
+            frequency: 추정 접근 빈도
+        
+        Returns:
+            List[Tuple[Hashable, Any, bool]]: (키, 배정 계층, 밀려난 희생자 여부) - 후보 1건 + 연쇄 희생자
+        """
+        assignments = []
+        candidate, candidate_frequency, displaced = key, frequency, False
+        
+        for level, capacity, min_frequency in self.levels:
+            if candidate_frequency < min_frequency:
+                continue
+            
+            heap = self._heaps[level]
+            entry = (candidate_frequency, next(self._sequence), candidate)
+            if len(heap) < capacity:
+                heapq.heappush(heap, entry)
+            elif heap and candidate_frequency > heap[0][0]:
+                victim_frequency, _, victim = heapq.heapreplace(heap, entry)
+                assignments.append((candidate, level, displaced))
+                self.stats["admitted"] += 1
+                self.stats["displaced"] += 1
+                # 희생자는 다음 계층 심사
+                candidate, candidate_frequency, displaced = victim, victim_frequency, True
+                continue
+            else:
+                self.stats["rejected"] += 1
+                continue
+            
+            assignments.append((candidate, level, displaced))
+            self.stats["admitted"] += 1
+            return assignments
+        
+        assignments.append((candidate, self.fallback, displaced))
+        return assignments
+    
+    def occupancy(self) -> Dict[Any, int]:
+        """계층별 배정된 키 수"""
+        return {level: len(heap) for level, heap in self._heaps.items()}
@@ -0,0 +1,711 @@
+"""
+Ingest Job Queue for BGBG AI Server
+Durable PDF ingest job queue (Redis with in-memory fallback) with a bounded worker pool,
+per-meeting round-robin fairness and per-page progress for ProcessPdfStream
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.config.settings import get_settings
+from src.utils.cancellation import RequestAbandonedError, RpcScope, bind_scope
+from src.utils.lazy_import import lazy_import
+from src.utils.tracing import trace_span
+
+fitz = lazy_import("fitz")
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+TERMINAL_STATES = (JOB_COMPLETED, JOB_FAILED)
+
+# 큐 등록: 미팅별 FIFO에 추가하고, 미팅 큐가 비어 있었으면 라운드로빈 링에 미팅 등록
+# KEYS: [미팅 큐, 미팅 링, 대기 작업 수] / ARGV: [job_id, meeting_id, 최대 대기 수, 앞에 넣기 여부]
+ENQUEUE_SCRIPT = """
+local front = ARGV[4] == '1'
+local pending = tonumber(redis.call('GET', KEYS[3]) or '0')
+if not front and pending >= tonumber(ARGV[3]) then
+    return -1
+end
+local length
+if front then
+    length = redis.call('LPUSH', KEYS[1], ARGV[1])
+else
+    length = redis.call('RPUSH', KEYS[1], ARGV[1])
+end
+if length == 1 then
+    redis.call('RPUSH', KEYS[2], ARGV[2])
+end
+redis.call('INCR', KEYS[3])
+return length - 1
+"""
+
+# 작업 할당: 링 맨 앞 미팅의 첫 작업을 꺼내고, 작업이 남아 있으면 미팅을 링 맨 뒤로 이동
+# 실행 중 집합에 넣는 것과 같은 원자 구간에서 작업 기록에 run_id/하트비트를 기록
+# (할당 직후 다른 프로세스의 복구 스캔이 하트비트 0인 작업을 stale로 보고 다시 대기열에 넣지 않도록)
+# 미팅 큐/작업 키를 스크립트 안에서 조립하므로 단일 Redis(비클러스터) 전용
+# KEYS: [미팅 링, 대기 작업 수, 실행 중 집합] / ARGV: [미팅 큐 키 접두사, 작업 키 접두사, run_id, 현재 시각]
+CLAIM_SCRIPT = """
+local meeting = redis.call('LPOP', KEYS[1])
+if not meeting then
+    return false
+end
+local queue_key = ARGV[1] .. meeting
+local job_id = redis.call('LPOP', queue_key)
+if redis.call('LLEN', queue_key) > 0 then
+    redis.call('RPUSH', KEYS[1], meeting)
+end
+if not job_id then
+    return false
+end
+redis.call('DECR', KEYS[2])
+redis.call('SADD', KEYS[3], job_id)
+local job_key = ARGV[2] .. job_id
+local payload = redis.call('GET', job_key)
+if payload then
+    local job = cjson.decode(payload)
+    job['run_id'] = ARGV[3]
+    job['heartbeat_at'] = tonumber(ARGV[4])
+    redis.call('SET', job_key, cjson.encode(job))
+end
+return job_id
+"""
+
+# 소유권 확인 후 저장: 저장된 작업의 run_id가 기대값과 같을 때만 덮어씀
+# (하트비트가 끊겨 다른 워커가 복구해 간 작업을 이전 실행이 덮어쓰지 않도록)
+# KEYS: [작업 키] / ARGV: [작업 JSON, 기대 run_id, TTL(0이면 만료 없음)]
+SAVE_IF_OWNER_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current or (cjson.decode(current)['run_id'] or '') ~= ARGV[2] then
+    return 0
+end
+if tonumber(ARGV[3]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+@dataclass
+class IngestJob:
+    """PDF 수집 작업 상태 (Redis/메모리에 JSON으로 저장)"""
+    job_id: str
+    document_id: str
+    meeting_id: str
+    file_name: str = ""
+    metadata: Dict[str, str] = field(default_factory=dict)
+    spool_path: str = ""
+    state: str = JOB_QUEUED
+    stage: str = "spooled"
+    pages_done: int = 0
+    total_pages: int = 0
+    embeddings_done: int = 0
+    chunk_count: int = 0
+    error: str = ""
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    heartbeat_at: float = 0.0
+    run_id: str = ""  # 현재 실행 시도 ID (복구 시 초기화되어 이전 실행의 저장을 막음)
+
+    @property
+    def terminal(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    def update(self, **changes):
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self.updated_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IngestJob":
+        names = {f.name for f in fields(cls)}
+        job = cls(**{key: value for key, value in data.items() if key in names})
+        # Lua cjson은 빈 dict를 구분하지 못하므로 빈 배열로 바뀐 metadata 보정
+        job.metadata = dict(job.metadata or {})
+        return job
+
+
+class _MemoryJobStore:
+    """Redis가 없을 때 사용하는 프로세스 로컬 저장소 (재시작 시 대기 작업 유실)"""
+
+    backend = "memory"
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        # job_id -> (expires_at, job dict) - 종료된 작업만 만료 시각을 가짐
+        self._jobs: Dict[str, Tuple[Optional[float], Dict[str, Any]]] = {}
+        self._queues: Dict[str, Deque[str]] = {}
+        self._ring: Deque[str] = deque()
+        self._running: Set[str] = set()
+
+    async def save(self, job: IngestJob):
+        expires_at = time.time() + self.ttl_seconds if job.terminal else None
+        self._jobs[job.job_id] = (expires_at, job.to_dict())
+
+    async def save_if_owner(self, job: IngestJob, run_id: Optional[str] = None) -> bool:
+        entry = self._jobs.get(job.job_id)
+        if entry is None or entry[1].get("run_id", "") != (job.run_id if run_id is None else run_id):
+            return False
+        await self.save(job)
+        return True
+
+    async def load(self, job_id: str) -> Optional[IngestJob]:
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._jobs[job_id]
+            return None
+        return IngestJob.from_dict(data)
+
+    async def delete(self, job_id: str):
+        self._jobs.pop(job_id, None)
+
+    async def enqueue(self, job: IngestJob, max_pending: int, front: bool = False) -> int:
+        if not front and await self.pending_count() >= max_pending:
+            return -1
+        queue = self._queues.setdefault(job.meeting_id, deque())
+        if front:
+            queue.appendleft(job.job_id)
+        else:
+            queue.append(job.job_id)
+        if len(queue) == 1:
+            self._ring.append(job.meeting_id)
+        return len(queue) - 1
+
+    async def claim(self, run_id: str) -> Optional[str]:
+        while self._ring:
+            meeting_id = self._ring.popleft()
+            queue = self._queues.get(meeting_id)
+            if not queue:
+                self._queues.pop(meeting_id, None)
+                continue
+            job_id = queue.popleft()
+            if queue:
+                self._ring.append(meeting_id)
+            else:
+                del self._queues[meeting_id]
+            self._running.add(job_id)
+            entry = self._jobs.get(job_id)
+            if entry is not None:
+                entry[1].update(run_id=run_id, heartbeat_at=time.time())
+            return job_id
+        return None
+
+    async def release(self, job_id: str) -> bool:
+        if job_id in self._running:
+            self._running.discard(job_id)
+            return True
+        return False
+
+    async def running_job_ids(self) -> List[str]:
+        return list(self._running)
+
+    async def pending_count(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def queue_position(self, job: IngestJob) -> int:
+        queue = self._queues.get(job.meeting_id)
+        if queue and job.job_id in queue:
+            return queue.index(job.job_id)
+        return 0
+
+
+class _RedisJobStore:
+    """
+    Redis 작업 저장소 (프로세스/워커 재시작에도 유지)
+
+    - ingest:job:{job_id}: 작업 상태 JSON (종료 후 TTL)
+    - ingest:queue:{meeting_id}: 미팅별 대기 작업 FIFO
+    - ingest:meetings: 대기 작업이 있는 미팅 라운드로빈 링
+    - ingest:pending / ingest:running: 대기 작업 수, 실행 중 작업 집합
+    """
+
+    backend = "redis"
+    KEY_PREFIX = "ingest"
+
+    def __init__(self, redis_client, ttl_seconds: int):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.ring_key = f"{self.KEY_PREFIX}:meetings"
+        self.pending_key = f"{self.KEY_PREFIX}:pending"
+        self.running_key = f"{self.KEY_PREFIX}:running"
+        self.queue_prefix = f"{self.KEY_PREFIX}:queue:"
+        self._enqueue_script = redis_client.register_script(ENQUEUE_SCRIPT)
+        self._claim_script = redis_client.register_script(CLAIM_SCRIPT)
+        self._save_if_owner_script = redis_client.register_script(SAVE_IF_OWNER_SCRIPT)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}:job:{job_id}"
+
+    async def save(self, job: IngestJob):
+        payload = json.dumps(job.to_dict(), ensure_ascii=False)
+        await self.redis.set(self._job_key(job.job_id), payload, ex=self.ttl_seconds if job.terminal else None)
+
+    async def save_if_owner(self, job: IngestJob, run_id: Optional[str] = None) -> bool:
+        payload = json.dumps(job.to_dict(), ensure_ascii=False)
+        args = [payload, job.run_id if run_id is None else run_id, self.ttl_seconds if job.terminal else 0]
+        return bool(await self._save_if_owner_script(keys=[self._job_key(job.job_id)], args=args))
+
+    async def load(self, job_id: str) -> Optional[IngestJob]:
+        payload = await self.redis.get(self._job_key(job_id))
+        if payload is None:
+            return None
+        return IngestJob.from_dict(json.loads(payload))
+
+    async def delete(self, job_id: str):
+        await self.redis.delete(self._job_key(job_id))
+
+    async def enqueue(self, job: IngestJob, max_pending: int, front: bool = False) -> int:
+        keys = [f"{self.queue_prefix}{job.meeting_id}", self.ring_key, self.pending_key]
+        args = [job.job_id, job.meeting_id, max_pending, "1" if front else "0"]
+        return int(await self._enqueue_script(keys=keys, args=args))
+
+    async def claim(self, run_id: str) -> Optional[str]:
+        keys = [self.ring_key, self.pending_key, self.running_key]
+        args = [self.queue_prefix, self._job_key(""), run_id, time.time()]
+        job_id = await self._claim_script(keys=keys, args=args)
+        return job_id or None
+
+    async def release(self, job_id: str) -> bool:
+        # 여러 프로세스가 같은 작업을 복구하지 않도록 SREM 결과로 소유권 확인
+        return bool(await self.redis.srem(self.running_key, job_id))
+
+    async def running_job_ids(self) -> List[str]:
+        return list(await self.redis.smembers(self.running_key))
+
+    async def pending_count(self) -> int:
+        return int(await self.redis.get(self.pending_key) or 0)
+
+    async def queue_position(self, job: IngestJob) -> int:
+        position = await self.redis.lpos(f"{self.queue_prefix}{job.meeting_id}", job.job_id)
+        return int(position) if position is not None else 0
+
+
+def _count_pdf_pages(pdf_data: bytes) -> int:
+    """진행률 표시용 전체 페이지 수 (실패 시 0 - OCR 결과로 보정)"""
+    try:
+        pdf_doc = fitz.open(stream=pdf_data, filetype="pdf")
+        try:
+            return len(pdf_doc)
+        finally:
+            pdf_doc.close()
+    except Exception as e:
+        logger.debug(f"Could not count PDF pages for ingest progress: {e}")
+        return 0
+
+
+IngestProcessor = Callable[[IngestJob, bytes], Awaitable[Dict[str, Any]]]
+
+
+class IngestJobQueue:
+    """
+    ProcessPdfStream 비동기 수집 작업 큐
+
+    업로드된 PDF를 스풀 디렉터리에 저장하고 작업 ID를 즉시 반환한 뒤,
+    제한된 수의 워커가 미팅별 라운드로빈으로 작업을 꺼내 OCR/벡터DB 저장을 수행합니다.
+    Redis가 있으면 작업 상태와 큐를 Redis에 두고, 없으면 프로세스 메모리를 사용합니다.
+
+    - processor(job, pdf_data)는 {"success", "chunk_count", "total_pages", "error"} 딕셔너리 반환
+    - 하위 서비스의 record_work()로 페이지/임베딩 진행률 갱신 (원격 OCR은 완료 시 일괄 반영)
+    - 하트비트가 끊긴 실행 중 작업은 다른 워커/재시작 후 다시 대기열로 복구
+    - 실행 중 저장은 run_id로 소유권을 확인하여, 복구된 작업을 이전 실행이 완료/덮어쓰지 않음
+    """
+
+    def __init__(self, redis_manager=None, processor: Optional[IngestProcessor] = None):
+        self.settings = get_settings()
+        self.config = self.settings.ingest
+        self.redis_manager = redis_manager
+        self.processor = processor
+        self.spool_dir = Path(self.config.SPOOL_DIR)
+        self.ttl_seconds = self.config.JOB_TTL_HOURS * 3600
+
+        self._store = None
+        self._workers: List[asyncio.Task] = []
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._running_jobs: Dict[str, IngestJob] = {}
+        self._job_scopes: Dict[str, RpcScope] = {}
+        self._pending_jobs = 0  # 하트비트마다 갱신 (동기 stats getter용)
+        self._stopping = False
+
+        self.stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "retried": 0,
+            "recovered": 0,
+            "interrupted": 0,
+            "superseded": 0
+        }
+
+    async def start(self) -> bool:
+        """저장소 선택, 중단된 작업 복구 후 워커 시작"""
+        if self._workers:
+            return True
+
+        if self._store is None:
+            self._store = await self._create_store()
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._stopping = False
+
+        await self._recover_stale_jobs()
+
+        self._workers = [
+            asyncio.create_task(self._worker_loop(index), name=f"ingest-worker-{index}")
+            for index in range(self.config.WORKERS)
+        ]
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop(), name="ingest-heartbeat")
+        logger.info(f"📥 Ingest job queue started: {self.config.WORKERS} workers, {self._store.backend} store")
+        return True
+
+    async def stop(self):
+        """워커 중단 - 실행 중이던 작업은 다음 시작 시 다시 처리되도록 대기열로 복귀"""
+        self._stopping = True
+        tasks = self._workers + ([self._heartbeat_task] if self._heartbeat_task else [])
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._heartbeat_task = None
+        logger.info("📥 Ingest job queue stopped")
+
+    async def _create_store(self):
+        if self.redis_manager:
+            try:
+                redis_client = await self.redis_manager.get_client()
+                if redis_client is not None:
+                    return _RedisJobStore(redis_client, self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"⚠️ Ingest queue Redis unavailable, using memory store: {e}")
+        else:
+            logger.warning("⚠️ Ingest queue running without Redis - queued jobs are lost on restart")
+        return _MemoryJobStore(self.ttl_seconds)
+
+    async def submit(
+        self,
+        document_id: str,
+        meeting_id: str,
+        pdf_data: bytes,
+        file_name: str = "",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        PDF 수집 작업 등록
+
+        Args:
+            document_id: 문서 ID
+            meeting_id: 미팅 ID (공정성 단위)
+            pdf_data: 업로드된 PDF 바이트
+            file_name: 원본 파일명
+            metadata: 벡터DB 메타데이터
+
+        Returns:
+            Dict[str, Any]: {"success": True, "job": IngestJob, "queue_position": int}
+                또는 {"success": False, "error": str, "queue_full": bool}
+        """
+        if self._store is None:
+            return {"success": False, "error": "Ingest job queue not started", "queue_full": False}
+
+        job_id = uuid.uuid4().hex
+        job = IngestJob(
+            job_id=job_id,
+            document_id=document_id,
+            meeting_id=meeting_id,
+            file_name=file_name,
+            metadata=dict(metadata or {}),
+            spool_path=str(self.spool_dir / f"{job_id}.pdf")
+        )
+
+        try:
+            await asyncio.to_thread(Path(job.spool_path).write_bytes, pdf_data)
+            await self._store.save(job)
+            position = await self._store.enqueue(job, self.config.MAX_PENDING_JOBS)
+        except Exception as e:
+            logger.error(f"❌ Failed to enqueue ingest job for document {document_id}: {e}")
+            await self._discard(job)
+            return {"success": False, "error": f"Failed to enqueue job: {e}", "queue_full": False}
+
+        if position < 0:
+            self.stats["rejected"] += 1
+            await self._discard(job)
+            logger.warning(f"🚫 Ingest queue full ({self.config.MAX_PENDING_JOBS} pending) - rejected document {document_id}")
+            return {"success": False, "error": "Ingest queue is full", "queue_full": True}
+
+        self.stats["submitted"] += 1
+        self._pending_jobs = max(self._pending_jobs, position + 1)
+        self._wakeup.set()
+        logger.info(f"📥 Ingest job {job_id} queued for meeting {meeting_id}, document {document_id} (position {position})")
+        return {"success": True, "job": job, "queue_position": position}
+
+    async def get_job(self, job_id: str) -> Optional[IngestJob]:
+        """작업 상태 조회 (이 프로세스에서 실행 중이면 최신 진행률 반환)"""
+        job = self._running_jobs.get(job_id)
+        if job is not None:
+            return job
+        if self._store is None:
+            return None
+        return await self._store.load(job_id)
+
+    async def get_queue_position(self, job: IngestJob) -> int:
+        """같은 미팅 대기열에서 앞선 작업 수 (대기 중이 아니면 0)"""
+        if job.state != JOB_QUEUED or self._store is None:
+            return 0
+        try:
+            return await self._store.queue_position(job)
+        except Exception as e:
+            logger.debug(f"Queue position lookup failed for job {job.job_id}: {e}")
+            return 0
+
+    async def _discard(self, job: IngestJob):
+        try:
+            await self._store.delete(job.job_id)
+        except Exception:
+            pass
+        self._remove_spool(job)
+
+    def _remove_spool(self, job: IngestJob):
+        try:
+            Path(job.spool_path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove spooled PDF {job.spool_path}: {e}")
+
+    async def _worker_loop(self, index: int):
+        while not self._stopping:
+            # 등록 알림을 놓치지 않도록 할당 시도 전에 초기화
+            self._wakeup.clear()
+            try:
+                job_id = await self._store.claim(uuid.uuid4().hex)
+            except Exception as e:
+                logger.warning(f"Ingest worker {index} failed to claim job: {e}")
+                job_id = None
+
+            if job_id is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.config.POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._run_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Ingest worker {index} error on job {job_id}: {e}")
+
+    async def _run_job(self, job_id: str):
+        job = await self._store.load(job_id)
+        if job is None or job.terminal:
+            await self._store.release(job_id)
+            return
+
+        # run_id는 할당 스크립트가 기록 - 그 사이 다른 프로세스가 복구했으면 실행하지 않음
+        job.update(state=JOB_RUNNING, stage="ocr", error="", attempts=job.attempts + 1, heartbeat_at=time.time())
+        if not await self._save_owned(job):
+            return
+        self._running_jobs[job_id] = job
+
+        scope = RpcScope(
+            "ingest_job",
+            time.monotonic() + self.config.JOB_TIMEOUT_SECONDS,
+            on_work=lambda kind, amount: self._on_job_work(job, kind, amount)
+        )
+        self._job_scopes[job_id] = scope
+        started_at = time.time()
+        logger.info(f"⚙️ Ingest job {job_id} started (attempt {job.attempts}) for document {job.document_id}")
+
+        try:
+            with trace_span("ingest.job", {
+                "ingest.job_id": job_id,
+                "document.id": job.document_id,
+                "meeting.id": job.meeting_id,
+                "ingest.attempt": job.attempts
+            }) as span:
+                pdf_data = await asyncio.to_thread(Path(job.spool_path).read_bytes)
+                if not job.total_pages:
+                    job.update(total_pages=await asyncio.to_thread(_count_pdf_pages, pdf_data))
+                with bind_scope(scope):
+                    result = await self.processor(job, pdf_data)
+                span.set_attributes({
+                    "pdf.page_count": job.total_pages,
+                    "vector_db.chunk_count": result.get("chunk_count", 0)
+                })
+        except RequestAbandonedError as e:
+            if e.reason == "superseded":
+                self._on_superseded(job)
+                return
+            await self._finish_failed(job, f"Job timed out after {self.config.JOB_TIMEOUT_SECONDS}s ({e.stage})", retry=False)
+            return
+        except asyncio.CancelledError:
+            # 서버 종료로 중단 - 시도 횟수에 포함하지 않고 대기열 앞으로 복귀
+            self.stats["interrupted"] += 1
+            job.update(state=JOB_QUEUED, stage="spooled", attempts=job.attempts - 1)
+            await self._requeue(job)
+            raise
+        except Exception as e:
+            await self._finish_failed(job, str(e), retry=True)
+            return
+        finally:
+            self._running_jobs.pop(job_id, None)
+            self._job_scopes.pop(job_id, None)
+
+        if not result.get("success"):
+            await self._finish_failed(job, result.get("error", "Unknown error"), retry=True)
+            return
+
+        total_pages = result.get("total_pages") or job.total_pages
+        job.update(
+            state=JOB_COMPLETED,
+            stage="done",
+            total_pages=total_pages,
+            pages_done=max(job.pages_done, total_pages),
+            chunk_count=result.get("chunk_count", job.chunk_count)
+        )
+        if not await self._save_owned(job):
+            return
+        await self._store.release(job_id)
+        self._remove_spool(job)
+        self.stats["completed"] += 1
+        logger.info(f"✅ Ingest job {job_id} completed in {time.time() - started_at:.1f}s: "
+                    f"{job.total_pages} pages, {job.chunk_count} chunks")
+
+    def _on_job_work(self, job: IngestJob, kind: str, amount: int):
+        """하위 서비스 record_work() -> 작업 진행률 (하트비트 시 저장)"""
+        if kind == "ocr_pages":
+            job.update(pages_done=job.pages_done + amount)
+        elif kind == "embeddings":
+            job.update(stage="indexing", embeddings_done=job.embeddings_done + amount)
+        elif kind == "upserted_chunks":
+            job.update(chunk_count=job.chunk_count + amount)
+
+    async def _finish_failed(self, job: IngestJob, error: str, retry: bool):
+        if retry and job.attempts < self.config.MAX_ATTEMPTS:
+            self.stats["retried"] += 1
+            logger.warning(f"🔁 Ingest job {job.job_id} failed (attempt {job.attempts}/{self.config.MAX_ATTEMPTS}), requeued: {error}")
+            job.update(state=JOB_QUEUED, stage="spooled", error=error, pages_done=0, embeddings_done=0, chunk_count=0)
+            await self._requeue(job)
+            return
+
+        job.update(state=JOB_FAILED, error=error)
+        if not await self._save_owned(job):
+            return
+        self.stats["failed"] += 1
+        logger.error(f"❌ Ingest job {job.job_id} failed for document {job.document_id}: {error}")
+        await self._store.release(job.job_id)
+        self._remove_spool(job)
+
+    async def _save_owned(self, job: IngestJob) -> bool:
+        """
+        작업 상태 저장 (실행 중인 시도는 소유권이 유지된 경우만)
+
+        Returns:
+            bool: 저장 여부 (False면 다른 워커가 복구해 간 작업이므로 큐/스풀을 건드리지 않음)
+        """
+        if not job.run_id:
+            await self._store.save(job)
+            return True
+        if await self._store.save_if_owner(job):
+            return True
+        self._on_superseded(job)
+        return False
+
+    def _on_superseded(self, job: IngestJob):
+        self.stats["superseded"] += 1
+        logger.warning(f"♻️ Ingest job {job.job_id} was recovered by another worker - discarding this run's result")
+
+    async def _requeue(self, job: IngestJob):
+        try:
+            if not await self._save_owned(job):
+                return
+            if await self._store.release(job.job_id):
+                await self._store.enqueue(job, self.config.MAX_PENDING_JOBS, front=True)
+                self._wakeup.set()
+        except Exception as e:
+            logger.error(f"❌ Failed to requeue ingest job {job.job_id}: {e}")
+
+    async def _heartbeat_loop(self):
+        last_recovery = time.monotonic()
+        while True:
+            await asyncio.sleep(self.config.HEARTBEAT_SECONDS)
+            for job in list(self._running_jobs.values()):
+                job.heartbeat_at = time.time()
+                try:
+                    owned = await self._store.save_if_owner(job)
+                except Exception as e:
+                    logger.warning(f"Ingest heartbeat failed for job {job.job_id}: {e}")
+                    continue
+                scope = self._job_scopes.get(job.job_id)
+                if not owned and scope is not None:
+                    # 하트비트가 늦어 다른 워커가 이미 가져간 작업 - 남은 OCR/임베딩 중단
+                    scope.abandon("superseded")
+            try:
+                self._pending_jobs = await self._store.pending_count()
+            except Exception:
+                pass
+
+            if time.monotonic() - last_recovery >= self.config.STALE_SECONDS:
+                last_recovery = time.monotonic()
+                await self._recover_stale_jobs()
+
+    async def _recover_stale_jobs(self):
+        """하트비트가 끊긴 실행 중 작업(프로세스 종료/크래시)을 대기열로 복구하거나 실패 처리"""
+        try:
+            job_ids = await self._store.running_job_ids()
+        except Exception as e:
+            logger.warning(f"Ingest recovery scan failed: {e}")
+            return
+
+        stale_before = time.time() - self.config.STALE_SECONDS
+        for job_id in job_ids:
+            if job_id in self._running_jobs:
+                continue
+            job = await self._store.load(job_id)
+            if job is not None and job.heartbeat_at > stale_before and not job.terminal:
+                continue
+            if job is None or job.terminal:
+                await self._store.release(job_id)
+                continue
+
+            # 이전 실행의 run_id를 먼저 비워 소유권 회수 (그 사이 이전 실행이 저장했으면 건너뜀)
+            stale_run_id = job.run_id
+            job.update(run_id="")
+            if not await self._store.save_if_owner(job, stale_run_id):
+                continue
+            self.stats["recovered"] += 1
+            if job.attempts >= self.config.MAX_ATTEMPTS:
+                await self._finish_failed(job, f"Worker stopped responding (attempt {job.attempts})", retry=False)
+                continue
+            logger.warning(f"♻️ Recovering stale ingest job {job_id} (attempt {job.attempts})")
+            job.update(state=JOB_QUEUED, stage="spooled", pages_done=0, embeddings_done=0, chunk_count=0)
+            await self._requeue(job)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 큐 통계 (대기 작업 수는 마지막 하트비트 기준)"""
+        return {
+            **self.stats,
+            "backend": self._store.backend if self._store else None,
+            "redis_backed": isinstance(self._store, _RedisJobStore),
+            "workers": len(self._workers),
+            "running": len(self._running_jobs),
+            "pending": self._pending_jobs
+        }
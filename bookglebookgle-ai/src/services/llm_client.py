@@ -4,12 +4,17 @@ Handles communication with GMS API (SSAFY Anthropic proxy)
 """
 
 import asyncio
+import json
+import time
 import httpx
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 from loguru import logger
 
 from src.config.settings import get_settings
+from src.services.circuit_breaker import CircuitOpenError, CircuitState, get_circuit_breaker
+from src.services.llm_telemetry import LLMCallTimer
+from src.utils.cancellation import abandon_budget, check_cancelled, clamp_timeout, record_work
 
 
 class LLMProvider(Enum):
@@ -17,12 +22,57 @@ class LLMProvider(Enum):
     MOCK = "mock"
 
 
+# 시스템 프롬프트 타입: 단일 문자열 또는 Anthropic system 블록 리스트
+SystemPrompt = Union[str, List[Dict[str, Any]]]
+
+# GMS 응답 읽기 타임아웃 (초, 호출 측 데드라인이 더 짧으면 clamp_timeout으로 줄어듦)
+GMS_READ_TIMEOUT = 20.0
+
+
+def build_system_blocks(*texts: Optional[str], cache: bool = True) -> List[Dict[str, Any]]:
+    """
+    고정 프롬프트 텍스트들을 Anthropic system 블록 리스트로 변환
+
+    cache=True이면 각 블록 끝에 cache_control을 지정하여 블록 경계마다
+    업스트림 프롬프트 캐시 prefix가 생성되도록 함 (공통 prefix는 세션 간에도 재사용)
+    Anthropic API는 요청당 cache_control 지점을 최대 4개까지 허용
+
+    Args:
+        *texts: 순서대로 배치할 텍스트 (빈 값은 제외)
+        cache: 캐시 지점 지정 여부
+
+    Returns:
+        List[Dict[str, Any]]: system 블록 리스트
+    """
+    blocks = [{"type": "text", "text": text} for text in texts if text]
+    if cache:
+        for block in blocks[:4]:
+            block["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
 class LLMClient:
     """Client for interacting with GMS API"""
     
     def __init__(self):
         self.settings = get_settings()
         self.gms_available = False  
+        
+        # 응답 usage 기반 토큰 집계 (GMS 실측치)
+        self.usage_stats = {
+            "requests": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0
+        }
+        
+        # GMS 서킷 브레이커 (모든 LLMClient 인스턴스가 공유) 및 헤지 요청 통계
+        self.breaker = get_circuit_breaker("gms") if self.settings.ai.GMS_BREAKER_ENABLED else None
+        self.hedge_stats = {
+            "hedged": 0,
+            "hedge_wins": 0
+        }
 
     def _is_valid_api_key(self, api_key: Optional[str]) -> bool:
         """Check if API key is valid (not empty or placeholder)"""
@@ -72,23 +122,52 @@ class LLMClient:
             self.gms_available = False
             logger.info("❌ Falling back to mock responses")
     
+    def assume_configured(self):
+        """
+        연결 확인 전 API 키 기준으로 GMS 사용 여부 설정
+        
+        시작 시 연결 확인(initialize)을 백그라운드로 미룰 때 사용 - 확인 전 요청은 서킷 브레이커가 보호하고,
+        확인이 실패하면 initialize()가 mock 응답으로 전환
+        """
+        self.gms_available = self._is_valid_api_key(self.settings.ai.GMS_API_KEY)
+    
     async def generate_completion(
         self,
         prompt: str,
-        system_message: Optional[str] = None,
+        system_message: Optional[SystemPrompt] = None,
         max_tokens: int = 1000,
         temperature: float = 0.7,
         provider: Optional[LLMProvider] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        cache_system: bool = False,
+        hedge: bool = False,
+        caller: str = "unknown"
     ) -> str:
-        """Generate text completion using GMS API"""
+        """
+        Generate text completion using GMS API
+        
+        system_message는 문자열 또는 system 블록 리스트(build_system_blocks)를 받으며,
+        cache_system=True이면 문자열 시스템 프롬프트를 캐시 가능한 블록으로 전송
+        hedge=True이면 지연 시 백분위수 기반 지연 후 헤지 요청 전송 (GMS_HEDGE_ENABLED)
+        caller는 텔레메트리 라벨 (quiz, proofreading, discussion 등)
+        """
         
         if self.settings.ai.MOCK_AI_RESPONSES or not self.gms_available:
             return await self._mock_completion(prompt)
         
+        # 호출 측이 이미 떠났으면 GMS 호출 생략
+        check_cancelled(f"llm:{caller}")
         try:
-            return await self._gms_completion(prompt, system_message, max_tokens, temperature)
+            system = self._prepare_system(system_message, cache_system)
+            result = await self._guarded_gms_completion(prompt, system, max_tokens, temperature, hedge, caller)
+            record_work("llm_calls")
+            return result
+        except CircuitOpenError as e:
+            logger.warning(f"⚡ {e} - using mock completion")
+            return await self._mock_completion(prompt, simulate_latency=False)
         except Exception as e:
+            # 실패 시점에 호출 측 데드라인이 이미 지났으면 mock 응답 대신 중단
+            check_cancelled(f"llm:{caller}")
             logger.error(f"GMS API completion failed: {e}")
             logger.warning("Falling back to mock completion")
             return await self._mock_completion(prompt)
@@ -121,14 +200,153 @@ class LLMClient:
             logger.error(f"❌ GMS API connection test failed: {e}")
             raise
     
+    async def _guarded_gms_completion(
+        self,
+        prompt: str,
+        system_message: Optional[SystemPrompt],
+        max_tokens: int,
+        temperature: float,
+        hedge: bool = False,
+        caller: str = "unknown"
+    ) -> str:
+        """
+        서킷 브레이커를 거친 GMS 호출
+        
+        Raises:
+            CircuitOpenError: 브레이커가 열려 있어 즉시 거부된 경우
+        """
+        started_at = time.perf_counter()
+        if self.breaker and not self.breaker.allow_request():
+            raise CircuitOpenError(f"GMS circuit is {self.breaker.state.value}")
+        
+        if (
+            hedge
+            and self.settings.ai.GMS_HEDGE_ENABLED
+            and (self.breaker is None or self.breaker.state == CircuitState.CLOSED)
+        ):
+            return await self._hedged_gms_completion(
+                prompt, system_message, max_tokens, temperature, caller, started_at
+            )
+        
+        return await self._timed_gms_completion(
+            prompt, system_message, max_tokens, temperature, caller, started_at
+        )
+    
+    async def _timed_gms_completion(
+        self,
+        prompt: str,
+        system_message: Optional[SystemPrompt],
+        max_tokens: int,
+        temperature: float,
+        caller: str = "unknown",
+        started_at: Optional[float] = None
+    ) -> str:
+        """GMS 호출 결과와 지연 시간을 브레이커에 기록"""
+        start_time = time.perf_counter()
+        timer = LLMCallTimer(caller, started_at or start_time)
+        try:
+            result = await self._gms_completion(prompt, system_message, max_tokens, temperature, timer)
+        except asyncio.CancelledError:
+            if self.breaker:
+                self.breaker.release()
+            raise
+        except Exception:
+            if self.breaker:
+                self.breaker.record_failure((time.perf_counter() - start_time) * 1000)
+            raise
+        
+        if self.breaker:
+            self.breaker.record_success((time.perf_counter() - start_time) * 1000)
+        return result
+    
+    async def _hedged_gms_completion(
+        self,
+        prompt: str,
+        system_message: Optional[SystemPrompt],
+        max_tokens: int,
+        temperature: float,
+        caller: str = "unknown",
+        started_at: Optional[float] = None
+    ) -> str:
+        """
+        헤지 요청: 첫 요청이 최근 지연 백분위수 안에 끝나지 않으면 동일 요청을 하나 더 보내고
+        먼저 성공한 응답을 사용 (나머지는 취소)
+        """
+        observed = self.breaker.latency_percentile(self.settings.ai.GMS_HEDGE_PERCENTILE) if self.breaker else None
+        delay_ms = min(
+            max(observed or self.settings.ai.GMS_HEDGE_MIN_DELAY_MS, self.settings.ai.GMS_HEDGE_MIN_DELAY_MS),
+            self.settings.ai.GMS_HEDGE_MAX_DELAY_MS
+        )
+        
+        primary = asyncio.create_task(
+            self._timed_gms_completion(prompt, system_message, max_tokens, temperature, caller, started_at)
+        )
+        launched_at = {primary: time.perf_counter()}
+        pending = {primary}
+        last_error: Optional[BaseException] = None
+        # 호출 측이 대기 중 취소되어도(스트림 종료, 데드라인) 진행 중인 GMS 요청이 남지 않도록 finally에서 정리
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay_ms / 1000)
+            if done:
+                if primary.cancelled():
+                    check_cancelled(f"llm:{caller}")
+                return primary.result()
+            
+            self.hedge_stats["hedged"] += 1
+            logger.debug(f"GMS call exceeded {delay_ms:.0f}ms, sending hedged request")
+            backup = asyncio.create_task(
+                self._timed_gms_completion(prompt, system_message, max_tokens, temperature, caller, started_at)
+            )
+            launched_at[backup] = time.perf_counter()
+            
+            pending = {primary, backup}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        # 호출 측 예산 소진으로 중단된 요청 (abandon_budget) - RequestAbandonedError로 전파
+                        check_cancelled(f"llm:{caller}")
+                        continue
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedge_stats["hedge_wins"] += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in pending:
+                if task.done():
+                    continue
+                task.cancel()
+                # 취소된 요청의 지연도 브레이커에 반영 (느린 호출이 hedge에 가려지지 않도록)
+                if self.breaker:
+                    self.breaker.record_cancelled((time.perf_counter() - launched_at[task]) * 1000)
+    
+    def _prepare_system(self, system_message: Optional[SystemPrompt], cache_system: bool) -> Optional[SystemPrompt]:
+        """시스템 프롬프트를 전송 형식으로 변환 (프롬프트 캐시 비활성화 시 cache_control 제거)"""
+        if not system_message:
+            return None
+        
+        if isinstance(system_message, str):
+            if cache_system and self.settings.ai.GMS_PROMPT_CACHING:
+                return build_system_blocks(system_message)
+            return system_message
+        
+        if not self.settings.ai.GMS_PROMPT_CACHING:
+            return [{k: v for k, v in block.items() if k != "cache_control"} for block in system_message]
+        return system_message
+    
     async def _gms_completion(
         self,
         prompt: str,
-        system_message: Optional[str],
+        system_message: Optional[SystemPrompt],
         max_tokens: int,
-        temperature: float
+        temperature: float,
+        timer: Optional[LLMCallTimer] = None
     ) -> str:
         """Generate completion using GMS (SSAFY Anthropic proxy)"""
+        timer = timer or LLMCallTimer("unknown")
+        body = b""
         try:
             logger.debug("🔄 Using GMS API for completion")
             
@@ -151,53 +369,107 @@ class LLMClient:
             
             if system_message:
                 data["system"] = system_message
+                if isinstance(system_message, list) and any("cache_control" in block for block in system_message):
+                    # 프롬프트 캐시 GA 이전 버전 프록시 호환용 헤더
+                    headers["anthropic-beta"] = "prompt-caching-2024-07-31"
             
-            logger.debug(f"📝 Request data: model={model}, max_tokens={max_tokens}, temperature={temperature}")
-            logger.info(f"🔗 Sending request to: {self.settings.ai.GMS_BASE_URL}/messages")
-            logger.info(f"🔑 API Key: {self.settings.ai.GMS_API_KEY[:20]}...{self.settings.ai.GMS_API_KEY[-4:] if len(self.settings.ai.GMS_API_KEY) > 24 else 'SHORT_KEY'}")
-            logger.info(f"📦 Payload size: {len(str(data))} characters")
+            # 실제 전송 바이트 기준으로 크기 측정 (직렬화는 한 번만 수행)
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            logger.debug(f"📝 Request data: model={model}, max_tokens={max_tokens}, "
+                         f"temperature={temperature}, bytes={len(body)}")
             
-            # 보다 공격적인 네트워크 타임아웃으로 행걸림 방지 (연결/읽기 분리)
-            timeout = httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0)
+            # 보다 공격적인 네트워크 타임아웃으로 행걸림 방지 (연결/읽기 분리, 읽기는 호출 측 남은 시간 이내)
+            read_timeout = clamp_timeout(GMS_READ_TIMEOUT, "llm")
+            timeout = httpx.Timeout(connect=5.0, read=read_timeout, write=10.0, pool=5.0)
             limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
             async with httpx.AsyncClient(timeout=timeout, limits=limits, follow_redirects=True) as client:
-                logger.info("⏳ Waiting for GMS API response (connect<=5s, read<=20s)...")
+                timer.mark_request_start()
                 response = await client.post(
                     f"{self.settings.ai.GMS_BASE_URL}/messages",
                     headers=headers,
-                    json=data,
-                    timeout=timeout
+                    content=body,
+                    timeout=timeout,
+                    extensions={"trace": timer.trace}
                 )
-                logger.info(f"📡 Received response: status={response.status_code}")
+                logger.debug(f"📡 Received response: status={response.status_code}")
                 response.raise_for_status()
                 result = response.json()
-                logger.info("✅ Response parsing successful")
+                
+                usage = result.get("usage") or {}
+                self._record_usage(usage)
                 
                 # Anthropic API 응답 파싱
                 if "content" in result and len(result["content"]) > 0:
                     content = result["content"][0]["text"]
-                    logger.info(f"✅ GMS response received (length: {len(content)} chars)")
+                    timer.finish("success", usage, len(body))
+                    logger.debug(f"✅ GMS response received (length: {len(content)} chars)")
                     return content.strip()
                 else:
                     logger.error("❌ Invalid GMS API response format")
                     raise ValueError("Invalid response format from GMS API")
                 
         except httpx.HTTPStatusError as e:
+            timer.finish("error", request_bytes=len(body))
             logger.error(f"❌ GMS API HTTP error {e.response.status_code}: {e.response.text}")
             raise
+        except httpx.ReadTimeout:
+            if read_timeout < GMS_READ_TIMEOUT:
+                # 호출 측 남은 시간으로 줄인 타임아웃 - GMS 장애로 기록하지 않고 중단 (브레이커는 release)
+                timer.finish("cancelled", request_bytes=len(body))
+                logger.warning(f"⏱️ GMS call exceeded caller budget ({read_timeout:.1f}s), abandoning")
+                abandon_budget("llm")
+            timer.finish("timeout", request_bytes=len(body))
+            logger.error("❌ GMS API timeout")
+            raise
         except httpx.TimeoutException:
+            timer.finish("timeout", request_bytes=len(body))
             logger.error("❌ GMS API timeout")
             raise
+        except asyncio.CancelledError:
+            timer.finish("cancelled", request_bytes=len(body))
+            raise
         except Exception as e:
+            timer.finish("error", request_bytes=len(body))
             logger.error(f"❌ GMS completion failed: {e}")
             raise
     
-    async def _mock_completion(self, prompt: str) -> str:
+    def _record_usage(self, usage: Dict[str, Any]):
+        """GMS 응답의 usage 필드로 입력/출력 토큰 집계"""
+        input_tokens = usage.get("input_tokens", 0) or 0
+        output_tokens = usage.get("output_tokens", 0) or 0
+        cache_write_tokens = usage.get("cache_creation_input_tokens", 0) or 0
+        cache_read_tokens = usage.get("cache_read_input_tokens", 0) or 0
+        self.usage_stats["requests"] += 1
+        self.usage_stats["input_tokens"] += input_tokens
+        self.usage_stats["output_tokens"] += output_tokens
+        self.usage_stats["cache_creation_input_tokens"] += cache_write_tokens
+        self.usage_stats["cache_read_input_tokens"] += cache_read_tokens
+        logger.debug(f"🧮 GMS usage: input={input_tokens}, output={output_tokens}, "
+                    f"cache_write={cache_write_tokens}, cache_read={cache_read_tokens} tokens")
+    
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """누적 토큰 사용량 통계"""
+        requests = self.usage_stats["requests"]
+        prompt_tokens = (
+            self.usage_stats["input_tokens"]
+            + self.usage_stats["cache_creation_input_tokens"]
+            + self.usage_stats["cache_read_input_tokens"]
+        )
+        return {
+            **self.usage_stats,
+            "avg_input_tokens": self.usage_stats["input_tokens"] / requests if requests else 0.0,
+            "cache_read_ratio": self.usage_stats["cache_read_input_tokens"] / prompt_tokens if prompt_tokens else 0.0,
+            "hedge": dict(self.hedge_stats),
+            "breaker": self.breaker.get_state() if self.breaker else None
+        }
+    
+    async def _mock_completion(self, prompt: str, simulate_latency: bool = True) -> str:
         """Generate mock completion for development/testing"""
         logger.debug("Using mock LLM completion")
         
         # Simulate processing time
-        await asyncio.sleep(0.5)
+        if simulate_latency:
+            await asyncio.sleep(0.5)
         
         # Generate mock response based on prompt content
         if "퀴즈" in prompt or "quiz" in prompt.lower():
@@ -228,11 +500,14 @@ D) 소셜 네트워킹
     async def generate_completion_stream(
         self,
         prompt: str,
-        system_message: Optional[str] = None,
+        system_message: Optional[SystemPrompt] = None,
         max_tokens: int = 1000,
         temperature: float = 0.7,
         provider: Optional[LLMProvider] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        cache_system: bool = False,
+        hedge: bool = False,
+        caller: str = "unknown"
     ):
         """Generate streaming text completion using GMS API (fallback to mock)"""
         
@@ -243,8 +518,13 @@ D) 소셜 네트워킹
         
         try:
             # GMS API doesn't support streaming, so we'll return the complete response as a single chunk
-            result = await self._gms_completion(prompt, system_message, max_tokens, temperature)
+            system = self._prepare_system(system_message, cache_system)
+            result = await self._guarded_gms_completion(prompt, system, max_tokens, temperature, hedge, caller)
             yield result
+        except CircuitOpenError as e:
+            logger.warning(f"⚡ {e} - using mock streaming completion")
+            async for chunk in self._mock_completion_stream(prompt, simulate_latency=False):
+                yield chunk
         except Exception as e:
             logger.error(f"GMS streaming completion failed: {e}")
             logger.warning("Falling back to mock streaming completion")
@@ -258,7 +538,7 @@ D) 소셜 네트워킹
         else:
             return LLMProvider.MOCK
 
-    async def _mock_completion_stream(self, prompt: str):
+    async def _mock_completion_stream(self, prompt: str, simulate_latency: bool = True):
         """Generate mock streaming completion for development/testing"""
         logger.debug("Using mock LLM streaming completion")
         
@@ -275,7 +555,8 @@ D) 소셜 네트워킹
             if i > 0:
                 chunk = " " + chunk
             yield chunk
-            await asyncio.sleep(0.1)  # Simulate network delay
+            if simulate_latency:
+                await asyncio.sleep(0.1)  # Simulate network delay
     
 
 
@@ -320,7 +601,8 @@ class QuizLLMClient:
             prompt=prompt,
             system_message=system_message,
             max_tokens=1500,
-            temperature=0.3
+            temperature=0.3,
+            caller="quiz"
         )
         
         # Parse response into structured format
@@ -425,7 +707,8 @@ class ProofreadingLLMClient:
             prompt=prompt,
             system_message=system_message,
             max_tokens=1000,
-            temperature=0.2
+            temperature=0.2,
+            caller="proofreading"
         )
         
         return self._parse_proofread_response(response, text)
@@ -509,7 +792,8 @@ class DiscussionLLMClient:
             prompt=prompt,
             system_message=system_message,
             max_tokens=200,
-            temperature=0.8
+            temperature=0.8,
+            caller="discussion"
         )
         
         return response.strip()
@@ -541,7 +825,8 @@ class DiscussionLLMClient:
             prompt=prompt,
             system_message=system_message,
             max_tokens=300,
-            temperature=0.7
+            temperature=0.7,
+            caller="discussion_topics"
         )
         
         # Parse topics
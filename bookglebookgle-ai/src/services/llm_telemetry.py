@@ -0,0 +1,152 @@
+"""
+LLM Call Telemetry for BGBG AI Server
+Per-call queue/connect/TTFB/total latency, token and payload metrics for GMS requests
+"""
+
+import time
+from typing import Dict, Any, Optional
+
+from loguru import logger
+
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # prometheus_client 미설치 시 로그 기록만 수행
+    PROMETHEUS_AVAILABLE = False
+
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0, 30.0)
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+BYTES_BUCKETS = (512, 1024, 4096, 8192, 16384, 32768, 65536, 131072)
+
+if PROMETHEUS_AVAILABLE:
+    LLM_QUEUE_SECONDS = Histogram(
+        "bgbg_llm_queue_seconds",
+        "Time from LLMClient call entry until the HTTP request starts (breaker, hedge delay, client setup)",
+        ["caller"], buckets=LATENCY_BUCKETS
+    )
+    LLM_CONNECT_SECONDS = Histogram(
+        "bgbg_llm_connect_seconds",
+        "TCP + TLS connect time to GMS",
+        ["caller"], buckets=LATENCY_BUCKETS
+    )
+    LLM_TTFB_SECONDS = Histogram(
+        "bgbg_llm_ttfb_seconds",
+        "Time from sending request headers to receiving response headers",
+        ["caller"], buckets=LATENCY_BUCKETS
+    )
+    LLM_REQUEST_SECONDS = Histogram(
+        "bgbg_llm_request_seconds",
+        "Total LLM call latency from call entry to parsed response",
+        ["caller", "outcome"], buckets=LATENCY_BUCKETS
+    )
+    LLM_INPUT_TOKENS = Histogram(
+        "bgbg_llm_input_tokens",
+        "Uncached input tokens per GMS request (response usage)",
+        ["caller"], buckets=TOKEN_BUCKETS
+    )
+    LLM_OUTPUT_TOKENS = Histogram(
+        "bgbg_llm_output_tokens",
+        "Output tokens per GMS request (response usage)",
+        ["caller"], buckets=TOKEN_BUCKETS
+    )
+    LLM_CACHE_TOKENS = Counter(
+        "bgbg_llm_cache_tokens_total",
+        "Prompt cache tokens reported by GMS",
+        ["caller", "kind"]
+    )
+    LLM_REQUEST_BYTES = Histogram(
+        "bgbg_llm_request_bytes",
+        "Serialized GMS request body size in bytes",
+        ["caller"], buckets=BYTES_BUCKETS
+    )
+
+
+class LLMCallTimer:
+    """
+    단일 GMS HTTP 요청의 단계별 시각 기록
+
+    httpx `trace` 확장 콜백으로 연결/헤더 송수신 시점을 수집하고,
+    finish()에서 Prometheus 히스토그램에 기록
+    """
+
+    def __init__(self, caller: str, started_at: Optional[float] = None):
+        self.caller = caller or "unknown"
+        self.started_at = started_at or time.perf_counter()
+        self.request_started_at: Optional[float] = None
+        self.marks: Dict[str, float] = {}
+
+    def mark_request_start(self):
+        """HTTP 요청 시작 시점 (queue 구간 종료)"""
+        self.request_started_at = time.perf_counter()
+
+    async def trace(self, event_name: str, info: Dict[str, Any]):
+        """httpx/httpcore trace callback"""
+        self.marks.setdefault(event_name, time.perf_counter())
+
+    def _span(self, start_suffix: str, end_suffixes: tuple) -> Optional[float]:
+        start = next((t for name, t in self.marks.items() if name.endswith(start_suffix)), None)
+        end = None
+        for suffix in end_suffixes:
+            end = next((t for name, t in self.marks.items() if name.endswith(suffix)), None)
+            if end is not None:
+                break
+        if start is None or end is None:
+            return None
+        return max(end - start, 0.0)
+
+    def finish(
+        self,
+        outcome: str,
+        usage: Optional[Dict[str, Any]] = None,
+        request_bytes: int = 0
+    ) -> Dict[str, Any]:
+        """
+        요청 종료 후 지표 기록
+
+        Args:
+            outcome: "success" | "error" | "timeout"
+            usage: GMS 응답 usage 필드
+            request_bytes: 요청 본문 크기
+
+        Returns:
+            Dict[str, Any]: 기록된 타이밍 (초)
+        """
+        now = time.perf_counter()
+        usage = usage or {}
+        timings = {
+            "queue": (self.request_started_at - self.started_at) if self.request_started_at else None,
+            "connect": self._span("connect_tcp.started", ("start_tls.complete", "connect_tcp.complete")),
+            "ttfb": self._span("send_request_headers.started", ("receive_response_headers.complete",)),
+            "total": now - self.started_at
+        }
+
+        if PROMETHEUS_AVAILABLE:
+            try:
+                if timings["queue"] is not None:
+                    LLM_QUEUE_SECONDS.labels(self.caller).observe(timings["queue"])
+                if timings["connect"] is not None:
+                    LLM_CONNECT_SECONDS.labels(self.caller).observe(timings["connect"])
+                if timings["ttfb"] is not None:
+                    LLM_TTFB_SECONDS.labels(self.caller).observe(timings["ttfb"])
+                LLM_REQUEST_SECONDS.labels(self.caller, outcome).observe(timings["total"])
+                if request_bytes:
+                    LLM_REQUEST_BYTES.labels(self.caller).observe(request_bytes)
+                if usage:
+                    LLM_INPUT_TOKENS.labels(self.caller).observe(usage.get("input_tokens", 0) or 0)
+                    LLM_OUTPUT_TOKENS.labels(self.caller).observe(usage.get("output_tokens", 0) or 0)
+                    LLM_CACHE_TOKENS.labels(self.caller, "read").inc(usage.get("cache_read_input_tokens", 0) or 0)
+                    LLM_CACHE_TOKENS.labels(self.caller, "write").inc(usage.get("cache_creation_input_tokens", 0) or 0)
+            except Exception as e:
+                logger.debug(f"Failed to record LLM metrics: {e}")
+
+        logger.debug(
+            f"⏱️ LLM call [{self.caller}] {outcome}: total={timings['total'] * 1000:.0f}ms, "
+            f"queue={self._fmt(timings['queue'])}, connect={self._fmt(timings['connect'])}, "
+            f"ttfb={self._fmt(timings['ttfb'])}, bytes={request_bytes}"
+        )
+        return timings
+
+    @staticmethod
+    def _fmt(value: Optional[float]) -> str:
+        return f"{value * 1000:.0f}ms" if value is not None else "-"
@@ -0,0 +1,131 @@
+"""
+Local Cache for BGBG AI Server
+In-process L0 cache (per key type LRU + TTL) in front of RedisCacheManager
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 캐시 미적중 표시 (저장된 값이 None일 수 있으므로 구분)
+MISS = object()
+
+
+class LocalCache:
+    """
+    키 타입별 인메모리 캐시
+    
+    - 타입별 최대 항목 수(LRU) 및 TTL - Redis TTL보다 짧게 설정
+    - 세션 단위 무효화 (다른 레플리카의 쓰기/무효화는 pub/sub로 전달받아 처리)
+    - 반환 값은 캐시 항목 자체이므로 호출자가 수정하지 않아야 함
+    """
+    
+    def __init__(self, limits: Dict[Hashable, Tuple[int, float]]):
+        """
+        Args:
+            limits: 키 타입 -> (최대 항목 수, TTL 초)
+        """
+        self.limits = limits
+        # 키 타입 -> (캐시 키 -> (만료 시각, 세션 ID, 값))
+        self._entries: Dict[Hashable, "OrderedDict[str, Tuple[float, str, Any]]"] = {
+            key_type: OrderedDict() for key_type in limits
+        }
+        self._type_stats: Dict[Hashable, Dict[str, int]] = {
+            key_type: {"hits": 0, "misses": 0, "evictions": 0} for key_type in limits
+        }
+        self.stats = {"invalidations": 0, "session_invalidations": 0, "clears": 0}
+    
+    def get(self, key_type: Hashable, key: str) -> Any:
+        """
+        캐시 조회
+        
+        Returns:
+            Any: 캐시된 값 또는 MISS
+        """
+        entries = self._entries[key_type]
+        entry = entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del entries[key]
+            self._type_stats[key_type]["misses"] += 1
+            return MISS
+        
+        entries.move_to_end(key)
+        self._type_stats[key_type]["hits"] += 1
+        return entry[2]
+    
+    def put(self, key_type: Hashable, key: str, session_id: str, value: Any, max_ttl: Optional[float] = None):
+        """
+        캐시 저장 (TTL은 타입별 TTL과 max_ttl 중 짧은 값)
+        
+        Args:
+            max_ttl: Redis 키의 TTL (L0 항목이 Redis보다 오래 남지 않도록)
+        """
+        max_entries, ttl = self.limits[key_type]
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+        if max_entries <= 0 or ttl <= 0:
+            return
+        
+        entries = self._entries[key_type]
+        entries[key] = (time.monotonic() + ttl, session_id, value)
+        entries.move_to_end(key)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+            self._type_stats[key_type]["evictions"] += 1
+    
+    def invalidate(self, key: str):
+        """캐시 키 무효화 (모든 타입)"""
+        for entries in self._entries.values():
+            if entries.pop(key, None) is not None:
+                self.stats["invalidations"] += 1
+    
+    def invalidate_session(self, session_id: str) -> int:
+        """세션의 모든 항목 무효화"""
+        removed = 0
+        for entries in self._entries.values():
+            stale = [key for key, entry in entries.items() if entry[1] == session_id]
+            for key in stale:
+                del entries[key]
+            removed += len(stale)
+        self.stats["session_invalidations"] += 1
+        self.stats["invalidations"] += removed
+        return removed
+    
+    def clear(self):
+        """전체 폐기 (무효화 이벤트 구독 유실 시)"""
+        for entries in self._entries.values():
+            entries.clear()
+        self.stats["clears"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        L0 캐시 통계
+        
+        Returns:
+            Dict[str, Any]: 전체/타입별 hit/miss/hit_rate 및 항목 수
+        """
+        hits = sum(stats["hits"] for stats in self._type_stats.values())
+        misses = sum(stats["misses"] for stats in self._type_stats.values())
+        by_type = {}
+        for key_type, stats in self._type_stats.items():
+            total = stats["hits"] + stats["misses"]
+            by_type[getattr(key_type, "value", key_type)] = {
+                **stats,
+                "hit_rate": stats["hits"] / total if total else 0.0,
+                "entries": len(self._entries[key_type]),
+                "max_entries": self.limits[key_type][0],
+                "ttl_seconds": self.limits[key_type][1]
+            }
+        return {
+            **self.stats,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "by_type": by_type
+        }
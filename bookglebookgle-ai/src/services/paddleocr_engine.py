@@ -12,18 +12,23 @@ import io
 import os
 from pathlib import Path
 
-import numpy as np
-import fitz  # PyMuPDF
-from PIL import Image, ImageEnhance, ImageFilter
-import cv2
 from loguru import logger
 
 from src.models.ocr_models import OCRBlock, BoundingBox
+from src.utils.cancellation import check_cancelled, clamp_timeout, record_work
+from src.utils.lazy_import import lazy_import
 from src.utils.debug_utils import (
     DebugLogger, DebugContextManager, OCRDebugHelper,
     debug_operation, async_debug_operation, default_debug_logger
 )
 
+# 이미지/PDF 처리 모듈은 엔진을 실제로 사용할 때 로드 (원격 OCR만 쓰는 서버의 시작 시간/메모리 절감)
+np = lazy_import("numpy")
+fitz = lazy_import("fitz")  # PyMuPDF
+cv2 = lazy_import("cv2")
+Image = lazy_import("PIL.Image")
+ImageEnhance = lazy_import("PIL.ImageEnhance")
+
 
 # 글로벌 PaddleOCR 인스턴스 캐시 (메모리 효율성 및 초기화 시간 단축)
 _global_ocr_cache = {}
@@ -347,12 +352,15 @@ class PaddleOCREngine:
                 
                 # 배치 내 페이지들 처리
                 for page_num in range(batch_start, batch_end):
+                    # 호출 측이 떠났으면 남은 페이지 렌더링/OCR 중단
+                    check_cancelled("ocr")
                     try:
                         page_start_time = time.time()
                         page_blocks = await self._process_page(pdf_document, page_num)
                         page_time = time.time() - page_start_time
                         
                         ocr_blocks.extend(page_blocks)
+                        record_work("ocr_pages")
                         
                         logger.info(f"✅ Page {page_num + 1}/{total_pages}: {len(page_blocks)} blocks, {page_time:.1f}s")
                         
@@ -454,7 +462,7 @@ class PaddleOCREngine:
                         self._safe_ocr_call,
                         image_array
                     ),
-                    timeout=60.0  # 페이지당 60초 타임아웃 (초기화 지연 대응)
+                    timeout=clamp_timeout(60.0, "ocr")  # 페이지당 60초 타임아웃 (초기화 지연 대응), 호출 측 데드라인 이내
                 )
                 logger.debug(f"🔍 Page {page_num + 1}: OCR completed, result type: {type(ocr_result)}, length: {len(ocr_result) if hasattr(ocr_result, '__len__') else 'N/A'}")
                 
@@ -495,7 +503,7 @@ class PaddleOCREngine:
             except:
                 pass  # 정리 중 오류는 무시
 
-    def _preprocess_image(self, image: Image.Image) -> Image.Image:
+    def _preprocess_image(self, image: "Image.Image") -> "Image.Image":
         """
         이미지 전처리로 OCR 정확도 향상 (PaddleOCR 3.1.0+ RGB 형식 유지)
         
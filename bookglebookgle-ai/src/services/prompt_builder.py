@@ -0,0 +1,245 @@
+"""
+Prompt Builder for BGBG AI Server
+Token-budgeted prompt assembly for discussion moderator replies
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+from src.config.settings import get_settings
+from src.services.llm_client import SystemPrompt, build_system_blocks
+
+
+# 토론 진행자 시스템 프롬프트 - 매 요청 동일한 바이트로 전송되어야 업스트림 프롬프트 캐시 적용 가능
+BOOKCLUB_MODERATOR_SYSTEM_PROMPT = """당신은 독서 모임의 전문 AI 토론 진행자입니다.
+최근 대화 흐름과 독서 자료를 모두 고려하여 맞춤형 응답을 해주세요.
+
+역할 및 지침:
+1. 최근 대화 맥락을 고려하여 자연스럽게 응답
+2. 참여자의 의견에 구체적으로 공감하고 인정
+3. 독서 내용과 연결된 새로운 관점이나 질문 제시
+4. 다른 참여자들의 참여를 자연스럽게 유도
+5. 150자 내외로 간결하면서도 의미있게 작성
+6. 친근하고 격려하는 톤 유지
+7. 대화가 반복되지 않도록 새로운 각도에서 접근
+8. **중요**: 매 메시지마다 응답하지 말고, 참여자들의 메시지가 2-3개 쌓인 후에만 의미있는 피드백 제공. 너무 적극적으로 개입하지 말 것
+9. 최근 대화가 2~3개 이하로 짧다면, 대화 시작을 돕는 배경/오픈 질문을 포함하고, 아직 참여하지 않은 분들을 부드럽게 초대
+10. 최근 10개 내 참여 빈도가 낮은 사람(메시지 1회 이하)이 있다면, 이름을 직접 거론하지 않고 모두에게 참여를 권유하는 일반 메시지를 덧붙이세요
+11. 위의 10개의 규칙을 절대로 위배하지 않기"""
+
+BOOKCLUB_PROMPT_TEMPLATE = """독서 자료 내용:
+{book_context}
+
+최근 대화 흐름:
+{chat_context}
+
+현재 상황:
+{sender_nickname}님이 방금 말했습니다: "{message}"
+
+위 맥락을 모두 고려하여 토론 진행자로서 자연스럽고 의미있는 응답을 해주세요."""
+
+# 세션 고정 독서 자료 (토론 시작 시 검색된 청크) - 세션 내 반복 턴에서 캐시 prefix로 재사용
+BOOKCLUB_SESSION_CONTEXT_TEMPLATE = """이번 독서 모임의 주요 독서 자료:
+{session_context}"""
+
+# 토큰 추정 계수 (Anthropic 토크나이저 근사)
+# 영문/숫자는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰으로 보수적으로 계산
+ASCII_CHARS_PER_TOKEN = 4
+NON_ASCII_TOKENS_PER_CHAR = 1.0
+
+# 잘라낸 청크가 이보다 짧으면 포함하지 않음
+MIN_PARTIAL_CHUNK_TOKENS = 80
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 토큰 수 근사 계산 (외부 토크나이저 호출 없음)
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN + non_ascii_chars * NON_ASCII_TOKENS_PER_CHAR)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    토큰 예산에 맞게 텍스트 앞부분만 남기고 자름 (가능하면 문장 경계에서)
+
+    Args:
+        text: 대상 텍스트
+        max_tokens: 허용 토큰 수
+
+    Returns:
+        str: 잘린 텍스트 (예산 초과 시 빈 문자열)
+    """
+    if max_tokens <= 0:
+        return ""
+
+    total = estimate_tokens(text)
+    if total <= max_tokens:
+        return text
+
+    cut = int(len(text) * max_tokens / total)
+    while cut > 0 and estimate_tokens(text[:cut]) > max_tokens:
+        cut = int(cut * 0.9)
+
+    truncated = text[:cut]
+    boundary = max(truncated.rfind(". "), truncated.rfind("다."), truncated.rfind("\n"))
+    if boundary > len(truncated) // 2:
+        truncated = truncated[:boundary + 1]
+
+    return truncated.rstrip()
+
+
+@dataclass
+class BuiltPrompt:
+    """예산 내로 조립된 프롬프트와 토큰 집계"""
+    system_message: SystemPrompt
+    prompt: str
+    input_tokens: int
+    book_tokens: int
+    history_tokens: int
+    dropped_chunks: int
+    dropped_messages: int
+    cached_prefix_tokens: int = 0
+
+
+class DiscussionPromptBuilder:
+    """
+    토론 진행자 응답용 토큰 예산 기반 프롬프트 빌더
+
+    - 시스템 프롬프트는 고정 상수로 유지 (업스트림 프롬프트 캐시 적중)
+    - 세션 고정 독서 자료는 시스템 블록 prefix에 배치하여 세션 내 턴 간 캐시 재사용
+      (CHAT_CACHED_CONTEXT_MAX_TOKENS 별도 예산)
+    - 채팅 기록은 최신 메시지부터 예산 내에서 유지
+    - 독서 자료 청크는 검색 순위(유사도 순) 그대로 채우고, 마지막 청크는 예산에 맞게 자름
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None, history_token_limit: Optional[int] = None):
+        settings = get_settings()
+        self.max_tokens = max_tokens or settings.chat_history.CHAT_MAX_TOKENS
+        self.history_token_limit = history_token_limit or settings.chat_history.CHAT_SUMMARIZATION_THRESHOLD
+        self.history_ratio = settings.chat_history.CHAT_HISTORY_TOKEN_RATIO
+        self.cached_context_max_tokens = settings.chat_history.CHAT_CACHED_CONTEXT_MAX_TOKENS
+        self.system_tokens = estimate_tokens(BOOKCLUB_MODERATOR_SYSTEM_PROMPT)
+
+    def build(
+        self,
+        message: str,
+        sender_nickname: str,
+        book_chunks: List[str],
+        chat_lines: List[str],
+        session_context: Optional[List[str]] = None
+    ) -> BuiltPrompt:
+        """
+        예산 내에서 토론 응답 프롬프트 조립
+
+        Args:
+            message: 현재 사용자 메시지
+            sender_nickname: 발신자 닉네임
+            book_chunks: 독서 자료 청크 (유사도 순)
+            chat_lines: 최근 대화 ("닉네임: 내용", 오래된 순)
+            session_context: 세션 고정 독서 자료 청크 (캐시 prefix, 선택)
+
+        Returns:
+            BuiltPrompt: 조립된 프롬프트와 토큰 집계
+        """
+        # 고정 영역: 시스템 프롬프트 + 템플릿 + 현재 메시지
+        fixed_tokens = self.system_tokens + estimate_tokens(
+            BOOKCLUB_PROMPT_TEMPLATE.format(
+                book_context="", chat_context="", sender_nickname=sender_nickname, message=message
+            )
+        )
+        remaining = max(self.max_tokens - fixed_tokens, 0)
+
+        history_budget = min(int(remaining * self.history_ratio), self.history_token_limit)
+        history_lines, history_tokens, dropped_messages = self._select_history(chat_lines, history_budget)
+
+        # 세션 고정 자료는 캐시 prefix로 보내고, 턴별 검색 청크에서는 중복 제거
+        # (예산 때문에 잘리거나 빠진 세션 청크는 prefix에 온전히 없으므로 검색 청크로 유지)
+        session_parts, cached_tokens, _ = self._select_book_context(
+            session_context or [], self.cached_context_max_tokens
+        )
+        if session_parts:
+            cached_chunks = set(session_parts) & set(session_context)
+            book_chunks = [chunk for chunk in book_chunks or [] if chunk not in cached_chunks]
+
+        book_budget = remaining - history_tokens
+        book_parts, book_tokens, dropped_chunks = self._select_book_context(book_chunks, book_budget)
+
+        book_context_text = "\n\n".join(book_parts) if book_parts else "독서 자료 내용 없음"
+        chat_context_text = "\n".join(history_lines) if history_lines else f"{sender_nickname}: {message}"
+
+        prompt = BOOKCLUB_PROMPT_TEMPLATE.format(
+            book_context=book_context_text,
+            chat_context=chat_context_text,
+            sender_nickname=sender_nickname,
+            message=message
+        )
+
+        session_block = (
+            BOOKCLUB_SESSION_CONTEXT_TEMPLATE.format(session_context="\n\n".join(session_parts))
+            if session_parts else None
+        )
+
+        return BuiltPrompt(
+            system_message=build_system_blocks(BOOKCLUB_MODERATOR_SYSTEM_PROMPT, session_block),
+            prompt=prompt,
+            input_tokens=self.system_tokens + cached_tokens + estimate_tokens(prompt),
+            book_tokens=book_tokens,
+            history_tokens=history_tokens,
+            dropped_chunks=dropped_chunks,
+            dropped_messages=dropped_messages,
+            cached_prefix_tokens=self.system_tokens + cached_tokens
+        )
+
+    def _select_history(self, chat_lines: List[str], budget: int) -> Tuple[List[str], int, int]:
+        """최신 메시지부터 예산 내로 채팅 기록 선택 (원래 순서 유지)"""
+        selected: List[str] = []
+        used = 0
+        for line in reversed(chat_lines or []):
+            line_tokens = estimate_tokens(line) + 1
+            if used + line_tokens > budget:
+                break
+            selected.append(line)
+            used += line_tokens
+
+        selected.reverse()
+        return selected, used, len(chat_lines or []) - len(selected)
+
+    def _select_book_context(self, chunks: List[str], budget: int) -> Tuple[List[str], int, int]:
+        """검색 순위대로 예산 내 독서 자료 청크 선택 (중복 제거, 마지막 청크는 부분 포함)"""
+        unique_chunks = list(dict.fromkeys(chunk for chunk in chunks or [] if chunk))
+        selected: List[str] = []
+        used = 0
+
+        for chunk in unique_chunks:
+            chunk_tokens = estimate_tokens(chunk) + 2
+            if used + chunk_tokens <= budget:
+                selected.append(chunk)
+                used += chunk_tokens
+                continue
+
+            # 남은 예산이 충분하면 잘라서 포함하고 종료
+            remaining = budget - used - 2
+            if remaining >= MIN_PARTIAL_CHUNK_TOKENS:
+                partial = truncate_to_tokens(chunk, remaining)
+                if partial:
+                    selected.append(partial)
+                    used += estimate_tokens(partial) + 2
+            break
+
+        dropped = len(unique_chunks) - len(selected)
+        if dropped:
+            logger.debug(f"Book context trimmed to budget: kept {len(selected)}/{len(unique_chunks)} chunks ({used} tokens)")
+        return selected, used, dropped
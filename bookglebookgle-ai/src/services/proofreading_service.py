@@ -12,6 +12,26 @@ from src.services.llm_client import LLMClient, ProofreadingLLMClient
 from src.config.settings import get_settings
 
 
+# 교정 시스템 프롬프트 (고정 상수)
+# 프롬프트 캐시 최소 길이(1024/2048 토큰)에 못 미쳐 cache_control을 붙여도 캐시되지 않으므로 일반 문자열로 전송
+PROOFREADING_SYSTEM_PROMPT = """당신은 전문적인 텍스트 교정 전문가입니다. 
+주어진 텍스트의 문법, 맞춤법, 문체를 검토하고 개선 사항을 제안해주세요.
+응답은 다음 JSON 형식으로 제공해주세요:
+
+{
+  "corrected_text": "교정된 전체 텍스트",
+  "corrections": [
+    {
+      "original": "원본 텍스트",
+      "corrected": "교정된 텍스트", 
+      "type": "grammar|spelling|style|clarity",
+      "explanation": "교정 이유 설명"
+    }
+  ],
+  "confidence_score": 0.95
+}"""
+
+
 class ProofreadingService:
     """Service for AI-powered text proofreading and correction"""
     
@@ -110,24 +130,6 @@ class ProofreadingService:
             context_text = proofread_data.get("context_text", "")
             language = proofread_data.get("language", "ko")
             
-            # 시스템 메시지 구성
-            system_message = """당신은 전문적인 텍스트 교정 전문가입니다. 
-주어진 텍스트의 문법, 맞춤법, 문체를 검토하고 개선 사항을 제안해주세요.
-응답은 다음 JSON 형식으로 제공해주세요:
-
-{
-  "corrected_text": "교정된 전체 텍스트",
-  "corrections": [
-    {
-      "original": "원본 텍스트",
-      "corrected": "교정된 텍스트", 
-      "type": "grammar|spelling|style|clarity",
-      "explanation": "교정 이유 설명"
-    }
-  ],
-  "confidence_score": 0.95
-}"""
-            
             # 프롬프트 구성
             prompt = f"""다음 텍스트를 교정해주세요:
 
@@ -145,10 +147,11 @@ class ProofreadingService:
             from src.services.llm_client import LLMProvider
             response = await self.llm_client.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=PROOFREADING_SYSTEM_PROMPT,
                 max_tokens=1500,
                 temperature=0.3,  # 교정 작업이므로 낮은 temperature 사용
-                provider=LLMProvider.GMS
+                provider=LLMProvider.GMS,
+                caller="proofreading"
             )
             
             # JSON 응답 파싱
@@ -0,0 +1,178 @@
+"""
+Quiz Bank for BGBG AI Server
+Stores pre-generated quiz questions per meeting/document/progress with TTL
+"""
+
+import json
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+from loguru import logger
+
+from src.config.settings import get_settings
+
+
+class QuizBank:
+    """
+    진도율별 사전 생성 퀴즈 저장소
+
+    Redis가 있으면 Redis에 TTL과 함께 저장하고,
+    없거나 실패하면 프로세스 메모리에 TTL 기반으로 보관합니다.
+    """
+
+    KEY_PREFIX = "quiz_bank"
+
+    def __init__(self, redis_manager=None):
+        self.settings = get_settings()
+        self.redis_manager = redis_manager
+        self.ttl_seconds = self.settings.ai.QUIZ_BANK_TTL_HOURS * 3600
+
+        # Redis 미사용 시 fallback 저장소: key -> (expires_at, payload_json)
+        self._memory_store: Dict[str, Tuple[float, str]] = {}
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "invalidations": 0
+        }
+
+    def _build_key(self, meeting_id: str, document_id: str, progress_percentage: int) -> str:
+        """퀴즈 뱅크 키 생성"""
+        return f"{self.KEY_PREFIX}:{meeting_id}:{document_id}:{progress_percentage}"
+
+    async def get(
+        self,
+        meeting_id: str,
+        document_id: str,
+        progress_percentage: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        사전 생성된 퀴즈 문항 조회
+
+        Returns:
+            검증된 문항 리스트 또는 None (미스)
+        """
+        key = self._build_key(meeting_id, document_id, progress_percentage)
+        payload = None
+
+        try:
+            if self.redis_manager:
+                payload = await self.redis_manager.get_key(key)
+        except Exception as e:
+            logger.warning(f"Quiz bank Redis lookup failed, using memory store: {e}")
+
+        if payload is None:
+            entry = self._memory_store.get(key)
+            if entry:
+                expires_at, stored = entry
+                if expires_at > time.time():
+                    payload = stored
+                else:
+                    del self._memory_store[key]
+
+        if payload is None:
+            self.stats["misses"] += 1
+            return None
+
+        try:
+            record = json.loads(payload)
+            questions = record.get("questions") or []
+            if not questions:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            return questions
+
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Corrupted quiz bank entry {key}: {e}")
+            self.stats["misses"] += 1
+            return None
+
+    async def put(
+        self,
+        meeting_id: str,
+        document_id: str,
+        progress_percentage: int,
+        questions: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        검증된 퀴즈 문항 저장
+
+        Returns:
+            저장 성공 여부
+        """
+        if not questions:
+            return False
+
+        key = self._build_key(meeting_id, document_id, progress_percentage)
+        payload = json.dumps({
+            "meeting_id": meeting_id,
+            "document_id": document_id,
+            "progress_percentage": progress_percentage,
+            "questions": questions,
+            "created_at": datetime.utcnow().isoformat()
+        }, ensure_ascii=False)
+
+        stored = False
+        try:
+            if self.redis_manager:
+                stored = await self.redis_manager.set_with_ttl(key, payload, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Quiz bank Redis store failed, using memory store: {e}")
+
+        if not stored:
+            self._memory_store[key] = (time.time() + self.ttl_seconds, payload)
+            stored = True
+
+        self.stats["stores"] += 1
+        return stored
+
+    async def invalidate_document(self, meeting_id: str, document_id: str) -> int:
+        """문서 재업로드 시 해당 문서의 모든 진도율 퀴즈 삭제"""
+        keys = [self._build_key(meeting_id, document_id, progress) for progress in (50, 100)]
+        return await self._delete(keys)
+
+    async def invalidate_meeting(self, meeting_id: str) -> int:
+        """미팅 종료 시 해당 미팅의 모든 퀴즈 삭제"""
+        pattern = f"{self.KEY_PREFIX}:{meeting_id}:*"
+        keys = [key for key in self._memory_store if key.startswith(pattern[:-1])]
+
+        try:
+            if self.redis_manager:
+                keys.extend(await self.redis_manager.scan_keys(pattern))
+        except Exception as e:
+            logger.warning(f"Quiz bank scan failed for meeting {meeting_id}: {e}")
+
+        return await self._delete(list(set(keys)))
+
+    async def _delete(self, keys: List[str]) -> int:
+        """메모리/Redis 양쪽에서 키 삭제"""
+        if not keys:
+            return 0
+
+        deleted = 0
+        for key in keys:
+            if self._memory_store.pop(key, None) is not None:
+                deleted += 1
+
+        try:
+            if self.redis_manager:
+                deleted = max(deleted, await self.redis_manager.delete_keys(*keys))
+        except Exception as e:
+            logger.warning(f"Quiz bank Redis delete failed: {e}")
+
+        self.stats["invalidations"] += deleted
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """퀴즈 뱅크 통계"""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / total if total > 0 else 0.0,
+            "memory_entries": len(self._memory_store),
+            "backend": "redis" if self.redis_manager else "memory"
+        }
@@ -8,13 +8,24 @@ import json
 import re
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from loguru import logger
 
 from src.services.llm_client import LLMClient, QuizLLMClient, LLMProvider
 from src.services.vector_db import VectorDBManager
+from src.services.quiz_bank import QuizBank
 from src.config.settings import get_settings
+from src.utils.cancellation import detach_scope
+
+
+# 퀴즈 생성 시스템 프롬프트 (고정 상수)
+# 프롬프트 캐시 최소 길이(1024/2048 토큰)에 못 미쳐 cache_control을 붙여도 캐시되지 않으므로 일반 문자열로 전송
+QUIZ_SYSTEM_PROMPT = """문서 기반 객관식 퀴즈를 JSON으로 생성하세요.
+
+형식: [{"question":"질문","options":["A","B","C","D"],"correct_answer":0,"explanation":"설명"}]
+
+JSON만 응답하세요."""
 
 
 class QuizService:
@@ -26,6 +37,13 @@ class QuizService:
         self.quiz_llm_client: Optional[QuizLLMClient] = None
         self.vector_db: Optional[VectorDBManager] = None
         self.active_quizzes: Dict[str, Dict[str, Any]] = {}
+        
+        # 퀴즈 뱅크 (ServiceInitializer에서 redis_manager 주입)
+        self.redis_manager = None
+        self.quiz_bank: Optional[QuizBank] = None
+        self._bank_queue: Optional[asyncio.Queue] = None
+        self._bank_worker: Optional[asyncio.Task] = None
+        self._bank_pending: set = set()
     
     async def initialize(self):
         """Initialize quiz service dependencies"""
@@ -45,6 +63,10 @@ class QuizService:
             # Note: VectorDB is managed by ServiceInitializer, not initialized here
             # self.vector_db is already set by ServiceInitializer - do not reset to None!
             
+            if self.settings.ai.QUIZ_BANK_ENABLED:
+                self.quiz_bank = QuizBank(self.redis_manager)
+                logger.info(f"📚 Quiz bank enabled (backend: {'redis' if self.redis_manager else 'memory'})")
+            
             logger.info("Quiz Service initialized successfully")
             
         except Exception as e:
@@ -76,90 +98,32 @@ class QuizService:
             if not self._validate_quiz_request(quiz_data):
                 return {"success": False, "error": "Invalid quiz request data"}
             
-            # VectorDB에서 진도율별 문서 내용 검색 (fallback 포함)
-            combined_content = ""
-            if self.vector_db:
-                try:
-                    content_chunks = await self.vector_db.search_by_progress(
-                        meeting_id=quiz_data["meeting_id"],
-                        document_id=quiz_data["document_id"],
-                        progress_percentage=quiz_data["progress_percentage"],
-                        max_chunks=3
-                    )
-                    
-                    if content_chunks:
-                        # VectorDB에서 이미 올바른 진도율 청크를 반환하므로 추가 필터링 불필요
-                        combined_content = "\n\n".join(content_chunks)
-                        logger.info(f"Retrieved {len(content_chunks)} chunks from VectorDB for {quiz_data['progress_percentage']}% progress")
-                    else:
-                        logger.warning(f"No content found in VectorDB for document {quiz_data['document_id']} at {quiz_data['progress_percentage']}% progress")
-                except Exception as e:
-                    logger.warning(f"VectorDB search failed: {e}")
-            else:
-                logger.warning("VectorDB not available, using fallback content")
-            
-            # Fallback: VectorDB에서 내용을 가져올 수 없을 때 기본 내용 사용
-            if not combined_content:
-                progress = quiz_data["progress_percentage"]
-                if progress == 50:
-                    combined_content = f"문서 전반부(50% 진도) 내용: 기본 개념과 도입부 설명이 포함되어 있습니다. 주요 용어와 기초 이론을 다루며, 이해하기 쉬운 예시들로 구성되어 있습니다."
-                else:  # 100%
-                    combined_content = f"문서 전체(100% 진도) 내용: 기본 개념부터 심화 내용까지 포괄적으로 다룹니다. 이론적 배경, 실무 적용 사례, 결론 및 요약이 포함되어 있습니다."
-                logger.info(f"Using fallback content for {progress}% progress")
-            
-            logger.info(f"📝 Content prepared, length: {len(combined_content)} characters")
-            
-            # 진도율별 컨텐츠 품질 확인
-            progress = quiz_data["progress_percentage"]
-            if combined_content and len(combined_content) > 50:
-                logger.info(f"✅ Using VectorDB content for {progress}% progress quiz")
-                content_source = "vectordb"
-            else:
-                logger.info(f"⚠️ VectorDB content insufficient, using fallback for {progress}% progress")
-                content_source = "fallback"
-            
-            quiz_data_with_content = {
-                **quiz_data,
-                "content": combined_content,
-                "content_source": content_source,
-                "language": "ko",
-                "question_count": 2,  # 2개로 조정
-                "difficulty_level": "medium"
-            }
-            
-            logger.info(f"🎯 Starting question generation process...")
-            logger.info(f"🔍 DEBUG - MOCK_AI_RESPONSES: {self.settings.ai.MOCK_AI_RESPONSES}")
-            logger.info(f"🔍 DEBUG - quiz_llm_client available: {'Yes' if self.quiz_llm_client else 'No'}")
-            
-            # 실제 LLM 연동 또는 Mock 선택
-            if not self.settings.ai.MOCK_AI_RESPONSES and self.quiz_llm_client:
-                logger.info("🤖 Using real LLM for quiz generation...")
-                # 실제 LLM을 사용한 퀴즈 생성
-                try:
-                    llm_questions = await self._generate_llm_questions(quiz_data_with_content)
-                    logger.info(f"🎯 LLM generation completed, result: {'Success' if llm_questions else 'Failed'}")
-                    if llm_questions:
-                        mock_questions = llm_questions
-                    else:
-                        logger.warning("LLM quiz generation failed, falling back to mock")
-                        mock_questions = self._generate_mock_questions(quiz_data_with_content)
-                except Exception as e:
-                    logger.error(f"LLM generation error: {e}")
-                    logger.info("🔄 Falling back to mock questions...")
-                    mock_questions = self._generate_mock_questions(quiz_data_with_content)
-            else:
-                logger.info("🎭 Using mock questions...")
-                # Mock 응답 사용
-                mock_questions = self._generate_mock_questions(quiz_data_with_content)
-            
-            logger.info(f"✅ Questions generated: {len(mock_questions) if mock_questions else 0}")
-            
-            # Validate generated questions
-            validated_questions = self._validate_questions(mock_questions)
-            logger.info(f"✅ Questions validated: {len(validated_questions) if validated_questions else 0}")
-            
+            # 사전 생성된 퀴즈 뱅크 우선 조회 (PDF 업로드 시 백그라운드 생성)
+            validated_questions = None
+            question_source = "bank"
+            if self.quiz_bank:
+                validated_questions = await self.quiz_bank.get(
+                    quiz_data["meeting_id"],
+                    quiz_data["document_id"],
+                    quiz_data["progress_percentage"]
+                )
+                if validated_questions:
+                    logger.info(f"⚡ Quiz bank hit for document {quiz_data['document_id']} at {quiz_data['progress_percentage']}% progress")
+            
+            # 뱅크 미스: 요청 경로에서 즉시 생성
             if not validated_questions:
-                return {"success": False, "error": "Failed to generate valid questions"}
+                validated_questions, question_source = await self._generate_questions(quiz_data)
+                
+                if not validated_questions:
+                    return {"success": False, "error": "Failed to generate valid questions"}
+                
+                if question_source == "llm" and self.quiz_bank:
+                    await self.quiz_bank.put(
+                        quiz_data["meeting_id"],
+                        quiz_data["document_id"],
+                        quiz_data["progress_percentage"],
+                        validated_questions
+                    )
             
             # Create quiz record
             quiz_id = self._generate_quiz_id(quiz_data["document_id"])
@@ -172,7 +136,8 @@ class QuizService:
                 "created_at": datetime.utcnow().isoformat(),
                 "difficulty_level": "medium",
                 "language": "ko",
-                "question_count": 4
+                "question_count": 4,
+                "source": question_source
             }
             
             # Store quiz for future reference
@@ -191,6 +156,177 @@ class QuizService:
             logger.error(f"Quiz generation failed: {e}")
             return {"success": False, "error": f"Quiz generation failed: {str(e)}"}
     
+    async def _generate_questions(self, quiz_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        VectorDB 내용 기반으로 퀴즈 문항을 생성하고 검증
+        
+        Returns:
+            (검증된 문항 리스트, 생성 출처 "llm" 또는 "mock")
+        """
+        # VectorDB에서 진도율별 문서 내용 검색 (fallback 포함)
+        combined_content = ""
+        content_chunks_found = False
+        question_source = "mock"
+        if self.vector_db:
+            try:
+                content_chunks = await self.vector_db.search_by_progress(
+                    meeting_id=quiz_data["meeting_id"],
+                    document_id=quiz_data["document_id"],
+                    progress_percentage=quiz_data["progress_percentage"],
+                    max_chunks=3
+                )
+                
+                if content_chunks:
+                    # VectorDB에서 이미 올바른 진도율 청크를 반환하므로 추가 필터링 불필요
+                    combined_content = "\n\n".join(content_chunks)
+                    content_chunks_found = True
+                    logger.info(f"Retrieved {len(content_chunks)} chunks from VectorDB for {quiz_data['progress_percentage']}% progress")
+                else:
+                    logger.warning(f"No content found in VectorDB for document {quiz_data['document_id']} at {quiz_data['progress_percentage']}% progress")
+            except Exception as e:
+                logger.warning(f"VectorDB search failed: {e}")
+        else:
+            logger.warning("VectorDB not available, using fallback content")
+        
+        # Fallback: VectorDB에서 내용을 가져올 수 없을 때 기본 내용 사용
+        if not combined_content:
+            progress = quiz_data["progress_percentage"]
+            if progress == 50:
+                combined_content = f"문서 전반부(50% 진도) 내용: 기본 개념과 도입부 설명이 포함되어 있습니다. 주요 용어와 기초 이론을 다루며, 이해하기 쉬운 예시들로 구성되어 있습니다."
+            else:  # 100%
+                combined_content = f"문서 전체(100% 진도) 내용: 기본 개념부터 심화 내용까지 포괄적으로 다룹니다. 이론적 배경, 실무 적용 사례, 결론 및 요약이 포함되어 있습니다."
+            logger.info(f"Using fallback content for {progress}% progress")
+        
+        logger.info(f"📝 Content prepared, length: {len(combined_content)} characters")
+        
+        # 진도율별 컨텐츠 품질 확인
+        progress = quiz_data["progress_percentage"]
+        if combined_content and len(combined_content) > 50:
+            logger.info(f"✅ Using VectorDB content for {progress}% progress quiz")
+            content_source = "vectordb"
+        else:
+            logger.info(f"⚠️ VectorDB content insufficient, using fallback for {progress}% progress")
+            content_source = "fallback"
+        
+        quiz_data_with_content = {
+            **quiz_data,
+            "content": combined_content,
+            "content_source": content_source,
+            "language": "ko",
+            "question_count": 2,  # 2개로 조정
+            "difficulty_level": "medium"
+        }
+        
+        logger.info(f"🎯 Starting question generation process...")
+        logger.info(f"🔍 DEBUG - MOCK_AI_RESPONSES: {self.settings.ai.MOCK_AI_RESPONSES}")
+        logger.info(f"🔍 DEBUG - quiz_llm_client available: {'Yes' if self.quiz_llm_client else 'No'}")
+        
+        # 실제 LLM 연동 또는 Mock 선택
+        if not self.settings.ai.MOCK_AI_RESPONSES and self.quiz_llm_client:
+            logger.info("🤖 Using real LLM for quiz generation...")
+            # 실제 LLM을 사용한 퀴즈 생성
+            try:
+                llm_questions = await self._generate_llm_questions(quiz_data_with_content)
+                logger.info(f"🎯 LLM generation completed, result: {'Success' if llm_questions else 'Failed'}")
+                if llm_questions:
+                    mock_questions = llm_questions
+                    # 실제 문서 내용 기반 LLM 문항만 퀴즈 뱅크 저장 대상
+                    question_source = "llm" if content_chunks_found else "llm_fallback"
+                else:
+                    logger.warning("LLM quiz generation failed, falling back to mock")
+                    mock_questions = self._generate_mock_questions(quiz_data_with_content)
+            except Exception as e:
+                logger.error(f"LLM generation error: {e}")
+                logger.info("🔄 Falling back to mock questions...")
+                mock_questions = self._generate_mock_questions(quiz_data_with_content)
+        else:
+            logger.info("🎭 Using mock questions...")
+            # Mock 응답 사용
+            mock_questions = self._generate_mock_questions(quiz_data_with_content)
+        
+        logger.info(f"✅ Questions generated: {len(mock_questions) if mock_questions else 0}")
+        
+        # Validate generated questions
+        validated_questions = self._validate_questions(mock_questions)
+        logger.info(f"✅ Questions validated: {len(validated_questions) if validated_questions else 0}")
+        
+        return validated_questions, question_source
+
+    async def schedule_quiz_bank_build(self, meeting_id: str, document_id: str) -> bool:
+        """
+        문서 저장 완료 후 50%/100% 진도 퀴즈 사전 생성을 큐에 등록
+
+        재업로드된 문서의 기존 퀴즈는 먼저 무효화하여 이전 내용이 제공되지 않도록 함
+
+        Returns:
+            등록 여부
+        """
+        if not self.quiz_bank:
+            return False
+
+        if self.settings.ai.MOCK_AI_RESPONSES or not self.quiz_llm_client:
+            logger.debug("Quiz bank build skipped: LLM not available")
+            return False
+
+        await self.quiz_bank.invalidate_document(meeting_id, document_id)
+
+        if self._bank_queue is None:
+            self._bank_queue = asyncio.Queue()
+        if self._bank_worker is None or self._bank_worker.done():
+            # 단일 워커로 순차 처리하여 업로드 폭주 시 LLM 동시 호출 제한
+            self._bank_worker = asyncio.create_task(self._quiz_bank_worker())
+
+        for progress in (50, 100):
+            job = (meeting_id, document_id, progress)
+            if job in self._bank_pending:
+                continue
+            self._bank_pending.add(job)
+            self._bank_queue.put_nowait(job)
+
+        logger.info(f"📚 Quiz bank build queued for document {document_id} (meeting {meeting_id})")
+        return True
+
+    async def _quiz_bank_worker(self):
+        """퀴즈 뱅크 백그라운드 생성 워커"""
+        # ProcessPdf 처리 중 생성되므로 해당 RPC의 데드라인/취소를 물려받지 않도록 분리
+        detach_scope()
+        while True:
+            job = await self._bank_queue.get()
+            meeting_id, document_id, progress = job
+            try:
+                start_time = asyncio.get_event_loop().time()
+                questions, source = await self._generate_questions({
+                    "meeting_id": meeting_id,
+                    "document_id": document_id,
+                    "progress_percentage": progress
+                })
+
+                if source == "llm" and questions:
+                    await self.quiz_bank.put(meeting_id, document_id, progress, questions)
+                    elapsed = asyncio.get_event_loop().time() - start_time
+                    logger.info(f"✅ Quiz bank ready: document {document_id} at {progress}% ({len(questions)} questions, {elapsed:.1f}s)")
+                else:
+                    logger.warning(f"⚠️ Quiz bank build produced no LLM questions for document {document_id} at {progress}% (source: {source})")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Quiz bank build failed for document {document_id} at {progress}%: {e}")
+            finally:
+                self._bank_pending.discard(job)
+                self._bank_queue.task_done()
+
+    async def cleanup(self):
+        """백그라운드 퀴즈 뱅크 워커 정리"""
+        if self._bank_worker and not self._bank_worker.done():
+            self._bank_worker.cancel()
+            try:
+                await self._bank_worker
+            except asyncio.CancelledError:
+                pass
+        self._bank_worker = None
+        self._bank_pending.clear()
+
     async def _extract_content_by_progress(self, quiz_data: Dict[str, Any]) -> str:
         """Extract relevant content based on progress percentage"""
         try:
@@ -389,13 +525,6 @@ class QuizService:
             logger.info(f"📊 Quiz parameters: {question_count} questions, {difficulty} difficulty, {progress}% progress")
             logger.info(f"📝 Content length: {len(content)} characters")
             
-            # 시스템 메시지와 프롬프트 구성 (간소화)
-            system_message = """문서 기반 객관식 퀴즈를 JSON으로 생성하세요.
-
-형식: [{"question":"질문","options":["A","B","C","D"],"correct_answer":0,"explanation":"설명"}]
-
-JSON만 응답하세요."""
-            
             # 진도율별 컨텐츠 처리 (차별화)
             if progress == 50:
                 # 50% 진도: 앞부분 위주 + 진도율 명시
@@ -423,10 +552,11 @@ JSON만 응답하세요."""
             # LLM 클라이언트를 통한 퀴즈 생성 (최적화된 파라미터)
             response = await self.llm_client.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
+                system_message=QUIZ_SYSTEM_PROMPT,
                 max_tokens=1200,  # 토큰 수 줄임 (토론과 비슷한 수준)
                 temperature=0.5,  # 온도 낮춤 (더 일관된 응답)
-                provider=LLMProvider.GMS
+                provider=LLMProvider.GMS,
+                caller="quiz"
             )
             
             logger.info(f"✅ LLM response received, length: {len(response) if response else 0} characters")
@@ -737,7 +867,12 @@ JSON만 응답하세요."""
                 del self.active_quizzes[quiz_id]
                 cleaned_count += 1
                 logger.debug(f"Removed quiz: {quiz_id}")
-            
+
+            # 사전 생성된 퀴즈 뱅크 삭제
+            if self.quiz_bank:
+                bank_cleaned = await self.quiz_bank.invalidate_meeting(meeting_id)
+                logger.debug(f"Removed {bank_cleaned} quiz bank entries for meeting: {meeting_id}")
+
             logger.info(f"✅ Cleaned up {cleaned_count} quizzes for meeting: {meeting_id}")
             
             return {
@@ -0,0 +1,239 @@
+"""
+Recent Message Cache for BGBG AI Server
+In-process per-session ring buffer of recent chat messages
+"""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any
+
+from src.models.chat_history_models import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+class SessionMessageBuffer:
+    """
+    세션별 최근 메시지 링 버퍼 (오래된 순)
+
+    message_count는 Redis 메시지 리스트 길이(LLEN)와 동기화되며,
+    다음 쓰기가 정확히 message_count + 1일 때만 이어 붙임 (아니면 버퍼 폐기)
+    """
+
+    __slots__ = ("messages", "message_count", "last_access")
+
+    def __init__(self, max_messages: int):
+        self.messages: Deque[ChatMessage] = deque(maxlen=max_messages)
+        self.message_count = 0
+        self.last_access = time.monotonic()
+
+    def covers(self, limit: int) -> bool:
+        """limit개 조회를 버퍼만으로 응답 가능한지 (세션 전체가 버퍼에 있거나 limit 이상 보유)"""
+        return len(self.messages) >= limit or len(self.messages) >= self.message_count
+
+    def recent(self, limit: int) -> List[ChatMessage]:
+        """최근 limit개 (오래된 순)"""
+        if limit <= 0:
+            return []
+        skip = max(len(self.messages) - limit, 0)
+        return list(islice(self.messages, skip, None))
+
+
+class RecentMessageCache:
+    """
+    세션별 최근 메시지 인메모리 캐시
+
+    - 쓰기 시 채움 (append-and-read 스크립트가 돌려준 message_count 기준)
+    - 다른 레플리카의 쓰기는 pub/sub 이벤트로 이어 붙이거나, 순서가 맞지 않으면 폐기
+    - 세션 종료/유휴 시간 초과/세션 수 초과(LRU) 시 제거
+    - 세션별 hit/miss 통계 제공 (버퍼 없이 miss만 난 세션도 유휴/LRU 기준으로 함께 정리)
+    """
+
+    def __init__(self, max_messages: int = 50, max_sessions: int = 1000, idle_seconds: int = 1800):
+        self.max_messages = max_messages
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+
+        self._buffers: "OrderedDict[str, SessionMessageBuffer]" = OrderedDict()
+        # 세션별 hit/miss (last_seen 포함, LRU 순서 - 최대 max_sessions개)
+        self._session_stats: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "appends": 0,
+            "remote_appends": 0,
+            "invalidations": 0,
+            "evictions": 0
+        }
+
+    def is_warm(self, session_id: str, limit: int) -> bool:
+        """limit개 조회를 Redis 없이 처리할 수 있는지"""
+        buffer = self._buffers.get(session_id)
+        return buffer is not None and buffer.covers(limit)
+
+    def get(
+        self,
+        session_id: str,
+        limit: int,
+        time_window: Optional[timedelta] = None
+    ) -> Optional[List[ChatMessage]]:
+        """
+        버퍼에서 최근 메시지 조회 (hit/miss 집계)
+
+        Returns:
+            Optional[List[ChatMessage]]: 오래된 순 메시지, 버퍼로 응답 불가 시 None
+        """
+        buffer = self._buffers.get(session_id)
+        if buffer is None or not buffer.covers(limit):
+            self.record_miss(session_id)
+            return None
+
+        self._touch(session_id, buffer)
+        self._count(session_id, "hits")
+        return filter_time_window(buffer.recent(limit), time_window)
+
+    def record_miss(self, session_id: str):
+        """버퍼 미사용 조회 기록"""
+        self._count(session_id, "misses")
+
+    def load(self, session_id: str, messages: List[ChatMessage], message_count: int):
+        """
+        Redis에서 읽은 최근 창으로 버퍼 재구성
+
+        Args:
+            messages: 필터링 전 최근 메시지 (오래된 순)
+            message_count: 세션 전체 메시지 수 (LLEN)
+        """
+        buffer = SessionMessageBuffer(self.max_messages)
+        buffer.messages.extend(messages)
+        buffer.message_count = message_count
+        self._buffers[session_id] = buffer
+        self._touch(session_id, buffer)
+        self.stats["loads"] += 1
+        self._evict_over_capacity()
+
+    def append(self, session_id: str, message: ChatMessage, message_count: int, remote: bool = False) -> bool:
+        """
+        저장된 메시지를 버퍼에 추가 (순서가 이어지지 않으면 버퍼 폐기)
+
+        Args:
+            message_count: 저장 직후 세션 메시지 수
+            remote: 다른 레플리카에서 발생한 쓰기 여부
+
+        Returns:
+            bool: 버퍼에 추가되었으면 True
+        """
+        buffer = self._buffers.get(session_id)
+        if buffer is None:
+            return False
+
+        if message is None or message_count != buffer.message_count + 1:
+            self.invalidate(session_id)
+            return False
+
+        buffer.messages.append(message)
+        buffer.message_count = message_count
+        if remote:
+            self.stats["remote_appends"] += 1
+        else:
+            self._touch(session_id, buffer)
+            self.stats["appends"] += 1
+        return True
+
+    def invalidate(self, session_id: str):
+        """세션 버퍼 폐기 (통계는 유지)"""
+        if self._buffers.pop(session_id, None) is not None:
+            self.stats["invalidations"] += 1
+
+    def clear(self):
+        """모든 버퍼 폐기 (pub/sub 연결 유실 시)"""
+        self.stats["invalidations"] += len(self._buffers)
+        self._buffers.clear()
+
+    def remove_session(self, session_id: str):
+        """세션 종료 - 버퍼와 통계 제거"""
+        self._buffers.pop(session_id, None)
+        self._session_stats.pop(session_id, None)
+
+    def evict_idle(self) -> int:
+        """유휴 세션 버퍼 제거 (버퍼 없이 남은 유휴 세션 통계도 정리)"""
+        cutoff = time.monotonic() - self.idle_seconds
+        idle_sessions = [sid for sid, buffer in self._buffers.items() if buffer.last_access < cutoff]
+        for session_id in idle_sessions:
+            self.remove_session(session_id)
+        self.stats["evictions"] += len(idle_sessions)
+
+        idle_stats = [
+            sid for sid, counts in self._session_stats.items()
+            if sid not in self._buffers and counts["last_seen"] < cutoff
+        ]
+        for session_id in idle_stats:
+            del self._session_stats[session_id]
+        return len(idle_sessions)
+
+    def get_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        캐시 통계 (session_id 지정 시 해당 세션만)
+
+        전체 통계는 집계 값만 반환 (세션 ID별 항목은 /metrics 라벨 수를 무한히 늘리므로 제외)
+
+        Returns:
+            Dict[str, Any]: hit/miss/hit_rate 및 버퍼 크기
+        """
+        if session_id is not None:
+            return self._session_summary(session_id)
+
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / total if total else 0.0,
+            "cached_sessions": len(self._buffers),
+            "tracked_sessions": len(self._session_stats)
+        }
+
+    def _session_summary(self, session_id: str) -> Dict[str, Any]:
+        counts = self._session_stats.get(session_id, {"hits": 0, "misses": 0})
+        total = counts["hits"] + counts["misses"]
+        buffer = self._buffers.get(session_id)
+        return {
+            "hits": counts["hits"],
+            "misses": counts["misses"],
+            "hit_rate": counts["hits"] / total if total else 0.0,
+            "buffered_messages": len(buffer.messages) if buffer else 0,
+            "message_count": buffer.message_count if buffer else None
+        }
+
+    def _count(self, session_id: str, key: str):
+        self.stats[key] += 1
+        counts = self._session_stats.get(session_id)
+        if counts is None:
+            counts = self._session_stats[session_id] = {"hits": 0, "misses": 0, "last_seen": 0.0}
+        else:
+            self._session_stats.move_to_end(session_id)
+        counts[key] += 1
+        counts["last_seen"] = time.monotonic()
+        # 버퍼가 한 번도 로드되지 않은 세션(miss만 발생)도 있으므로 통계 수를 별도로 제한
+        while len(self._session_stats) > self.max_sessions:
+            self._session_stats.popitem(last=False)
+
+    def _touch(self, session_id: str, buffer: SessionMessageBuffer):
+        buffer.last_access = time.monotonic()
+        self._buffers.move_to_end(session_id)
+
+    def _evict_over_capacity(self):
+        while len(self._buffers) > self.max_sessions:
+            session_id, _ = self._buffers.popitem(last=False)
+            self._session_stats.pop(session_id, None)
+            self.stats["evictions"] += 1
+
+
+def filter_time_window(messages: List[ChatMessage], time_window: Optional[timedelta]) -> List[ChatMessage]:
+    """time_window 밖의 메시지 제외 (RedisChatStorage.get_recent_messages와 동일 기준)"""
+    if not time_window:
+        return messages
+    cutoff_time = datetime.utcnow() - time_window
+    return [message for message in messages if message.timestamp >= cutoff_time]
@@ -6,9 +6,10 @@ Implements intelligent caching strategies for chat history and context data
 import asyncio
 import json
 import logging
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import hashlib
 
@@ -16,9 +17,18 @@ import redis.asyncio as redis
 from src.config.settings import get_settings
 from src.config.chat_config import get_performance_config, get_ttl_config
 from src.models.chat_history_models import ChatMessage, ConversationContext, ParticipantState
+from src.services.frequency_sketch import FrequencySketch, TieredAdmission
+from src.services.local_cache import LocalCache, MISS
 
 logger = logging.getLogger(__name__)
 
+# 스코프(세션/문서)별 캐시 키 인덱스 셋 - 쓰기 시 등록, 무효화는 KEYS 없이 인덱스로 처리
+# ("cache:*" 스캔에 걸리지 않도록 별도 접두어 사용)
+CACHE_INDEX_KEY = "cache_index:{scope}"
+
+# L0 캐시 무효화 이벤트 ("{origin_instance_id}|key|{cache_key}" 또는 "{origin_instance_id}|session|{session_id}")
+CACHE_INVALIDATION_CHANNEL = "cache:invalidations"
+
 
 class CacheLevel(str, Enum):
     """Cache levels for different data types"""
@@ -35,6 +45,7 @@ class CacheKeyType(str, Enum):
     SESSION_META = "meta"
     ANALYSIS = "analysis"
     SUMMARY = "summary"
+    TOPICS = "topics"
 
 
 @dataclass
@@ -48,6 +59,7 @@ class CacheStats:
     memory_usage_bytes: int
     evicted_keys: int
     last_reset: datetime
+    layers: Dict[str, Any] = field(default_factory=dict)  # 계층별(l0, redis) hit rate
 
 
 @dataclass
@@ -94,7 +106,8 @@ class RedisCacheManager:
             CacheKeyType.PARTICIPANT: "cache:part:{session_id}:{user_id}",
             CacheKeyType.SESSION_META: "cache:meta:{session_id}",
             CacheKeyType.ANALYSIS: "cache:analysis:{session_id}:{analysis_type}",
-            CacheKeyType.SUMMARY: "cache:summary:{session_id}:{summary_type}"
+            CacheKeyType.SUMMARY: "cache:summary:{session_id}:{summary_type}",
+            CacheKeyType.TOPICS: "cache:topics:{meeting_id}:{document_id}:{fingerprint}"
         }
         
         # Cache statistics
@@ -109,8 +122,33 @@ class RedisCacheManager:
             last_reset=datetime.utcnow()
         )
         
-        # Access tracking for intelligent caching
-        self._access_tracker: Dict[str, int] = {}
+        # Access tracking for intelligent caching (고정 메모리 빈도 추정, 주기적 감쇠)
+        self._frequency = FrequencySketch(width=self.performance_config.get('cache_sketch_width', 16384))
+        
+        # 계층 승격 심사: (계층, 용량, 최소 추정 빈도) - 상위 계층부터
+        self.tier_admission_levels = [
+            (CacheLevel.L1_HOT, self.performance_config.get('cache_l1_capacity', 1000), 10),
+            (CacheLevel.L2_WARM, self.performance_config.get('cache_l2_capacity', 10000), 3)
+        ]
+        self._last_admission: Dict[str, Any] = {}
+        
+        # In-process L0 cache: 키 타입 -> (최대 항목 수, TTL 초) - Redis TTL보다 짧게, pub/sub로 무효화
+        self.instance_id = uuid.uuid4().hex
+        self._local: Optional[LocalCache] = None
+        if self.settings.chat_history.CHAT_CACHE_L0_ENABLED:
+            self._local = LocalCache({
+                CacheKeyType.CONTEXT: (512, 5),
+                CacheKeyType.PARTICIPANT: (2048, 10),
+                CacheKeyType.ANALYSIS: (256, 30)
+            })
+        self._invalidation_task: Optional[asyncio.Task] = None
+        self._invalidations_connected = False
+        
+        # SCAN/파이프라인 배치 크기
+        self.scan_batch_size = self.performance_config.get('redis_scan_batch_size', 200)
+        
+        # 인덱스 도입 이전 키는 최대 TTL(L3) 이후 모두 만료되므로 그때까지만 SCAN 폴백
+        self._scan_fallback_until = datetime.utcnow() + timedelta(seconds=self.cache_ttls[CacheLevel.L3_COLD])
         
         logger.info("RedisCacheManager initialized")
     
@@ -136,6 +174,8 @@ class RedisCacheManager:
             # Start background tasks
             asyncio.create_task(self._stats_update_loop())
             asyncio.create_task(self._cache_optimization_loop())
+            if self._local is not None:
+                self._invalidation_task = asyncio.create_task(self._invalidation_loop())
             
             logger.info("RedisCacheManager started with background tasks")
             
@@ -146,6 +186,13 @@ class RedisCacheManager:
     async def stop(self) -> None:
         """Stop cache manager and close connections"""
         try:
+            if self._invalidation_task:
+                self._invalidation_task.cancel()
+                try:
+                    await self._invalidation_task
+                except asyncio.CancelledError:
+                    pass
+            
             if self._redis:
                 await self._redis.close()
             logger.info("RedisCacheManager stopped")
@@ -191,7 +238,7 @@ class RedisCacheManager:
             
             # Cache with TTL
             ttl = self.cache_ttls[cache_level]
-            await self._redis.setex(key, ttl, json.dumps(message_data))
+            await self._set_indexed(key, ttl, json.dumps(message_data), self._session_index_key(session_id))
             
             # Update access tracking
             self._track_access(key)
@@ -294,7 +341,8 @@ class RedisCacheManager:
             
             # Cache with TTL
             ttl = self.cache_ttls[cache_level]
-            await self._redis.setex(key, ttl, json.dumps(context_data))
+            await self._set_indexed(key, ttl, json.dumps(context_data), self._session_index_key(session_id), invalidate_l0=True)
+            self._l0_put(CacheKeyType.CONTEXT, key, session_id, context_data, ttl)
             
             self._track_access(key)
             logger.debug(f"Cached context for session {session_id}")
@@ -318,13 +366,20 @@ class RedisCacheManager:
             key = self._build_key(CacheKeyType.CONTEXT, session_id=session_id)
             
             self._stats.total_requests += 1
-            cached_data = await self._redis.get(key)
+            context_data = self._l0_get(CacheKeyType.CONTEXT, key)
+            if context_data is not MISS:
+                self._stats.cache_hits += 1
+                self._track_access(key)
+                return context_data
+            
+            cached_data, remaining_ttl = await self._get_with_ttl(key)
             
             if cached_data:
                 self._stats.cache_hits += 1
                 self._track_access(key)
                 
                 context_data = json.loads(cached_data)
+                self._l0_put(CacheKeyType.CONTEXT, key, session_id, context_data, remaining_ttl)
                 logger.debug(f"Cache hit for context {session_id}")
                 return context_data
             else:
@@ -366,7 +421,8 @@ class RedisCacheManager:
             
             # Cache with TTL
             ttl = self.cache_ttls[cache_level]
-            await self._redis.setex(key, ttl, json.dumps(state_data))
+            await self._set_indexed(key, ttl, json.dumps(state_data), self._session_index_key(session_id), invalidate_l0=True)
+            self._l0_put(CacheKeyType.PARTICIPANT, key, session_id, state_data, ttl)
             
             self._track_access(key)
             logger.debug(f"Cached participant state for {user_id} in session {session_id}")
@@ -391,13 +447,20 @@ class RedisCacheManager:
             key = self._build_key(CacheKeyType.PARTICIPANT, session_id=session_id, user_id=user_id)
             
             self._stats.total_requests += 1
-            cached_data = await self._redis.get(key)
+            state_data = self._l0_get(CacheKeyType.PARTICIPANT, key)
+            if state_data is not MISS:
+                self._stats.cache_hits += 1
+                self._track_access(key)
+                return state_data
+            
+            cached_data, remaining_ttl = await self._get_with_ttl(key)
             
             if cached_data:
                 self._stats.cache_hits += 1
                 self._track_access(key)
                 
                 state_data = json.loads(cached_data)
+                self._l0_put(CacheKeyType.PARTICIPANT, key, session_id, state_data, remaining_ttl)
                 logger.debug(f"Cache hit for participant {user_id}")
                 return state_data
             else:
@@ -442,7 +505,8 @@ class RedisCacheManager:
             
             # Cache with TTL
             ttl = self.cache_ttls[cache_level]
-            await self._redis.setex(key, ttl, json.dumps(cached_result))
+            await self._set_indexed(key, ttl, json.dumps(cached_result), self._session_index_key(session_id), invalidate_l0=True)
+            self._l0_put(CacheKeyType.ANALYSIS, key, session_id, cached_result, ttl)
             
             self._track_access(key)
             logger.debug(f"Cached {analysis_type} analysis for session {session_id}")
@@ -467,13 +531,20 @@ class RedisCacheManager:
             key = self._build_key(CacheKeyType.ANALYSIS, session_id=session_id, analysis_type=analysis_type)
             
             self._stats.total_requests += 1
-            cached_data = await self._redis.get(key)
+            result = self._l0_get(CacheKeyType.ANALYSIS, key)
+            if result is not MISS:
+                self._stats.cache_hits += 1
+                self._track_access(key)
+                return result
+            
+            cached_data, remaining_ttl = await self._get_with_ttl(key)
             
             if cached_data:
                 self._stats.cache_hits += 1
                 self._track_access(key)
                 
                 result = json.loads(cached_data)
+                self._l0_put(CacheKeyType.ANALYSIS, key, session_id, result, remaining_ttl)
                 logger.debug(f"Cache hit for {analysis_type} analysis")
                 return result
             else:
@@ -485,6 +556,132 @@ class RedisCacheManager:
             self._stats.cache_misses += 1
             return None
     
+    # Discussion topic caching
+    
+    async def cache_discussion_topics(
+        self,
+        meeting_id: str,
+        document_id: str,
+        fingerprint: str,
+        topics: List[str],
+        cache_level: CacheLevel = CacheLevel.L3_COLD
+    ) -> bool:
+        """
+        Cache generated discussion topics for a document
+        
+        Args:
+            meeting_id: Meeting identifier
+            document_id: Document identifier
+            fingerprint: Content fingerprint of the chunks used for generation
+            topics: Generated discussion topics
+            cache_level: Cache level for TTL determination
+            
+        Returns:
+            bool: True if cached successfully
+        """
+        try:
+            key = self._build_key(
+                CacheKeyType.TOPICS,
+                meeting_id=meeting_id,
+                document_id=document_id,
+                fingerprint=fingerprint
+            )
+            
+            cached_topics = {
+                "topics": topics,
+                "cached_at": datetime.utcnow().isoformat()
+            }
+            
+            ttl = self.cache_ttls[cache_level]
+            await self._set_indexed(
+                key,
+                ttl,
+                json.dumps(cached_topics, ensure_ascii=False),
+                self._topics_index_key(meeting_id, document_id)
+            )
+            
+            self._track_access(key)
+            logger.debug(f"Cached {len(topics)} discussion topics for document {document_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to cache discussion topics: {e}")
+            return False
+    
+    async def get_cached_discussion_topics(
+        self,
+        meeting_id: str,
+        document_id: str,
+        fingerprint: str
+    ) -> Optional[List[str]]:
+        """
+        Retrieve cached discussion topics
+        
+        Args:
+            meeting_id: Meeting identifier
+            document_id: Document identifier
+            fingerprint: Content fingerprint of the current chunks
+            
+        Returns:
+            Optional[List[str]]: Cached topics or None
+        """
+        try:
+            key = self._build_key(
+                CacheKeyType.TOPICS,
+                meeting_id=meeting_id,
+                document_id=document_id,
+                fingerprint=fingerprint
+            )
+            
+            self._stats.total_requests += 1
+            cached_data = await self._redis.get(key)
+            
+            if cached_data:
+                self._stats.cache_hits += 1
+                self._track_access(key)
+                
+                topics = json.loads(cached_data).get("topics", [])
+                logger.debug(f"Cache hit for discussion topics of document {document_id}")
+                return topics
+            else:
+                self._stats.cache_misses += 1
+                return None
+                
+        except Exception as e:
+            logger.error(f"Failed to get cached discussion topics: {e}")
+            self._stats.cache_misses += 1
+            return None
+    
+    async def invalidate_document_topics(self, meeting_id: str, document_id: str) -> int:
+        """
+        Invalidate cached discussion topics for a document (e.g. on re-upload)
+        
+        Args:
+            meeting_id: Meeting identifier
+            document_id: Document identifier
+            
+        Returns:
+            int: Number of keys invalidated
+        """
+        try:
+            pattern = self._build_key(
+                CacheKeyType.TOPICS,
+                meeting_id=meeting_id,
+                document_id=document_id,
+                fingerprint="*"
+            )
+            
+            deleted = await self._invalidate_indexed(self._topics_index_key(meeting_id, document_id), [pattern])
+            
+            if deleted:
+                logger.info(f"Invalidated {deleted} topic cache entries for document {document_id}")
+            
+            return deleted
+            
+        except Exception as e:
+            logger.error(f"Failed to invalidate document topics: {e}")
+            return 0
+    
     # Cache management methods
     
     async def invalidate_session_cache(self, session_id: str) -> int:
@@ -498,23 +695,23 @@ class RedisCacheManager:
             int: Number of keys invalidated
         """
         try:
-            # Find all keys for this session
+            # 인덱스 셋으로 세션 키 조회 (인덱스 이전 키는 SCAN 폴백)
             patterns = [
                 f"cache:*:{session_id}",
                 f"cache:*:{session_id}:*"
             ]
             
-            keys_to_delete = []
-            for pattern in patterns:
-                keys = await self._redis.keys(pattern)
-                keys_to_delete.extend(keys)
+            deleted = await self._invalidate_indexed(self._session_index_key(session_id), patterns)
             
-            # Delete keys
-            if keys_to_delete:
-                await self._redis.delete(*keys_to_delete)
-                logger.info(f"Invalidated {len(keys_to_delete)} cache entries for session {session_id}")
+            # L0 무효화 (이 프로세스 + 다른 레플리카)
+            if self._local is not None:
+                self._local.invalidate_session(session_id)
+                await self._redis.publish(CACHE_INVALIDATION_CHANNEL, f"{self.instance_id}|session|{session_id}")
             
-            return len(keys_to_delete)
+            if deleted:
+                logger.info(f"Invalidated {deleted} cache entries for session {session_id}")
+            
+            return deleted
             
         except Exception as e:
             logger.error(f"Failed to invalidate session cache: {e}")
@@ -531,25 +728,31 @@ class RedisCacheManager:
             # Update hit rate
             if self._stats.total_requests > 0:
                 self._stats.hit_rate = self._stats.cache_hits / self._stats.total_requests
+            self._stats.layers = self._layer_stats()
             
-            # Get total cache keys
-            cache_keys = await self._redis.keys("cache:*")
-            self._stats.total_keys = len(cache_keys)
+            # Count cache keys with a cursor-based SCAN (non-blocking), keep first 100 as sample
+            total_keys = 0
+            sample_keys = []
+            async for key in self._redis.scan_iter(match="cache:*", count=self.scan_batch_size):
+                total_keys += 1
+                if len(sample_keys) < 100:
+                    sample_keys.append(key)
+            self._stats.total_keys = total_keys
             
-            # Estimate memory usage
+            # Estimate memory usage (MEMORY USAGE pipelined for the sample)
             total_memory = 0
-            for key in cache_keys[:100]:  # Sample first 100 keys
-                try:
-                    memory = await self._redis.memory_usage(key)
-                    if memory:
+            if sample_keys:
+                pipe = self._redis.pipeline(transaction=False)
+                for key in sample_keys:
+                    pipe.memory_usage(key)
+                for memory in await pipe.execute(raise_on_error=False):
+                    if isinstance(memory, int):
                         total_memory += memory
-                except Exception:
-                    pass
             
             # Extrapolate total memory usage
-            if len(cache_keys) > 0:
-                avg_memory_per_key = total_memory / min(100, len(cache_keys))
-                self._stats.memory_usage_bytes = int(avg_memory_per_key * len(cache_keys))
+            if total_keys > 0:
+                avg_memory_per_key = total_memory / len(sample_keys)
+                self._stats.memory_usage_bytes = int(avg_memory_per_key * total_keys)
             
             return self._stats
             
@@ -569,46 +772,38 @@ class RedisCacheManager:
             
             promoted_keys = 0
             demoted_keys = 0
+            total_keys = 0
             
-            # Get all cache keys
-            cache_keys = await self._redis.keys("cache:*")
+            # 이번 패스의 계층 배정 (용량 초과 시 추정 빈도가 더 높은 키만 승격)
+            admission = TieredAdmission(self.tier_admission_levels, fallback=CacheLevel.L3_COLD)
             
-            for key in cache_keys:
-                try:
-                    access_count = self._access_tracker.get(key, 0)
-                    current_ttl = await self._redis.ttl(key)
-                    
-                    if current_ttl <= 0:
-                        continue
-                    
-                    # Determine optimal cache level based on access pattern
-                    if access_count >= 10:
-                        # Promote to hot cache
-                        new_ttl = self.cache_ttls[CacheLevel.L1_HOT]
-                        if current_ttl < new_ttl:
-                            await self._redis.expire(key, new_ttl)
-                            promoted_keys += 1
-                    elif access_count >= 3:
-                        # Keep in warm cache
-                        new_ttl = self.cache_ttls[CacheLevel.L2_WARM]
-                        await self._redis.expire(key, new_ttl)
-                    else:
-                        # Demote to cold cache
-                        new_ttl = self.cache_ttls[CacheLevel.L3_COLD]
-                        if current_ttl > new_ttl:
-                            await self._redis.expire(key, new_ttl)
-                            demoted_keys += 1
-                
-                except Exception as e:
-                    logger.warning(f"Error optimizing key {key}: {e}")
+            # Walk cache keys with SCAN, one pipelined TTL + EXPIRE round-trip per batch
+            batch = []
+            async for key in self._redis.scan_iter(match="cache:*", count=self.scan_batch_size):
+                batch.append(key)
+                if len(batch) >= self.scan_batch_size:
+                    promoted, demoted = await self._optimize_batch(batch, admission)
+                    promoted_keys += promoted
+                    demoted_keys += demoted
+                    total_keys += len(batch)
+                    batch = []
             
-            # Reset access tracker
-            self._access_tracker.clear()
+            if batch:
+                promoted, demoted = await self._optimize_batch(batch, admission)
+                promoted_keys += promoted
+                demoted_keys += demoted
+                total_keys += len(batch)
+            
+            self._last_admission = {
+                **admission.stats,
+                "occupancy": {level.value: count for level, count in admission.occupancy().items()}
+            }
             
             result = {
                 "promoted_keys": promoted_keys,
                 "demoted_keys": demoted_keys,
-                "total_keys_processed": len(cache_keys),
+                "total_keys_processed": total_keys,
+                "admission": self._last_admission,
                 "optimization_time": datetime.utcnow().isoformat()
             }
             
@@ -626,9 +821,169 @@ class RedisCacheManager:
         pattern = self.key_patterns[key_type]
         return pattern.format(**kwargs)
     
+    def _session_index_key(self, session_id: str) -> str:
+        """세션 캐시 키 인덱스 셋"""
+        return CACHE_INDEX_KEY.format(scope=session_id)
+    
+    def _topics_index_key(self, meeting_id: str, document_id: str) -> str:
+        """문서 토론 주제 캐시 키 인덱스 셋"""
+        return CACHE_INDEX_KEY.format(scope=f"topics:{meeting_id}:{document_id}")
+    
+    async def _set_indexed(self, key: str, ttl: int, value: str, index_key: str, invalidate_l0: bool = False) -> None:
+        """
+        캐시 값 저장과 인덱스 셋 등록을 한 번의 파이프라인으로 처리
+        
+        인덱스 셋 TTL은 최대 캐시 TTL(L3)로 갱신하여 항상 멤버 키보다 오래 유지됨
+        invalidate_l0이면 다른 레플리카의 L0 항목 무효화 이벤트도 같은 파이프라인으로 발행
+        """
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.setex(key, ttl, value)
+        pipe.sadd(index_key, key)
+        pipe.expire(index_key, self.cache_ttls[CacheLevel.L3_COLD])
+        if invalidate_l0 and self._local is not None:
+            pipe.publish(CACHE_INVALIDATION_CHANNEL, f"{self.instance_id}|key|{key}")
+        await pipe.execute()
+    
+    def _l0_get(self, key_type: CacheKeyType, key: str) -> Any:
+        """L0 조회 (무효화 이벤트 구독 중에만 사용)"""
+        if self._local is None or not self._invalidations_connected:
+            return MISS
+        return self._local.get(key_type, key)
+    
+    async def _get_with_ttl(self, key: str) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Redis 조회 - L0 사용 중이면 같은 파이프라인으로 남은 TTL(PTTL)도 조회
+        
+        Returns:
+            Tuple[Optional[str], Optional[float]]: (값, 남은 TTL 초 - 만료 없음/L0 미사용 시 None)
+        """
+        if self._local is None or not self._invalidations_connected:
+            return await self._redis.get(key), None
+        
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        value, pttl = await pipe.execute()
+        return value, (pttl / 1000 if pttl is not None and pttl >= 0 else None)
+    
+    def _l0_put(self, key_type: CacheKeyType, key: str, session_id: str, value: Any, redis_ttl: Optional[float] = None) -> None:
+        """L0 저장 (무효화 이벤트 구독 중에만 사용)"""
+        if self._local is None or not self._invalidations_connected:
+            return
+        self._local.put(key_type, key, session_id, value, max_ttl=redis_ttl)
+    
+    def _layer_stats(self) -> Dict[str, Any]:
+        """계층별 hit rate - Redis 계층 요청은 L0에서 응답하지 못한 요청"""
+        l0_stats = self._local.get_stats() if self._local is not None else None
+        l0_hits = l0_stats["hits"] if l0_stats else 0
+        
+        redis_requests = self._stats.total_requests - l0_hits
+        redis_hits = self._stats.cache_hits - l0_hits
+        layers = {
+            "redis": {
+                "requests": redis_requests,
+                "hits": redis_hits,
+                "hit_rate": redis_hits / redis_requests if redis_requests > 0 else 0.0
+            }
+        }
+        
+        if l0_stats is None:
+            layers["l0"] = {"enabled": False}
+        else:
+            layers["l0"] = {"enabled": True, "connected": self._invalidations_connected, **l0_stats}
+        
+        return layers
+    
+    async def _invalidate_indexed(self, index_key: str, fallback_patterns: List[str]) -> int:
+        """
+        인덱스 셋에 등록된 키 삭제 (UNLINK, 배치 단위)
+        
+        Args:
+            index_key: 캐시 키 인덱스 셋
+            fallback_patterns: 인덱스가 비어 있을 때 SCAN할 패턴 (인덱스 도입 이전 키)
+            
+        Returns:
+            int: 실제 삭제된 키 수 (이미 만료된 인덱스 멤버 제외)
+        """
+        keys = [key async for key in self._redis.sscan_iter(index_key, count=self.scan_batch_size)]
+        
+        if not keys and datetime.utcnow() < self._scan_fallback_until:
+            for pattern in fallback_patterns:
+                keys.extend([key async for key in self._redis.scan_iter(match=pattern, count=self.scan_batch_size)])
+        
+        deleted = 0
+        for start in range(0, len(keys), self.scan_batch_size):
+            deleted += await self._redis.unlink(*keys[start:start + self.scan_batch_size])
+        
+        await self._redis.unlink(index_key)
+        return deleted
+    
+    async def _optimize_batch(self, keys: List[str], admission: TieredAdmission) -> Tuple[int, int]:
+        """
+        키 배치의 TTL을 계층 배정 결과에 맞게 조정
+        
+        이전 배치에서 상위 계층에 배정됐다가 밀려난 키의 강등도 같은 파이프라인으로 처리
+        
+        Returns:
+            Tuple[int, int]: (promoted, demoted)
+        """
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute(raise_on_error=False)
+        
+        promoted_keys = 0
+        demoted_keys = 0
+        pipe = self._redis.pipeline(transaction=False)
+        
+        for key, current_ttl in zip(keys, ttls):
+            if not isinstance(current_ttl, int) or current_ttl <= 0:
+                continue
+            
+            # Determine cache level by TinyLFU-style admission on the estimated frequency
+            for assigned_key, level, displaced in admission.admit(key, self._frequency.estimate(key)):
+                if displaced:
+                    # 상위 계층에서 밀려난 키 - 배정된 계층 TTL로 강등
+                    pipe.expire(assigned_key, self.cache_ttls[level])
+                    demoted_keys += 1
+                elif level == CacheLevel.L1_HOT:
+                    # Promote to hot cache
+                    new_ttl = self.cache_ttls[CacheLevel.L1_HOT]
+                    if current_ttl < new_ttl:
+                        pipe.expire(key, new_ttl)
+                        promoted_keys += 1
+                elif level == CacheLevel.L2_WARM:
+                    # Keep in warm cache
+                    pipe.expire(key, self.cache_ttls[CacheLevel.L2_WARM])
+                else:
+                    # Demote to cold cache
+                    new_ttl = self.cache_ttls[CacheLevel.L3_COLD]
+                    if current_ttl > new_ttl:
+                        pipe.expire(key, new_ttl)
+                        demoted_keys += 1
+        
+        if len(pipe):
+            errors = [result for result in await pipe.execute(raise_on_error=False) if isinstance(result, Exception)]
+            if errors:
+                logger.warning(f"Error optimizing {len(errors)} keys: {errors[0]}")
+        
+        return promoted_keys, demoted_keys
+    
     def _track_access(self, key: str) -> None:
         """Track key access for optimization"""
-        self._access_tracker[key] = self._access_tracker.get(key, 0) + 1
+        self._frequency.increment(key)
+    
+    def get_frequency_stats(self) -> Dict[str, Any]:
+        """
+        Get access frequency sketch and last tier admission statistics
+        
+        Returns:
+            Dict[str, Any]: Sketch size/aging and admitted/rejected/displaced counts
+        """
+        return {
+            "sketch": self._frequency.get_stats(),
+            "last_admission": self._last_admission
+        }
     
     async def _stats_update_loop(self) -> None:
         """Background task to update cache statistics"""
@@ -641,6 +996,56 @@ class RedisCacheManager:
             except Exception as e:
                 logger.error(f"Error in stats update loop: {e}")
     
+    async def _invalidation_loop(self) -> None:
+        """
+        Apply L0 invalidations published by other replicas
+        
+        구독이 끊기면 L0를 비우고(이벤트 유실 가능) 재구독될 때까지 L0를 사용하지 않음
+        """
+        retry_delay = 1
+        
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                self._invalidations_connected = True
+                retry_delay = 1
+                
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+                    try:
+                        origin, scope, target = data.split("|", 2)
+                    except ValueError:
+                        logger.warning(f"Invalid cache invalidation event: {data!r}")
+                        continue
+                    
+                    if origin == self.instance_id:
+                        continue  # 자신의 쓰기는 L0에 이미 반영
+                    if scope == "session":
+                        self._local.invalidate_session(target)
+                    else:
+                        self._local.invalidate(target)
+                        
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation subscription lost: {e}")
+            finally:
+                self._invalidations_connected = False
+                self._local.clear()
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+            
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+    
     async def _cache_optimization_loop(self) -> None:
         """Background task for cache optimization"""
         while True:
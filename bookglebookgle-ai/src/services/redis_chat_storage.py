@@ -5,20 +5,157 @@ Implements chat message storage with TTL-based automatic expiration
 
 import json
 import asyncio
+import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import logging
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool, Redis
 
 from src.config.settings import get_settings
-from src.models.chat_history_models import ChatMessage, SessionMetadata, StorageError
+from src.models.chat_history_models import ChatMessage, MessageType, SessionMetadata, StorageError
 from src.models.chat_interfaces import ChatHistoryManagerInterface
+from src.services.chat_message_codec import decode_message, get_chat_message_codec
+from src.services.redis_set_reconciler import SetReconciler
 
 logger = logging.getLogger(__name__)
 
 
+# 활동량 기반 세션 TTL 구간 (메시지 수 초과 기준, TTL 시간)
+SESSION_TTL_TIERS = ((50, 6), (20, 4), (0, 2))
+
+
+def stream_id_after(timestamp: datetime) -> str:
+    """naive UTC datetime 이후(초과)의 첫 스트림 ID"""
+    epoch_ms = (timestamp - datetime(1970, 1, 1)) // timedelta(milliseconds=1)
+    return f"{epoch_ms + 1}-0"
+
+
+def _stream_id_key(stream_id: str) -> tuple:
+    """스트림 ID 비교용 키 ('-'/'+' 경계 포함)"""
+    if stream_id == "-":
+        return (0, 0)
+    millis, _, sequence = stream_id.lstrip("(").partition("-")
+    return (int(millis), int(sequence or 0))
+
+
+def session_ttl_hours(message_count: int) -> int:
+    """메시지 수에 따른 세션 TTL (시간)"""
+    for threshold, ttl_hours in SESSION_TTL_TIERS:
+        if message_count > threshold:
+            return ttl_hours
+    return SESSION_TTL_TIERS[-1][1]
+
+
+# 채팅 턴 1회 왕복 처리 스크립트
+# KEYS: messages (list 또는 stream), meta, participants, context, active_sessions, activity, user_index
+# ARGV: encoded_message, session_id, user_id, participant_json, now_iso, limit,
+#       tier_high_count, tier_high_ttl, tier_mid_count, tier_mid_ttl, tier_low_ttl,
+#       origin_instance_id, events_channel ('' = 이벤트 발행 안 함),
+#       use_stream ('1' = Streams 백엔드), stream_maxlen
+# 반환: {message_count, user_messages_since_ai, ttl_seconds, speakers_since_ai, encoded_message...(최신순)}
+APPEND_AND_READ_SCRIPT = """
+local use_stream = ARGV[14] == '1'
+
+-- 최근 메시지 원본 (최신순)
+local function recent_raw(count)
+    if not use_stream then
+        return redis.call('LRANGE', KEYS[1], 0, count - 1)
+    end
+    local raws = {}
+    for _, entry in ipairs(redis.call('XREVRANGE', KEYS[1], '+', '-', 'COUNT', count)) do
+        raws[#raws + 1] = entry[2][2]
+    end
+    return raws
+end
+
+-- 메시지 타입 판별: msgpack v1은 2번째 바이트가 타입 코드 (1 = ai), 레거시 JSON은 디코딩
+local function message_type(raw)
+    local version = string.byte(raw, 1)
+    if version == 1 then
+        local code = string.byte(raw, 2)
+        if code == 0 then return 'user' elseif code == 1 then return 'ai' end
+        return 'system'
+    end
+    local ok, decoded = pcall(cjson.decode, raw)
+    if ok and type(decoded) == 'table' then
+        return decoded['message_type']
+    end
+    return nil
+end
+
+-- 마지막 AI 응답 이후 활동 요약 (activity 해시)
+-- user_since_ai: 사용자 메시지 수, speakers_since_ai: 발언자 수, u:{user_id}: 사용자별 메시지 수
+-- 카운터 도입 이전 세션은 최초 1회 메시지 리스트를 역순으로 훑어 초기값 계산
+if redis.call('HEXISTS', KEYS[6], 'user_since_ai') == 0 then
+    local backlog = 0
+    for _, raw in ipairs(recent_raw(100)) do
+        local kind = message_type(raw)
+        if kind == 'ai' then break end
+        if kind == 'user' then backlog = backlog + 1 end
+    end
+    redis.call('HSET', KEYS[6], 'user_since_ai', backlog, 'speakers_since_ai', 0)
+end
+
+local kind = message_type(ARGV[1])
+if kind == 'ai' then
+    redis.call('DEL', KEYS[6])
+    redis.call('HSET', KEYS[6], 'user_since_ai', 0, 'speakers_since_ai', 0, 'last_ai_at', ARGV[5])
+elseif kind == 'user' then
+    redis.call('HINCRBY', KEYS[6], 'user_since_ai', 1)
+    if redis.call('HINCRBY', KEYS[6], 'u:' .. ARGV[3], 1) == 1 then
+        redis.call('HINCRBY', KEYS[6], 'speakers_since_ai', 1)
+    end
+    redis.call('HSET', KEYS[6], 'last_user_id', ARGV[3], 'last_user_at', ARGV[5])
+end
+
+if use_stream then
+    -- 사용자 인덱스는 같은 ID로 참조만 기록 (시계 역행 등으로 ID가 거부되어도 본 쓰기는 유지)
+    local id = redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[15], '*', 'm', ARGV[1])
+    redis.pcall('XADD', KEYS[7], 'MAXLEN', '~', ARGV[15], id, 'r', '')
+else
+    redis.call('LPUSH', KEYS[1], ARGV[1])
+end
+redis.call('SADD', KEYS[5], ARGV[2])
+
+redis.call('HSET', KEYS[2], 'session_id', ARGV[2], 'last_activity', ARGV[5], 'status', 'active')
+redis.call('HSETNX', KEYS[2], 'created_at', ARGV[5])
+local total_count = redis.call('HINCRBY', KEYS[2], 'message_count', 1)
+redis.call('HSET', KEYS[3], ARGV[3], ARGV[4])
+
+-- 스트림은 MAXLEN으로 잘리므로 누적 메시지 수는 메타 카운터 기준
+local message_count = total_count
+if not use_stream then
+    message_count = redis.call('LLEN', KEYS[1])
+end
+local ttl_seconds = tonumber(ARGV[11]) * 3600
+if message_count > tonumber(ARGV[7]) then
+    ttl_seconds = tonumber(ARGV[8]) * 3600
+elseif message_count > tonumber(ARGV[9]) then
+    ttl_seconds = tonumber(ARGV[10]) * 3600
+end
+for _, i in ipairs({1, 2, 3, 4, 6, 7}) do
+    redis.call('EXPIRE', KEYS[i], ttl_seconds)
+end
+
+-- 다른 레플리카의 최근 메시지 버퍼 동기화: origin|message_count|encoded_message
+if ARGV[13] ~= '' then
+    redis.call('PUBLISH', ARGV[13], ARGV[12] .. '|' .. message_count .. '|' .. ARGV[1])
+end
+
+local activity = redis.call('HMGET', KEYS[6], 'user_since_ai', 'speakers_since_ai')
+local result = {message_count, tonumber(activity[1]) or 0, ttl_seconds, tonumber(activity[2]) or 0}
+local limit = tonumber(ARGV[6])
+if limit > 0 then
+    for _, raw in ipairs(recent_raw(limit)) do
+        result[#result + 1] = raw
+    end
+end
+return result
+"""
+
+
 class RedisChatStorage(ChatHistoryManagerInterface):
     """
     Redis-based implementation of chat history storage
@@ -35,20 +172,53 @@ class RedisChatStorage(ChatHistoryManagerInterface):
         self.settings = get_settings()
         self._redis_client = redis_client
         self._connection_pool = None
+        self._raw_client = None
+        self._raw_pool = None
+        self._append_and_read_script = None
+        
+        # 메시지 저장 코덱 (읽기는 레거시 JSON 포함 모든 버전 지원)
+        self.codec = get_chat_message_codec(self.settings.chat_history.CHAT_MESSAGE_CODEC)
         
         # Redis key patterns
         self.MESSAGES_KEY = "chat:session:{session_id}:messages"
         self.CONTEXT_KEY = "chat:session:{session_id}:context"
         self.PARTICIPANTS_KEY = "chat:session:{session_id}:participants"
         self.META_KEY = "chat:session:{session_id}:meta"
+        self.ACTIVITY_KEY = "chat:session:{session_id}:activity"
         self.ACTIVE_SESSIONS_KEY = "chat:active_sessions"
         
+        # Streams 백엔드: 세션 로그 스트림 + 사용자별 인덱스 스트림 (본 로그와 같은 ID, 참조만 저장)
+        self.STREAM_KEY = "chat:session:{session_id}:stream"
+        self.USER_INDEX_KEY = "chat:session:{session_id}:user:{user_id}"
+        self.use_streams = self.settings.chat_history.CHAT_STORAGE_BACKEND == "stream"
+        self.stream_maxlen = self.settings.chat_history.CHAT_STREAM_MAXLEN
+        
+        # 메시지 이벤트 채널 (레플리카 간 최근 메시지 버퍼 동기화)
+        self.EVENTS_CHANNEL = "chat:events:{session_id}"
+        self.EVENTS_PATTERN = "chat:events:*"
+        self.instance_id = uuid.uuid4().hex
+        self.publish_events = self.settings.chat_history.CHAT_RECENT_BUFFER_ENABLED
+        
+        # 활성 세션 셋 정리 (배치 스크립트, 실행당 시간 예산)
+        self.reconciler = SetReconciler(
+            "chat_sessions",
+            member_key=self._log_key,
+            batch_size=self.settings.chat_history.CHAT_REDIS_SCAN_BATCH_SIZE,
+            time_budget_ms=self.settings.chat_history.CHAT_RECONCILE_TIME_BUDGET_MS
+        )
+        
         # TTL settings from configuration (convert hours to seconds)
         self.DEFAULT_MESSAGE_TTL = self.settings.chat_history.CHAT_MESSAGE_TTL_HOURS * 3600
         self.DEFAULT_CONTEXT_TTL = self.settings.chat_history.CHAT_CONTEXT_TTL_HOURS * 3600
         self.DEFAULT_PARTICIPANT_TTL = self.settings.chat_history.CHAT_PARTICIPANT_TTL_HOURS * 3600
         self.DEFAULT_META_TTL = self.settings.chat_history.CHAT_META_TTL_HOURS * 3600
     
+    def _log_key(self, session_id: str) -> str:
+        """세션 메시지 로그 키 (백엔드별 list 또는 stream)"""
+        if self.use_streams:
+            return self.STREAM_KEY.format(session_id=session_id)
+        return self.MESSAGES_KEY.format(session_id=session_id)
+    
     async def _get_redis_client(self) -> Redis:
         """Get or create Redis client with connection pool"""
         if self._redis_client is None:
@@ -69,6 +239,23 @@ class RedisChatStorage(ChatHistoryManagerInterface):
         
         return self._redis_client
     
+    async def _get_raw_client(self) -> Redis:
+        """Get binary-safe client (decode_responses=False) for encoded message lists"""
+        if self._raw_client is None:
+            base_client = await self._get_redis_client()
+            base_pool = base_client.connection_pool
+            connection_kwargs = dict(base_pool.connection_kwargs)
+            connection_kwargs["decode_responses"] = False
+            
+            self._raw_pool = ConnectionPool(
+                connection_class=base_pool.connection_class,
+                max_connections=base_pool.max_connections,
+                **connection_kwargs
+            )
+            self._raw_client = Redis(connection_pool=self._raw_pool)
+        
+        return self._raw_client
+    
     async def _ensure_connection(self) -> Redis:
         """Ensure Redis connection is available"""
         try:
@@ -93,11 +280,16 @@ class RedisChatStorage(ChatHistoryManagerInterface):
         Raises:
             StorageError: If message storage fails
         """
+        if self.use_streams:
+            # 스트림 ID와 사용자 인덱스를 함께 기록해야 하므로 스크립트 경로로 저장
+            await self.append_and_read(session_id, message, limit=0)
+            return message.message_id
+        
         try:
             redis_client = await self._ensure_connection()
             
-            # Serialize message to JSON
-            message_json = message.to_json()
+            # Serialize message with configured codec
+            encoded_message = self.codec.encode(message)
             
             # Store message in Redis list
             messages_key = self.MESSAGES_KEY.format(session_id=session_id)
@@ -106,7 +298,7 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             pipe = redis_client.pipeline()
             
             # Add message to list
-            pipe.lpush(messages_key, message_json)
+            pipe.lpush(messages_key, encoded_message)
             
             # Set TTL for messages
             pipe.expire(messages_key, self.DEFAULT_MESSAGE_TTL)
@@ -117,6 +309,10 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             # Update session metadata
             await self._update_session_metadata(pipe, session_id, message)
             
+            # 순서 정보 없이 저장된 쓰기 - 다른 레플리카의 버퍼 무효화
+            if self.publish_events:
+                pipe.publish(self.EVENTS_CHANNEL.format(session_id=session_id), f"{self.instance_id}|0|")
+            
             # Execute pipeline
             await pipe.execute()
             
@@ -127,6 +323,95 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             logger.error(f"Failed to store message: {e}")
             raise StorageError(f"Failed to store message: {e}")
     
+    async def append_and_read(
+        self,
+        session_id: str,
+        message: ChatMessage,
+        limit: int = 10,
+        time_window: Optional[timedelta] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a message and read the recent window in a single round trip
+        
+        메시지 저장, 메타데이터/참여자 갱신, 활동량 기반 TTL 적용, 최근 메시지 조회를
+        서버 측 스크립트(EVALSHA) 한 번으로 원자적으로 처리
+        
+        Args:
+            session_id: Discussion session identifier
+            message: ChatMessage object to store
+            limit: Number of recent messages to return (0 = store only)
+            time_window: Optional time window to filter returned messages
+            
+        Returns:
+            Dict[str, Any]: messages (oldest first), user_messages_since_ai,
+                speakers_since_ai, message_count, ttl_seconds
+            
+        Raises:
+            StorageError: If the script execution fails
+        """
+        try:
+            redis_client = await self._get_raw_client()
+            if self._append_and_read_script is None:
+                self._append_and_read_script = redis_client.register_script(APPEND_AND_READ_SCRIPT)
+            
+            (high_count, high_ttl), (mid_count, mid_ttl), (_, low_ttl) = SESSION_TTL_TIERS
+            participant_json = json.dumps({
+                "nickname": message.nickname,
+                "last_message_time": message.timestamp.isoformat(),
+                "user_id": message.user_id
+            })
+            
+            result = await self._append_and_read_script(
+                keys=[
+                    self._log_key(session_id),
+                    self.META_KEY.format(session_id=session_id),
+                    self.PARTICIPANTS_KEY.format(session_id=session_id),
+                    self.CONTEXT_KEY.format(session_id=session_id),
+                    self.ACTIVE_SESSIONS_KEY,
+                    self.ACTIVITY_KEY.format(session_id=session_id),
+                    self.USER_INDEX_KEY.format(session_id=session_id, user_id=message.user_id)
+                ],
+                args=[
+                    self.codec.encode(message), session_id, message.user_id, participant_json,
+                    datetime.utcnow().isoformat(), limit,
+                    high_count, high_ttl, mid_count, mid_ttl, low_ttl,
+                    self.instance_id,
+                    self.EVENTS_CHANNEL.format(session_id=session_id) if self.publish_events else "",
+                    "1" if self.use_streams else "0",
+                    self.stream_maxlen
+                ]
+            )
+            
+            message_count, user_since_ai, ttl_seconds, speakers_since_ai = (int(value) for value in result[:4])
+            cutoff_time = datetime.utcnow() - time_window if time_window else None
+            
+            messages = []
+            for encoded_message in result[4:]:
+                try:
+                    stored = decode_message(encoded_message)
+                    if cutoff_time and stored.timestamp < cutoff_time:
+                        continue
+                    messages.append(stored)
+                except Exception as e:
+                    logger.warning(f"Failed to deserialize message: {e}")
+                    continue
+            
+            # Return in chronological order (oldest first)
+            messages.reverse()
+            
+            logger.debug(f"Stored message {message.message_id} and read {len(messages)} messages for session {session_id}")
+            return {
+                "messages": messages,
+                "user_messages_since_ai": user_since_ai,
+                "speakers_since_ai": speakers_since_ai,
+                "message_count": message_count,
+                "ttl_seconds": ttl_seconds
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to append and read messages: {e}")
+            raise StorageError(f"Failed to append and read messages: {e}")
+    
     async def get_recent_messages(
         self, 
         session_id: str, 
@@ -148,12 +433,17 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             StorageError: If message retrieval fails
         """
         try:
-            redis_client = await self._ensure_connection()
+            await self._ensure_connection()
+            raw_client = await self._get_raw_client()
             
-            messages_key = self.MESSAGES_KEY.format(session_id=session_id)
-            
-            # Get messages from Redis list (newest first)
-            message_jsons = await redis_client.lrange(messages_key, 0, limit - 1)
+            if self.use_streams:
+                entries = await raw_client.xrevrange(self._log_key(session_id), count=limit)
+                encoded_messages = [fields[b"m"] for _, fields in entries]
+            else:
+                messages_key = self.MESSAGES_KEY.format(session_id=session_id)
+                
+                # Get messages from Redis list (newest first)
+                encoded_messages = await raw_client.lrange(messages_key, 0, limit - 1)
             
             messages = []
             cutoff_time = None
@@ -161,9 +451,9 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             if time_window:
                 cutoff_time = datetime.utcnow() - time_window
             
-            for message_json in message_jsons:
+            for encoded_message in encoded_messages:
                 try:
-                    message = ChatMessage.from_json(message_json)
+                    message = decode_message(encoded_message)
                     
                     # Filter by time window if specified
                     if cutoff_time and message.timestamp < cutoff_time:
@@ -185,6 +475,42 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             logger.error(f"Failed to retrieve messages: {e}")
             raise StorageError(f"Failed to retrieve messages: {e}")
     
+    async def listen_message_events(self, on_subscribed: Optional[Callable[[], None]] = None):
+        """
+        Subscribe to chat message events published by every replica
+        
+        Args:
+            on_subscribed: Called once the subscription is active
+        
+        Yields:
+            tuple: (session_id, origin_instance_id, message_count, ChatMessage or None)
+                message_count 0 또는 message None은 해당 세션 버퍼 무효화를 의미
+        """
+        raw_client = await self._get_raw_client()
+        pubsub = raw_client.pubsub()
+        channel_prefix = self.EVENTS_CHANNEL.format(session_id="")
+        await pubsub.psubscribe(self.EVENTS_PATTERN)
+        if on_subscribed:
+            on_subscribed()
+        
+        try:
+            async for event in pubsub.listen():
+                if event.get("type") != "pmessage":
+                    continue
+                
+                session_id = event["channel"].decode("utf-8")[len(channel_prefix):]
+                try:
+                    origin, message_count, payload = event["data"].split(b"|", 2)
+                    message = decode_message(payload) if payload else None
+                except Exception as e:
+                    logger.warning(f"Invalid chat message event for session {session_id}: {e}")
+                    origin, message_count, message = b"", b"0", None
+                
+                yield session_id, origin.decode("utf-8"), int(message_count), message
+        finally:
+            await pubsub.punsubscribe(self.EVENTS_PATTERN)
+            await pubsub.close()
+    
     async def get_user_messages(
         self, 
         session_id: str, 
@@ -205,6 +531,10 @@ class RedisChatStorage(ChatHistoryManagerInterface):
         Raises:
             StorageError: If message retrieval fails
         """
+        if self.use_streams:
+            page = await self.get_message_page(session_id, limit, user_id=user_id)
+            return page["messages"]
+        
         try:
             # Get all recent messages first
             all_messages = await self.get_recent_messages(session_id, limit * 3)  # Get more to filter
@@ -219,6 +549,134 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             logger.error(f"Failed to retrieve user messages: {e}")
             raise StorageError(f"Failed to retrieve user messages: {e}")
     
+    async def get_message_page(
+        self,
+        session_id: str,
+        limit: int = 50,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        since: Optional[datetime] = None,
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Read one page of chat history with cursor pagination
+        
+        Streams 백엔드는 XREVRANGE/XRANGE로 구간을 서버에서 잘라 limit + 1개만 읽으므로
+        has_more가 정확하고, user_id 조회는 사용자별 인덱스 스트림을 사용.
+        list 백엔드는 커서 없이 최근 limit + 1개를 읽어 필터링 (커서 인자는 무시).
+        
+        Args:
+            session_id: Discussion session identifier
+            limit: Page size
+            before: 이 커서보다 오래된 메시지 (이전 페이지)
+            after: 이 커서보다 새로운 메시지 (증분 동기화, 오래된 순으로 limit개)
+            since: 이 시각 이후 메시지만 (스트림 ID 시각 기준)
+            user_id: 특정 사용자 메시지만
+            
+        Returns:
+            Dict[str, Any]: messages (oldest first), has_more, next_cursor (요청 방향으로 이어서 읽을 커서),
+                latest_cursor (반환된 가장 새 메시지 커서)
+            
+        Raises:
+            StorageError: If the read fails
+        """
+        if not self.use_streams:
+            return await self._get_list_page(session_id, limit, since, user_id)
+        
+        try:
+            raw_client = await self._get_raw_client()
+            source_key = (
+                self.USER_INDEX_KEY.format(session_id=session_id, user_id=user_id)
+                if user_id else self._log_key(session_id)
+            )
+            lower = stream_id_after(since) if since else "-"
+            
+            if after:
+                # 증분 동기화: after 이후를 오래된 순으로
+                if since is None or _stream_id_key(after) >= _stream_id_key(lower):
+                    lower = f"({after}"
+                entries = await raw_client.xrange(source_key, min=lower, max="+", count=limit + 1)
+                has_more = len(entries) > limit
+                entries = entries[:limit]
+            else:
+                entries = await raw_client.xrevrange(
+                    source_key, max=f"({before}" if before else "+", min=lower, count=limit + 1
+                )
+                has_more = len(entries) > limit
+                entries = entries[:limit]
+                entries.reverse()
+            
+            ids = [entry_id.decode("utf-8") for entry_id, _ in entries]
+            if user_id:
+                encoded_messages = await self._read_stream_entries(raw_client, session_id, ids)
+            else:
+                encoded_messages = [fields[b"m"] for _, fields in entries]
+            
+            messages = []
+            for encoded_message in encoded_messages:
+                if encoded_message is None:
+                    continue  # 본 로그에서 MAXLEN으로 잘린 항목
+                try:
+                    messages.append(decode_message(encoded_message))
+                except Exception as e:
+                    logger.warning(f"Failed to deserialize message: {e}")
+            
+            next_cursor = None
+            if has_more and ids:
+                next_cursor = ids[-1] if after else ids[0]
+            
+            return {
+                "messages": messages,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+                "latest_cursor": ids[-1] if ids else after
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to read message page: {e}")
+            raise StorageError(f"Failed to read message page: {e}")
+    
+    async def _read_stream_entries(self, raw_client: Redis, session_id: str, ids: List[str]) -> List[Optional[bytes]]:
+        """사용자 인덱스 ID로 본 로그 항목 조회 (파이프라인 1회, 잘린 항목은 None)"""
+        if not ids:
+            return []
+        
+        log_key = self._log_key(session_id)
+        pipe = raw_client.pipeline(transaction=False)
+        for entry_id in ids:
+            pipe.xrange(log_key, min=entry_id, max=entry_id, count=1)
+        results = await pipe.execute()
+        
+        return [entries[0][1][b"m"] if entries else None for entries in results]
+    
+    async def _get_list_page(
+        self,
+        session_id: str,
+        limit: int,
+        since: Optional[datetime],
+        user_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """list 백엔드 페이지 조회 (최근 limit + 1개 기준, 커서 미지원)"""
+        if user_id:
+            messages = await self.get_user_messages(session_id, user_id, limit)
+            has_more = False
+        else:
+            messages = await self.get_recent_messages(session_id, limit + 1)
+            has_more = len(messages) > limit
+            messages = messages[-limit:] if limit > 0 else []
+        
+        if since:
+            filtered = [message for message in messages if message.timestamp > since]
+            has_more = has_more and len(filtered) == len(messages)
+            messages = filtered
+        
+        return {
+            "messages": messages,
+            "has_more": has_more,
+            "next_cursor": None,
+            "latest_cursor": None
+        }
+    
     async def cleanup_old_messages(
         self, 
         session_id: str, 
@@ -264,12 +722,19 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             
             # Set TTL for all session keys
             keys = [
-                self.MESSAGES_KEY.format(session_id=session_id),
+                self._log_key(session_id),
                 self.CONTEXT_KEY.format(session_id=session_id),
                 self.PARTICIPANTS_KEY.format(session_id=session_id),
-                self.META_KEY.format(session_id=session_id)
+                self.META_KEY.format(session_id=session_id),
+                self.ACTIVITY_KEY.format(session_id=session_id)
             ]
             
+            if self.use_streams:
+                # 사용자별 인덱스 스트림 (참여자 해시의 사용자 목록 기준)
+                participants_key = self.PARTICIPANTS_KEY.format(session_id=session_id)
+                for user_id in await redis_client.hkeys(participants_key):
+                    keys.append(self.USER_INDEX_KEY.format(session_id=session_id, user_id=user_id))
+            
             pipe = redis_client.pipeline()
             for key in keys:
                 pipe.expire(key, ttl_seconds)
@@ -282,6 +747,42 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             logger.error(f"Failed to set session TTL: {e}")
             raise StorageError(f"Failed to set session TTL: {e}")
     
+    async def get_turn_activity(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get activity since the last AI reply with a single HGETALL
+        
+        Args:
+            session_id: Discussion session identifier
+            
+        Returns:
+            Dict[str, Any]: user_messages_since_ai, speakers_since_ai,
+                participant_messages (user_id -> count), last_user_id, last_ai_at
+            
+        Raises:
+            StorageError: If the read fails
+        """
+        try:
+            redis_client = await self._get_redis_client()
+            activity = await redis_client.hgetall(self.ACTIVITY_KEY.format(session_id=session_id))
+            
+            participant_messages = {
+                field[2:]: int(value) for field, value in activity.items() if field.startswith("u:")
+            }
+            
+            return {
+                "session_id": session_id,
+                "user_messages_since_ai": int(activity.get("user_since_ai", 0)),
+                "speakers_since_ai": len(participant_messages),
+                "participant_messages": participant_messages,
+                "last_user_id": activity.get("last_user_id"),
+                "last_user_at": activity.get("last_user_at"),
+                "last_ai_at": activity.get("last_ai_at")
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get turn activity: {e}")
+            raise StorageError(f"Failed to get turn activity: {e}")
+    
     async def get_session_stats(self, session_id: str) -> Dict[str, Any]:
         """
         Get statistics for a session
@@ -299,8 +800,11 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             redis_client = await self._ensure_connection()
             
             # Get message count
-            messages_key = self.MESSAGES_KEY.format(session_id=session_id)
-            message_count = await redis_client.llen(messages_key)
+            messages_key = self._log_key(session_id)
+            if self.use_streams:
+                message_count = await redis_client.xlen(messages_key)
+            else:
+                message_count = await redis_client.llen(messages_key)
             
             # Get session metadata
             meta_key = self.META_KEY.format(session_id=session_id)
@@ -371,6 +875,18 @@ class RedisChatStorage(ChatHistoryManagerInterface):
             "user_id": message.user_id
         }))
         pipe.expire(participants_key, self.DEFAULT_PARTICIPANT_TTL)
+        
+        # Update activity summary since last AI reply
+        activity_key = self.ACTIVITY_KEY.format(session_id=session_id)
+        now_iso = datetime.utcnow().isoformat()
+        if message.message_type == MessageType.AI:
+            pipe.delete(activity_key)
+            pipe.hset(activity_key, mapping={"user_since_ai": 0, "speakers_since_ai": 0, "last_ai_at": now_iso})
+        elif message.message_type == MessageType.USER:
+            pipe.hincrby(activity_key, "user_since_ai", 1)
+            pipe.hincrby(activity_key, f"u:{message.user_id}", 1)
+            pipe.hset(activity_key, mapping={"last_user_id": message.user_id, "last_user_at": now_iso})
+        pipe.expire(activity_key, self.DEFAULT_PARTICIPANT_TTL)
     
     async def get_active_sessions(self) -> List[str]:
         """
@@ -392,33 +908,38 @@ class RedisChatStorage(ChatHistoryManagerInterface):
         """
         Clean up expired sessions from active sessions set
         
+        세션 목록을 SSCAN 배치로 나누어 배치당 스크립트 1회로 정리하며,
+        시간 예산을 넘기면 다음 호출에서 이어서 진행
+        
         Returns:
             int: Number of sessions cleaned up
         """
         try:
             redis_client = await self._ensure_connection()
-            active_sessions = await self.get_active_sessions()
+            metrics = await self.reconciler.run(redis_client, [self.ACTIVE_SESSIONS_KEY])
             
-            cleaned_count = 0
-            for session_id in active_sessions:
-                # Check if session still has data
-                messages_key = self.MESSAGES_KEY.format(session_id=session_id)
-                exists = await redis_client.exists(messages_key)
-                
-                if not exists:
-                    # Remove from active sessions
-                    await redis_client.srem(self.ACTIVE_SESSIONS_KEY, session_id)
-                    cleaned_count += 1
-                    logger.info(f"Cleaned up expired session: {session_id}")
+            if metrics["removed"] > 0:
+                logger.info(
+                    f"Cleaned up {metrics['removed']} expired sessions "
+                    f"({metrics['scanned']} scanned in {metrics['batches']} batches, {metrics['duration_ms']}ms)"
+                )
             
-            return cleaned_count
+            return metrics["removed"]
             
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {e}")
             raise StorageError(f"Failed to cleanup expired sessions: {e}")
     
+    def get_reconcile_stats(self) -> Dict[str, Any]:
+        """Active session reconciliation metrics"""
+        return self.reconciler.get_stats()
+    
     async def close(self) -> None:
         """Close Redis connection"""
+        if self._raw_client:
+            await self._raw_client.close()
+        if self._raw_pool:
+            await self._raw_pool.disconnect()
         if self._redis_client:
             await self._redis_client.close()
         if self._connection_pool:
@@ -4,45 +4,101 @@ Replaces memory-based session management with Redis for persistence and scalabil
 """
 
 import json
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List, Tuple
 from loguru import logger
 
+from src.config.settings import get_settings
 from src.services.redis_connection_manager import RedisConnectionManager
+from src.services.redis_set_reconciler import SetReconciler
 from src.services.vector_db import VectorDBManager
 
 
+# Redis 키 / 채널
+SESSION_KEY = "discussion:session:{session_id}"
+ACTIVE_SESSIONS_KEY = "discussion:active_sessions:{meeting_id}"
+# 세션 수명 이벤트 ("{event}|{origin_instance_id}|{session_id}") - 모든 레플리카가 구독
+EVENTS_CHANNEL = "discussion:events"
+# AI 응답 청크 중계 (JSON: origin, session_id, payload) - 다른 레플리카에 연결된 스트림으로 전달
+BROADCAST_CHANNEL = "discussion:broadcast"
+
+EVENT_STARTED = "started"
+EVENT_ENDED = "ended"
+EVENT_REPLY = "reply"
+
+# 로컬 캐시 미적중 표시 (없는 세션도 None으로 캐시하므로 구분 필요)
+_CACHE_MISS = object()
+
+
 class RedisDiscussionManager:
     """
     Redis 기반 토론 세션 관리자 - 서버 재시작 및 다중 인스턴스 환경 지원
+    
+    - 세션 상태는 Redis에 저장, 모임별 활성 세션 셋으로 색인
+    - 짧은 TTL의 로컬 read-through 캐시 (이벤트 구독 중에만 사용)
+    - 시작/종료 이벤트를 pub/sub로 발행하여 다른 레플리카의 캐시 무효화 및 스트림 종료
+    - AI 응답 청크를 pub/sub로 중계하여 다른 레플리카의 세션 스트림에도 전달
     """
     
     def __init__(self, redis_manager: RedisConnectionManager = None):
         self.redis_manager = redis_manager
         self.vector_db = None
         self.session_ttl_hours = 24  # 기본 세션 TTL: 24시간
+        self.instance_id = uuid.uuid4().hex
+        
+        settings = get_settings()
+        self.reconciler = SetReconciler(
+            "discussion_sessions",
+            member_key=lambda session_id: SESSION_KEY.format(session_id=session_id),
+            batch_size=settings.chat_history.CHAT_REDIS_SCAN_BATCH_SIZE,
+            time_budget_ms=settings.chat_history.CHAT_RECONCILE_TIME_BUDGET_MS
+        )
         
+        # 로컬 세션 캐시: session_id -> (만료 시각, 세션 데이터 또는 None)
+        self.local_cache_ttl = settings.ai.DISCUSSION_STATE_CACHE_TTL_SECONDS
+        self._local_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._events_connected = False
+        self.cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "events_published": 0,
+            "events_received": 0,
+            "replies_relayed": 0,
+            "replies_received": 0
+        }
+    
     async def initialize(self, vector_db: VectorDBManager):
         """Initialize with vector DB"""
         self.vector_db = vector_db
         logger.info("RedisDiscussionManager initialized")
     
+    async def _client(self):
+        client = await self.redis_manager.get_client()
+        if client is None:
+            raise ConnectionError("Redis client not available")
+        return client
+    
     async def start_discussion(
-        self, 
+        self,
         meeting_id: str,
         session_id: str,
         document_id: str,
-        participants: List[Dict[str, str]] = None
+        participants: List[Dict[str, str]] = None,
+        book_context: List[str] = None
     ) -> Dict[str, Any]:
         """
-        간단한 토론 세션 시작 - Redis에 기본 세션 정보만 저장
+        토론 세션 시작 - 세션 정보 저장, 모임별 활성 세션 셋 등록, 시작 이벤트 발행
         
         Args:
             meeting_id: 독서 모임 ID
             session_id: 토론 세션 ID
             document_id: 문서 ID
             participants: 참여자 목록
-            
+            book_context: 세션 고정 독서 자료 청크
+        
         Returns:
             Dict with success status
         """
@@ -52,26 +108,32 @@ class RedisDiscussionManager:
                 "document_id": document_id,
                 "started_at": datetime.utcnow().isoformat(),
                 "participants": participants or [],
-                "chatbot_active": True
+                "chatbot_active": True,
+                "book_context": book_context or []
             }
             
-            # Redis에 세션 저장 (24시간 TTL)
-            session_key = f"discussion:session:{session_id}"
+            # 세션 저장 + 활성 세션 셋 등록 + 이벤트 발행 (24시간 TTL, 1회 왕복)
             ttl_seconds = self.session_ttl_hours * 3600
+            active_sessions_key = ACTIVE_SESSIONS_KEY.format(meeting_id=meeting_id)
+            
+            client = await self._client()
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.setex(SESSION_KEY.format(session_id=session_id), ttl_seconds, json.dumps(session_data))
+                pipe.sadd(active_sessions_key, session_id)
+                pipe.expire(active_sessions_key, ttl_seconds)
+                pipe.publish(EVENTS_CHANNEL, self._event_payload(EVENT_STARTED, session_id))
+                await pipe.execute()
             
-            await self.redis_manager.set_with_ttl(
-                session_key, 
-                json.dumps(session_data), 
-                ttl_seconds
-            )
+            self.cache_stats["events_published"] += 1
+            self._cache_put(session_id, session_data)
             
-            logger.info(f"✅ Simple discussion session started: {session_id}")
+            logger.info(f"✅ Discussion session stored in Redis: {session_id}")
             
             return {
                 "success": True,
                 "message": "Discussion session started successfully"
             }
-            
+        
         except Exception as e:
             logger.error(f"Failed to start discussion session: {e}")
             return {
@@ -85,12 +147,12 @@ class RedisDiscussionManager:
         
         Args:
             session_id: 토론 세션 ID
-            
+        
         Returns:
             Session data or None if not found
         """
         try:
-            session_key = f"discussion:session:{session_id}"
+            session_key = SESSION_KEY.format(session_id=session_id)
             session_data_json = await self.redis_manager.get_key(session_key)
             
             if session_data_json:
@@ -100,7 +162,7 @@ class RedisDiscussionManager:
                 return session_data
             
             return None
-            
+        
         except Exception as e:
             logger.error(f"Failed to get discussion session {session_id}: {e}")
             return None
@@ -111,7 +173,7 @@ class RedisDiscussionManager:
         
         Args:
             session_id: 토론 세션 ID
-            
+        
         Returns:
             bool: 업데이트 성공 여부
         """
@@ -120,7 +182,7 @@ class RedisDiscussionManager:
             if session_data:
                 session_data["last_activity"] = datetime.utcnow().isoformat()
                 
-                session_key = f"discussion:session:{session_id}"
+                session_key = SESSION_KEY.format(session_id=session_id)
                 ttl_seconds = self.session_ttl_hours * 3600
                 
                 await self.redis_manager.set_with_ttl(
@@ -131,21 +193,25 @@ class RedisDiscussionManager:
                 return True
             
             return False
-            
+        
         except Exception as e:
             logger.error(f"Failed to update last activity for session {session_id}: {e}")
             return False
     
     async def get_discussion_session_raw(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """활동 시간 업데이트 없이 세션 정보만 조회"""
+        """활동 시간 업데이트 없이 세션 정보만 조회 (로컬 캐시 우선)"""
+        cached = self._cache_get(session_id)
+        if cached is not _CACHE_MISS:
+            return cached
+        
         try:
-            session_key = f"discussion:session:{session_id}"
+            session_key = SESSION_KEY.format(session_id=session_id)
             session_data_json = await self.redis_manager.get_key(session_key)
             
-            if session_data_json:
-                return json.loads(session_data_json)
-            return None
-            
+            session_data = json.loads(session_data_json) if session_data_json else None
+            self._cache_put(session_id, session_data)
+            return session_data
+        
         except Exception as e:
             logger.error(f"Failed to get raw session data {session_id}: {e}")
             return None
@@ -156,7 +222,7 @@ class RedisDiscussionManager:
         
         Args:
             session_id: 토론 세션 ID
-            
+        
         Returns:
             bool: 활성 상태 여부
         """
@@ -165,34 +231,47 @@ class RedisDiscussionManager:
     
     async def end_discussion(self, session_id: str) -> Dict[str, Any]:
         """
-        간단한 토론 세션 종료 - Redis에서 세션 삭제
+        토론 세션 종료 - 세션 삭제, 활성 세션 셋에서 제거, 종료 이벤트 발행
         
         Args:
             session_id: 토론 세션 ID
-            
+        
         Returns:
             Dict with success status
         """
         try:
-            session_key = f"discussion:session:{session_id}"
+            session_key = SESSION_KEY.format(session_id=session_id)
+            self.invalidate_local(session_id)
+            
+            client = await self._client()
+            session_data_json = await client.get(session_key)
             
             # 세션 존재 확인
-            if not await self.redis_manager.redis.exists(session_key):
+            if not session_data_json:
                 return {
                     "success": False,
                     "message": "Discussion session not found"
                 }
             
-            # 세션 삭제 (단순하게)
-            await self.redis_manager.delete_keys(session_key)
+            meeting_id = json.loads(session_data_json).get("meeting_id")
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.delete(session_key)
+                if meeting_id:
+                    pipe.srem(ACTIVE_SESSIONS_KEY.format(meeting_id=meeting_id), session_id)
+                pipe.publish(EVENTS_CHANNEL, self._event_payload(EVENT_ENDED, session_id))
+                await pipe.execute()
             
-            logger.info(f"✅ Simple discussion session ended: {session_id}")
+            self.cache_stats["events_published"] += 1
+            self._cache_put(session_id, None)
+            
+            logger.info(f"✅ Discussion session removed from Redis: {session_id}")
             
             return {
                 "success": True,
+                "meeting_id": meeting_id,
                 "message": "Discussion session ended successfully"
             }
-            
+        
         except Exception as e:
             logger.error(f"Failed to end discussion session {session_id}: {e}")
             return {
@@ -206,21 +285,149 @@ class RedisDiscussionManager:
         
         Args:
             meeting_id: 독서 모임 ID
-            
+        
         Returns:
             List of active session IDs
         """
         try:
-            active_sessions_key = f"discussion:active_sessions:{meeting_id}"
-            session_ids = await self.redis_manager.redis.smembers(active_sessions_key)
+            active_sessions_key = ACTIVE_SESSIONS_KEY.format(meeting_id=meeting_id)
+            client = await self._client()
+            session_ids = await client.smembers(active_sessions_key)
             
             # bytes를 string으로 변환
             return [sid.decode('utf-8') if isinstance(sid, bytes) else sid for sid in session_ids]
-            
+        
         except Exception as e:
             logger.error(f"Failed to get active sessions for meeting {meeting_id}: {e}")
             return []
     
+    async def publish_reply(self, session_id: str, payload: Dict[str, Any]) -> int:
+        """
+        AI 응답 청크를 다른 레플리카로 중계
+        
+        Args:
+            session_id: 토론 세션 ID
+            payload: 스트림 응답 필드 (JSON 직렬화 가능)
+            
+        Returns:
+            int: 메시지를 받은 구독 연결 수 (자신 포함)
+        """
+        client = await self._client()
+        message = json.dumps(
+            {"origin": self.instance_id, "session_id": session_id, "payload": payload},
+            ensure_ascii=False
+        )
+        receivers = await client.publish(BROADCAST_CHANNEL, message)
+        self.cache_stats["replies_relayed"] += 1
+        return receivers
+    
+    async def listen_session_events(self, on_subscribed: Optional[Callable[[], None]] = None):
+        """
+        Subscribe to discussion session events and relayed replies published by every replica
+        
+        Args:
+            on_subscribed: Called once the subscription is active
+        
+        Yields:
+            tuple: (event, session_id, origin_instance_id, payload)
+                payload는 EVENT_REPLY에서만 설정 (그 외 None)
+        """
+        client = await self._client()
+        pubsub = client.pubsub()
+        await pubsub.subscribe(EVENTS_CHANNEL, BROADCAST_CHANNEL)
+        self._events_connected = True
+        if on_subscribed:
+            on_subscribed()
+        
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                
+                channel = message["channel"]
+                data = message["data"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                
+                if channel == BROADCAST_CHANNEL:
+                    try:
+                        relayed = json.loads(data)
+                        origin, session_id, payload = relayed["origin"], relayed["session_id"], relayed["payload"]
+                    except (ValueError, KeyError):
+                        logger.warning(f"Invalid relayed discussion reply: {data[:100]!r}")
+                        continue
+                    
+                    self.cache_stats["replies_received"] += 1
+                    yield EVENT_REPLY, session_id, origin, payload
+                    continue
+                
+                try:
+                    event, origin, session_id = data.split("|", 2)
+                except ValueError:
+                    logger.warning(f"Invalid discussion session event: {data!r}")
+                    continue
+                
+                self.cache_stats["events_received"] += 1
+                if origin != self.instance_id:
+                    self.invalidate_local(session_id)
+                yield event, session_id, origin, None
+        finally:
+            # 구독이 끊기면 이벤트 유실 가능 - 재구독 전까지 로컬 캐시 사용 안 함
+            self._events_connected = False
+            self.clear_local_cache()
+            await pubsub.unsubscribe(EVENTS_CHANNEL, BROADCAST_CHANNEL)
+            await pubsub.close()
+    
+    def _event_payload(self, event: str, session_id: str) -> str:
+        return f"{event}|{self.instance_id}|{session_id}"
+    
+    def _cache_get(self, session_id: str) -> Any:
+        """캐시된 세션 데이터(없는 세션은 None) 또는 _CACHE_MISS"""
+        if not self._events_connected or self.local_cache_ttl <= 0:
+            return _CACHE_MISS
+        
+        entry = self._local_cache.get(session_id)
+        if entry is None or entry[0] < time.monotonic():
+            self.cache_stats["misses"] += 1
+            return _CACHE_MISS
+        
+        self.cache_stats["hits"] += 1
+        return entry[1]
+    
+    def _cache_put(self, session_id: str, session_data: Optional[Dict[str, Any]]):
+        if not self._events_connected or self.local_cache_ttl <= 0:
+            return
+        
+        now = time.monotonic()
+        if len(self._local_cache) > 10000:
+            # 만료 항목 일괄 정리 (캐시 크기 상한)
+            self._local_cache = {sid: entry for sid, entry in self._local_cache.items() if entry[0] >= now}
+        self._local_cache[session_id] = (now + self.local_cache_ttl, session_data)
+    
+    def invalidate_local(self, session_id: str):
+        """로컬 캐시에서 세션 제거"""
+        if self._local_cache.pop(session_id, None) is not None:
+            self.cache_stats["invalidations"] += 1
+    
+    def clear_local_cache(self):
+        """로컬 캐시 전체 폐기"""
+        self.cache_stats["invalidations"] += len(self._local_cache)
+        self._local_cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """로컬 세션 캐시 통계"""
+        total = self.cache_stats["hits"] + self.cache_stats["misses"]
+        return {
+            **self.cache_stats,
+            "hit_rate": self.cache_stats["hits"] / total if total else 0.0,
+            "cached_sessions": len(self._local_cache),
+            "ttl_seconds": self.local_cache_ttl,
+            "events_connected": self._events_connected,
+            "instance_id": self.instance_id
+        }
+    
     async def cleanup_expired_sessions(self) -> int:
         """
         만료된 토론 세션 정리
@@ -231,41 +438,26 @@ class RedisDiscussionManager:
         try:
             # Redis TTL에 의해 자동 삭제되므로 추가 정리는 불필요
             # 하지만 활성 세션 목록의 불일치를 정리
+            client = await self._client()
             
             # 모든 활성 세션 키 찾기
-            pattern = "discussion:active_sessions:*"
-            keys = []
-            cursor = 0
-            
-            while True:
-                cursor, batch_keys = await self.redis_manager.redis.scan(
-                    cursor=cursor, match=pattern, count=100
+            pattern = ACTIVE_SESSIONS_KEY.format(meeting_id="*")
+            keys = [
+                key.decode('utf-8') if isinstance(key, bytes) else key
+                async for key in client.scan_iter(match=pattern, count=self.reconciler.batch_size)
+            ]
+            
+            # 셋마다 SSCAN 배치 + 배치당 스크립트 1회 (시간 예산 초과 시 다음 실행에서 이어서)
+            metrics = await self.reconciler.run(client, keys)
+            
+            if metrics["removed"] > 0:
+                logger.info(
+                    f"🧹 Cleaned up {metrics['removed']} expired discussion sessions "
+                    f"({metrics['scanned']} scanned, {metrics['sets_completed']}/{len(keys)} meetings, {metrics['duration_ms']}ms)"
                 )
-                keys.extend(batch_keys)
-                if cursor == 0:
-                    break
-            
-            cleaned_count = 0
-            for key in keys:
-                if isinstance(key, bytes):
-                    key = key.decode('utf-8')
-                
-                # 각 세션의 실제 존재 여부 확인
-                session_ids = await self.redis_manager.redis.smembers(key)
-                for session_id in session_ids:
-                    if isinstance(session_id, bytes):
-                        session_id = session_id.decode('utf-8')
-                    
-                    session_key = f"discussion:session:{session_id}"
-                    if not await self.redis_manager.redis.exists(session_key):
-                        await self.redis_manager.redis.srem(key, session_id)
-                        cleaned_count += 1
-            
-            if cleaned_count > 0:
-                logger.info(f"🧹 Cleaned up {cleaned_count} expired discussion sessions")
-            
-            return cleaned_count
             
+            return metrics["removed"]
+        
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {e}")
             return 0
@@ -278,13 +470,15 @@ class RedisDiscussionManager:
             Dict with session statistics
         """
         try:
+            client = await self._client()
+            
             # 전체 활성 세션 수 계산
-            pattern = "discussion:session:*"
+            pattern = SESSION_KEY.format(session_id="*")
             total_sessions = 0
             cursor = 0
             
             while True:
-                cursor, keys = await self.redis_manager.redis.scan(
+                cursor, keys = await client.scan(
                     cursor=cursor, match=pattern, count=100
                 )
                 total_sessions += len(keys)
@@ -292,12 +486,12 @@ class RedisDiscussionManager:
                     break
             
             # 활성 모임 수 계산
-            active_meetings_pattern = "discussion:active_sessions:*"
+            active_meetings_pattern = ACTIVE_SESSIONS_KEY.format(meeting_id="*")
             cursor = 0
             active_meetings = 0
             
             while True:
-                cursor, keys = await self.redis_manager.redis.scan(
+                cursor, keys = await client.scan(
                     cursor=cursor, match=active_meetings_pattern, count=100
                 )
                 active_meetings += len(keys)
@@ -308,13 +502,15 @@ class RedisDiscussionManager:
                 "total_sessions": total_sessions,
                 "active_meetings": active_meetings,
                 "session_ttl_hours": self.session_ttl_hours,
+                "reconcile": self.reconciler.get_stats(),
+                "local_cache": self.get_cache_stats(),
                 "timestamp": datetime.utcnow().isoformat()
             }
-            
+        
         except Exception as e:
             logger.error(f"Failed to get session stats: {e}")
             return {
                 "total_sessions": 0,
                 "active_meetings": 0,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
@@ -13,9 +13,29 @@ from enum import Enum
 import redis.asyncio as redis
 from src.config.settings import get_settings
 from src.config.chat_config import get_performance_config, get_ttl_config
+from src.services.redis_cache_manager import CACHE_INDEX_KEY
 
 logger = logging.getLogger(__name__)
 
+# RedisChatStorage 키 구조 (세션별 키는 고정 목록이라 패턴 검색 불필요)
+ACTIVE_SESSIONS_KEY = "chat:active_sessions"
+SESSION_KEY_PATTERNS = (
+    "chat:session:{session_id}:messages",
+    "chat:session:{session_id}:stream",
+    "chat:session:{session_id}:context",
+    "chat:session:{session_id}:participants",
+    "chat:session:{session_id}:meta",
+    "chat:session:{session_id}:activity"
+)
+SESSION_META_KEY = "chat:session:{session_id}:meta"
+SESSION_MESSAGES_KEY = "chat:session:{session_id}:messages"
+SESSION_PARTICIPANTS_KEY = "chat:session:{session_id}:participants"
+# Streams 백엔드 사용자별 인덱스 (참여자 해시의 사용자 목록으로 키 도출)
+SESSION_USER_INDEX_KEY = "chat:session:{session_id}:user:{user_id}"
+
+# 강제 만료 대상 (이 서비스가 쓰는 키만 - 공유 Redis의 다른 키는 건드리지 않음)
+MANAGED_KEY_PATTERNS = ("chat:session:*", "cache:*", "cache_index:*")
+
 
 class MemoryStatus(str, Enum):
     """Redis memory status levels"""
@@ -77,12 +97,16 @@ class RedisMemoryManager:
             MemoryStatus.EMERGENCY: 1.0
         }
         
+        # SCAN/SSCAN 커서 단위 및 파이프라인 배치 크기
+        self.batch_size = self.performance_config.get('redis_scan_batch_size', 200)
+        
         # Cleanup statistics
         self._last_cleanup = datetime.utcnow()
         self._cleanup_stats = {
             "sessions_cleaned": 0,
             "keys_expired": 0,
-            "memory_freed_bytes": 0
+            "memory_freed_bytes": 0,
+            "stale_index_entries_removed": 0
         }
         
         logger.info("RedisMemoryManager initialized")
@@ -237,25 +261,22 @@ class RedisMemoryManager:
             # Find inactive sessions
             inactive_sessions = await self._find_inactive_sessions(max_age_hours)
             
-            # Clean up sessions
+            # Clean up sessions in pipelined batches (memory was measured while scanning)
             cleaned_count = 0
             memory_freed = 0
             
-            for session_info in inactive_sessions:
+            for start in range(0, len(inactive_sessions), self.batch_size):
+                batch = inactive_sessions[start:start + self.batch_size]
                 try:
-                    # Calculate memory usage before cleanup
-                    memory_before = await self._estimate_session_memory(session_info.session_id)
+                    await self._cleanup_sessions([session_info.session_id for session_info in batch])
                     
-                    # Clean up session
-                    await self._cleanup_session(session_info.session_id)
+                    cleaned_count += len(batch)
+                    memory_freed += sum(session_info.memory_usage_bytes for session_info in batch)
                     
-                    cleaned_count += 1
-                    memory_freed += memory_before
-                    
-                    logger.debug(f"Cleaned up session {session_info.session_id}")
+                    logger.debug(f"Cleaned up {len(batch)} sessions")
                     
                 except Exception as e:
-                    logger.warning(f"Failed to cleanup session {session_info.session_id}: {e}")
+                    logger.warning(f"Failed to cleanup {len(batch)} sessions: {e}")
             
             # Update cleanup statistics
             self._cleanup_stats["sessions_cleaned"] += cleaned_count
@@ -411,56 +432,90 @@ class RedisMemoryManager:
             return MemoryStatus.HEALTHY
     
     async def _count_active_sessions(self) -> int:
-        """Count active chat sessions"""
+        """Count active chat sessions (SCARD on the active session index)"""
         try:
-            # Count keys matching chat session pattern
-            pattern = "chat_session:*"
-            keys = await self._redis.keys(pattern)
-            return len(keys)
+            return await self._redis.scard(ACTIVE_SESSIONS_KEY)
         except Exception as e:
             logger.error(f"Failed to count active sessions: {e}")
             return 0
     
+    async def _iter_session_id_batches(self):
+        """
+        세션 ID를 배치 단위로 순회
+        
+        RedisChatStorage가 쓰기 시 유지하는 활성 세션 셋을 SSCAN으로 읽고,
+        셋이 없으면 메타 키 SCAN으로 대체 (둘 다 커서 기반이라 Redis를 블로킹하지 않음)
+        """
+        if await self._redis.exists(ACTIVE_SESSIONS_KEY):
+            ids = self._redis.sscan_iter(ACTIVE_SESSIONS_KEY, count=self.batch_size)
+        else:
+            ids = (
+                key[len("chat:session:"):-len(":meta")]
+                async for key in self._redis.scan_iter(match=SESSION_META_KEY.format(session_id="*"), count=self.batch_size)
+            )
+        
+        batch = []
+        async for session_id in ids:
+            batch.append(session_id)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
     async def _find_inactive_sessions(self, max_age_hours: int) -> List[SessionInfo]:
-        """Find inactive sessions for cleanup"""
+        """Find inactive sessions for cleanup (one HGETALL/TTL pipeline per batch)"""
         try:
             inactive_sessions = []
             cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
             
-            # Get all session keys
-            pattern = "chat_session:*"
-            session_keys = await self._redis.keys(pattern)
-            
-            for key in session_keys:
-                try:
-                    # Extract session ID
-                    session_id = key.split(":", 1)[1]
+            async for session_ids in self._iter_session_id_batches():
+                pipe = self._redis.pipeline(transaction=False)
+                for session_id in session_ids:
+                    pipe.hgetall(SESSION_META_KEY.format(session_id=session_id))
+                    pipe.ttl(SESSION_MESSAGES_KEY.format(session_id=session_id))
+                results = await pipe.execute(raise_on_error=False)
+                
+                candidates = []
+                stale_ids = []
+                for index, session_id in enumerate(session_ids):
+                    session_data, ttl = results[2 * index], results[2 * index + 1]
+                    if isinstance(session_data, Exception) or isinstance(ttl, Exception):
+                        logger.warning(f"Error processing session {session_id}: {session_data if isinstance(session_data, Exception) else ttl}")
+                        continue
                     
-                    # Get session info
-                    session_data = await self._redis.hgetall(key)
                     if not session_data:
+                        # TTL로 키가 모두 만료된 세션 - 인덱스에서만 제거
+                        if ttl == -2:
+                            stale_ids.append(session_id)
                         continue
                     
-                    # Check last activity
-                    last_activity_str = session_data.get("last_activity")
-                    if last_activity_str:
-                        last_activity = datetime.fromisoformat(last_activity_str)
-                        if last_activity < cutoff_time:
-                            # Get additional info
-                            message_count = int(session_data.get("message_count", 0))
-                            ttl = await self._redis.ttl(key)
-                            memory_usage = await self._estimate_session_memory(session_id)
-                            
-                            inactive_sessions.append(SessionInfo(
-                                session_id=session_id,
-                                last_activity=last_activity,
-                                message_count=message_count,
-                                memory_usage_bytes=memory_usage,
-                                ttl_remaining=ttl
-                            ))
+                    try:
+                        # Check last activity
+                        last_activity_str = session_data.get("last_activity")
+                        if last_activity_str:
+                            last_activity = datetime.fromisoformat(last_activity_str)
+                            if last_activity < cutoff_time:
+                                candidates.append((session_id, session_data, last_activity, ttl))
+                    except Exception as e:
+                        logger.warning(f"Error processing session {session_id}: {e}")
                 
-                except Exception as e:
-                    logger.warning(f"Error processing session key {key}: {e}")
+                if stale_ids:
+                    await self._redis.srem(ACTIVE_SESSIONS_KEY, *stale_ids)
+                    self._cleanup_stats["stale_index_entries_removed"] += len(stale_ids)
+                
+                if not candidates:
+                    continue
+                
+                memory_usage = await self._estimate_sessions_memory([candidate[0] for candidate in candidates])
+                for session_id, session_data, last_activity, ttl in candidates:
+                    inactive_sessions.append(SessionInfo(
+                        session_id=session_id,
+                        last_activity=last_activity,
+                        message_count=int(session_data.get("message_count", 0)),
+                        memory_usage_bytes=memory_usage.get(session_id, 0),
+                        ttl_remaining=ttl
+                    ))
             
             # Sort by last activity (oldest first)
             inactive_sessions.sort(key=lambda x: x.last_activity)
@@ -473,84 +528,99 @@ class RedisMemoryManager:
     
     async def _cleanup_session(self, session_id: str) -> None:
         """Clean up a specific session"""
+        await self._cleanup_sessions([session_id])
+    
+    async def _cleanup_sessions(self, session_ids: List[str]) -> None:
+        """
+        Clean up sessions: fixed session keys + indexed cache keys, removed from the active index
+        
+        Deletes with UNLINK (memory reclaimed in a background thread) in one pipeline
+        """
         try:
-            # Delete all keys related to this session
-            patterns = [
-                f"chat_session:{session_id}",
-                f"chat_messages:{session_id}",
-                f"chat_context:{session_id}",
-                f"participant_state:{session_id}:*"
-            ]
-            
-            for pattern in patterns:
-                keys = await self._redis.keys(pattern)
-                if keys:
-                    await self._redis.delete(*keys)
+            # 세션별 캐시 키 인덱스와 참여자 목록 조회 (세션 수만큼의 SMEMBERS/HKEYS를 한 번에)
+            pipe = self._redis.pipeline(transaction=False)
+            for session_id in session_ids:
+                pipe.smembers(CACHE_INDEX_KEY.format(scope=session_id))
+                pipe.hkeys(SESSION_PARTICIPANTS_KEY.format(session_id=session_id))
+            results = await pipe.execute()
+            
+            pipe = self._redis.pipeline(transaction=False)
+            for index, session_id in enumerate(session_ids):
+                indexed_keys, user_ids = results[2 * index], results[2 * index + 1]
+                keys = [pattern.format(session_id=session_id) for pattern in SESSION_KEY_PATTERNS]
+                keys.append(CACHE_INDEX_KEY.format(scope=session_id))
+                keys.extend(indexed_keys)
+                keys.extend(SESSION_USER_INDEX_KEY.format(session_id=session_id, user_id=user_id) for user_id in user_ids)
+                pipe.unlink(*keys)
+            pipe.srem(ACTIVE_SESSIONS_KEY, *session_ids)
+            await pipe.execute()
             
         except Exception as e:
-            logger.error(f"Failed to cleanup session {session_id}: {e}")
+            logger.error(f"Failed to cleanup sessions {session_ids[:5]}: {e}")
             raise
     
     async def _estimate_session_memory(self, session_id: str) -> int:
         """Estimate memory usage of a session"""
+        memory_usage = await self._estimate_sessions_memory([session_id])
+        return memory_usage.get(session_id, 0)
+    
+    async def _estimate_sessions_memory(self, session_ids: List[str]) -> Dict[str, int]:
+        """
+        Estimate memory usage of sessions with one pipelined MEMORY USAGE batch
+        
+        Returns:
+            Dict[str, int]: session_id -> bytes (missing keys and errors count as 0)
+        """
         try:
-            total_memory = 0
-            
-            # Get memory usage of session-related keys
-            patterns = [
-                f"chat_session:{session_id}",
-                f"chat_messages:{session_id}",
-                f"chat_context:{session_id}",
-                f"participant_state:{session_id}:*"
-            ]
-            
-            for pattern in patterns:
-                keys = await self._redis.keys(pattern)
-                for key in keys:
-                    try:
-                        # Use MEMORY USAGE command if available
-                        memory = await self._redis.memory_usage(key)
-                        if memory:
-                            total_memory += memory
-                    except Exception:
-                        # Fallback: estimate based on key length and type
-                        key_type = await self._redis.type(key)
-                        if key_type == "string":
-                            value = await self._redis.get(key)
-                            total_memory += len(str(value)) if value else 0
-                        elif key_type == "hash":
-                            hash_data = await self._redis.hgetall(key)
-                            total_memory += sum(len(str(k)) + len(str(v)) for k, v in hash_data.items())
-                        elif key_type == "list":
-                            list_len = await self._redis.llen(key)
-                            total_memory += list_len * 50  # Rough estimate
-            
-            return total_memory
+            pipe = self._redis.pipeline(transaction=False)
+            for session_id in session_ids:
+                for pattern in SESSION_KEY_PATTERNS:
+                    pipe.memory_usage(pattern.format(session_id=session_id))
+            results = await pipe.execute(raise_on_error=False)
+            
+            key_count = len(SESSION_KEY_PATTERNS)
+            return {
+                session_id: sum(
+                    memory for memory in results[index * key_count:(index + 1) * key_count]
+                    if isinstance(memory, int)
+                )
+                for index, session_id in enumerate(session_ids)
+            }
             
         except Exception as e:
-            logger.warning(f"Failed to estimate memory for session {session_id}: {e}")
-            return 0
+            logger.warning(f"Failed to estimate memory for {len(session_ids)} sessions: {e}")
+            return {}
     
     async def _force_expire_keys(self) -> int:
-        """Force expire keys that have TTL"""
+        """Force expire managed keys expiring within 1 minute (SCAN + pipelined TTL)"""
         try:
             expired_count = 0
             
-            # Get all keys with TTL
-            all_keys = await self._redis.keys("*")
-            
-            for key in all_keys:
-                try:
-                    ttl = await self._redis.ttl(key)
-                    if 0 < ttl <= 60:  # Keys expiring within 1 minute
-                        await self._redis.delete(key)
-                        expired_count += 1
-                except Exception:
-                    continue
+            for pattern in MANAGED_KEY_PATTERNS:
+                batch = []
+                async for key in self._redis.scan_iter(match=pattern, count=self.batch_size):
+                    batch.append(key)
+                    if len(batch) >= self.batch_size:
+                        expired_count += await self._expire_soon_expiring(batch)
+                        batch = []
+                if batch:
+                    expired_count += await self._expire_soon_expiring(batch)
             
             self._cleanup_stats["keys_expired"] += expired_count
             return expired_count
             
         except Exception as e:
             logger.error(f"Failed to force expire keys: {e}")
-            return 0
\ No newline at end of file
+            return 0
+    
+    async def _expire_soon_expiring(self, keys: List[str]) -> int:
+        """Unlink keys in the batch whose TTL is within 1 minute"""
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute(raise_on_error=False)
+        
+        expiring = [key for key, ttl in zip(keys, ttls) if isinstance(ttl, int) and 0 < ttl <= 60]
+        if not expiring:
+            return 0
+        return await self._redis.unlink(*expiring)
@@ -0,0 +1,152 @@
+"""
+Redis Set Reconciler for BGBG AI Server
+Batched, time-budgeted removal of index set members whose data key has expired
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+# 배치 단위 정리 스크립트 (EXISTS 확인과 SREM을 원자적으로 처리 - 확인 직후 재생성된 세션을 지우지 않음)
+# KEYS[1]: 인덱스 셋, KEYS[2..n]: 멤버별 데이터 키
+# ARGV[i]: KEYS[i + 1]에 대응하는 셋 멤버
+RECONCILE_SCRIPT = """
+local removed = 0
+for i = 2, #KEYS do
+  if redis.call('EXISTS', KEYS[i]) == 0 then
+    removed = removed + redis.call('SREM', KEYS[1], ARGV[i - 1])
+  end
+end
+return removed
+"""
+
+
+class SetReconciler:
+    """
+    활성 세션 인덱스 셋 정리기
+
+    - SSCAN 커서로 배치 단위 순회, 배치마다 스크립트 1회 호출 (세션당 왕복 없음)
+    - 실행당 시간 예산을 넘기면 커서를 저장하고 다음 주기에 이어서 진행
+    - 실행별/누적 정리 지표 제공
+    """
+
+    def __init__(
+        self,
+        name: str,
+        member_key: Callable[[str], str],
+        batch_size: int = 200,
+        time_budget_ms: int = 250
+    ):
+        """
+        Args:
+            name: 로그/지표용 이름
+            member_key: 셋 멤버 -> 존재 여부를 확인할 데이터 키
+            batch_size: SSCAN COUNT 및 스크립트 1회당 멤버 수 상한
+            time_budget_ms: 실행 1회의 시간 예산
+        """
+        self.name = name
+        self.member_key = member_key
+        self.batch_size = batch_size
+        self.time_budget = time_budget_ms / 1000
+
+        self._script = None
+        self._script_client: Optional[Redis] = None
+        # 예산 초과로 중단된 위치 (셋 키, SSCAN 커서)
+        self._resume: Optional[Tuple[str, int]] = None
+
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "scanned": 0,
+            "removed": 0,
+            "batches": 0,
+            "budget_exhausted_runs": 0,
+            "last_run": None
+        }
+
+    async def run(self, redis_client: Redis, set_keys: List[str]) -> Dict[str, Any]:
+        """
+        인덱스 셋 정리 1회 실행 (시간 예산 내)
+
+        Args:
+            redis_client: Redis 클라이언트
+            set_keys: 정리할 인덱스 셋 키 목록
+
+        Returns:
+            Dict[str, Any]: 실행 지표 (scanned, removed, batches, sets_completed, duration_ms, complete)
+        """
+        started = time.monotonic()
+        deadline = started + self.time_budget
+        metrics = {"scanned": 0, "removed": 0, "batches": 0, "sets_completed": 0, "complete": True}
+
+        resume_key, resume_cursor = self._resume or (None, 0)
+        self._resume = None
+        if resume_key in set_keys:
+            # 지난 실행이 멈춘 셋부터 이어서 진행
+            start = set_keys.index(resume_key)
+            set_keys = set_keys[start:] + set_keys[:start]
+        else:
+            resume_cursor = 0
+
+        for position, set_key in enumerate(set_keys):
+            cursor = resume_cursor if set_key == resume_key else 0
+
+            while True:
+                cursor, members = await redis_client.sscan(set_key, cursor=cursor, count=self.batch_size)
+                if members:
+                    metrics["removed"] += await self._reconcile_batch(redis_client, set_key, members)
+                    metrics["scanned"] += len(members)
+                    metrics["batches"] += 1
+
+                if cursor == 0 or time.monotonic() >= deadline:
+                    break
+
+            if cursor == 0:
+                metrics["sets_completed"] += 1
+                next_position = position + 1
+                if next_position < len(set_keys) and time.monotonic() >= deadline:
+                    self._resume = (set_keys[next_position], 0)
+                    metrics["complete"] = False
+                    break
+            else:
+                self._resume = (set_key, cursor)
+                metrics["complete"] = False
+                break
+
+        metrics["duration_ms"] = round((time.monotonic() - started) * 1000, 2)
+        self._record(metrics)
+        return metrics
+
+    async def _reconcile_batch(self, redis_client: Redis, set_key: str, members: List[Union[str, bytes]]) -> int:
+        if self._script is None or self._script_client is not redis_client:
+            self._script = redis_client.register_script(RECONCILE_SCRIPT)
+            self._script_client = redis_client
+
+        keys = [set_key]
+        keys.extend(
+            self.member_key(member.decode("utf-8") if isinstance(member, bytes) else member)
+            for member in members
+        )
+        return int(await self._script(keys=keys, args=list(members)))
+
+    def _record(self, metrics: Dict[str, Any]):
+        self.stats["runs"] += 1
+        self.stats["scanned"] += metrics["scanned"]
+        self.stats["removed"] += metrics["removed"]
+        self.stats["batches"] += metrics["batches"]
+        if not metrics["complete"]:
+            self.stats["budget_exhausted_runs"] += 1
+        self.stats["last_run"] = metrics
+
+        logger.debug(
+            f"🧹 {self.name} reconcile: scanned={metrics['scanned']} removed={metrics['removed']} "
+            f"batches={metrics['batches']} {metrics['duration_ms']}ms complete={metrics['complete']}"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 정리 지표"""
+        return {**self.stats, "resume_pending": self._resume is not None}
@@ -13,6 +13,7 @@ from src.services.quiz_service import QuizService
 from src.services.proofreading_service import ProofreadingService
 from src.services.vector_db import VectorDBManager
 from src.services.redis_connection_manager import RedisConnectionManager
+from src.services.startup_graph import StartupFailure, StartupGraph
 from src.config.settings import get_settings
 
 
@@ -74,115 +75,125 @@ class OptionalServiceFailure(ServiceInitializationError):
 class ServiceInitializer:
     """AI 서비스들의 초기화를 관리하는 클래스"""
     
+    # 서버에 전달되는 서비스 키 (시작 그래프의 구성 요소 중 일부)
+    SERVICE_KEYS = ("redis_manager", "vector_db", "llm_client", "quiz_service", "proofreading_service")
+    
     def __init__(self):
         self.settings = get_settings()
         self.status = ServiceInitializationStatus()
         self.services: Dict[str, Any] = {}
+        self.startup_graph: Optional[StartupGraph] = None
     
     async def initialize_all_services(self) -> Dict[str, Any]:
-        """모든 서비스를 올바른 순서로 초기화"""
+        """
+        모든 서비스를 의존성 그래프 순서로 초기화
+        
+        서로 의존하지 않는 서비스(Redis, Vector DB, LLM Client)는 동시에 초기화하고,
+        STARTUP_BACKGROUND_WARMUP이면 GMS 연결 확인은 준비 완료 선언 후에도 계속 진행
+        """
         logger.info("🔧 Starting comprehensive service initialization...")
         
+        self.startup_graph = self._build_startup_graph()
         try:
-            # 1. 기본 서비스들 초기화 (병렬)
-            basic_services = await self._initialize_basic_services()
-            
-            # 2. LLM 기반 서비스들 초기화 (순차) - basic_services 전달
-            ai_services = await self._initialize_ai_services(
-                basic_services.get('llm_client'),
-                basic_services  # basic_services 전달
-            )
+            # 1. 시작 그래프 실행 (필수 및 전경 구성 요소 완료까지)
+            results = await self.startup_graph.run()
             
-            # 3. 모든 서비스 통합
-            all_services = {**basic_services, **ai_services}
+            # 2. 모든 서비스 통합 (웜업 중인 구성 요소는 서비스 키가 아님)
+            all_services = {name: results.get(name) for name in self.SERVICE_KEYS}
             self.services = all_services
             
-            # 4. 초기화 상태 로깅
+            # 3. 초기화 상태 로깅
             logger.info("📊 Service Initialization Summary:")
             logger.info(f"\n{self.status.get_status_summary()}")
             
-            # 5. 필수 서비스 확인
+            # 4. 필수 서비스 확인
             if not self.status.all_critical_services_ready:
                 raise CriticalServiceFailure("Critical services failed to initialize")
             
             logger.info("✅ All services initialized successfully")
             return all_services
             
+        except StartupFailure as e:
+            self.services = {name: self.startup_graph.results.get(name) for name in self.SERVICE_KEYS}
+            logger.error(f"❌ Service initialization failed: {e}")
+            logger.info(f"📊 Final Status:\n{self.status.get_status_summary()}")
+            raise CriticalServiceFailure(str(e)) from e
         except Exception as e:
             logger.error(f"❌ Service initialization failed: {e}")
             logger.info(f"📊 Final Status:\n{self.status.get_status_summary()}")
             raise
     
-    async def _initialize_basic_services(self) -> Dict[str, Any]:
-        """기본 서비스들을 병렬로 초기화"""
-        logger.info("🔧 Initializing basic services...")
-        
-        services = {}
+    def _build_startup_graph(self) -> StartupGraph:
+        """서비스 초기화 의존성 그래프 구성"""
+        graph = StartupGraph("service startup")
+        warm_in_background = self.settings.STARTUP_BACKGROUND_WARMUP
         
-        # Redis Manager 초기화 (선택적)
+        graph.add("redis_manager", self._start_redis_manager, critical=False)
+        graph.add("vector_db", self._start_vector_db)
+        graph.add("llm_client", self._start_llm_client)
+        graph.add("llm_probe", self._probe_llm_client, depends_on=["llm_client"],
+                  critical=False, background=warm_in_background)
+        graph.add("quiz_service", self._start_quiz_service,
+                  depends_on=["llm_client", "vector_db", "redis_manager"], critical=False)
+        graph.add("proofreading_service", self._start_proofreading_service,
+                  depends_on=["llm_client"], critical=False)
+        return graph
+    
+    async def _start_redis_manager(self, deps: Dict[str, Any]) -> Optional[RedisConnectionManager]:
+        """Redis Manager 초기화 (선택적)"""
         try:
             logger.info("🔗 Initializing Redis Connection Manager...")
             redis_manager = RedisConnectionManager()
             await redis_manager.initialize()
-            services['redis_manager'] = redis_manager
             self.status.redis_manager = True
             logger.info("✅ Redis Connection Manager initialized")
+            return redis_manager
         except Exception as e:
             logger.warning(f"⚠️ Redis Connection Manager failed: {e}")
             logger.info("💡 Continuing without Redis (chat history will be limited)")
-            services['redis_manager'] = None
             self.status.redis_manager = False
-        
-        # Vector DB Manager 초기화 (필수)
+            return None
+    
+    async def _start_vector_db(self, deps: Dict[str, Any]) -> VectorDBManager:
+        """Vector DB Manager 초기화 (필수) - Chroma 열기와 임베딩 모델 로드는 스레드에서 실행"""
         try:
             logger.info("🗄️ Initializing Vector DB Manager...")
             vector_db = VectorDBManager()
             await vector_db.initialize()
-            services['vector_db'] = vector_db
             self.status.vector_db = True
             logger.info("✅ Vector DB Manager initialized")
+            return vector_db
         except Exception as e:
             logger.error(f"❌ Vector DB Manager failed: {e}")
-            services['vector_db'] = None
             self.status.vector_db = False
             raise CriticalServiceFailure(f"Vector DB initialization failed: {e}")
-        
-        # LLM Client 초기화 (필수)
+    
+    async def _start_llm_client(self, deps: Dict[str, Any]) -> LLMClient:
+        """LLM Client 생성 (필수) - GMS 연결 확인은 llm_probe에서 진행"""
         try:
             logger.info("🤖 Initializing LLM Client...")
             llm_client = LLMClient()
-            await llm_client.initialize()
-            services['llm_client'] = llm_client
+            # 연결 확인 전까지는 API 키 설정 여부로 GMS 사용 (확인 실패 시 mock으로 전환)
+            llm_client.assume_configured()
             self.status.llm_client = True
             logger.info("✅ LLM Client initialized")
+            return llm_client
         except Exception as e:
             logger.error(f"❌ LLM Client failed: {e}")
-            services['llm_client'] = None
             self.status.llm_client = False
             raise CriticalServiceFailure(f"LLM Client initialization failed: {e}")
-        
-        return services
     
-    async def _initialize_ai_services(
-        self, 
-        llm_client: Optional[LLMClient],
-        basic_services: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
-        """LLM 기반 AI 서비스들을 초기화"""
-        logger.info("🧠 Initializing AI services...")
-        
-        services = {}
-        
-        if not llm_client:
-            logger.warning("⚠️ LLM Client not available, skipping AI services")
-            services['quiz_service'] = None
-            services['proofreading_service'] = None
-            return services
-        
-        # VectorDB 가져오기 (QuizService에서 필요) - basic_services에서 직접 가져오기
-        vector_db = basic_services.get('vector_db') if basic_services else None
+    async def _probe_llm_client(self, deps: Dict[str, Any]) -> bool:
+        """GMS 연결 확인 (선택적 - 실패 시 LLMClient가 mock 응답으로 전환)"""
+        llm_client = deps["llm_client"]
+        await llm_client.initialize()
+        return llm_client.gms_available
+    
+    async def _start_quiz_service(self, deps: Dict[str, Any]) -> Optional[QuizService]:
+        """Quiz Service 초기화 (LLM Client 재사용, VectorDB/Redis 주입)"""
+        llm_client = deps["llm_client"]
+        vector_db = deps.get("vector_db")
         
-        # Quiz Service 초기화
         try:
             logger.info("📝 Initializing Quiz Service...")
             quiz_service = QuizService()
@@ -196,17 +207,23 @@ class ServiceInitializer:
             quiz_service.vector_db = vector_db
             logger.info(f"📊 QuizService VectorDB injection: {'✅ Success' if vector_db else '❌ VectorDB not available'}")
             
+            # Redis 주입 (퀴즈 뱅크 저장소, 없으면 메모리 사용)
+            quiz_service.redis_manager = deps.get("redis_manager")
+            
             await quiz_service.initialize()
-            services['quiz_service'] = quiz_service
             self.status.quiz_service = True
             logger.info("✅ Quiz Service initialized")
+            return quiz_service
         except Exception as e:
             logger.warning(f"⚠️ Quiz Service failed: {e}")
             logger.info("💡 Quiz generation will use mock data")
-            services['quiz_service'] = None
             self.status.quiz_service = False
+            return None
+    
+    async def _start_proofreading_service(self, deps: Dict[str, Any]) -> Optional[ProofreadingService]:
+        """Proofreading Service 초기화 (LLM Client 재사용)"""
+        llm_client = deps["llm_client"]
         
-        # Proofreading Service 초기화
         try:
             logger.info("✏️ Initializing Proofreading Service...")
             proofreading_service = ProofreadingService()
@@ -216,16 +233,18 @@ class ServiceInitializer:
                 from src.services.llm_client import ProofreadingLLMClient
                 proofreading_service.proofreading_llm_client = ProofreadingLLMClient(llm_client)
             await proofreading_service.initialize()
-            services['proofreading_service'] = proofreading_service
             self.status.proofreading_service = True
             logger.info("✅ Proofreading Service initialized")
+            return proofreading_service
         except Exception as e:
             logger.warning(f"⚠️ Proofreading Service failed: {e}")
             logger.info("💡 Text proofreading will use mock data")
-            services['proofreading_service'] = None
             self.status.proofreading_service = False
-        
-        return services
+            return None
+    
+    def get_startup_timeline(self) -> Dict[str, Any]:
+        """구성 요소별 시작 타임라인 반환"""
+        return self.startup_graph.get_timeline() if self.startup_graph else {}
     
     def get_initialization_status(self) -> ServiceInitializationStatus:
         """현재 초기화 상태 반환"""
@@ -239,6 +258,17 @@ class ServiceInitializer:
         """서비스들 정리"""
         logger.info("🧹 Cleaning up services...")
         
+        # 웜업 중인 구성 요소 취소 (GMS 연결 확인 등)
+        if self.startup_graph:
+            await self.startup_graph.cancel_background()
+        
+        try:
+            if self.services.get('quiz_service'):
+                await self.services['quiz_service'].cleanup()
+                logger.info("✅ Quiz Service cleaned up")
+        except Exception as e:
+            logger.error(f"⚠️ Error cleaning up Quiz Service: {e}")
+        
         try:
             if self.services.get('vector_db'):
                 # VectorDB cleanup if available
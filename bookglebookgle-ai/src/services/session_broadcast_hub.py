@@ -0,0 +1,201 @@
+"""
+Session Broadcast Hub for BGBG AI Server
+Fan-out of AI moderator replies to every chat stream of a discussion session
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 구독 종료 표시 (스트림 종료 또는 느린 구독자 제거)
+_CLOSED = object()
+
+
+class BroadcastSubscriber:
+    """
+    세션 스트림 1개의 수신 큐
+    
+    큐가 가득 차면 (클라이언트가 응답을 읽지 못하면) 허브에서 제거되고 스트림이 종료됨
+    - 청크 일부만 건너뛰면 AI 응답이 깨지므로 메시지 단위가 아닌 구독자 단위로 버림
+    """
+    
+    def __init__(self, hub: "SessionBroadcastHub", subscriber_id: int, session_id: str, queue_size: int):
+        self.hub = hub
+        self.subscriber_id = subscriber_id
+        self.session_id = session_id
+        self.queue: "asyncio.Queue[Tuple[float, Any]]" = asyncio.Queue(maxsize=queue_size)
+        self.delivered = 0
+        self.closed = False
+        self.dropped = False
+    
+    def offer(self, payload: Any) -> bool:
+        """큐에 추가 (가득 차 있으면 False)"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait((time.monotonic(), payload))
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    def close(self, drain: bool = False):
+        """
+        구독 종료
+        
+        Args:
+            drain: True면 대기 중인 항목을 모두 전달한 뒤 종료 (클라이언트 입력 종료 시)
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if not drain or self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+        self.queue.put_nowait((time.monotonic(), _CLOSED))
+    
+    async def get(self) -> Optional[Any]:
+        """
+        다음 항목 대기 (전달 지연 시간 기록)
+        
+        Returns:
+            Optional[Any]: 다음 payload, 구독 종료 시 None
+        """
+        enqueued_at, payload = await self.queue.get()
+        if payload is _CLOSED:
+            return None
+        self.delivered += 1
+        self.hub.record_delivery(time.monotonic() - enqueued_at)
+        return payload
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> Any:
+        payload = await self.get()
+        if payload is None:
+            raise StopAsyncIteration
+        return payload
+
+
+class SessionBroadcastHub:
+    """
+    세션별 브로드캐스트 허브 (프로세스 로컬)
+    
+    - publish: 세션의 모든 구독자 큐에 추가, 가득 찬 구독자는 제거(스트림 종료 후 재연결 시 기록으로 동기화)
+    - send: 한 구독자에게만 전달 (보낸 사람에게만 가는 안내/오류)
+    - 발행 -> 스트림 전달 지연 시간(p50/p95/max) 집계
+    """
+    
+    def __init__(self, queue_size: int = 256, latency_window: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Dict[int, BroadcastSubscriber]] = {}
+        self._ids = itertools.count(1)
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self.stats = {
+            "published": 0,
+            "enqueued": 0,
+            "delivered": 0,
+            "dropped_subscribers": 0,
+            "latency_ms_total": 0.0,
+            "latency_ms_max": 0.0
+        }
+    
+    def subscribe(self, session_id: str) -> BroadcastSubscriber:
+        """세션 스트림 구독 등록"""
+        subscriber = BroadcastSubscriber(self, next(self._ids), session_id, self.queue_size)
+        self._subscribers.setdefault(session_id, {})[subscriber.subscriber_id] = subscriber
+        return subscriber
+    
+    def unsubscribe(self, subscriber: BroadcastSubscriber):
+        """구독 해제 (스트림 종료 시)"""
+        subscriber.close()
+        session_subscribers = self._subscribers.get(subscriber.session_id)
+        if session_subscribers is None:
+            return
+        session_subscribers.pop(subscriber.subscriber_id, None)
+        if not session_subscribers:
+            del self._subscribers[subscriber.session_id]
+    
+    def publish(self, session_id: str, payload: Any) -> int:
+        """
+        세션의 모든 구독자에게 전달
+        
+        Args:
+            session_id: 토론 세션 ID
+            payload: 전달할 항목
+        
+        Returns:
+            int: 큐에 추가된 구독자 수
+        """
+        self.stats["published"] += 1
+        enqueued = 0
+        for subscriber in list(self._subscribers.get(session_id, {}).values()):
+            if subscriber.offer(payload):
+                enqueued += 1
+            else:
+                self._drop(subscriber)
+        self.stats["enqueued"] += enqueued
+        return enqueued
+    
+    def send(self, subscriber: BroadcastSubscriber, payload: Any) -> bool:
+        """한 구독자에게만 전달"""
+        if subscriber.offer(payload):
+            self.stats["enqueued"] += 1
+            return True
+        self._drop(subscriber)
+        return False
+    
+    def close_session(self, session_id: str) -> int:
+        """세션의 모든 구독 종료"""
+        subscribers = list(self._subscribers.get(session_id, {}).values())
+        for subscriber in subscribers:
+            self.unsubscribe(subscriber)
+        return len(subscribers)
+    
+    def subscriber_count(self, session_id: str) -> int:
+        """세션 구독자 수"""
+        return len(self._subscribers.get(session_id, {}))
+    
+    def record_delivery(self, latency_seconds: float):
+        """발행 -> 구독자 수신 지연 시간 기록"""
+        latency_ms = latency_seconds * 1000
+        self._latencies.append(latency_ms)
+        self.stats["delivered"] += 1
+        self.stats["latency_ms_total"] += latency_ms
+        if latency_ms > self.stats["latency_ms_max"]:
+            self.stats["latency_ms_max"] = latency_ms
+    
+    def _drop(self, subscriber: BroadcastSubscriber):
+        if subscriber.closed:
+            return
+        subscriber.dropped = True
+        self.unsubscribe(subscriber)
+        self.stats["dropped_subscribers"] += 1
+        logger.warning(
+            f"🐢 Dropped slow chat stream subscriber {subscriber.subscriber_id} "
+            f"for session {subscriber.session_id} (queue full: {self.queue_size})"
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        브로드캐스트 통계
+        
+        Returns:
+            Dict[str, Any]: 발행/전달/제거 수 및 전달 지연 시간
+        """
+        delivered = self.stats["delivered"]
+        recent = sorted(self._latencies)
+        return {
+            **self.stats,
+            "sessions": len(self._subscribers),
+            "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "avg_latency_ms": self.stats["latency_ms_total"] / delivered if delivered else 0.0,
+            "p50_latency_ms": recent[len(recent) // 2] if recent else 0.0,
+            "p95_latency_ms": recent[min(int(len(recent) * 0.95), len(recent) - 1)] if recent else 0.0
+        }
@@ -7,17 +7,22 @@ PaddleOCR 전용 OCR 서비스 - LLM 후처리 없이 고성능 텍스트 추출
 import asyncio
 import time
 import traceback
-from typing import Dict, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 import psutil
 import os
 
-import fitz  # PyMuPDF
 from loguru import logger
 
 from src.models.ocr_models import (
     OCRBlock, ProcessedOCRBlock, ProcessingMetrics
 )
-from src.services.paddleocr_engine import PaddleOCREngine, PaddleOCRConfig
+from src.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from src.services.paddleocr_engine import PaddleOCRConfig
+
+# PaddleOCR 엔진 모듈은 서비스 생성 시 로드
+paddleocr_engine = lazy_import("src.services.paddleocr_engine")
 
 
 class SimplifiedOCRService:
@@ -28,7 +33,7 @@ class SimplifiedOCRService:
     
     def __init__(
         self,
-        paddleocr_config: Optional[PaddleOCRConfig] = None,
+        paddleocr_config: Optional["PaddleOCRConfig"] = None,
         enable_llm_postprocessing: bool = False  # 기본값을 False로 변경
     ):
         """
@@ -39,11 +44,11 @@ class SimplifiedOCRService:
             enable_llm_postprocessing: LLM 후처리 활성화 여부 (사용하지 않음)
         """
         # 설정 초기화
-        self.paddleocr_config = paddleocr_config or PaddleOCRConfig()
+        self.paddleocr_config = paddleocr_config or paddleocr_engine.PaddleOCRConfig()
         self.enable_llm_postprocessing = False  # 강제로 False로 설정
         
         # 엔진 초기화
-        self.ocr_engine = PaddleOCREngine(self.paddleocr_config)
+        self.ocr_engine = paddleocr_engine.PaddleOCREngine(self.paddleocr_config)
         
         # 성능 모니터링
         self.processing_stats = {
@@ -0,0 +1,301 @@
+"""
+Startup Graph for BGBG AI Server
+Dependency-graph service startup: independent initializers run concurrently with a per-component timeline
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+
+# 구성 요소 초기화 함수: 의존 구성 요소 결과(이름 -> 결과)를 받아 서비스 객체 반환
+StartupFn = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class StartupFailure(Exception):
+    """필수 구성 요소 시작 실패"""
+    pass
+
+
+@dataclass
+class StartupComponent:
+    """시작 그래프의 구성 요소"""
+    name: str
+    init: StartupFn
+    depends_on: Sequence[str] = ()
+    critical: bool = True
+    background: bool = False  # True면 준비 완료 선언을 기다리지 않음 (웜업)
+
+
+@dataclass
+class ComponentTiming:
+    """구성 요소별 시작 기록 (그래프 시작 시각 기준 ms)"""
+    name: str
+    critical: bool
+    background: bool
+    status: str = "pending"  # pending / running / ready / failed / skipped / cancelled
+    started_ms: Optional[float] = None
+    finished_ms: Optional[float] = None
+    error: Optional[str] = None
+    
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.started_ms is None or self.finished_ms is None:
+            return None
+        return self.finished_ms - self.started_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "critical": self.critical,
+            "background": self.background,
+            "started_ms": self.started_ms,
+            "finished_ms": self.finished_ms,
+            "duration_ms": self.duration_ms,
+            "error": self.error
+        }
+
+
+_STATUS_ICONS = {
+    "pending": "⏳",
+    "running": "🔥",
+    "ready": "✅",
+    "failed": "❌",
+    "skipped": "⏭️",
+    "cancelled": "🛑"
+}
+
+
+class StartupGraph:
+    """
+    의존성 그래프 기반 시작 오케스트레이터
+    
+    - 모든 구성 요소를 태스크로 동시에 시작하고, 각 구성 요소는 의존 구성 요소 완료를 기다린 뒤 초기화
+    - 실패한 필수 의존성이 있으면 건너뜀(skipped), 실패한 선택 의존성은 None으로 전달
+    - run()은 전경 구성 요소가 모두 끝나면 반환(준비 완료), background 구성 요소는 계속 웜업
+    - 블로킹 모델 로드는 초기화 함수에서 asyncio.to_thread로 실행해야 다른 구성 요소와 겹침
+    """
+    
+    def __init__(self, name: str = "startup"):
+        self.name = name
+        self._components: Dict[str, StartupComponent] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.timeline: Dict[str, ComponentTiming] = {}
+        self.results: Dict[str, Any] = {}
+        self._origin: Optional[float] = None
+        self.ready_ms: Optional[float] = None
+        self.settled_ms: Optional[float] = None
+    
+    def add(
+        self,
+        name: str,
+        init: StartupFn,
+        depends_on: Sequence[str] = (),
+        critical: bool = True,
+        background: bool = False
+    ):
+        """
+        구성 요소 등록
+        
+        Args:
+            name: 구성 요소 이름 (결과 키)
+            init: 초기화 함수 (의존 구성 요소 결과 dict를 받음)
+            depends_on: 먼저 완료되어야 하는 구성 요소 이름
+            critical: 실패 시 시작 실패로 처리할지 여부
+            background: 준비 완료 선언 후에도 계속 초기화할지 여부 (선택 구성 요소만)
+        
+        Raises:
+            ValueError: 이름 중복 또는 필수 background 구성 요소
+        """
+        if name in self._components:
+            raise ValueError(f"Duplicate startup component: {name}")
+        if critical and background:
+            raise ValueError(f"Critical startup component cannot warm in background: {name}")
+        self._components[name] = StartupComponent(name, init, tuple(depends_on), critical, background)
+    
+    def _validate(self):
+        for component in self._components.values():
+            for dependency in component.depends_on:
+                if dependency not in self._components:
+                    raise ValueError(f"Unknown dependency '{dependency}' for startup component '{component.name}'")
+        
+        # 순환 의존성 검사 (DFS)
+        visiting, visited = set(), set()
+        
+        def visit(name: str, path: List[str]):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dependency in self._components[name].depends_on:
+                visit(dependency, path + [name])
+            visiting.discard(name)
+            visited.add(name)
+        
+        for name in self._components:
+            visit(name, [])
+    
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
+    
+    async def _run_component(self, component: StartupComponent) -> Any:
+        timing = self.timeline[component.name]
+        
+        dependencies = {}
+        for dependency in component.depends_on:
+            # shield: 이 구성 요소가 취소되어도 공유 의존 태스크는 유지
+            result = await asyncio.shield(self._tasks[dependency])
+            dependency_status = self.timeline[dependency].status
+            if dependency_status != "ready" and self._components[dependency].critical:
+                timing.status = "skipped"
+                timing.error = f"dependency '{dependency}' {dependency_status}"
+                logger.warning(f"⏭️ Skipping {component.name}: {timing.error}")
+                self.results[component.name] = None
+                self._on_component_done(component)
+                return None
+            dependencies[dependency] = result
+        
+        timing.status = "running"
+        timing.started_ms = self._elapsed_ms()
+        result = None
+        try:
+            result = await component.init(dependencies)
+            timing.status = "ready"
+        except asyncio.CancelledError:
+            timing.status = "cancelled"
+            raise
+        except Exception as e:
+            timing.status = "failed"
+            timing.error = str(e)
+            if component.critical:
+                logger.error(f"❌ Startup component {component.name} failed: {e}")
+            else:
+                logger.warning(f"⚠️ Optional startup component {component.name} failed: {e}")
+        finally:
+            timing.finished_ms = self._elapsed_ms()
+        
+        self.results[component.name] = result
+        self._on_component_done(component)
+        return result
+    
+    def _on_component_done(self, component: StartupComponent):
+        if not component.background or self.ready_ms is None:
+            return
+        timing = self.timeline[component.name]
+        logger.info(
+            f"🔥 {component.name} finished warming after readiness: {timing.status} "
+            f"(+{timing.finished_ms or self._elapsed_ms():.0f}ms)"
+        )
+        if all(task.done() or name == component.name for name, task in self._tasks.items()):
+            self.settled_ms = self._elapsed_ms()
+            self.log_timeline(f"⏱️ {self.name} settled in {self.settled_ms:.0f}ms")
+    
+    async def run(self) -> Dict[str, Any]:
+        """
+        그래프 실행 - 전경 구성 요소가 모두 끝날 때까지 대기
+        
+        Returns:
+            Dict[str, Any]: 구성 요소 이름 -> 결과 (실패/건너뜀은 None, 웜업 중인 구성 요소는 포함되지 않음)
+        
+        Raises:
+            StartupFailure: 필수 구성 요소 실패 또는 건너뜀
+            ValueError: 알 수 없는 의존성 또는 순환 의존성
+        """
+        self._validate()
+        self._origin = time.perf_counter()
+        self.timeline = {
+            name: ComponentTiming(name, component.critical, component.background)
+            for name, component in self._components.items()
+        }
+        # 모든 태스크를 먼저 만든 뒤 실행되므로 의존 태스크 조회가 항상 가능
+        for name, component in self._components.items():
+            self._tasks[name] = asyncio.create_task(self._run_component(component), name=f"{self.name}:{name}")
+        
+        foreground = [self._tasks[name] for name, component in self._components.items() if not component.background]
+        await asyncio.gather(*foreground)
+        
+        self.ready_ms = self._elapsed_ms()
+        warming = self.warming_components()
+        if not warming:
+            self.settled_ms = self.ready_ms
+        self.log_timeline(
+            f"⏱️ {self.name} ready in {self.ready_ms:.0f}ms"
+            + (f" (warming: {', '.join(warming)})" if warming else "")
+        )
+        
+        failed = [
+            name for name, timing in self.timeline.items()
+            if timing.critical and timing.status != "ready"
+        ]
+        if failed:
+            raise StartupFailure(f"Critical startup components failed: {', '.join(failed)}")
+        
+        return dict(self.results)
+    
+    def warming_components(self) -> List[str]:
+        """아직 초기화 중인 background 구성 요소"""
+        return [name for name, task in self._tasks.items() if not task.done()]
+    
+    async def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """
+        background 구성 요소까지 모두 완료될 때까지 대기
+        
+        Returns:
+            bool: 제한 시간 내 모두 완료되었는지 여부
+        """
+        pending = [task for task in self._tasks.values() if not task.done()]
+        if not pending:
+            return True
+        done, still_pending = await asyncio.wait(pending, timeout=timeout)
+        return not still_pending
+    
+    async def cancel_background(self):
+        """웜업 중인 구성 요소 취소 (종료 시)"""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    def get_timeline(self) -> Dict[str, Any]:
+        """
+        시작 타임라인
+        
+        Returns:
+            Dict[str, Any]: 준비 완료/전체 완료 시각 및 구성 요소별 시작·종료·소요 시간(ms)
+        """
+        return {
+            "ready_ms": self.ready_ms,
+            "settled_ms": self.settled_ms,
+            "warming": self.warming_components(),
+            "components": [
+                timing.to_dict()
+                for timing in sorted(
+                    self.timeline.values(),
+                    key=lambda timing: timing.started_ms if timing.started_ms is not None else float("inf")
+                )
+            ]
+        }
+    
+    def log_timeline(self, title: str):
+        """구성 요소별 타임라인 로깅"""
+        lines = [title]
+        for entry in self.get_timeline()["components"]:
+            icon = _STATUS_ICONS.get(entry["status"], "•")
+            kind = "critical" if entry["critical"] else ("background" if entry["background"] else "optional")
+            if entry["started_ms"] is None:
+                span = "not started"
+            elif entry["finished_ms"] is None:
+                span = f"+{entry['started_ms']:.0f}ms -> ..."
+            else:
+                span = f"+{entry['started_ms']:.0f}ms -> +{entry['finished_ms']:.0f}ms ({entry['duration_ms']:.0f}ms)"
+            line = f"  {icon} {entry['name']:<22} {kind:<10} {span}"
+            if entry["error"]:
+                line += f" - {entry['error']}"
+            lines.append(line)
+        logger.info("\n".join(lines))
@@ -8,10 +8,15 @@ import io
 from typing import Dict, Any, List, Optional, AsyncIterator
 import grpc
 from loguru import logger
-import fitz
 
 from src.config.settings import get_settings
 from src.models.ocr_models import OCRBlock, ProcessedOCRBlock, ProcessingMetrics, BoundingBox
+from src.utils.cancellation import check_cancelled, clamp_timeout, record_work
+from src.utils.lazy_import import lazy_import
+from src.utils.tracing import inject_metadata, set_span_attributes, trace_span, traced
+
+# PyMuPDF는 첫 PDF 처리 시 로드
+fitz = lazy_import("fitz")
 
 
 # gRPC protobuf imports - try multiple paths
@@ -192,6 +197,7 @@ class TailscaleOCRClient:
         
         return pdf_bytes
 
+    @traced("ocr.process_pdf", {"ocr.backend": "tailscale"})
     async def process_pdf_stream(
         self, 
         pdf_stream: bytes, 
@@ -226,8 +232,11 @@ class TailscaleOCRClient:
             # 재시도 로직
             last_error = None
             for attempt in range(self.retry_attempts):
+                # 호출 측이 취소했거나 데드라인이 지났으면 재시도하지 않음
+                check_cancelled("ocr")
                 try:
                     result = await self._process_with_retry(pdf_stream, document_id, attempt)
+                    record_work("ocr_pages", result['total_pages'])
                     
                     processing_time = time.time() - start_time
                     self.stats['successful_requests'] += 1
@@ -236,6 +245,14 @@ class TailscaleOCRClient:
                     
                     pages_per_second = result['total_pages'] / processing_time if processing_time > 0 else 0
                     
+                    set_span_attributes({
+                        "document.id": document_id,
+                        "pdf.bytes": len(pdf_stream),
+                        "pdf.page_count": result['total_pages'],
+                        "ocr.block_count": len(result['ocr_blocks']),
+                        "ocr.attempts": attempt + 1
+                    })
+                    
                     logger.info(f"✅ Tailscale OCR processing completed:")
                     logger.info(f"   ⚡ Speed: {pages_per_second:.1f} pages/sec")
                     logger.info(f"   📊 Pages: {result['total_pages']}")
@@ -252,7 +269,7 @@ class TailscaleOCRClient:
                         wait_time = self.retry_delay * (attempt + 1)
                         logger.warning(f"⚠️ Tailscale OCR attempt {attempt + 1} failed: {e}")
                         logger.info(f"🔄 Retrying in {wait_time}s...")
-                        await asyncio.sleep(wait_time)
+                        await asyncio.sleep(clamp_timeout(wait_time, "ocr"))
                     else:
                         break
             
@@ -270,10 +287,9 @@ class TailscaleOCRClient:
             self.stats['failed_requests'] += 1
             raise
 
-    import fitz
-
     async def _process_with_retry(self, pdf_stream: bytes, document_id: str, attempt: int) -> Dict[str, Any]:
         """재시도 가능한 OCR 처리"""
+        page_count = None
         try:
             # 페이지 수에 따라 동적으로 타임아웃 계산
             pdf_doc = fitz.open(stream=pdf_stream, filetype="pdf")
@@ -291,6 +307,9 @@ class TailscaleOCRClient:
         except Exception as e:
             logger.warning(f"Could not determine page count from PDF stream: {e}. Falling back to default timeout.")
             current_timeout = self.timeout + (attempt * 10)
+        
+        # 호출 측 남은 시간을 gRPC 데드라인으로 전달 (로컬 OCR 서버도 데드라인에 취소됨)
+        current_timeout = clamp_timeout(current_timeout, "ocr")
 
         async def request_generator():
             # PDF 정보 전송
@@ -303,11 +322,20 @@ class TailscaleOCRClient:
                 yield ProcessPdfRequest(chunk=chunk)
         
         try:
-            # Tailscale OCR 서비스 호출
-            response = await asyncio.wait_for(
-                self.stub.ProcessPdf(request_generator()),
-                timeout=current_timeout
-            )
+            # Tailscale OCR 서비스 호출 (traceparent metadata로 로컬 OCR 서버에 trace 전파)
+            with trace_span("ocr.remote_call", {
+                "rpc.system": "grpc",
+                "rpc.method": "ProcessPdf",
+                "net.peer.name": f"{self.host}:{self.port}",
+                "ocr.attempt": attempt + 1,
+                "ocr.timeout_seconds": current_timeout,
+                "pdf.page_count": page_count
+            }, kind="client") as span:
+                response = await asyncio.wait_for(
+                    self.stub.ProcessPdf(request_generator(), timeout=current_timeout, metadata=inject_metadata()),
+                    timeout=current_timeout
+                )
+                span.set_attributes({"ocr.block_count": len(response.text_blocks), "ocr.success": response.success})
             
             if not response.success:
                 raise Exception(f"Tailscale OCR failed: {response.message}")
@@ -363,8 +391,10 @@ class TailscaleOCRClient:
             }
             
         except asyncio.TimeoutError:
-            raise Exception(f"Tailscale OCR timeout after {self.timeout + (attempt * 10)}s")
+            raise Exception(f"Tailscale OCR timeout after {current_timeout:.1f}s")
         except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise Exception(f"Tailscale OCR deadline exceeded after {current_timeout:.1f}s")
             if e.code() == grpc.StatusCode.UNAVAILABLE:
                 raise Exception(f"Tailscale OCR service unavailable: {e.details()}")
             else:
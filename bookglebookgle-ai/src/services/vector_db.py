@@ -9,13 +9,16 @@ import uuid
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
-import chromadb
-from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
-import numpy as np
 from loguru import logger
 
 from src.config.settings import get_settings
+from src.services.embedding_backend import EmbeddingBackend, get_shared_embedding_backend
+from src.utils.cancellation import check_cancelled, record_work
+from src.utils.lazy_import import lazy_import
+from src.utils.tracing import set_span_attributes, trace_span, traced
+
+# chromadb는 initialize() 시점에 로드 (import만으로도 무거움)
+chromadb = lazy_import("chromadb")
 
 
 class VectorDBManager:
@@ -23,20 +26,24 @@ class VectorDBManager:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client: Optional[chromadb.Client] = None
-        self.embedding_model: Optional[SentenceTransformer] = None
-        self.collections: Dict[str, chromadb.Collection] = {}
+        self.client: Optional["chromadb.Client"] = None
+        self.embedding_model: Optional[EmbeddingBackend] = None
+        self.collections: Dict[str, "chromadb.Collection"] = {}
         
     async def initialize(self):
         """Initialize vector database and embedding model"""
         try:
             logger.info("Initializing Vector Database Manager...")
             
+            from chromadb.config import Settings
+            
             # Initialize ChromaDB client
             persist_dir = Path(self.settings.vector_db.CHROMA_PERSIST_DIRECTORY)
             persist_dir.mkdir(parents=True, exist_ok=True)
             
-            self.client = chromadb.PersistentClient(
+            # 블로킹 초기화는 스레드에서 실행 (시작 시 다른 서비스 초기화와 겹치도록)
+            self.client = await asyncio.to_thread(
+                chromadb.PersistentClient,
                 path=str(persist_dir),
                 settings=Settings(
                     anonymized_telemetry=False,
@@ -44,8 +51,12 @@ class VectorDBManager:
                 )
             )
             
-            # Initialize embedding model
-            await self._initialize_embedding_model()
+            # Initialize embedding model (EMBEDDING_PRELOAD=false면 첫 임베딩 시 로드)
+            if self.settings.vector_db.EMBEDDING_PRELOAD:
+                await self._initialize_embedding_model()
+            else:
+                self.embedding_model = get_shared_embedding_backend()
+                logger.info(f"Embedding model load deferred until first use: {self.embedding_model.model_name}")
             
             # Create default collections
             await self._create_default_collections()
@@ -59,13 +70,10 @@ class VectorDBManager:
     async def _initialize_embedding_model(self):
         """Initialize sentence transformer model for embeddings"""
         try:
-            logger.info("Loading embedding model...")
-            
-            # Use multilingual model for Korean support
-            model_name = "paraphrase-multilingual-MiniLM-L12-v2"
-            self.embedding_model = SentenceTransformer(model_name)
-            
-            logger.info(f"Embedding model loaded: {model_name}")
+            # Use multilingual model for Korean support (EmbeddingBackend 기본 모델)
+            if self.embedding_model is None:
+                self.embedding_model = get_shared_embedding_backend()
+            await self.embedding_model.ensure_loaded()
             
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
@@ -92,7 +100,7 @@ class VectorDBManager:
             except Exception as e:
                 logger.error(f"Failed to create collection '{collection_name}': {e}")
     
-    async def get_bookclub_collection(self, meeting_id: str) -> chromadb.Collection:
+    async def get_bookclub_collection(self, meeting_id: str) -> "chromadb.Collection":
         """
         Get or create book club specific collection
         독서 모임별 전용 컬렉션 반환 (docs/toron.md 요구사항)
@@ -125,6 +133,7 @@ class VectorDBManager:
             logger.error(f"Failed to get book club collection for {meeting_id}: {e}")
             raise
 
+    @traced("vector_db.process_bookclub_document")
     async def process_bookclub_document(
         self, 
         meeting_id: str, 
@@ -154,8 +163,12 @@ class VectorDBManager:
             # Get book club specific collection
             collection = await self.get_bookclub_collection(meeting_id)
             
+            set_span_attributes({"document.id": document_id, "meeting.id": meeting_id, "text.length": len(text)})
+            
             # 1. 일반 청크 생성
-            chunks = await self._chunk_document(text)
+            with trace_span("vector_db.chunk", {"text.length": len(text)}) as span:
+                chunks = await self._chunk_document(text)
+                span.set_attribute("chunk_count", len(chunks))
             
             chunk_ids = []
             documents = []
@@ -163,94 +176,107 @@ class VectorDBManager:
             metadatas = []
             
             # Initialize embedding model if needed
-            if self.embedding_model is None:
+            if self.embedding_model is None or not self.embedding_model.loaded:
                 await self._initialize_embedding_model()
             
-            # 2. 일반 청크 처리
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"{meeting_id}_{document_id}_{section or 'main'}_{i}"
-                chunk_ids.append(chunk_id)
-                documents.append(chunk)
+            # 일반 청크 + 진도율 청크(50%, 100%) 임베딩
+            with trace_span("vector_db.embed", {
+                "chunk_count": len(chunks) + 2,
+                "embedding.model": self.embedding_model.model_name
+            }):
+                # 2. 일반 청크 처리
+                # 임베딩/저장은 스레드에서 실행 (이벤트 루프를 점유하면 gRPC 요청과 ingest 하트비트가 멈춤)
+                for i, chunk in enumerate(chunks):
+                    check_cancelled("embedding")
+                    chunk_id = f"{meeting_id}_{document_id}_{section or 'main'}_{i}"
+                    chunk_ids.append(chunk_id)
+                    documents.append(chunk)
+                    
+                    embedding = (await asyncio.to_thread(self.embedding_model.encode, chunk)).tolist()
+                    embeddings.append(embedding)
+                    record_work("embeddings")
+                    
+                    # Prepare metadata for regular chunks
+                    chunk_metadata = {
+                        "document_id": document_id,
+                        "meeting_id": meeting_id,
+                        "section": section or "main",
+                        "chunk_index": i,
+                        "chunk_length": len(chunk),
+                        "chunk_type": "regular",
+                        "text_hash": hashlib.md5(chunk.encode()).hexdigest(),
+                        "timestamp": asyncio.get_event_loop().time()
+                    }
+                    
+                    # Merge with additional metadata
+                    if metadata:
+                        chunk_metadata.update(metadata)
+                    
+                    metadatas.append(chunk_metadata)
                 
-                embedding = self.embedding_model.encode(chunk).tolist()
-                embeddings.append(embedding)
+                # 3. 진도율 기반 청크 생성 (50%, 100%)
+                total_pages = metadata.get("total_pages", 1) if metadata else 1
                 
-                # Prepare metadata for regular chunks
-                chunk_metadata = {
+                # 50% 진도율 청크
+                half_length = len(text) // 2
+                half_text = text[:half_length]
+                
+                half_chunk_id = f"{meeting_id}_{document_id}_progress_50"
+                chunk_ids.append(half_chunk_id)
+                documents.append(half_text)
+                
+                half_embedding = (await asyncio.to_thread(self.embedding_model.encode, half_text)).tolist()
+                embeddings.append(half_embedding)
+                
+                half_metadata = {
                     "document_id": document_id,
                     "meeting_id": meeting_id,
-                    "section": section or "main",
-                    "chunk_index": i,
-                    "chunk_length": len(chunk),
-                    "chunk_type": "regular",
-                    "text_hash": hashlib.md5(chunk.encode()).hexdigest(),
+                    "chunk_type": "progress",
+                    "progress_percentage": 50,
+                    "text_length": len(half_text),
+                    "total_pages": total_pages,
+                    "pages_included": max(1, total_pages // 2),
                     "timestamp": asyncio.get_event_loop().time()
                 }
-                
-                # Merge with additional metadata
                 if metadata:
-                    chunk_metadata.update(metadata)
+                    half_metadata.update({k: v for k, v in metadata.items() if k not in ["total_pages"]})
+                metadatas.append(half_metadata)
                 
-                metadatas.append(chunk_metadata)
-            
-            # 3. 진도율 기반 청크 생성 (50%, 100%)
-            total_pages = metadata.get("total_pages", 1) if metadata else 1
-            
-            # 50% 진도율 청크
-            half_length = len(text) // 2
-            half_text = text[:half_length]
-            
-            half_chunk_id = f"{meeting_id}_{document_id}_progress_50"
-            chunk_ids.append(half_chunk_id)
-            documents.append(half_text)
-            
-            half_embedding = self.embedding_model.encode(half_text).tolist()
-            embeddings.append(half_embedding)
-            
-            half_metadata = {
-                "document_id": document_id,
-                "meeting_id": meeting_id,
-                "chunk_type": "progress",
-                "progress_percentage": 50,
-                "text_length": len(half_text),
-                "total_pages": total_pages,
-                "pages_included": max(1, total_pages // 2),
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            if metadata:
-                half_metadata.update({k: v for k, v in metadata.items() if k not in ["total_pages"]})
-            metadatas.append(half_metadata)
-            
-            # 100% 진도율 청크 (전체 문서)
-            full_chunk_id = f"{meeting_id}_{document_id}_progress_100"
-            chunk_ids.append(full_chunk_id)
-            documents.append(text)
-            
-            full_embedding = self.embedding_model.encode(text).tolist()
-            embeddings.append(full_embedding)
-            
-            full_metadata = {
-                "document_id": document_id,
-                "meeting_id": meeting_id,
-                "chunk_type": "progress",
-                "progress_percentage": 100,
-                "text_length": len(text),
-                "total_pages": total_pages,
-                "pages_included": total_pages,
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            if metadata:
-                full_metadata.update({k: v for k, v in metadata.items() if k not in ["total_pages"]})
-            metadatas.append(full_metadata)
-            
-            # Store in book club specific collection
-            collection.upsert(
-                ids=chunk_ids,
-                documents=documents,
-                embeddings=embeddings,
-                metadatas=metadatas
-            )
+                # 100% 진도율 청크 (전체 문서)
+                full_chunk_id = f"{meeting_id}_{document_id}_progress_100"
+                chunk_ids.append(full_chunk_id)
+                documents.append(text)
+                
+                full_embedding = (await asyncio.to_thread(self.embedding_model.encode, text)).tolist()
+                embeddings.append(full_embedding)
+                
+                full_metadata = {
+                    "document_id": document_id,
+                    "meeting_id": meeting_id,
+                    "chunk_type": "progress",
+                    "progress_percentage": 100,
+                    "text_length": len(text),
+                    "total_pages": total_pages,
+                    "pages_included": total_pages,
+                    "timestamp": asyncio.get_event_loop().time()
+                }
+                if metadata:
+                    full_metadata.update({k: v for k, v in metadata.items() if k not in ["total_pages"]})
+                metadatas.append(full_metadata)
+            
+            # Store in book club specific collection (호출 측이 떠났으면 저장하지 않음)
+            check_cancelled("upsert")
+            with trace_span("vector_db.upsert", {"chunk_count": len(chunk_ids), "collection": collection.name}):
+                await asyncio.to_thread(
+                    collection.upsert,
+                    ids=chunk_ids,
+                    documents=documents,
+                    embeddings=embeddings,
+                    metadatas=metadatas
+                )
+            record_work("upserted_chunks", len(chunk_ids))
             
+            set_span_attributes({"chunk_count": len(chunk_ids)})
             logger.info(f"Stored {len(chunks)} chunks for book club document {document_id}")
             return chunk_ids
             
@@ -452,7 +478,7 @@ class VectorDBManager:
                 documents.append(chunk_text)
                 
                 # Generate embedding
-                if self.embedding_model is None:
+                if self.embedding_model is None or not self.embedding_model.loaded:
                     await self._initialize_embedding_model()
                 
                 embedding = self.embedding_model.encode(chunk_text).tolist()
@@ -0,0 +1,294 @@
+"""
+Cooperative cancellation and deadline propagation for BGBG AI Server
+Binds the caller's gRPC deadline/cancellation to the handling task so OCR, LLM and vector DB
+work can stop early, and counts the work wasted on abandoned RPCs
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import grpc
+from loguru import logger
+
+from src.config.settings import get_settings
+
+
+class RequestAbandonedError(asyncio.CancelledError):
+    """
+    호출 측 데드라인 경과 또는 취소로 더 진행할 필요가 없는 작업
+
+    asyncio.CancelledError 하위 클래스이므로 서비스의 except Exception 폴백/재시도 경로에
+    잡히지 않고 핸들러까지 그대로 전파됨
+    """
+
+    def __init__(self, method: str, stage: str, reason: str):
+        super().__init__(f"{method} abandoned during {stage}: {reason}")
+        self.method = method
+        self.stage = stage
+        self.reason = reason
+
+
+class RpcScope:
+    """
+    RPC 하나의 데드라인/취소 상태와 수행한 작업량
+
+    - deadline은 time.monotonic() 기준 (호출 측이 데드라인을 보내지 않으면 None)
+    - 취소 플래그는 threading.Event라 asyncio.to_thread 작업에서도 확인 가능
+    - 핸들러가 정상 종료된 뒤에는 check()가 아무것도 하지 않음
+    - on_work가 있으면 작업량 기록마다 호출 (ingest job 진행률 등)
+    """
+
+    def __init__(
+        self,
+        method: str,
+        deadline: Optional[float],
+        on_work: Optional[Callable[[str, int], None]] = None
+    ):
+        self.method = method
+        self.deadline = deadline
+        self.on_work = on_work
+        self.started_at = time.monotonic()
+        self.work: Dict[str, int] = {}
+        self.reason: Optional[str] = None
+        self.finished = False
+        self._abandoned = threading.Event()
+
+    def remaining(self) -> Optional[float]:
+        """데드라인까지 남은 시간 (초, 데드라인이 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def abandon(self, reason: str):
+        if not self._abandoned.is_set():
+            self.reason = reason
+            self._abandoned.set()
+
+    def mark_cancelled(self):
+        """grpc.aio가 RPC를 취소한 경우 (데드라인 시각에도 취소로 전달되므로 약간의 오차 허용)"""
+        remaining = self.remaining()
+        self.abandon("deadline_exceeded" if remaining is not None and remaining <= 0.05 else "cancelled")
+
+    @property
+    def abandoned(self) -> bool:
+        if self.finished:
+            return False
+        if self._abandoned.is_set():
+            return True
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            self.abandon("deadline_exceeded")
+            return True
+        return False
+
+    def check(self, stage: str):
+        if self.abandoned:
+            raise RequestAbandonedError(self.method, stage, self.reason)
+
+    def record_work(self, kind: str, amount: int = 1):
+        self.work[kind] = self.work.get(kind, 0) + amount
+        if self.on_work:
+            self.on_work(kind, amount)
+
+
+_current_scope: ContextVar[Optional[RpcScope]] = ContextVar("bgbg_rpc_scope", default=None)
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Any] = {
+    "scoped_rpcs": 0,
+    "abandoned_rpcs": 0,
+    "deadline_exceeded": 0,
+    "cancelled": 0,
+    "stopped_early": 0,  # 서비스 내부 check에서 먼저 중단한 경우
+    "wasted_seconds": 0.0,
+    "wasted_work": {},
+    "abandoned_by_method": {}
+}
+
+
+def current_scope() -> Optional[RpcScope]:
+    return _current_scope.get()
+
+
+def detach_scope():
+    """
+    현재 태스크를 RPC 범위에서 분리
+
+    RPC 처리 중 생성되어 RPC보다 오래 사는 백그라운드 워커(퀴즈 뱅크 등)는 컨텍스트를 복사해
+    호출 측 데드라인을 물려받으므로 시작 시 호출
+    """
+    _current_scope.set(None)
+
+
+def remaining_time() -> Optional[float]:
+    """호출 측 데드라인까지 남은 시간 (RPC 범위 밖이거나 데드라인이 없으면 None)"""
+    scope = _current_scope.get()
+    return scope.remaining() if scope else None
+
+
+def check_cancelled(stage: str):
+    """
+    호출 측이 취소했거나 데드라인이 지났으면 중단
+
+    Raises:
+        RequestAbandonedError: RPC가 이미 포기된 경우
+    """
+    scope = _current_scope.get()
+    if scope:
+        scope.check(stage)
+
+
+def clamp_timeout(timeout: float, stage: str) -> float:
+    """
+    하위 호출 타임아웃을 호출 측 남은 시간으로 제한 (응답 조립용 여유 시간 제외)
+
+    Args:
+        timeout: 서비스 기본 타임아웃 (초)
+        stage: 중단 시 기록할 단계 이름
+
+    Returns:
+        float: min(timeout, 남은 시간 - 여유 시간)
+
+    Raises:
+        RequestAbandonedError: 남은 시간이 없는 경우
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return timeout
+    scope.check(stage)
+    remaining = scope.remaining()
+    if remaining is None:
+        return timeout
+    budget = remaining - get_settings().RPC_DEADLINE_MARGIN_SECONDS
+    if budget <= 0:
+        scope.abandon("deadline_exceeded")
+        scope.check(stage)
+    return min(timeout, budget)
+
+
+def abandon_budget(stage: str):
+    """
+    clamp_timeout으로 줄인 타임아웃이 먼저 끝난 경우 호출 (하위 서비스 장애가 아닌 호출 측 예산 소진)
+
+    여유 시간이 남아 있어도 응답을 기다릴 수 없으므로 RPC를 포기된 것으로 표시하고 중단
+
+    Args:
+        stage: 중단 시 기록할 단계 이름
+
+    Raises:
+        RequestAbandonedError: RPC 범위 안에서 호출된 경우 항상
+    """
+    scope = _current_scope.get()
+    if scope is None or scope.finished:
+        return
+    scope.abandon("deadline_exceeded")
+    raise RequestAbandonedError(scope.method, stage, scope.reason)
+
+
+def record_work(kind: str, amount: int = 1):
+    """
+    RPC 범위에서 완료한 작업량 기록 (RPC가 포기되면 낭비된 작업으로 집계)
+
+    Args:
+        kind: 작업 종류 (ocr_pages, llm_calls, embeddings, upserted_chunks 등)
+        amount: 작업량
+    """
+    scope = _current_scope.get()
+    if scope and not scope.finished:
+        scope.record_work(kind, amount)
+
+
+def _record_abandoned(scope: RpcScope, stopped_early: bool):
+    elapsed = time.monotonic() - scope.started_at
+    with _stats_lock:
+        _stats["abandoned_rpcs"] += 1
+        if scope.reason == "deadline_exceeded":
+            _stats["deadline_exceeded"] += 1
+        else:
+            _stats["cancelled"] += 1
+        if stopped_early:
+            _stats["stopped_early"] += 1
+        _stats["wasted_seconds"] += elapsed
+        for kind, amount in scope.work.items():
+            _stats["wasted_work"][kind] = _stats["wasted_work"].get(kind, 0) + amount
+        by_method = _stats["abandoned_by_method"]
+        by_method[scope.method] = by_method.get(scope.method, 0) + 1
+
+    work = ", ".join(f"{kind}={amount}" for kind, amount in scope.work.items()) or "none"
+    logger.warning(f"🛑 {scope.method} abandoned ({scope.reason}) after {elapsed:.1f}s - wasted work: {work}")
+
+
+def cancellable_rpc(method: str) -> Callable:
+    """
+    서비서 핸들러(self, request, context)를 호출 측 데드라인/취소에 바인딩하는 데코레이터
+
+    - context.time_remaining()으로 데드라인을 잡고 하위 서비스는 check_cancelled()/clamp_timeout()으로 확인
+    - 호출 측 취소/데드라인 시 grpc.aio가 핸들러 태스크를 취소하면 낭비된 작업을 집계하고 전파
+    - 서비스 내부 확인에서 먼저 중단되면 DEADLINE_EXCEEDED/CANCELLED로 응답
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, request, context):
+            remaining = context.time_remaining()
+            scope = RpcScope(method, time.monotonic() + remaining if remaining is not None else None)
+            # 클라이언트 취소 즉시 플래그 설정 (스레드에서 실행 중인 작업도 확인 가능)
+            context.add_done_callback(lambda _: context.cancelled() and scope.mark_cancelled())
+            token = _current_scope.set(scope)
+            with _stats_lock:
+                _stats["scoped_rpcs"] += 1
+            try:
+                return await func(self, request, context)
+            except RequestAbandonedError as e:
+                _record_abandoned(scope, stopped_early=True)
+                code = grpc.StatusCode.DEADLINE_EXCEEDED if e.reason == "deadline_exceeded" else grpc.StatusCode.CANCELLED
+                await context.abort(code, str(e))
+            except asyncio.CancelledError:
+                scope.mark_cancelled()
+                _record_abandoned(scope, stopped_early=False)
+                raise
+            finally:
+                scope.finished = True
+                _current_scope.reset(token)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def bind_scope(scope: RpcScope) -> Iterator[RpcScope]:
+    """
+    RPC 밖에서 실행되는 작업(ingest job 등)을 scope에 바인딩
+
+    하위 서비스의 check_cancelled()/clamp_timeout()/record_work()가 RPC와 같은 방식으로 동작하며,
+    중단되면 낭비된 작업으로 집계
+    """
+    token = _current_scope.set(scope)
+    with _stats_lock:
+        _stats["scoped_rpcs"] += 1
+    try:
+        yield scope
+    except RequestAbandonedError:
+        _record_abandoned(scope, stopped_early=True)
+        raise
+    except asyncio.CancelledError:
+        scope.mark_cancelled()
+        _record_abandoned(scope, stopped_early=False)
+        raise
+    finally:
+        scope.finished = True
+        _current_scope.reset(token)
+
+
+def get_cancellation_stats() -> Dict[str, Any]:
+    """포기된 RPC 수와 낭비된 작업량"""
+    with _stats_lock:
+        return {
+            **_stats,
+            "wasted_seconds": round(_stats["wasted_seconds"], 3),
+            "wasted_work": dict(_stats["wasted_work"]),
+            "abandoned_by_method": dict(_stats["abandoned_by_method"])
+        }
@@ -0,0 +1,90 @@
+"""
+Lazy import helpers for BGBG AI Server
+Defers heavy optional modules (OCR stack, embedding backend) until first attribute access
+"""
+
+import importlib
+import threading
+import time
+import types
+from typing import Any, Dict
+
+from loguru import logger
+
+
+# 모듈 이름 -> 실제 로드 소요 시간(ms), 로드된 모듈만 기록
+_load_times: Dict[str, float] = {}
+_registered: Dict[str, "LazyModule"] = {}
+_lock = threading.RLock()
+
+
+class LazyModule(types.ModuleType):
+    """
+    첫 속성 접근 시 실제 모듈을 import하는 모듈 대리 객체
+
+    - `np = lazy_import("numpy")`처럼 모듈 최상단 import를 대체
+    - 함수 시그니처의 타입 힌트에서 속성을 참조하면 정의 시점에 로드되므로 문자열 힌트를 사용해야 함
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+
+        with _lock:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                started_at = time.perf_counter()
+                module = importlib.import_module(self.__name__)
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                _load_times[self.__name__] = elapsed_ms
+                self.__dict__["_lazy_module"] = module
+                logger.info(f"📦 Lazy-loaded {self.__name__} ({elapsed_ms:.0f}ms)")
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    지연 로드 모듈 반환 (같은 이름은 같은 대리 객체 공유)
+
+    Args:
+        name: 모듈 전체 이름 (예: "cv2", "PIL.Image")
+
+    Returns:
+        LazyModule: 첫 속성 접근 시 로드되는 모듈 대리 객체
+    """
+    with _lock:
+        module = _registered.get(name)
+        if module is None:
+            module = LazyModule(name)
+            _registered[name] = module
+        return module
+
+
+def get_lazy_import_stats() -> Dict[str, Any]:
+    """
+    지연 로드 현황
+
+    Returns:
+        Dict[str, Any]: 등록/로드된 모듈 및 모듈별 로드 시간(ms)
+    """
+    with _lock:
+        return {
+            "registered": sorted(_registered),
+            "loaded": sorted(name for name, module in _registered.items() if module.is_loaded),
+            "load_ms": dict(_load_times)
+        }
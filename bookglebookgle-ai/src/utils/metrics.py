@@ -0,0 +1,146 @@
+"""
+Prometheus metrics helpers for BGBG AI Server
+Starts the /metrics HTTP endpoint scraped by prometheus/prometheus.yml
+and exports existing service stats dicts as gauges
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.config.settings import get_settings
+
+try:
+    from prometheus_client import REGISTRY, start_http_server
+    from prometheus_client.core import GaugeMetricFamily
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # prometheus_client 미설치 시 메트릭 비활성화
+    start_http_server = None
+    PROMETHEUS_AVAILABLE = False
+
+
+_metrics_server_started = False
+
+# 컴포넌트당 최대 stat 라벨 수 (세션/미팅 ID 키 dict가 섞여도 시계열 수가 무한히 늘지 않도록)
+MAX_STATS_PER_COMPONENT = 200
+
+
+def _flatten_stats(stats: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """중첩 통계 dict에서 숫자 값만 (키 경로, 값)으로 펼침 (bool은 0/1)"""
+    for key, value in stats.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, bool):
+            yield name, float(value)
+        elif isinstance(value, (int, float)):
+            yield name, float(value)
+        elif isinstance(value, dict):
+            yield from _flatten_stats(value, f"{name}.")
+
+
+class ServiceStatsCollector:
+    """
+    서비스 통계 dict를 스크레이프 시점에 읽어 bgbg_service_stat{component, stat} 게이지로 노출
+
+    - 동기 getter만 등록 (스크레이프는 메트릭 HTTP 서버 스레드에서 실행)
+    - getter는 집계 값만 반환해야 함 (ID별 항목은 stat 라벨이 되어 시계열 수가 무한히 늘어남)
+    - 컴포넌트당 MAX_STATS_PER_COMPONENT개를 넘는 stat은 버리고 한 번 경고
+    - getter 실패(dict 변경 중 순회 등)는 해당 스크레이프에서만 건너뜀
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._truncated: Set[str] = set()
+
+    def register(self, component: str, getter: Callable[[], Dict[str, Any]]):
+        with self._lock:
+            self._sources[component] = getter
+
+    def unregister(self, component: str):
+        with self._lock:
+            self._sources.pop(component, None)
+
+    def collect(self):
+        family = GaugeMetricFamily(
+            "bgbg_service_stat",
+            "Numeric values from in-process service stats dicts (OCR client, caches, broadcast hub, LLM usage)",
+            labels=["component", "stat"]
+        )
+        with self._lock:
+            sources = list(self._sources.items())
+        for component, getter in sources:
+            try:
+                stats = getter()
+            except Exception as e:
+                logger.debug(f"Skipping stats for {component} in this scrape: {e}")
+                continue
+            for index, (stat, value) in enumerate(_flatten_stats(stats or {})):
+                if index >= MAX_STATS_PER_COMPONENT:
+                    if component not in self._truncated:
+                        self._truncated.add(component)
+                        logger.warning(f"⚠️ Stats for {component} exceed {MAX_STATS_PER_COMPONENT} series - "
+                                       f"extra values dropped (getter should return aggregate counters only)")
+                    break
+                family.add_metric([component, stat], value)
+        yield family
+
+
+_stats_collector: Optional[ServiceStatsCollector] = None
+
+
+def register_stats_collector(component: str, getter: Callable[[], Dict[str, Any]]) -> bool:
+    """
+    서비스 통계 getter 등록 (같은 component는 교체)
+
+    Args:
+        component: 메트릭 라벨 값 (예: "ocr_client")
+        getter: 통계 dict를 반환하는 동기 함수
+
+    Returns:
+        bool: 등록 여부 (prometheus_client 미설치 시 False)
+    """
+    global _stats_collector
+
+    if not PROMETHEUS_AVAILABLE:
+        return False
+    if _stats_collector is None:
+        _stats_collector = ServiceStatsCollector()
+        REGISTRY.register(_stats_collector)
+    _stats_collector.register(component, getter)
+    return True
+
+
+def start_metrics_server(port: Optional[int] = None) -> bool:
+    """
+    Start Prometheus metrics HTTP server on PROMETHEUS_PORT
+
+    Args:
+        port: Override port (per-worker port in multi-process mode)
+
+    Returns:
+        bool: True if the endpoint is serving
+    """
+    global _metrics_server_started
+
+    settings = get_settings()
+    if not settings.ENABLE_METRICS:
+        logger.info("📉 Metrics disabled (ENABLE_METRICS=false)")
+        return False
+
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("⚠️ prometheus_client not installed - metrics endpoint disabled")
+        return False
+
+    if _metrics_server_started:
+        return True
+
+    port = port or settings.PROMETHEUS_PORT
+    try:
+        start_http_server(port, addr=settings.SERVER_HOST)
+        _metrics_server_started = True
+        logger.info(f"📈 Prometheus metrics available at http://{settings.SERVER_HOST}:{port}/metrics")
+        return True
+    except OSError as e:
+        logger.error(f"❌ Failed to start metrics server on port {port}: {e}")
+        return False
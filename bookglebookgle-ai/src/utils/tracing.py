@@ -0,0 +1,296 @@
+"""
+OpenTelemetry tracing helpers for BGBG AI Server
+Offline span export (console / OTLP JSON lines file / OTLP gRPC) and W3C trace context
+propagation over gRPC metadata
+"""
+
+import base64
+import functools
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from src.config.settings import get_settings
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind
+    OTEL_AVAILABLE = True
+except ImportError:  # opentelemetry 미설치 시 트레이싱 비활성화 (no-op span)
+    OTEL_AVAILABLE = False
+
+try:
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor, ConsoleSpanExporter, SpanExporter, SpanExportResult
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    OTEL_SDK_AVAILABLE = True
+except ImportError:
+    SpanExporter = object
+    OTEL_SDK_AVAILABLE = False
+
+
+TRACER_NAME = "bgbg-ai"
+
+_tracer_provider = None
+_tracing_enabled = False
+
+
+class _NoopSpan:
+    """트레이싱 비활성화 시 사용하는 span (속성 기록 무시)"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def record_exception(self, exception: BaseException, **kwargs):
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _hex_ids(value: Any) -> Any:
+    """protobuf JSON의 base64 traceId/spanId를 OTLP JSON 규격(hex)으로 변환"""
+    if isinstance(value, dict):
+        converted = {}
+        for key, item in value.items():
+            if key in ("traceId", "spanId", "parentSpanId") and isinstance(item, str):
+                converted[key] = base64.b64decode(item).hex()
+            else:
+                converted[key] = _hex_ids(item)
+        return converted
+    if isinstance(value, list):
+        return [_hex_ids(item) for item in value]
+    return value
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    """
+    OTLP JSON lines 파일 exporter (수집기 없이 오프라인 기록)
+
+    배치마다 ExportTraceServiceRequest 한 줄을 추가 - OpenTelemetry Collector의
+    otlpjsonfile receiver나 jq로 그대로 읽을 수 있음
+    """
+
+    def __init__(self, file_path: str):
+        from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+        from google.protobuf.json_format import MessageToDict
+
+        self._encode_spans = encode_spans
+        self._message_to_dict = MessageToDict
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.file_path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any]) -> "SpanExportResult":
+        try:
+            payload = _hex_ids(self._message_to_dict(self._encode_spans(spans)))
+            line = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            with self._lock:
+                self._file.write(line + "\n")
+                self._file.flush()
+            return SpanExportResult.SUCCESS
+        except Exception as e:
+            logger.warning(f"⚠️ Trace export to {self.file_path} failed: {e}")
+            return SpanExportResult.FAILURE
+
+    def shutdown(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def _create_exporter(settings, worker_index: Optional[int]):
+    exporter_name = settings.TRACING_EXPORTER.lower()
+    if exporter_name == "console":
+        return ConsoleSpanExporter(service_name=settings.TRACING_SERVICE_NAME), "stdout"
+
+    if exporter_name == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT, insecure=True), settings.TRACING_OTLP_ENDPOINT
+
+    if exporter_name != "file":
+        raise ValueError(f"Unknown TRACING_EXPORTER: {settings.TRACING_EXPORTER} (console, file, otlp)")
+
+    # 멀티 프로세스 모드에서는 워커별 파일 (traces.worker0.jsonl ...)로 줄 섞임 방지
+    file_path = Path(settings.TRACING_FILE_PATH)
+    if worker_index is not None:
+        file_path = file_path.with_name(f"{file_path.stem}.worker{worker_index}{file_path.suffix}")
+    return OTLPJsonFileExporter(str(file_path)), str(file_path)
+
+
+def setup_tracing(worker_index: Optional[int] = None) -> bool:
+    """
+    TracerProvider 설정 (TRACING_ENABLED일 때만)
+
+    Args:
+        worker_index: 멀티 프로세스 모드의 워커 번호 (워커별 파일/리소스 속성)
+
+    Returns:
+        bool: 트레이싱 활성화 여부
+    """
+    global _tracer_provider, _tracing_enabled
+    settings = get_settings()
+    if not settings.TRACING_ENABLED or _tracing_enabled:
+        return _tracing_enabled
+    if not (OTEL_AVAILABLE and OTEL_SDK_AVAILABLE):
+        logger.warning("⚠️ opentelemetry-sdk not installed - tracing disabled")
+        return False
+
+    try:
+        exporter, destination = _create_exporter(settings, worker_index)
+    except Exception as e:
+        logger.error(f"❌ Failed to create trace exporter: {e}")
+        return False
+
+    resource_attributes = {
+        "service.name": settings.TRACING_SERVICE_NAME,
+        "process.pid": os.getpid()
+    }
+    if worker_index is not None:
+        resource_attributes["service.instance.id"] = f"worker-{worker_index}"
+
+    _tracer_provider = TracerProvider(
+        resource=Resource.create(resource_attributes),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO))
+    )
+    _tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_tracer_provider)
+    _tracing_enabled = True
+
+    logger.info(f"🔭 Tracing enabled: {settings.TRACING_EXPORTER} exporter -> {destination} "
+                f"(sample ratio {settings.TRACING_SAMPLE_RATIO})")
+    return True
+
+
+def shutdown_tracing():
+    """남은 span flush 후 exporter 종료"""
+    global _tracer_provider, _tracing_enabled
+    if _tracer_provider is None:
+        return
+    try:
+        _tracer_provider.shutdown()
+    except Exception as e:
+        logger.warning(f"⚠️ Tracing shutdown failed: {e}")
+    _tracer_provider = None
+    _tracing_enabled = False
+
+
+def is_tracing_enabled() -> bool:
+    return _tracing_enabled
+
+
+def _clean_attributes(attributes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """None 값 제외 (OpenTelemetry 속성은 None을 허용하지 않음)"""
+    return {key: value for key, value in (attributes or {}).items() if value is not None}
+
+
+@contextmanager
+def trace_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: str = "internal",
+    parent: Optional[Any] = None
+) -> Iterator[Any]:
+    """
+    현재 컨텍스트의 자식 span 생성 (트레이싱 비활성화 시 no-op)
+
+    Args:
+        name: span 이름 (예: "vector_db.upsert")
+        attributes: span 속성 (None 값은 무시)
+        kind: "internal", "server", "client"
+        parent: extract_context()로 얻은 상위 컨텍스트 (없으면 현재 컨텍스트)
+
+    Yields:
+        span: set_attribute()/record_exception()을 지원하는 span
+    """
+    if not _tracing_enabled:
+        yield _NOOP_SPAN
+        return
+
+    tracer = trace.get_tracer(TRACER_NAME)
+    with tracer.start_as_current_span(
+        name,
+        context=parent,
+        kind=getattr(SpanKind, kind.upper(), SpanKind.INTERNAL),
+        attributes=_clean_attributes(attributes)
+    ) as span:
+        yield span
+
+
+def traced(name: str, attributes: Optional[Dict[str, Any]] = None) -> Callable:
+    """
+    async 함수 전체를 span으로 감싸는 데코레이터
+
+    함수 내부에서는 set_span_attributes()로 현재 span에 결과 속성을 추가
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with trace_span(name, attributes):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def set_span_attributes(attributes: Dict[str, Any]):
+    """현재 span에 속성 추가 (트레이싱 비활성화 시 무시, None 값 제외)"""
+    if not _tracing_enabled:
+        return
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes(_clean_attributes(attributes))
+
+
+def inject_metadata(metadata: Optional[List[Tuple[str, str]]] = None) -> Optional[List[Tuple[str, str]]]:
+    """
+    현재 trace 컨텍스트를 gRPC 호출 metadata(traceparent/tracestate)로 추가
+
+    Args:
+        metadata: 기존 호출 metadata
+
+    Returns:
+        Optional[List[Tuple[str, str]]]: 전파 헤더가 추가된 metadata (전파할 것이 없으면 입력 그대로)
+    """
+    if not _tracing_enabled:
+        return metadata
+    carrier: Dict[str, str] = {}
+    propagate.inject(carrier)
+    if not carrier:
+        return metadata
+    return list(metadata or []) + list(carrier.items())
+
+
+def extract_context(metadata: Optional[Sequence[Tuple[str, Any]]]) -> Optional[Any]:
+    """
+    수신 gRPC metadata에서 상위 trace 컨텍스트 추출
+
+    Args:
+        metadata: context.invocation_metadata() 결과
+
+    Returns:
+        Optional[Context]: trace_span(parent=...)에 전달할 컨텍스트 (없으면 None)
+    """
+    if not _tracing_enabled or not metadata:
+        return None
+    carrier = {key: value for key, value in metadata if isinstance(value, str)}
+    if "traceparent" not in carrier:
+        return None
+    return propagate.extract(carrier)
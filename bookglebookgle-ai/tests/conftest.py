@@ -0,0 +1,38 @@
+"""
+Pytest fixtures for BGBG AI Server
+동시성 경로(수집 큐, 승인 제어, 캐시, 헤징) 테스트 공용 설정
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 저장소 루트(src 패키지) import 경로 등록
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import get_settings  # noqa: E402
+
+
+@pytest.fixture
+def settings():
+    """전역 설정 (테스트에서 monkeypatch.setattr로 변경 후 자동 복원)"""
+    return get_settings()
+
+
+class FakeRedisManager:
+    """RedisManager.get_client()만 제공하는 fakeredis 래퍼 (같은 server를 쓰면 프로세스 간 공유처럼 동작)"""
+
+    def __init__(self, server):
+        import fakeredis.aioredis
+        self.client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+    async def get_client(self):
+        return self.client
+
+
+@pytest.fixture
+def redis_server():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # Lua 스크립트(EVALSHA) 실행에 필요
+    return fakeredis.FakeServer()
@@ -0,0 +1,198 @@
+"""
+AdaptiveLimiter / AdmissionControlInterceptor 테스트 - 대기 시간 초과, 취소 시 슬롯 반납, 우선순위별 차단 순서
+"""
+
+import asyncio
+
+import grpc
+import pytest
+
+from src.grpc_server.admission_interceptor import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdaptiveLimiter,
+    AdmissionControlInterceptor
+)
+
+
+class AbortedRpc(Exception):
+    def __init__(self, code, details, trailing_metadata):
+        super().__init__(details)
+        self.code = code
+        self.trailing_metadata = dict(trailing_metadata)
+
+
+class FakeContext:
+    """context.abort()만 흉내 (grpc.aio처럼 예외로 핸들러 종료)"""
+
+    async def abort(self, code, details="", trailing_metadata=()):
+        raise AbortedRpc(code, details, trailing_metadata)
+
+
+def _method(rpc_name: str) -> str:
+    return f"/bgbg.AIService/{rpc_name}"
+
+
+def test_acquire_times_out_and_leaves_no_waiter():
+    async def scenario():
+        limiter = AdaptiveLimiter("/svc/Test", PRIORITY_BATCH, max_limit=1)
+        assert await limiter.acquire(1.0) is None
+        assert await limiter.acquire(0) == "limit"
+        assert await limiter.acquire(0.05) == "queue_timeout"
+        assert limiter.queue_length == 0
+
+        # 대기자가 없으므로 반납한 슬롯은 그대로 비어 있어야 함
+        limiter.release(None)
+        assert limiter.in_flight == 0
+        assert limiter.has_capacity()
+
+    asyncio.run(scenario())
+
+
+def test_queue_full_is_rejected_immediately(settings, monkeypatch):
+    monkeypatch.setattr(settings.admission, "MAX_QUEUE", 1)
+
+    async def scenario():
+        limiter = AdaptiveLimiter("/svc/Test", PRIORITY_BATCH, max_limit=1)
+        await limiter.acquire(1.0)
+        queued = asyncio.create_task(limiter.acquire(5.0))
+        await asyncio.sleep(0)
+        assert limiter.queue_length == 1
+        assert await limiter.acquire(5.0) == "queue_full"
+
+        limiter.release(None)
+        assert await queued is None
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_waiter_cancelled_while_queued_does_not_take_slot():
+    async def scenario():
+        limiter = AdaptiveLimiter("/svc/Test", PRIORITY_BATCH, max_limit=1)
+        await limiter.acquire(1.0)
+        queued = asyncio.create_task(limiter.acquire(5.0))
+        await asyncio.sleep(0)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert limiter.queue_length == 0
+
+        limiter.release(None)
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_slot_released_when_queued_call_is_cancelled_after_handoff():
+    async def scenario():
+        interceptor = AdmissionControlInterceptor()
+        limiter = AdaptiveLimiter("/svc/Test", PRIORITY_BATCH, max_limit=1)
+        gate = asyncio.Event()
+
+        async def behavior(request, context):
+            await gate.wait()
+            return "ok"
+
+        handler = interceptor._wrap_unary(limiter, behavior)
+        first = asyncio.create_task(handler(None, FakeContext()))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(handler(None, FakeContext()))
+        await asyncio.sleep(0)
+        assert limiter.queue_length == 1
+
+        # 첫 요청 완료로 슬롯이 넘어간 직후(같은 틱) 두 번째 호출 측이 취소
+        gate.set()
+        await first
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+
+        assert limiter.in_flight == 0
+        assert limiter.queue_length == 0
+
+    asyncio.run(scenario())
+
+
+def test_unary_handler_error_releases_slot():
+    async def scenario():
+        interceptor = AdmissionControlInterceptor()
+        limiter = AdaptiveLimiter("/svc/Test", PRIORITY_BATCH, max_limit=1)
+
+        async def behavior(request, context):
+            raise RuntimeError("boom")
+
+        handler = interceptor._wrap_unary(limiter, behavior)
+        with pytest.raises(RuntimeError):
+            await handler(None, FakeContext())
+        assert limiter.in_flight == 0
+        # 예외는 지연 샘플에서 제외
+        assert limiter.samples == 0
+
+    asyncio.run(scenario())
+
+
+def test_batch_is_shed_before_interactive_under_pressure(settings, monkeypatch):
+    interactive_rpc = settings.admission.INTERACTIVE_METHODS[0]
+    batch_rpc = settings.admission.BATCH_METHODS[0]
+    monkeypatch.setitem(settings.admission.METHOD_LIMITS, interactive_rpc, 1)
+    monkeypatch.setitem(settings.admission.METHOD_LIMITS, batch_rpc, 4)
+
+    async def scenario():
+        interceptor = AdmissionControlInterceptor()
+        interactive = interceptor._limiter(_method(interactive_rpc))
+        batch = interceptor._limiter(_method(batch_rpc))
+        assert interactive.priority == PRIORITY_INTERACTIVE
+        assert batch.priority == PRIORITY_BATCH
+
+        # batch는 부하 신호 전에는 정상 승인
+        await interceptor._admit(batch, FakeContext())
+        assert batch.in_flight == 1
+
+        # interactive 슬롯 포화 -> 대기 발생 시 부하 신호
+        await interceptor._admit(interactive, FakeContext())
+        waiting = asyncio.create_task(interceptor._admit(interactive, FakeContext()))
+        await asyncio.sleep(0)
+        assert interceptor.under_pressure
+        assert batch.limit < 4
+
+        # 신규 batch 요청은 대기 없이 retry-after와 함께 거부
+        with pytest.raises(AbortedRpc) as shed:
+            await interceptor._admit(batch, FakeContext())
+        assert shed.value.code == grpc.StatusCode.RESOURCE_EXHAUSTED
+        assert float(shed.value.trailing_metadata["retry-after"]) > 0
+        assert "grpc-retry-pushback-ms" in shed.value.trailing_metadata
+
+        # 대기 중인 interactive 요청은 슬롯이 반납되면 승인
+        interactive.release(None)
+        await asyncio.wait_for(waiting, timeout=1.0)
+        assert interactive.in_flight == 1
+
+        stats = interceptor.get_stats()
+        assert stats["shed"][PRIORITY_BATCH] == 1
+        assert stats["shed"][PRIORITY_INTERACTIVE] == 0
+        assert stats["pressure_events"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_latency_spike_decreases_limit_once_per_window(settings, monkeypatch):
+    monkeypatch.setattr(settings.admission, "MIN_LATENCY_SAMPLES", 5)
+    monkeypatch.setattr(settings.admission, "LATENCY_FLOOR_MS", 10.0)
+
+    limiter = AdaptiveLimiter("/svc/Test", PRIORITY_BATCH, max_limit=10)
+    for _ in range(10):
+        limiter.in_flight += 1
+        limiter.release(0.002)
+    assert limiter.limit == 10
+
+    # 기준선의 4배라도 바닥값(10ms) 이하(2ms -> 8ms)는 과부하로 보지 않음
+    limiter.in_flight += 1
+    limiter.release(0.008)
+    assert limiter.limit == 10
+
+    limiter.in_flight += 2
+    limiter.release(0.5)
+    limiter.release(0.5)
+    assert limiter.limit == pytest.approx(10 * settings.admission.DECREASE_FACTOR)
+    assert limiter.stats["decreases"] == 1
@@ -0,0 +1,311 @@
+"""
+IngestJobQueue 테스트 - 할당/재시도/복구/소유권(run_id) 확인 (메모리, fakeredis 저장소)
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.services.ingest_job_queue import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    IngestJob,
+    IngestJobQueue
+)
+from src.utils.cancellation import check_cancelled
+
+from conftest import FakeRedisManager
+
+
+@pytest.fixture(autouse=True)
+def fast_ingest(settings, monkeypatch, tmp_path):
+    """하트비트/복구 주기를 테스트용으로 단축"""
+    config = settings.ingest
+    monkeypatch.setattr(config, "SPOOL_DIR", str(tmp_path / "spool"))
+    monkeypatch.setattr(config, "WORKERS", 1)
+    monkeypatch.setattr(config, "HEARTBEAT_SECONDS", 0.05)
+    monkeypatch.setattr(config, "STALE_SECONDS", 0.5)
+    monkeypatch.setattr(config, "POLL_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(config, "MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(config, "MAX_PENDING_JOBS", 10)
+    return config
+
+
+@pytest.fixture(params=["memory", "redis"])
+def make_queue(request):
+    """같은 백엔드를 공유하는 큐 생성 함수 (redis는 fakeredis 서버 하나를 여러 큐가 공유)"""
+    if request.param == "memory":
+        return lambda processor=None: IngestJobQueue(None, processor)
+    server = request.getfixturevalue("redis_server")
+    return lambda processor=None: IngestJobQueue(FakeRedisManager(server), processor)
+
+
+@pytest.fixture
+def redis_queue(redis_server):
+    return lambda processor=None: IngestJobQueue(FakeRedisManager(redis_server), processor)
+
+
+async def _succeed(job, pdf_data):
+    return {"success": True, "chunk_count": 3, "total_pages": 1}
+
+
+async def _wait_terminal(queue: IngestJobQueue, job_id: str, timeout: float = 3.0) -> IngestJob:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = await queue.get_job(job_id)
+        if job is not None and job.terminal:
+            return job
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish: {job}")
+
+
+async def _prepare(queue: IngestJobQueue):
+    """워커 없이 저장소만 준비 (대기열 상태를 직접 조작하는 테스트용)"""
+    queue._store = await queue._create_store()
+    queue.spool_dir.mkdir(parents=True, exist_ok=True)
+
+
+def test_submitted_job_completes_and_removes_spool(make_queue):
+    async def scenario():
+        queue = make_queue(_succeed)
+        await queue.start()
+        try:
+            result = await queue.submit("doc-1", "meeting-1", b"%PDF", metadata={"title": "t"})
+            assert result["success"]
+            job = await _wait_terminal(queue, result["job"].job_id)
+        finally:
+            await queue.stop()
+
+        assert job.state == JOB_COMPLETED
+        assert job.chunk_count == 3
+        assert job.attempts == 1
+        assert job.metadata == {"title": "t"}
+        assert not os.path.exists(result["job"].spool_path)
+        assert queue.get_stats()["completed"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_claim_is_round_robin_across_meetings(make_queue):
+    async def scenario():
+        queue = make_queue()
+        await _prepare(queue)
+        first = (await queue.submit("d1", "m1", b"%PDF"))["job"]
+        second = (await queue.submit("d2", "m1", b"%PDF"))["job"]
+        other = (await queue.submit("d3", "m2", b"%PDF"))["job"]
+
+        assert await queue.get_queue_position(second) == 1
+        claimed = [await queue._store.claim(f"run-{i}") for i in range(4)]
+        assert claimed == [first.job_id, other.job_id, second.job_id, None]
+        assert await queue._store.pending_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_claim_stamps_run_id_and_heartbeat(make_queue):
+    async def scenario():
+        queue = make_queue()
+        await _prepare(queue)
+        submitted = (await queue.submit("d1", "m1", b"%PDF"))["job"]
+
+        before = time.time()
+        job_id = await queue._store.claim("run-1")
+        job = await queue._store.load(job_id)
+        assert job.run_id == "run-1"
+        assert job.heartbeat_at >= before - 1
+        assert job.metadata == {}
+        assert job.job_id == submitted.job_id
+
+        # 할당 직후 다른 프로세스의 복구 검사는 이 작업을 가져가지 않음
+        await queue._recover_stale_jobs()
+        assert queue.stats["recovered"] == 0
+        assert await queue._store.running_job_ids() == [job_id]
+
+    asyncio.run(scenario())
+
+
+def test_queue_full_rejects_and_discards_spool(make_queue, fast_ingest, monkeypatch):
+    monkeypatch.setattr(fast_ingest, "MAX_PENDING_JOBS", 1)
+
+    async def scenario():
+        queue = make_queue()
+        await _prepare(queue)
+        assert (await queue.submit("d1", "m1", b"%PDF"))["success"]
+        rejected = await queue.submit("d2", "m2", b"%PDF")
+        assert not rejected["success"] and rejected["queue_full"]
+        assert queue.stats["rejected"] == 1
+        assert len(list(queue.spool_dir.iterdir())) == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_job_is_retried_then_fails(make_queue):
+    calls = []
+
+    async def flaky(job, pdf_data):
+        calls.append(job.attempts)
+        return {"success": False, "error": f"attempt {job.attempts} failed"}
+
+    async def scenario():
+        queue = make_queue(flaky)
+        await queue.start()
+        try:
+            job_id = (await queue.submit("d1", "m1", b"%PDF"))["job"].job_id
+            job = await _wait_terminal(queue, job_id)
+        finally:
+            await queue.stop()
+
+        assert calls == [1, 2]
+        assert job.state == JOB_FAILED
+        assert job.error == "attempt 2 failed"
+        assert queue.stats["retried"] == 1
+        assert queue.stats["failed"] == 1
+        assert await queue._store.running_job_ids() == []
+
+    asyncio.run(scenario())
+
+
+def test_stop_requeues_running_job_at_front(make_queue):
+    async def scenario():
+        running = asyncio.Event()
+
+        async def hang(job, pdf_data):
+            running.set()
+            await asyncio.sleep(30)
+
+        queue = make_queue(hang)
+        await queue.start()
+        job_id = (await queue.submit("d1", "m1", b"%PDF"))["job"].job_id
+        await asyncio.wait_for(running.wait(), timeout=2.0)
+        await queue.stop()
+
+        job = await queue._store.load(job_id)
+        assert job.state == JOB_QUEUED
+        assert job.attempts == 0
+        assert queue.stats["interrupted"] == 1
+        assert await queue._store.running_job_ids() == []
+        assert await queue._store.claim("run-next") == job_id
+
+    asyncio.run(scenario())
+
+
+def test_stale_running_job_is_recovered_on_start(make_queue):
+    async def scenario():
+        queue = make_queue(_succeed)
+        await _prepare(queue)
+        job_id = (await queue.submit("d1", "m1", b"%PDF"))["job"].job_id
+
+        # 크래시한 워커: 할당 후 하트비트가 멈춘 상태
+        await queue._store.claim("crashed-run")
+        job = await queue._store.load(job_id)
+        job.update(state=JOB_RUNNING, attempts=1, heartbeat_at=time.time() - 60)
+        await queue._store.save(job)
+
+        await queue.start()
+        try:
+            job = await _wait_terminal(queue, job_id)
+        finally:
+            await queue.stop()
+
+        assert queue.stats["recovered"] == 1
+        assert job.state == JOB_COMPLETED
+        assert job.attempts == 2
+        assert job.run_id != "crashed-run"
+
+    asyncio.run(scenario())
+
+
+def test_stale_job_at_max_attempts_fails(make_queue):
+    async def scenario():
+        queue = make_queue(_succeed)
+        await _prepare(queue)
+        job_id = (await queue.submit("d1", "m1", b"%PDF"))["job"].job_id
+        await queue._store.claim("crashed-run")
+        job = await queue._store.load(job_id)
+        job.update(state=JOB_RUNNING, attempts=2, heartbeat_at=time.time() - 60)
+        await queue._store.save(job)
+
+        await queue._recover_stale_jobs()
+
+        job = await queue._store.load(job_id)
+        assert job.state == JOB_FAILED
+        assert "stopped responding" in job.error
+        assert await queue._store.running_job_ids() == []
+
+    asyncio.run(scenario())
+
+
+def test_save_from_superseded_run_is_rejected(make_queue):
+    async def scenario():
+        queue = make_queue()
+        await _prepare(queue)
+        job_id = (await queue.submit("d1", "m1", b"%PDF"))["job"].job_id
+        await queue._store.claim("old-run")
+        stale = await queue._store.load(job_id)
+
+        # 복구가 run_id를 회수한 뒤 이전 실행의 완료 저장은 무시되어야 함
+        recovered = await queue._store.load(job_id)
+        recovered.update(run_id="")
+        assert await queue._store.save_if_owner(recovered, "old-run")
+
+        stale.update(state=JOB_COMPLETED, chunk_count=99)
+        assert not await queue._save_owned(stale)
+        assert queue.stats["superseded"] == 1
+        job = await queue._store.load(job_id)
+        assert job.state != JOB_COMPLETED and job.chunk_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_takeover_cancels_previous_run(redis_queue, fast_ingest):
+    """하트비트가 늦은 프로세스 A의 작업을 B가 복구하면 A는 중단되고 B의 결과만 저장"""
+    runs = []
+
+    async def slow(job, pdf_data):
+        runs.append(("A", job.run_id))
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            check_cancelled("embedding")
+        return {"success": True, "chunk_count": 1, "total_pages": 1}
+
+    async def fast(job, pdf_data):
+        runs.append(("B", job.run_id))
+        return {"success": True, "chunk_count": 7, "total_pages": 1}
+
+    async def scenario():
+        a, b = redis_queue(slow), redis_queue(fast)
+        await a.start()
+        try:
+            job_id = (await a.submit("d1", "m1", b"%PDF"))["job"].job_id
+            while not runs:
+                await asyncio.sleep(0.02)
+
+            # A의 하트비트가 멈춘 것처럼 만든 뒤 B 시작 (start 시 stale 복구)
+            a._heartbeat_task.cancel()
+            job = await a._store.load(job_id)
+            job.update(heartbeat_at=time.time() - 60)
+            await a._store.save(job)
+            await b.start()
+            job = await _wait_terminal(b, job_id)
+
+            # A 하트비트 재개 -> 소유권 상실 감지 후 실행 중단
+            a._heartbeat_task = asyncio.create_task(a._heartbeat_loop())
+            deadline = time.monotonic() + 2.0
+            while a._running_jobs and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+        finally:
+            await a.stop()
+            await b.stop()
+
+        assert [name for name, _ in runs] == ["A", "B"]
+        assert runs[0][1] != runs[1][1]
+        assert job.state == JOB_COMPLETED and job.chunk_count == 7
+        assert a.stats["superseded"] == 1 and a.stats["completed"] == 0
+        assert b.stats["recovered"] == 1 and b.stats["completed"] == 1
+        assert (await b._store.load(job_id)).chunk_count == 7
+
+    asyncio.run(scenario())
@@ -0,0 +1,98 @@
+"""
+LLMClient 헤지 요청 테스트 - 호출 측 취소 시 진행 중인 GMS 요청 정리, 헤지 승리 집계
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.llm_client import LLMClient
+
+
+class FakeGms:
+    """호출 순서별 지연 후 응답하는 _gms_completion 대체 (시작/취소 횟수 기록)"""
+
+    def __init__(self, *delays: float):
+        self.delays = list(delays)
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self, prompt, system_message, max_tokens, temperature, timer):
+        index = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"response {index}"
+
+
+@pytest.fixture
+def hedging_client(settings, monkeypatch):
+    monkeypatch.setattr(settings.ai, "MOCK_AI_RESPONSES", False)
+    monkeypatch.setattr(settings.ai, "GMS_HEDGE_ENABLED", True)
+    monkeypatch.setattr(settings.ai, "GMS_HEDGE_MIN_DELAY_MS", 100)
+    monkeypatch.setattr(settings.ai, "GMS_HEDGE_MAX_DELAY_MS", 100)
+
+    def make(gms: FakeGms) -> LLMClient:
+        client = LLMClient()
+        client.gms_available = True
+        client.breaker = None  # 공유 브레이커의 지연 분포와 무관하게 고정 헤지 지연 사용
+        client._gms_completion = gms
+        return client
+    return make
+
+
+async def _cancel_after(client: LLMClient, wait: float):
+    call = asyncio.create_task(client.generate_completion("hi", hedge=True))
+    await asyncio.sleep(wait)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(0.01)
+    return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+
+def test_caller_cancelled_before_hedge_cancels_primary(hedging_client):
+    gms = FakeGms(10, 10)
+    client = hedging_client(gms)
+
+    leftover = asyncio.run(_cancel_after(client, 0.03))
+
+    assert leftover == []
+    assert gms.started == 1 and gms.cancelled == 1
+    assert client.hedge_stats["hedged"] == 0
+
+
+def test_caller_cancelled_after_hedge_cancels_both(hedging_client):
+    gms = FakeGms(10, 10)
+    client = hedging_client(gms)
+
+    leftover = asyncio.run(_cancel_after(client, 0.2))
+
+    assert leftover == []
+    assert gms.started == 2 and gms.cancelled == 2
+    assert client.hedge_stats["hedged"] == 1
+
+
+def test_backup_win_cancels_slow_primary(hedging_client):
+    gms = FakeGms(10, 0.01)
+    client = hedging_client(gms)
+
+    result = asyncio.run(client.generate_completion("hi", hedge=True))
+
+    assert result == "response 1"
+    assert gms.cancelled == 1
+    assert client.hedge_stats == {"hedged": 1, "hedge_wins": 1}
+
+
+def test_fast_primary_sends_no_hedge(hedging_client):
+    gms = FakeGms(0.01)
+    client = hedging_client(gms)
+
+    result = asyncio.run(client.generate_completion("hi", hedge=True))
+
+    assert result == "response 0"
+    assert gms.started == 1
+    assert client.hedge_stats == {"hedged": 0, "hedge_wins": 0}
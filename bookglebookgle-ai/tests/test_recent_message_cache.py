@@ -0,0 +1,85 @@
+"""
+RecentMessageCache 테스트 - 세션 버퍼/통계 상한과 이어 붙이기 규칙
+"""
+
+from datetime import datetime
+
+from src.models.chat_history_models import ChatMessage
+from src.services.recent_message_cache import RecentMessageCache
+
+
+def _message(session_id: str, index: int) -> ChatMessage:
+    return ChatMessage(
+        message_id=f"{session_id}-{index}",
+        session_id=session_id,
+        user_id="u1",
+        nickname="tester",
+        content=f"message {index}",
+        timestamp=datetime.now()
+    )
+
+
+def test_buffers_are_capped_by_lru():
+    cache = RecentMessageCache(max_messages=5, max_sessions=3)
+    for i in range(5):
+        cache.load(f"s{i}", [_message(f"s{i}", 0)], 1)
+
+    assert list(cache._buffers) == ["s2", "s3", "s4"]
+    assert cache.get_stats()["evictions"] == 2
+
+
+def test_buffer_keeps_only_max_messages():
+    cache = RecentMessageCache(max_messages=3, max_sessions=10)
+    cache.load("s1", [], 0)
+    for count in range(1, 6):
+        assert cache.append("s1", _message("s1", count), count)
+
+    recent = cache.get("s1", 3)
+    assert [m.content for m in recent] == ["message 3", "message 4", "message 5"]
+    # 버퍼(3개)보다 많은 조회는 Redis로 위임
+    assert cache.get("s1", 10) is None
+
+
+def test_out_of_order_append_invalidates_buffer():
+    cache = RecentMessageCache(max_messages=5, max_sessions=10)
+    cache.load("s1", [_message("s1", 1)], 1)
+
+    assert not cache.append("s1", _message("s1", 3), 3)
+    assert not cache.is_warm("s1", 1)
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_miss_only_session_stats_are_bounded():
+    cache = RecentMessageCache(max_sessions=100)
+    for i in range(1000):
+        cache.record_miss(f"s{i}")
+
+    stats = cache.get_stats()
+    assert stats["misses"] == 1000
+    assert stats["tracked_sessions"] == 100
+    # 가장 최근 세션만 남음 (LRU)
+    assert "s999" in cache._session_stats and "s0" not in cache._session_stats
+
+
+def test_evict_idle_prunes_stats_without_buffers():
+    cache = RecentMessageCache(max_sessions=100, idle_seconds=0)
+    cache.load("buffered", [_message("buffered", 1)], 1)
+    for i in range(10):
+        cache.record_miss(f"s{i}")
+
+    assert cache.evict_idle() == 1
+    assert cache.get_stats()["tracked_sessions"] == 0
+    assert cache.get_stats()["cached_sessions"] == 0
+
+
+def test_aggregate_stats_have_no_per_session_entries():
+    cache = RecentMessageCache()
+    cache.load("s1", [_message("s1", 1)], 1)
+    cache.get("s1", 1)
+    cache.record_miss("s2")
+
+    stats = cache.get_stats()
+    assert "sessions" not in stats
+    assert all(not isinstance(value, dict) for value in stats.values())
+    assert stats["hit_rate"] == 0.5
+    assert cache.get_stats("s1")["hits"] == 1
@@ -1,11 +1,11 @@
 package com.example.bookglebookgleserver.ocr.grpc;
 
 import com.bgbg.ai.grpc.AIServiceGrpc;
+import com.bgbg.ai.grpc.AIServiceProto.IngestJobAccepted;
 import com.bgbg.ai.grpc.AIServiceProto.PdfInfo;
 import com.bgbg.ai.grpc.AIServiceProto.ProcessPdfRequest;
 import com.bgbg.ai.grpc.AIServiceProto.ProcessPdfResponse;
 import com.google.protobuf.ByteString;
-import com.google.protobuf.Empty;
 import io.grpc.ManagedChannel;
 import io.grpc.ManagedChannelBuilder;
 import io.grpc.stub.StreamObserver;
@@ -18,6 +18,7 @@ import org.springframework.web.multipart.MultipartFile;
 import java.io.InputStream;
 import java.util.Arrays;
 import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.TimeUnit;
 
 @Slf4j
 @Component
@@ -95,15 +96,16 @@ public class GrpcOcrClient {
         return responseHolder[0];
     }
 
-    // 📌 No OCR 처리(응답 없음) - 새로 추가
-    public void sendPdfNoOcr(Long pdfId, MultipartFile file, Long meetingId) {
+    // 📌 No OCR 처리 - AI 서버가 PDF를 수집 작업 큐에 등록하고 작업 ID를 즉시 반환
+    public IngestJobAccepted sendPdfNoOcr(Long pdfId, MultipartFile file, Long meetingId) {
         final CountDownLatch finishLatch = new CountDownLatch(1);
+        final IngestJobAccepted[] responseHolder = new IngestJobAccepted[1];
         final Throwable[] errorHolder = new Throwable[1];
 
-        StreamObserver<ProcessPdfRequest> requestObserver = stub.processPdfStream(new StreamObserver<Empty>() {
+        StreamObserver<ProcessPdfRequest> requestObserver = stub.processPdfStream(new StreamObserver<IngestJobAccepted>() {
             @Override
-            public void onNext(Empty response) {
-                // ProcessPdfStream은 응답 데이터 없음(Empty)
+            public void onNext(IngestJobAccepted response) {
+                responseHolder[0] = response;
             }
             @Override
             public void onError(Throwable t) {
@@ -138,7 +140,17 @@ public class GrpcOcrClient {
             // 3. 완료 전송
             requestObserver.onCompleted();
 
+            // 4. 작업 등록 응답 대기 (스풀 후 바로 반환되므로 OCR 완료까지 기다리지 않음)
+            if (!finishLatch.await(30, TimeUnit.SECONDS)) {
+                throw new IllegalStateException("수집 작업 등록 응답 시간 초과");
+            }
             if (errorHolder[0] != null) throw new RuntimeException(errorHolder[0]);
+            IngestJobAccepted accepted = responseHolder[0];
+            if (accepted == null || !accepted.getSuccess()) {
+                throw new IllegalStateException("수집 작업 등록 실패: " + (accepted != null ? accepted.getMessage() : "응답 없음"));
+            }
+            log.info("📥 수집 작업 등록 - jobId: {}, 대기 순번: {}", accepted.getJobId(), accepted.getQueuePosition());
+            return accepted;
         } catch (Exception e) {
             log.error("❌ 파일 전송 중 예외 발생 (No OCR)", e);
             throw new RuntimeException(e);